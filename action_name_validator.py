@@ -36,16 +36,16 @@ class ActionNameValidator:
         # Minimum length for action names
         self.min_length = 2
         
-        # Load MW_ACTIONS_CATALOG if available
-        self.mw_actions_catalog = self._load_mw_catalog()
+        # Load MW_ACTIONS_CATALOG and its index if available
+        self.mw_actions_catalog, self.catalog_index = self._load_mw_catalog()
     
-    def _load_mw_catalog(self) -> List[Any]:
-        """Load Moveworks Actions Catalog if available."""
+    def _load_mw_catalog(self) -> Tuple[List[Any], Any]:
+        """Load Moveworks Actions Catalog and its lookup index if available."""
         try:
-            from mw_actions_catalog import MW_ACTIONS_CATALOG
-            return MW_ACTIONS_CATALOG
+            from mw_actions_catalog import MW_ACTIONS_CATALOG, catalog_index
+            return MW_ACTIONS_CATALOG, catalog_index
         except ImportError:
-            return []
+            return [], None
     
     def validate_action_name(self, action_name: str, step_context: Any = None) -> ActionNameValidationResult:
         """
@@ -127,25 +127,15 @@ class ActionNameValidator:
             return result
         
         # Check if it's a known action
-        for action in self.mw_actions_catalog:
-            if action.action_name == action_name:
-                result['is_known'] = True
-                result['category'] = action.category
-                return result
-        
-        # If not found, look for similar actions
-        similar_actions = []
-        action_name_lower = action_name.lower()
-        
-        for action in self.mw_actions_catalog:
-            # Check for partial matches
-            if action_name_lower in action.action_name.lower():
-                similar_actions.append(action.action_name)
-            elif action.action_name.lower().startswith(action_name_lower):
-                similar_actions.append(action.action_name)
-        
-        # Limit suggestions to top 3
-        result['suggestions'] = [f"Did you mean: {action}" for action in similar_actions[:3]]
+        action = self.catalog_index.get(action_name)
+        if action is not None:
+            result['is_known'] = True
+            result['category'] = action.category
+            return result
+        
+        # If not found, look for similar actions (partial matches), limited to top 3
+        similar_actions = self.catalog_index.names_containing(action_name, limit=3)
+        result['suggestions'] = [f"Did you mean: {action}" for action in similar_actions]
         
         return result
     
@@ -162,14 +152,7 @@ class ActionNameValidator:
         if not self.mw_actions_catalog:
             return []
         
-        suggestions = []
-        partial_lower = partial_name.lower()
-        
-        for action in self.mw_actions_catalog:
-            if not partial_name or partial_lower in action.action_name.lower():
-                suggestions.append(action.action_name)
-        
-        return sorted(suggestions)
+        return sorted(self.catalog_index.names_containing(partial_name))
     
     def get_actions_by_category(self, category: str) -> List[str]:
         """
@@ -184,8 +167,7 @@ class ActionNameValidator:
         if not self.mw_actions_catalog:
             return []
         
-        return [action.action_name for action in self.mw_actions_catalog 
-                if action.category == category]
+        return [action.action_name for action in self.catalog_index.by_category(category)]
     
     def get_all_categories(self) -> List[str]:
         """
@@ -197,8 +179,7 @@ class ActionNameValidator:
         if not self.mw_actions_catalog:
             return []
         
-        categories = set(action.category for action in self.mw_actions_catalog)
-        return sorted(list(categories))
+        return self.catalog_index.categories()
     
     def validate_workflow_action_names(self, workflow) -> List[ActionNameValidationResult]:
         """
@@ -271,18 +252,18 @@ class ActionNameValidator:
         if not self.mw_actions_catalog:
             return None
         
-        for action in self.mw_actions_catalog:
-            if action.action_name == action_name:
-                return {
-                    'action_name': action.action_name,
-                    'display_name': action.display_name,
-                    'description': action.description,
-                    'category': action.category,
-                    'input_args': [arg.name for arg in action.input_args],
-                    'required_args': [arg.name for arg in action.input_args if arg.required]
-                }
-        
-        return None
+        action = self.catalog_index.get(action_name)
+        if action is None:
+            return None
+
+        return {
+            'action_name': action.action_name,
+            'display_name': action.display_name,
+            'description': action.description,
+            'category': action.category,
+            'input_args': [arg.name for arg in action.input_args],
+            'required_args': [arg.name for arg in action.input_args if arg.required]
+        }
 
 
 # Global validator instance
@@ -11,6 +11,7 @@ APIthon Code Restrictions (Enforced "No" List):
 4. External library references or non-APIthon built-ins
 5. Non-Python syntax or unsupported Python features
 6. Function definitions at module level (def keyword outside of inline expressions)
+7. Attributes of interpreter internals (gi_*, cr_*, ag_*, f_*, tb_*, co_*, func_*)
 
 Required YAML Structure:
 - script:
@@ -22,8 +23,13 @@ Required YAML Structure:
 """
 
 import ast
+import hashlib
 import re
-from typing import List, Dict, Any, Set
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import cached_property
+from typing import List, Dict, Any, Set, Tuple
 from core_structures import ScriptStep, Workflow
 
 
@@ -92,6 +98,269 @@ PROHIBITED_PATTERNS = [
     (r'\bsubprocess\.', "Subprocess operations are not allowed in APIthon"),
 ]
 
+# Import statement patterns with educational descriptions
+IMPORT_PATTERNS = [
+    {
+        'pattern': r'\bimport\s+([\w\.]+)(?:\s+as\s+(\w+))?',
+        'type': 'simple_import',
+        'description': 'Simple import statement'
+    },
+    {
+        'pattern': r'\bfrom\s+([\w\.]+)\s+import\s+([\w\*]+)(?:\s+as\s+(\w+))?',
+        'type': 'from_import',
+        'description': 'From...import statement'
+    },
+    {
+        'pattern': r'\bfrom\s+([\w\.]+)\s+import\s+\*',
+        'type': 'wildcard_import',
+        'description': 'Wildcard import (from ... import *)'
+    },
+    {
+        'pattern': r'__import__\s*\(\s*["\']([^"\']+)["\']\s*\)',
+        'type': 'dynamic_import',
+        'description': 'Dynamic import with __import__()'
+    }
+]
+
+# Data reference patterns
+DATA_REFERENCE_PATTERNS = [
+    r'\bdata\.[\w\.]+',
+    r'\bmeta_info\.[\w\.]+',
+]
+
+# Precompiled forms of the pattern tables above
+_COMPILED_PROHIBITED_PATTERNS = [(re.compile(pattern, re.MULTILINE), message) for pattern, message in PROHIBITED_PATTERNS]
+_COMPILED_IMPORT_PATTERNS = [(re.compile(info['pattern'], re.MULTILINE), info) for info in IMPORT_PATTERNS]
+_COMPILED_DATA_REFERENCE_PATTERNS = [re.compile(pattern) for pattern in DATA_REFERENCE_PATTERNS]
+_PRIVATE_IDENTIFIER_PATTERN = re.compile(r'\b_[a-zA-Z_][a-zA-Z0-9_]*\b')
+
+# Attribute prefixes of interpreter internals (generator, coroutine, frame,
+# traceback, code and function objects); reaching them escapes the sandbox
+INTERNAL_ATTRIBUTE_PREFIXES = ('gi_', 'cr_', 'ag_', 'f_', 'tb_', 'co_', 'func_')
+
+# str.format fields looking up such attributes, e.g. '{0.gi_frame}'
+_INTERNAL_FORMAT_FIELD_PATTERN = re.compile(
+    r'\{[^{}]*\.((?:' + '|'.join(INTERNAL_ATTRIBUTE_PREFIXES) + r')\w*)'
+)
+
+# Maximum number of analyses kept by get_apiton_analysis
+ANALYSIS_CACHE_SIZE = 512
+
+
+class APIthonAnalysis:
+    """
+    Single-parse analysis of an APIthon script.
+
+    The code is parsed once and the AST is walked once, sorting every node the
+    validators care about into buckets (in ast.walk order). Text-based pattern
+    scans are also run once. All script validators read from this object, and
+    get_apiton_analysis shares it between callers by code hash.
+
+    Attributes:
+        code: The analyzed script code
+        lines: The code split into lines
+        code_bytes: Size of the code in UTF-8 bytes
+        tree: The parsed module, or None if the code has a syntax error
+        import_nodes: ast.Import and ast.ImportFrom nodes
+        restricted_nodes: Import, class, function, global and nonlocal nodes
+        string_constants: String literal nodes
+        numeric_constants: Numeric literal nodes (including booleans)
+        list_nodes: List literal nodes
+        dict_nodes: Dict literal nodes
+        return_nodes: Return statement nodes
+        literal_nodes: String, list and dict literal nodes
+        internal_attributes: (attribute, line number) for every access to an
+            attribute in INTERNAL_ATTRIBUTE_PREFIXES, including str.format fields
+        has_generator_syntax: Whether the code uses yield or await
+    """
+
+    def __init__(self, code: str):
+        self.code = code
+        self.lines = code.split('\n')
+        self.code_bytes = len(code.encode('utf-8'))
+
+        self.import_nodes = []
+        self.restricted_nodes = []
+        self.string_constants = []
+        self.numeric_constants = []
+        self.list_nodes = []
+        self.dict_nodes = []
+        self.return_nodes = []
+        self.literal_nodes = []
+        self.internal_attributes = []
+        self.has_generator_syntax = False
+
+        try:
+            self.tree = ast.parse(code)
+        except (SyntaxError, ValueError):
+            self.tree = None
+            return
+
+        for node in ast.walk(self.tree):
+            if isinstance(node, ast.Constant):
+                if isinstance(node.value, str):
+                    self.string_constants.append(node)
+                    self.literal_nodes.append(node)
+                    for match in _INTERNAL_FORMAT_FIELD_PATTERN.finditer(node.value):
+                        self.internal_attributes.append((match.group(1), node.lineno))
+                elif isinstance(node.value, (int, float)):
+                    self.numeric_constants.append(node)
+            elif isinstance(node, ast.List):
+                self.list_nodes.append(node)
+                self.literal_nodes.append(node)
+            elif isinstance(node, ast.Dict):
+                self.dict_nodes.append(node)
+                self.literal_nodes.append(node)
+            elif isinstance(node, ast.Return):
+                self.return_nodes.append(node)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                self.import_nodes.append(node)
+                self.restricted_nodes.append(node)
+            elif isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef, ast.Global, ast.Nonlocal)):
+                self.restricted_nodes.append(node)
+            elif isinstance(node, ast.Attribute):
+                if node.attr.startswith(INTERNAL_ATTRIBUTE_PREFIXES):
+                    self.internal_attributes.append((node.attr, node.lineno))
+            elif isinstance(node, (ast.Yield, ast.YieldFrom, ast.Await)):
+                self.has_generator_syntax = True
+
+    @property
+    def has_syntax_error(self) -> bool:
+        """Whether the code failed to parse."""
+        return self.tree is None
+
+    @cached_property
+    def prohibited_pattern_messages(self) -> List[str]:
+        """Messages of every PROHIBITED_PATTERNS entry that matches the code."""
+        return [message for pattern, message in _COMPILED_PROHIBITED_PATTERNS if pattern.search(self.code)]
+
+    @cached_property
+    def import_pattern_matches(self) -> List[Tuple[Dict[str, str], int, str]]:
+        """(pattern info, line number, matched text) for every IMPORT_PATTERNS match."""
+        line_starts = [0]
+        for line in self.lines[:-1]:
+            line_starts.append(line_starts[-1] + len(line) + 1)
+
+        matches = []
+        for pattern, info in _COMPILED_IMPORT_PATTERNS:
+            for match in pattern.finditer(self.code):
+                matches.append((info, bisect_right(line_starts, match.start()), match.group(0)))
+        return matches
+
+    @cached_property
+    def private_identifiers(self) -> List[Tuple[str, int, int]]:
+        """(identifier, line number, column) for every identifier starting with an underscore."""
+        found = []
+        for line_num, line in enumerate(self.lines, 1):
+            for match in _PRIVATE_IDENTIFIER_PATTERN.finditer(line):
+                found.append((match.group(), line_num, match.start()))
+        return found
+
+    @cached_property
+    def data_references(self) -> Set[str]:
+        """All data.* and meta_info.* references in the code."""
+        found = set()
+        for pattern in _COMPILED_DATA_REFERENCE_PATTERNS:
+            found.update(pattern.findall(self.code))
+        return found
+
+    @cached_property
+    def syntax_errors(self) -> List[str]:
+        """Syntax errors, allowing return statements at module level."""
+        if self.tree is not None and not self.has_generator_syntax:
+            # Compile the already-parsed tree; this covers the common valid cases
+            # without tokenizing the code again. Module level returns are allowed,
+            # so scripts that contain one are compiled as a function body.
+            tree = self.tree
+            if self.return_nodes:
+                tree = ast.Module(body=[ast.FunctionDef(
+                    name='apiton_script',
+                    args=ast.arguments(posonlyargs=[], args=[], kwonlyargs=[], kw_defaults=[], defaults=[]),
+                    body=self.tree.body, decorator_list=[], returns=None,
+                    lineno=1, col_offset=0, end_lineno=len(self.lines), end_col_offset=0
+                )], type_ignores=[])
+            try:
+                compile(tree, '<apiton_script>', 'exec')
+                return []
+            except (SyntaxError, ValueError, TypeError):
+                pass
+
+        # Fall back to compiling the source for exact error messages
+        return _compile_apiton_source(self.code)
+
+
+def _compile_apiton_source(code: str) -> List[str]:
+    """Compile APIthon source and report syntax errors, allowing module level returns."""
+    errors = []
+
+    # APIthon allows return statements at module level, so we need special handling
+    try:
+        # First, try to compile as-is (this will fail if there are return statements at module level)
+        try:
+            compile(code, '<apiton_script>', 'exec')
+        except SyntaxError as e:
+            # Check if the error is due to return statement at module level
+            if "'return' outside function" in str(e):
+                # Wrap in a function to validate the rest of the syntax
+                wrapped_code = f"def apiton_script():\n"
+                indented_code = '\n'.join(f"    {line}" for line in code.split('\n'))
+                wrapped_code += indented_code
+
+                try:
+                    compile(wrapped_code, '<apiton_script_wrapped>', 'exec')
+                    # If this succeeds, the return statement is the only issue, which is allowed in APIthon
+                except SyntaxError as wrapped_e:
+                    # There are other syntax errors
+                    error_msg = str(wrapped_e)
+                    if hasattr(wrapped_e, 'lineno') and wrapped_e.lineno and wrapped_e.lineno > 1:
+                        # Adjust line numbers for the original code
+                        adjusted_lineno = wrapped_e.lineno - 1
+                        error_msg = error_msg.replace(f"line {wrapped_e.lineno}", f"line {adjusted_lineno}")
+                    errors.append(f"Script syntax error - {error_msg}")
+            else:
+                # Other syntax error
+                errors.append(f"Script syntax error - {str(e)}")
+
+    except Exception as e:
+        errors.append(f"Script compilation error - {str(e)}")
+
+    return errors
+
+
+_analysis_cache: "OrderedDict[str, APIthonAnalysis]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+
+def get_apiton_analysis(code: str) -> APIthonAnalysis:
+    """
+    Get the shared analysis of a script, parsing it only on first use.
+
+    Analyses are memoized by a hash of the code, so every validator that looks
+    at the same script shares one parse.
+
+    Args:
+        code: The APIthon script code
+
+    Returns:
+        APIthonAnalysis for the code
+    """
+    key = hashlib.blake2b(code.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+    with _analysis_cache_lock:
+        analysis = _analysis_cache.get(key)
+        if analysis is not None:
+            _analysis_cache.move_to_end(key)
+            return analysis
+
+    analysis = APIthonAnalysis(code)
+
+    with _analysis_cache_lock:
+        _analysis_cache[key] = analysis
+        if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+
+    return analysis
+
 
 def validate_apiton_code_restrictions(code: str) -> List[str]:
     """
@@ -108,50 +377,47 @@ def validate_apiton_code_restrictions(code: str) -> List[str]:
     if not code or not code.strip():
         return ["Script code cannot be empty"]
 
+    analysis = get_apiton_analysis(code)
+
     # Check for prohibited patterns using regex
-    for pattern, error_message in PROHIBITED_PATTERNS:
-        if re.search(pattern, code, re.MULTILINE):
-            error_set.add(error_message)
+    error_set.update(analysis.prohibited_pattern_messages)
 
     # Enhanced AST-based validation for comprehensive import detection
-    try:
-        tree = ast.parse(code)
-
-        # Check for prohibited AST node types with detailed import analysis
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                # Extract specific import names for detailed error messages
-                import_names = [alias.name for alias in node.names]
-                if len(import_names) == 1:
-                    error_set.add(f"Import statement 'import {import_names[0]}' is not allowed in APIthon")
-                else:
-                    error_set.add(f"Import statements 'import {', '.join(import_names)}' are not allowed in APIthon")
-
-            elif isinstance(node, ast.ImportFrom):
-                # Extract from...import details for specific error messages
-                module_name = node.module or "unknown"
-                import_names = [alias.name for alias in node.names]
-                if '*' in [alias.name for alias in node.names]:
-                    error_set.add(f"Wildcard import 'from {module_name} import *' is not allowed in APIthon")
-                elif len(import_names) == 1:
-                    error_set.add(f"Import statement 'from {module_name} import {import_names[0]}' is not allowed in APIthon")
-                else:
-                    error_set.add(f"Import statement 'from {module_name} import {', '.join(import_names)}' is not allowed in APIthon")
-
-            elif isinstance(node, ast.ClassDef):
-                error_set.add("Class definitions are not allowed in APIthon")
-            elif isinstance(node, ast.FunctionDef):
-                error_set.add("Function definitions are not allowed in APIthon")
-            elif isinstance(node, ast.AsyncFunctionDef):
-                error_set.add("Async function definitions are not allowed in APIthon")
-            elif isinstance(node, ast.Global):
-                error_set.add("Global statements are not allowed in APIthon")
-            elif isinstance(node, ast.Nonlocal):
-                error_set.add("Nonlocal statements are not allowed in APIthon")
-
-    except SyntaxError:
-        # Syntax errors will be caught by the main syntax validation
-        pass
+    # (syntax errors will be caught by the main syntax validation)
+    for node in analysis.restricted_nodes:
+        if isinstance(node, ast.Import):
+            # Extract specific import names for detailed error messages
+            import_names = [alias.name for alias in node.names]
+            if len(import_names) == 1:
+                error_set.add(f"Import statement 'import {import_names[0]}' is not allowed in APIthon")
+            else:
+                error_set.add(f"Import statements 'import {', '.join(import_names)}' are not allowed in APIthon")
+
+        elif isinstance(node, ast.ImportFrom):
+            # Extract from...import details for specific error messages
+            module_name = node.module or "unknown"
+            import_names = [alias.name for alias in node.names]
+            if '*' in [alias.name for alias in node.names]:
+                error_set.add(f"Wildcard import 'from {module_name} import *' is not allowed in APIthon")
+            elif len(import_names) == 1:
+                error_set.add(f"Import statement 'from {module_name} import {import_names[0]}' is not allowed in APIthon")
+            else:
+                error_set.add(f"Import statement 'from {module_name} import {', '.join(import_names)}' is not allowed in APIthon")
+
+        elif isinstance(node, ast.ClassDef):
+            error_set.add("Class definitions are not allowed in APIthon")
+        elif isinstance(node, ast.FunctionDef):
+            error_set.add("Function definitions are not allowed in APIthon")
+        elif isinstance(node, ast.AsyncFunctionDef):
+            error_set.add("Async function definitions are not allowed in APIthon")
+        elif isinstance(node, ast.Global):
+            error_set.add("Global statements are not allowed in APIthon")
+        elif isinstance(node, ast.Nonlocal):
+            error_set.add("Nonlocal statements are not allowed in APIthon")
+
+    for name, line in analysis.internal_attributes:
+        error_set.add(f"Attribute '{name}' (line {line}) reaches interpreter internals and is not allowed in APIthon; "
+                      f"use item access such as value['{name}'] for data fields")
 
     return list(error_set)
 
@@ -171,86 +437,52 @@ def detect_import_statements_comprehensive(code: str) -> List[Dict[str, str]]:
     if not code or not code.strip():
         return import_violations
 
-    # Enhanced regex patterns for specific import types
-    import_patterns = [
-        {
-            'pattern': r'\bimport\s+([\w\.]+)(?:\s+as\s+(\w+))?',
-            'type': 'simple_import',
-            'description': 'Simple import statement'
-        },
-        {
-            'pattern': r'\bfrom\s+([\w\.]+)\s+import\s+([\w\*]+)(?:\s+as\s+(\w+))?',
-            'type': 'from_import',
-            'description': 'From...import statement'
-        },
-        {
-            'pattern': r'\bfrom\s+([\w\.]+)\s+import\s+\*',
-            'type': 'wildcard_import',
-            'description': 'Wildcard import (from ... import *)'
-        },
-        {
-            'pattern': r'__import__\s*\(\s*["\']([^"\']+)["\']\s*\)',
-            'type': 'dynamic_import',
-            'description': 'Dynamic import with __import__()'
-        }
-    ]
+    analysis = get_apiton_analysis(code)
 
     # Check each pattern
-    for pattern_info in import_patterns:
-        matches = re.finditer(pattern_info['pattern'], code, re.MULTILINE)
-        for match in matches:
-            line_num = code[:match.start()].count('\n') + 1
-            matched_text = match.group(0)
-
-            violation = {
-                'type': pattern_info['type'],
-                'description': pattern_info['description'],
-                'line_number': line_num,
-                'matched_text': matched_text,
-                'error_message': f"Line {line_num}: {pattern_info['description']} '{matched_text}' is not allowed in APIthon",
-                'remediation': _get_import_remediation(pattern_info['type'], matched_text),
-                'educational_context': "APIthon runs in a sandboxed environment and doesn't support external module imports. Use built-in Python functions or data.* references instead."
-            }
-            import_violations.append(violation)
-
-    # AST-based detection for complex cases
-    try:
-        tree = ast.parse(code)
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.Import, ast.ImportFrom)):
-                line_num = getattr(node, 'lineno', 0)
-
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        violation = {
-                            'type': 'ast_import',
-                            'description': 'Import statement (AST detected)',
-                            'line_number': line_num,
-                            'matched_text': f"import {alias.name}" + (f" as {alias.asname}" if alias.asname else ""),
-                            'error_message': f"Line {line_num}: Import statement 'import {alias.name}' is not allowed in APIthon",
-                            'remediation': _get_import_remediation('simple_import', alias.name),
-                            'educational_context': "APIthon scripts cannot import external modules. Use built-in functions or process data using data.* references."
-                        }
-                        import_violations.append(violation)
-
-                elif isinstance(node, ast.ImportFrom):
-                    module_name = node.module or "unknown"
-                    for alias in node.names:
-                        import_text = f"from {module_name} import {alias.name}"
-                        violation = {
-                            'type': 'ast_from_import',
-                            'description': 'From...import statement (AST detected)',
-                            'line_number': line_num,
-                            'matched_text': import_text,
-                            'error_message': f"Line {line_num}: Import statement '{import_text}' is not allowed in APIthon",
-                            'remediation': _get_import_remediation('from_import', f"{module_name}.{alias.name}"),
-                            'educational_context': "APIthon cannot access external modules. Use built-in Python functions or data processing patterns instead."
-                        }
-                        import_violations.append(violation)
-
-    except SyntaxError:
-        # Syntax errors are handled elsewhere
-        pass
+    for pattern_info, line_num, matched_text in analysis.import_pattern_matches:
+        violation = {
+            'type': pattern_info['type'],
+            'description': pattern_info['description'],
+            'line_number': line_num,
+            'matched_text': matched_text,
+            'error_message': f"Line {line_num}: {pattern_info['description']} '{matched_text}' is not allowed in APIthon",
+            'remediation': _get_import_remediation(pattern_info['type'], matched_text),
+            'educational_context': "APIthon runs in a sandboxed environment and doesn't support external module imports. Use built-in Python functions or data.* references instead."
+        }
+        import_violations.append(violation)
+
+    # AST-based detection for complex cases (syntax errors are handled elsewhere)
+    for node in analysis.import_nodes:
+        line_num = getattr(node, 'lineno', 0)
+
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                violation = {
+                    'type': 'ast_import',
+                    'description': 'Import statement (AST detected)',
+                    'line_number': line_num,
+                    'matched_text': f"import {alias.name}" + (f" as {alias.asname}" if alias.asname else ""),
+                    'error_message': f"Line {line_num}: Import statement 'import {alias.name}' is not allowed in APIthon",
+                    'remediation': _get_import_remediation('simple_import', alias.name),
+                    'educational_context': "APIthon scripts cannot import external modules. Use built-in functions or process data using data.* references."
+                }
+                import_violations.append(violation)
+
+        elif isinstance(node, ast.ImportFrom):
+            module_name = node.module or "unknown"
+            for alias in node.names:
+                import_text = f"from {module_name} import {alias.name}"
+                violation = {
+                    'type': 'ast_from_import',
+                    'description': 'From...import statement (AST detected)',
+                    'line_number': line_num,
+                    'matched_text': import_text,
+                    'error_message': f"Line {line_num}: Import statement '{import_text}' is not allowed in APIthon",
+                    'remediation': _get_import_remediation('from_import', f"{module_name}.{alias.name}"),
+                    'educational_context': "APIthon cannot access external modules. Use built-in Python functions or data processing patterns instead."
+                }
+                import_violations.append(violation)
 
     return import_violations
 
@@ -308,43 +540,10 @@ def validate_apiton_syntax(code: str) -> List[str]:
     Returns:
         List of syntax validation error messages
     """
-    errors = []
-
     if not code or not code.strip():
         return ["Script code cannot be empty"]
 
-    # APIthon allows return statements at module level, so we need special handling
-    try:
-        # First, try to compile as-is (this will fail if there are return statements at module level)
-        try:
-            compile(code, '<apiton_script>', 'exec')
-        except SyntaxError as e:
-            # Check if the error is due to return statement at module level
-            if "'return' outside function" in str(e):
-                # Wrap in a function to validate the rest of the syntax
-                wrapped_code = f"def apiton_script():\n"
-                indented_code = '\n'.join(f"    {line}" for line in code.split('\n'))
-                wrapped_code += indented_code
-
-                try:
-                    compile(wrapped_code, '<apiton_script_wrapped>', 'exec')
-                    # If this succeeds, the return statement is the only issue, which is allowed in APIthon
-                except SyntaxError as wrapped_e:
-                    # There are other syntax errors
-                    error_msg = str(wrapped_e)
-                    if hasattr(wrapped_e, 'lineno') and wrapped_e.lineno and wrapped_e.lineno > 1:
-                        # Adjust line numbers for the original code
-                        adjusted_lineno = wrapped_e.lineno - 1
-                        error_msg = error_msg.replace(f"line {wrapped_e.lineno}", f"line {adjusted_lineno}")
-                    errors.append(f"Script syntax error - {error_msg}")
-            else:
-                # Other syntax error
-                errors.append(f"Script syntax error - {str(e)}")
-
-    except Exception as e:
-        errors.append(f"Script compilation error - {str(e)}")
-
-    return errors
+    return list(get_apiton_analysis(code).syntax_errors)
 
 
 def validate_apiton_data_references(code: str, available_data_paths: Set[str] = None) -> List[str]:
@@ -364,15 +563,7 @@ def validate_apiton_data_references(code: str, available_data_paths: Set[str] =
         return errors
 
     # Find data reference patterns
-    data_patterns = [
-        r'\bdata\.[\w\.]+',
-        r'\bmeta_info\.[\w\.]+',
-    ]
-
-    found_references = set()
-    for pattern in data_patterns:
-        matches = re.findall(pattern, code)
-        found_references.update(matches)
+    found_references = get_apiton_analysis(code).data_references
 
     # Validate each reference if we have available paths
     if available_data_paths:
@@ -0,0 +1,181 @@
+"""
+Batch Validation for the Moveworks YAML Assistant.
+
+This module validates many saved workflow files headlessly, spreading the work
+across worker processes. Each file is loaded, checked with comprehensive_validate
+and the ComplianceValidator, and reported as a BatchValidationResult as soon as
+it completes. It backs the `validate-batch` CLI command used by CI gates.
+"""
+
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core_structures import Workflow, DataContext
+
+
+# File extensions picked up when a directory is given
+WORKFLOW_FILE_EXTENSIONS = ('.json', '.yaml', '.yml')
+
+
+@dataclass
+class BatchValidationResult:
+    """Validation outcome for a single workflow file."""
+    path: str
+    valid: bool
+    step_count: int = 0
+    errors: List[str] = field(default_factory=list)
+    compliance_errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    load_error: Optional[str] = None
+    elapsed_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to a JSON-serializable dictionary."""
+        return asdict(self)
+
+    def to_json_line(self) -> str:
+        """Serialize the result as a single JSON line."""
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+
+def expand_workflow_paths(patterns: Iterable[str]) -> List[str]:
+    """
+    Expand glob patterns and directories into a sorted list of workflow files.
+
+    Args:
+        patterns: Glob patterns (recursive ``**`` supported), file paths or directories
+
+    Returns:
+        Sorted list of unique file paths
+    """
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, _, files in os.walk(pattern):
+                for name in files:
+                    if name.lower().endswith(WORKFLOW_FILE_EXTENSIONS):
+                        paths.add(os.path.join(root, name))
+            continue
+
+        matches = glob.glob(pattern, recursive=True)
+        if not matches and os.path.isfile(pattern):
+            matches = [pattern]
+        paths.update(match for match in matches if os.path.isfile(match))
+
+    return sorted(paths)
+
+
+def load_workflow_file(path: str) -> Tuple[Workflow, Optional[str]]:
+    """
+    Load a workflow file.
+
+    JSON files use the saved workflow format (see workflow_serializer); .yaml/.yml files are compound
+    action YAML and are parsed with yaml_parser.
+
+    Args:
+        path: Path to the workflow file
+
+    Returns:
+        Tuple of (workflow, action_name); action_name is None when the file
+        does not define one
+
+    Raises:
+        ValueError: If the file does not contain a valid workflow
+    """
+    if path.lower().endswith(('.yaml', '.yml')):
+        from yaml_parser import load_compound_action_file
+        parsed = load_compound_action_file(path)
+        return parsed.workflow, parsed.action_name
+
+    from workflow_serializer import load_workflow
+    return load_workflow(path), None
+
+
+def validate_workflow_file(path: str, action_name: str = None) -> BatchValidationResult:
+    """
+    Load and validate a single workflow file.
+
+    This is a module-level function so it can run in worker processes.
+
+    Args:
+        path: Path to the workflow file
+        action_name: Optional compound action name for compliance validation;
+            defaults to the action_name in the file, then the file name
+
+    Returns:
+        BatchValidationResult for the file
+    """
+    from validator import comprehensive_validate
+    from compliance_validator import compliance_validator
+
+    start = time.perf_counter()
+
+    try:
+        workflow, file_action_name = load_workflow_file(path)
+    except Exception as e:
+        return BatchValidationResult(
+            path=path,
+            valid=False,
+            load_error=f"{type(e).__name__}: {e}",
+            elapsed_ms=(time.perf_counter() - start) * 1000
+        )
+
+    if action_name is None:
+        action_name = file_action_name or os.path.splitext(os.path.basename(path))[0]
+
+    errors = comprehensive_validate(workflow, DataContext())
+    compliance = compliance_validator.validate_workflow_compliance(workflow, action_name)
+    compliance_errors = (
+        compliance.errors + compliance.mandatory_field_errors +
+        compliance.field_naming_errors + compliance.apiton_errors
+    )
+
+    return BatchValidationResult(
+        path=path,
+        valid=not errors and compliance.is_valid,
+        step_count=len(workflow.steps),
+        errors=errors,
+        compliance_errors=compliance_errors,
+        warnings=list(compliance.warnings),
+        elapsed_ms=(time.perf_counter() - start) * 1000
+    )
+
+
+def iter_batch_validation(paths: List[str], workers: Optional[int] = None,
+                          action_name: str = None) -> Iterator[BatchValidationResult]:
+    """
+    Validate workflow files in parallel, yielding results as they complete.
+
+    Args:
+        paths: Workflow file paths to validate
+        workers: Number of worker processes; None uses the CPU count and
+            1 validates in the current process
+        action_name: Optional compound action name applied to every file
+
+    Yields:
+        BatchValidationResult for each file, in completion order
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield validate_workflow_file(path, action_name)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        futures = {executor.submit(validate_workflow_file, path, action_name): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                yield BatchValidationResult(
+                    path=futures[future],
+                    valid=False,
+                    load_error=f"{type(e).__name__}: {e}"
+                )
@@ -390,7 +390,7 @@ class BenderFunctionBuilder(QWidget):
             return
         
         # Validate using DSL validator
-        result = dsl_validator.validate_expression(expression)
+        result = dsl_validator.validate_dsl_expression(expression)
         
         if result.is_valid:
             self.validation_status.setText("✓ Expression is valid")
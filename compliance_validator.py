@@ -69,13 +69,17 @@ class ComplianceValidator:
             'data', 'input', 'output', 'error', 'requestor', 'mw', 'meta_info', 'user'
         }
     
-    def validate_workflow_compliance(self, workflow: Workflow, action_name: str = None) -> ComplianceValidationResult:
+    def validate_workflow_compliance(self, workflow: Workflow, action_name: str = None,
+                                     step_results: List[ComplianceValidationResult] = None) -> ComplianceValidationResult:
         """
         Perform comprehensive compliance validation on a workflow.
         
         Args:
             workflow: The Workflow instance to validate
             action_name: Optional action name for compound action validation
+            step_results: Optional precomputed per-step results (one per top-level
+                step, as returned by validate_step_compliance) to merge instead of
+                re-validating each step
             
         Returns:
             ComplianceValidationResult with detailed validation feedback
@@ -88,7 +92,10 @@ class ComplianceValidator:
         # Validate each step
         for i, step in enumerate(workflow.steps):
             step_num = i + 1
-            self._validate_step_compliance(step, step_num, result)
+            if step_results is not None:
+                self._merge_step_result(step_results[i], result)
+            else:
+                self._validate_step_compliance(step, step_num, result)
 
         # Validate output_key uniqueness across the entire workflow
         self.validate_output_key_uniqueness(workflow, result)
@@ -103,6 +110,58 @@ class ComplianceValidator:
         
         return result
     
+    def validate_step_compliance(self, step: Any, step_num: int) -> ComplianceValidationResult:
+        """
+        Validate a single top-level step in isolation.
+
+        Workflow-wide checks (compound action structure and output_key
+        uniqueness) are not included; see validate_workflow_compliance.
+
+        Args:
+            step: The step to validate
+            step_num: 1-based position of the step, used in messages
+
+        Returns:
+            ComplianceValidationResult containing only this step's findings
+        """
+        result = ComplianceValidationResult()
+        self._validate_step_compliance(step, step_num, result)
+        return result
+
+    def validate_mandatory_fields(self, workflow: Workflow, action_name: str = None) -> ComplianceValidationResult:
+        """
+        Run only the mandatory-field checks of validate_workflow_compliance.
+
+        This covers the compound action structure, per-step mandatory fields
+        and output_key uniqueness, and skips naming, catalog and APIthon checks.
+        It is cheap enough to run on every edit, e.g. before a YAML preview.
+
+        Args:
+            workflow: The Workflow instance to validate
+            action_name: Optional action name for compound action validation
+
+        Returns:
+            ComplianceValidationResult with mandatory_field_errors populated
+        """
+        result = ComplianceValidationResult()
+        self._validate_compound_action_structure(workflow, action_name, result)
+
+        for step_num, step in enumerate(workflow.steps, 1):
+            self._validate_mandatory_fields(step, type(step).__name__, step_num, result, check_format=False)
+
+        self.validate_output_key_uniqueness(workflow, result)
+        result.is_valid = not result.mandatory_field_errors
+        return result
+
+    def _merge_step_result(self, step_result: ComplianceValidationResult, result: ComplianceValidationResult):
+        """Append the findings of a single-step result to a workflow result."""
+        result.errors.extend(step_result.errors)
+        result.warnings.extend(step_result.warnings)
+        result.suggestions.extend(step_result.suggestions)
+        result.mandatory_field_errors.extend(step_result.mandatory_field_errors)
+        result.field_naming_errors.extend(step_result.field_naming_errors)
+        result.apiton_errors.extend(step_result.apiton_errors)
+
     def _validate_compound_action_structure(self, workflow: Workflow, action_name: str, result: ComplianceValidationResult):
         """Validate compound action structure compliance."""
         # Validate action_name is provided and not empty
@@ -127,7 +186,8 @@ class ComplianceValidator:
         if isinstance(step, ScriptStep):
             self._validate_apiton_compliance(step, step_num, result)
     
-    def _validate_mandatory_fields(self, step: Any, step_type: str, step_num: int, result: ComplianceValidationResult):
+    def _validate_mandatory_fields(self, step: Any, step_type: str, step_num: int, result: ComplianceValidationResult,
+                                   check_format: bool = True):
         """Validate that all mandatory fields are present and non-empty."""
         mandatory_fields = self.mandatory_fields.get(step_type, [])
 
@@ -135,7 +195,7 @@ class ComplianceValidator:
         self._validate_output_key_requirements(step, step_type, step_num, result)
 
         # Enhanced action_name validation based on context
-        self._validate_action_name_requirements(step, step_type, step_num, result)
+        self._validate_action_name_requirements(step, step_type, step_num, result, check_format)
         
         for field_name in mandatory_fields:
             if not hasattr(step, field_name):
@@ -327,7 +387,8 @@ class ComplianceValidator:
                     f"Duplicate output_key '{output_key}' found in: {', '.join(step_descriptions)}"
                 )
 
-    def _validate_action_name_requirements(self, step: Any, step_type: str, step_num: int, result: ComplianceValidationResult):
+    def _validate_action_name_requirements(self, step: Any, step_type: str, step_num: int, result: ComplianceValidationResult,
+                                           check_format: bool = True):
         """Validate action_name requirements based on step type and context."""
         requirement = self.action_name_requirements.get(step_type, 'not_applicable')
 
@@ -337,7 +398,7 @@ class ComplianceValidator:
                 result.mandatory_field_errors.append(
                     f"Step {step_num} ({step_type}): action_name is required for {step_type}"
                 )
-            else:
+            elif check_format:
                 # Validate action_name format and content
                 self._validate_action_name_format(step.action_name, step_type, step_num, result)
 
@@ -371,18 +432,14 @@ class ComplianceValidator:
     def _validate_action_name_catalog(self, action_name: str, step_type: str, step_num: int, result: ComplianceValidationResult):
         """Validate action_name against Moveworks Actions Catalog."""
         try:
-            from mw_actions_catalog import MW_ACTIONS_CATALOG
-
-            # Get list of known action names
-            known_actions = [action.action_name for action in MW_ACTIONS_CATALOG]
+            from mw_actions_catalog import catalog_index
 
             # Check if it's a known action
-            if action_name not in known_actions:
+            if action_name not in catalog_index:
                 # Check for similar actions (typo detection)
-                similar_actions = [action for action in known_actions if action_name.lower() in action.lower()]
+                suggestions = catalog_index.names_containing(action_name, limit=3)  # Top 3 suggestions
 
-                if similar_actions:
-                    suggestions = similar_actions[:3]  # Top 3 suggestions
+                if suggestions:
                     result.warnings.append(
                         f"Step {step_num} ({step_type}): action_name '{action_name}' not found in catalog. Did you mean: {', '.join(suggestions)}?"
                     )
@@ -391,7 +448,7 @@ class ComplianceValidator:
                         f"Step {step_num} ({step_type}): action_name '{action_name}' not found in Moveworks catalog. Verify the action name is correct."
                     )
         except ImportError:
-            # MW_ACTIONS_CATALOG not available, skip catalog validation
+            # Actions catalog not available, skip catalog validation
             pass
 
     def _validate_script_code_field(self, step: ScriptStep, step_num: int, result: ComplianceValidationResult):
@@ -3,17 +3,47 @@ Comprehensive Documentation Generator for the Enhanced Moveworks YAML Assistant.
 
 This module generates complete documentation including user manuals, API references,
 tutorials, and help content in multiple formats (HTML, PDF, Markdown).
+
+Builds are incremental. Each topic page is keyed by a hash of its HelpTopic
+(plus the renderer version), and the keys of the last build are kept in a
+manifest in the output directory. Pages whose key is unchanged are neither
+rendered nor rewritten; the remaining topic pages are rendered in a process
+pool. Shared pages (indexes, assets, search index) are cheap to render and
+are only rewritten when their content changes. Pages left over from removed
+topics are deleted. Page content never includes the build time, which is
+recorded in the manifest instead, so rebuilding unchanged inputs on another
+day rewrites nothing.
 """
 
-import os
+import hashlib
 import json
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
 
-from help_system import help_system, HelpTopic, HelpSection
-from tutorials import UnifiedTutorialManager
+from help_system import help_system, HelpTopic, HelpSection, topic_search_document, HELP_SEARCH_FIELD_WEIGHTS
+from search_index import SearchIndex
+
+try:
+    from tutorials import UnifiedTutorialManager
+except ImportError:
+    # Documentation can be built without the GUI toolkit (e.g. in CI)
+    UnifiedTutorialManager = None
+
+
+# Bump when topic page rendering changes, so cached pages are rebuilt
+DOC_RENDERER_VERSION = 1
+
+# Build manifest written to the output directory
+DOC_BUILD_MANIFEST = ".doc-build-manifest.json"
+
+# Below this many pages, rendering in-process is faster than starting a pool
+MIN_PARALLEL_PAGES = 8
 
 
 @dataclass
@@ -26,12 +56,47 @@ class DocumentationConfig:
     include_examples: bool = True
     theme: str = "modern"
     version: str = "2.0"
+    release_date: Optional[str] = None  # shown on the index pages; the build time is only kept in the manifest
+    incremental: bool = True  # skip pages whose inputs are unchanged since the last build
+    max_workers: Optional[int] = None  # rendering processes; None uses os.cpu_count()
     
     def __post_init__(self):
         if self.formats is None:
             self.formats = ["html", "markdown"]
 
 
+@dataclass(frozen=True)
+class DocumentationPage:
+    """
+    A page rendered from a single help topic.
+
+    Attributes:
+        path: Output path relative to the output directory (POSIX separators)
+        format: "html" or "markdown"
+        topic: The topic to render
+        related: Titles of the topic's related topics that exist
+    """
+    path: str
+    format: str
+    topic: HelpTopic
+    related: Tuple[str, ...] = ()
+
+    def cache_key(self) -> str:
+        """Hash of everything the rendered page depends on."""
+        payload = json.dumps([DOC_RENDERER_VERSION, self.format, asdict(self.topic), self.related],
+                             sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass
+class DocumentationBuild:
+    """Outcome of a documentation build (paths relative to the output directory)."""
+    rendered: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    written: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+
 class ComprehensiveDocumentationGenerator:
     """
     Generates comprehensive documentation for all application features.
@@ -50,6 +115,9 @@ class ComprehensiveDocumentationGenerator:
         self.config = config or DocumentationConfig()
         self.output_path = Path(self.config.output_dir)
         self.templates = self._load_templates()
+        self.last_build = DocumentationBuild()
+        self._previous_manifest: Dict[str, str] = {}
+        self._manifest: Dict[str, str] = {}
     
     def generate_complete_documentation(self) -> bool:
         """Generate complete documentation suite."""
@@ -58,6 +126,9 @@ class ComprehensiveDocumentationGenerator:
             
             # Create output directory
             self.output_path.mkdir(exist_ok=True)
+            self.last_build = DocumentationBuild()
+            self._previous_manifest = self._load_manifest() if self.config.incremental else {}
+            self._manifest = {}
             
             # Generate different formats
             for format_type in self.config.formats:
@@ -73,7 +144,12 @@ class ComprehensiveDocumentationGenerator:
             # Generate additional resources
             self._generate_search_index()
             self._copy_assets()
+            self._remove_stale_pages()
+            self._save_manifest()
             
+            build = self.last_build
+            print(f"📝 {len(build.rendered)} topic pages rendered, {len(build.skipped)} unchanged, "
+                  f"{len(build.written)} files written, {len(build.removed)} removed")
             print("✅ Documentation generation completed successfully!")
             return True
             
@@ -95,12 +171,7 @@ class ComprehensiveDocumentationGenerator:
             self._generate_html_section(html_dir, section)
         
         # Generate individual topic pages
-        for topic_title, topic in help_system.topics.items():
-            self._generate_html_topic(html_dir, topic)
-        
-        # Generate tutorial pages
-        if self.config.include_tutorials and tutorial_system:
-            self._generate_html_tutorials(html_dir)
+        self._generate_topic_pages("html", "html", ".html")
         
         # Copy CSS and JavaScript
         self._generate_html_assets(html_dir)
@@ -150,7 +221,7 @@ class ComprehensiveDocumentationGenerator:
             <header class="page-header">
                 <h1>🚀 Enhanced Moveworks YAML Assistant</h1>
                 <p class="subtitle">Complete Documentation & User Guide</p>
-                <div class="version-info">Version {self.config.version} • Updated {datetime.now().strftime('%B %d, %Y')}</div>
+                <div class="version-info">{self._version_line(" • Updated ")}</div>
             </header>
             
             <section class="hero-section">
@@ -237,7 +308,7 @@ class ComprehensiveDocumentationGenerator:
     
     <footer class="footer">
         <div class="footer-content">
-            <p>&copy; 2024 Enhanced Moveworks YAML Assistant. Documentation generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p>&copy; 2024 Enhanced Moveworks YAML Assistant. Documentation {self._version_line(", released ")}</p>
         </div>
     </footer>
     
@@ -248,9 +319,15 @@ class ComprehensiveDocumentationGenerator:
 </html>
         """.strip()
         
-        with open(html_dir / "index.html", "w", encoding="utf-8") as f:
-            f.write(content)
+        self._write_output(html_dir / "index.html", content)
     
+    def _version_line(self, date_separator: str) -> str:
+        """The documentation version, followed by the configured release date if any."""
+        line = f"Version {self.config.version}"
+        if self.config.release_date:
+            line += f"{date_separator}{self.config.release_date}"
+        return line
+
     def _generate_navigation_menu(self) -> str:
         """Generate the navigation menu HTML."""
         menu_html = ""
@@ -284,76 +361,6 @@ class ComprehensiveDocumentationGenerator:
         
         return menu_html
     
-    def _generate_html_topic(self, html_dir: Path, topic: HelpTopic):
-        """Generate HTML page for a specific topic."""
-        content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{topic.title} - Moveworks YAML Assistant Documentation</title>
-    <link rel="stylesheet" href="assets/style.css">
-    <link rel="stylesheet" href="assets/prism.css">
-</head>
-<body>
-    <nav class="navbar">
-        <div class="nav-container">
-            <a href="index.html" class="nav-title">📋 Moveworks YAML Assistant</a>
-            <div class="nav-breadcrumb">
-                <a href="index.html">Home</a> → 
-                <a href="{self._slugify(topic.category)}.html">{topic.category}</a> → 
-                {topic.title}
-            </div>
-        </div>
-    </nav>
-    
-    <div class="container">
-        <aside class="sidebar">
-            <div class="sidebar-content">
-                <a href="index.html" class="back-link">← Back to Home</a>
-                
-                <div class="topic-meta">
-                    <h4>Topic Information</h4>
-                    <p><strong>Category:</strong> {topic.category}</p>
-                    <p><strong>Difficulty:</strong> {topic.difficulty}</p>
-                    <p><strong>Time:</strong> {topic.estimated_time}</p>
-                    {f'<p><strong>Prerequisites:</strong> {", ".join(topic.prerequisites)}</p>' if topic.prerequisites else ''}
-                </div>
-                
-                {self._generate_related_topics_html(topic)}
-            </div>
-        </aside>
-        
-        <main class="main-content">
-            <article class="topic-content">
-                <header class="topic-header">
-                    <h1>{topic.title}</h1>
-                    <div class="topic-badges">
-                        <span class="badge badge-{topic.difficulty.lower()}">{topic.difficulty}</span>
-                        <span class="badge badge-category">{topic.category}</span>
-                    </div>
-                </header>
-                
-                <div class="topic-body">
-                    {self._convert_content_to_html(topic.content)}
-                </div>
-                
-                {self._generate_topic_examples_html(topic)}
-            </article>
-        </main>
-    </div>
-    
-    <script src="assets/prism.js"></script>
-    <script src="assets/main.js"></script>
-</body>
-</html>
-        """.strip()
-        
-        filename = f"{self._slugify(topic.title)}.html"
-        with open(html_dir / filename, "w", encoding="utf-8") as f:
-            f.write(content)
-    
     def _generate_markdown_documentation(self):
         """Generate Markdown documentation."""
         md_dir = self.output_path / "markdown"
@@ -368,8 +375,7 @@ class ComprehensiveDocumentationGenerator:
             self._generate_markdown_section(md_dir, section)
         
         # Generate topic files
-        for topic_title, topic in help_system.topics.items():
-            self._generate_markdown_topic(md_dir, topic)
+        self._generate_topic_pages("markdown", "markdown", ".md")
     
     def _generate_markdown_readme(self, md_dir: Path):
         """Generate the main README.md file."""
@@ -424,17 +430,14 @@ This documentation is available in multiple formats:
 - **Markdown** - GitHub-compatible markdown files
 - **PDF** - Printable documentation (if configured)
 
-## 🆕 Version {self.config.version}
-
-Generated on {datetime.now().strftime('%B %d, %Y')}
+## 🆕 {self._version_line(" • Released ")}
 
 ---
 
 For the latest updates and support, visit the application's Help menu or check the interactive tutorials.
 """
         
-        with open(md_dir / "README.md", "w", encoding="utf-8") as f:
-            f.write(content)
+        self._write_output(md_dir / "README.md", content)
     
     def _generate_markdown_toc(self) -> str:
         """Generate table of contents for markdown."""
@@ -622,8 +625,7 @@ code {
 }
         """.strip()
         
-        with open(assets_dir / "style.css", "w", encoding="utf-8") as f:
-            f.write(css_content)
+        self._write_output(assets_dir / "style.css", css_content)
         
         # Generate search JavaScript
         js_content = """
@@ -656,21 +658,73 @@ class DocumentationSearch {
         try {
             const response = await fetch('search-index.json');
             this.searchIndex = await response.json();
+            this.sortedTerms = Object.keys(this.searchIndex.terms).sort();
+            const lengths = this.searchIndex.documents.map(doc => doc.length);
+            this.averageLength = lengths.reduce((a, b) => a + b, 0) / (lengths.length || 1) || 1;
         } catch (error) {
             console.warn('Search index not available:', error);
         }
     }
     
+    // Same tokenization as search_index.tokenize
+    tokenize(text) {
+        const normalize = token =>
+            token.length > 3 && token.endsWith('s') && !token.endsWith('ss') ? token.slice(0, -1) : token;
+        const terms = [];
+        for (const token of text.toLowerCase().match(/[a-z0-9]+(?:_[a-z0-9]+)*/g) || []) {
+            terms.push(normalize(token));
+            if (token.includes('_')) {
+                token.split('_').filter(part => part).forEach(part => terms.push(normalize(part)));
+            }
+        }
+        return [...new Set(terms)];
+    }
+    
+    expandTerm(term, prefix) {
+        if (!prefix) return term in this.searchIndex.terms ? [term] : [];
+        let low = 0, high = this.sortedTerms.length;
+        while (low < high) {
+            const mid = (low + high) >> 1;
+            if (this.sortedTerms[mid] < term) low = mid + 1; else high = mid;
+        }
+        const matches = [];
+        for (let i = low; i < this.sortedTerms.length && this.sortedTerms[i].startsWith(term); i++) {
+            matches.push(this.sortedTerms[i]);
+        }
+        return matches;
+    }
+    
+    // BM25 ranking; every query term must match and the last one may be a prefix
     performSearch(query) {
-        if (query.length < 2) return;
+        if (query.length < 2 || !this.searchIndex.terms) return;
         
-        const results = this.searchIndex.filter(item => 
-            item.title.toLowerCase().includes(query.toLowerCase()) ||
-            item.content.toLowerCase().includes(query.toLowerCase()) ||
-            item.keywords.some(keyword => 
-                keyword.toLowerCase().includes(query.toLowerCase())
-            )
-        );
+        const { k1, b } = this.searchIndex.bm25;
+        const documents = this.searchIndex.documents;
+        const queryTerms = this.tokenize(query);
+        const scores = new Map();
+        const matched = new Map();
+        
+        queryTerms.forEach((queryTerm, position) => {
+            const best = new Map();
+            for (const term of this.expandTerm(queryTerm, position === queryTerms.length - 1)) {
+                const postings = this.searchIndex.terms[term];
+                const idf = Math.log(1 + (documents.length - postings.length + 0.5) / (postings.length + 0.5));
+                for (const [doc, frequency] of postings) {
+                    const norm = k1 * (1 - b + b * documents[doc].length / this.averageLength);
+                    const score = idf * frequency * (k1 + 1) / (frequency + norm);
+                    if (score > (best.get(doc) || 0)) best.set(doc, score);
+                }
+            }
+            best.forEach((score, doc) => {
+                scores.set(doc, (scores.get(doc) || 0) + score);
+                matched.set(doc, (matched.get(doc) || 0) + 1);
+            });
+        });
+        
+        const results = [...scores.entries()]
+            .filter(([doc]) => matched.get(doc) === queryTerms.length)
+            .sort((x, y) => y[1] - x[1])
+            .map(([doc, score]) => ({ ...documents[doc], score }));
         
         this.displaySearchResults(results);
     }
@@ -687,80 +741,168 @@ document.addEventListener('DOMContentLoaded', () => {
 });
         """.strip()
         
-        with open(assets_dir / "search.js", "w", encoding="utf-8") as f:
-            f.write(js_content)
+        self._write_output(assets_dir / "search.js", js_content)
     
-    def _generate_search_index(self):
-        """Generate search index for documentation."""
-        search_index = []
+    def _generate_topic_pages(self, format_type: str, subdir: str, extension: str):
+        """Render the topic pages of one format, skipping pages whose topic is unchanged."""
+        pages = [
+            DocumentationPage(
+                path=f"{subdir}/{slugify(topic.title)}{extension}",
+                format=format_type,
+                topic=topic,
+                related=tuple(title for title in topic.related_topics if help_system.get_topic(title))
+            )
+            for topic in help_system.topics.values()
+        ]
+
+        pending = []
+        for page in pages:
+            key = page.cache_key()
+            if self._is_current(page.path, key):
+                self._manifest[page.path] = key
+                self.last_build.skipped.append(page.path)
+            else:
+                pending.append((page, key))
+
+        contents = self._render_pages([page for page, _ in pending])
+        for (page, key), content in zip(pending, contents):
+            self._write_output(self.output_path / page.path, content, key)
+            self.last_build.rendered.append(page.path)
+
+    def _render_pages(self, pages: List[DocumentationPage]) -> List[str]:
+        """Render pages in a process pool (in-process for small batches)."""
+        workers = self.config.max_workers or os.cpu_count() or 1
+        if workers > 1 and len(pages) >= MIN_PARALLEL_PAGES:
+            try:
+                with ProcessPoolExecutor(max_workers=min(workers, len(pages))) as executor:
+                    return list(executor.map(render_page, pages, chunksize=max(1, len(pages) // (workers * 4))))
+            except (OSError, NotImplementedError, BrokenProcessPool) as e:
+                print(f"⚠️ Parallel rendering unavailable ({e}); rendering serially")
+        return [render_page(page) for page in pages]
+
+    def _is_current(self, relative_path: str, key: str) -> bool:
+        """Whether the last build wrote this page from the same inputs."""
+        return (self._previous_manifest.get(relative_path) == key
+                and (self.output_path / relative_path).is_file())
+
+    def _write_output(self, path: Path, content: str, key: Optional[str] = None):
+        """
+        Write a generated file unless the last build already wrote it.
+
+        Args:
+            path: File to write
+            content: File content
+            key: Cache key of the file's inputs; defaults to a hash of the content
+        """
+        relative_path = path.relative_to(self.output_path).as_posix()
+        if key is None:
+            key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+        self._manifest[relative_path] = key
+        if self._is_current(relative_path, key):
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        self.last_build.written.append(relative_path)
+
+    def _load_manifest(self) -> Dict[str, str]:
+        """Read the page keys of the last build."""
+        try:
+            with open(self.output_path / DOC_BUILD_MANIFEST, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("renderer_version") != DOC_RENDERER_VERSION:
+            return {}
+        pages = data.get("pages")
+        return pages if isinstance(pages, dict) else {}
+
+    def _save_manifest(self):
+        """Write the page keys of this build."""
+        with open(self.output_path / DOC_BUILD_MANIFEST, "w", encoding="utf-8") as f:
+            json.dump({
+                "renderer_version": DOC_RENDERER_VERSION,
+                "generated": datetime.now().isoformat(timespec="seconds"),
+                "pages": dict(sorted(self._manifest.items()))
+            }, f, indent=2)
+
+    def _remove_stale_pages(self):
+        """Delete pages written by the last build that this build no longer produces."""
+        for relative_path in self._previous_manifest:
+            if relative_path in self._manifest:
+                continue
+            path = self.output_path / relative_path
+            if path.is_file():
+                path.unlink()
+                self.last_build.removed.append(relative_path)
+
+    def _generate_html_section(self, html_dir: Path, section: HelpSection):
+        """Generate the HTML page listing a section's topics."""
+        items = "\n".join(
+            f'                    <li><a href="{slugify(topic.title)}.html">{topic.title}</a></li>'
+            for topic in help_system.get_section_topics(section.title)
+        )
+        content = f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{section.title} - Moveworks YAML Assistant Documentation</title>
+    <link rel="stylesheet" href="assets/style.css">
+</head>
+<body>
+    <nav class="navbar">
+        <div class="nav-container">
+            <a href="index.html" class="nav-title">📋 Moveworks YAML Assistant</a>
+        </div>
+    </nav>
+    
+    <div class="container">
+        <main class="main-content">
+            <article class="topic-content">
+                <h1>{section.icon} {section.title}</h1>
+                <p>{section.description}</p>
+                <ul class="section-topics">
+{items}
+                </ul>
+            </article>
+        </main>
+    </div>
+</body>
+</html>
+        """.strip()
         
-        for topic_title, topic in help_system.topics.items():
-            search_index.append({
+        self._write_output(html_dir / f"{slugify(section.title)}.html", content)
+    
+    def _generate_markdown_section(self, md_dir: Path, section: HelpSection):
+        """Generate the Markdown page listing a section's topics."""
+        lines = [f"# {section.icon} {section.title}", "", section.description, ""]
+        for topic in help_system.get_section_topics(section.title):
+            lines.append(f"- [{topic.title}]({slugify(topic.title)}.md)")
+        
+        self._write_output(md_dir / f"{slugify(section.title)}.md", "\n".join(lines) + "\n")
+    
+    def _generate_search_index(self):
+        """Generate the BM25 search index (covering each topic's full content) for the HTML documentation."""
+        documents = [
+            topic_search_document(topic, {
                 "title": topic.title,
                 "category": topic.category,
-                "content": topic.content[:500],  # First 500 chars
-                "keywords": topic.keywords,
+                "summary": topic.content.strip()[:200],
                 "url": f"{self._slugify(topic.title)}.html",
                 "difficulty": topic.difficulty
             })
+            for topic in help_system.topics.values()
+        ]
         
         # Save search index
-        with open(self.output_path / "html" / "search-index.json", "w", encoding="utf-8") as f:
-            json.dump(search_index, f, indent=2)
+        index = SearchIndex.build(documents, HELP_SEARCH_FIELD_WEIGHTS)
+        self._write_output(self.output_path / "html" / "search-index.json",
+                           json.dumps(index.to_dict(), separators=(",", ":")))
     
     def _slugify(self, text: str) -> str:
         """Convert text to URL-friendly slug."""
-        import re
-        text = text.lower()
-        text = re.sub(r'[^\w\s-]', '', text)
-        text = re.sub(r'[-\s]+', '-', text)
-        return text.strip('-')
-    
-    def _convert_content_to_html(self, content: str) -> str:
-        """Convert markdown-like content to HTML."""
-        # Basic markdown conversions
-        content = content.replace('\n# ', '\n<h1>')
-        content = content.replace('\n## ', '\n<h2>')
-        content = content.replace('\n### ', '\n<h3>')
-        content = content.replace('\n\n', '</p><p>')
-        
-        # Code blocks
-        content = content.replace('```yaml\n', '<pre><code class="language-yaml">')
-        content = content.replace('```python\n', '<pre><code class="language-python">')
-        content = content.replace('```json\n', '<pre><code class="language-json">')
-        content = content.replace('```\n', '</code></pre>')
-        
-        # Wrap in paragraph tags
-        if not content.startswith('<'):
-            content = f'<p>{content}</p>'
-        
-        return content
-    
-    def _generate_related_topics_html(self, topic: HelpTopic) -> str:
-        """Generate HTML for related topics."""
-        if not topic.related_topics:
-            return ""
-        
-        html = '<div class="related-topics"><h4>Related Topics</h4><ul>'
-        for related_title in topic.related_topics:
-            related_topic = help_system.get_topic(related_title)
-            if related_topic:
-                html += f'<li><a href="{self._slugify(related_title)}.html">{related_title}</a></li>'
-        html += '</ul></div>'
-        
-        return html
-    
-    def _generate_topic_examples_html(self, topic: HelpTopic) -> str:
-        """Generate HTML for topic examples."""
-        if not topic.examples:
-            return ""
-        
-        html = '<div class="topic-examples"><h3>Examples</h3>'
-        for example in topic.examples:
-            html += f'<div class="example-block"><pre><code>{example}</code></pre></div>'
-        html += '</div>'
-        
-        return html
+        return slugify(text)
     
     def _load_templates(self) -> Dict[str, str]:
         """Load documentation templates."""
@@ -776,6 +918,158 @@ document.addEventListener('DOMContentLoaded', () => {
         pass
 
 
+def slugify(text: str) -> str:
+    """Convert text to URL-friendly slug."""
+    text = text.lower()
+    text = re.sub(r'[^\w\s-]', '', text)
+    text = re.sub(r'[-\s]+', '-', text)
+    return text.strip('-')
+
+
+def convert_content_to_html(content: str) -> str:
+    """Convert markdown-like content to HTML."""
+    # Basic markdown conversions
+    content = content.replace('\n# ', '\n<h1>')
+    content = content.replace('\n## ', '\n<h2>')
+    content = content.replace('\n### ', '\n<h3>')
+    content = content.replace('\n\n', '</p><p>')
+    
+    # Code blocks
+    content = content.replace('```yaml\n', '<pre><code class="language-yaml">')
+    content = content.replace('```python\n', '<pre><code class="language-python">')
+    content = content.replace('```json\n', '<pre><code class="language-json">')
+    content = content.replace('```\n', '</code></pre>')
+    
+    # Wrap in paragraph tags
+    if not content.startswith('<'):
+        content = f'<p>{content}</p>'
+    
+    return content
+
+
+def _related_topics_html(related: Tuple[str, ...], extension: str) -> str:
+    """Generate HTML for related topics."""
+    if not related:
+        return ""
+    
+    html = '<div class="related-topics"><h4>Related Topics</h4><ul>'
+    for related_title in related:
+        html += f'<li><a href="{slugify(related_title)}{extension}">{related_title}</a></li>'
+    html += '</ul></div>'
+    
+    return html
+
+
+def _topic_examples_html(topic: HelpTopic) -> str:
+    """Generate HTML for topic examples."""
+    if not topic.examples:
+        return ""
+    
+    html = '<div class="topic-examples"><h3>Examples</h3>'
+    for example in topic.examples:
+        html += f'<div class="example-block"><pre><code>{example}</code></pre></div>'
+    html += '</div>'
+    
+    return html
+
+
+def render_html_topic(topic: HelpTopic, related: Tuple[str, ...] = ()) -> str:
+    """Render the HTML page of a topic."""
+    return f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{topic.title} - Moveworks YAML Assistant Documentation</title>
+<link rel="stylesheet" href="assets/style.css">
+<link rel="stylesheet" href="assets/prism.css">
+</head>
+<body>
+<nav class="navbar">
+    <div class="nav-container">
+        <a href="index.html" class="nav-title">📋 Moveworks YAML Assistant</a>
+        <div class="nav-breadcrumb">
+            <a href="index.html">Home</a> → 
+            <a href="{slugify(topic.category)}.html">{topic.category}</a> → 
+            {topic.title}
+        </div>
+    </div>
+</nav>
+
+<div class="container">
+    <aside class="sidebar">
+        <div class="sidebar-content">
+            <a href="index.html" class="back-link">← Back to Home</a>
+            
+            <div class="topic-meta">
+                <h4>Topic Information</h4>
+                <p><strong>Category:</strong> {topic.category}</p>
+                <p><strong>Difficulty:</strong> {topic.difficulty}</p>
+                <p><strong>Time:</strong> {topic.estimated_time}</p>
+                {f'<p><strong>Prerequisites:</strong> {", ".join(topic.prerequisites)}</p>' if topic.prerequisites else ''}
+            </div>
+            
+            {_related_topics_html(related, ".html")}
+        </div>
+    </aside>
+    
+    <main class="main-content">
+        <article class="topic-content">
+            <header class="topic-header">
+                <h1>{topic.title}</h1>
+                <div class="topic-badges">
+                    <span class="badge badge-{topic.difficulty.lower()}">{topic.difficulty}</span>
+                    <span class="badge badge-category">{topic.category}</span>
+                </div>
+            </header>
+            
+            <div class="topic-body">
+                {convert_content_to_html(topic.content)}
+            </div>
+            
+            {_topic_examples_html(topic)}
+        </article>
+    </main>
+</div>
+
+<script src="assets/prism.js"></script>
+<script src="assets/main.js"></script>
+</body>
+</html>
+    """.strip()
+
+
+def render_markdown_topic(topic: HelpTopic, related: Tuple[str, ...] = ()) -> str:
+    """Render the Markdown page of a topic."""
+    lines = [
+        f"# {topic.title}",
+        "",
+        f"**Category:** {topic.category} • **Difficulty:** {topic.difficulty} • **Time:** {topic.estimated_time}",
+    ]
+    if topic.prerequisites:
+        lines.append(f"**Prerequisites:** {', '.join(topic.prerequisites)}")
+    lines.extend(["", topic.content.strip()])
+    
+    if topic.examples:
+        lines.extend(["", "## Examples"])
+        for example in topic.examples:
+            lines.extend(["", "```", example.strip(), "```"])
+    
+    if related:
+        lines.extend(["", "## Related Topics", ""])
+        lines.extend(f"- [{title}]({slugify(title)}.md)" for title in related)
+    
+    return "\n".join(lines) + "\n"
+
+
+def render_page(page: DocumentationPage) -> str:
+    """Render a topic page (runs in a worker process, so it must not use help_system)."""
+    if page.format == "markdown":
+        return render_markdown_topic(page.topic, page.related)
+    return render_html_topic(page.topic, page.related)
+
+
 def generate_documentation(config: DocumentationConfig = None) -> bool:
     """Generate comprehensive documentation."""
     generator = ComprehensiveDocumentationGenerator(config)
@@ -8,15 +8,58 @@ Based on Sections 2.1, 2.3, and 11.1 of the Source of Truth Document.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, Iterable, List, Union
 import json
 
+from json_path import CompiledPath, JsonPathSyntaxError, compile_path, resolve_many
+
 
 class DataPathNotFound(Exception):
     """Exception raised when a data path cannot be found in the DataContext."""
     pass
 
 
+class LazyParsedJSON:
+    """
+    Descriptor for parsed_json_output that parses user_provided_json_output on first access.
+
+    Sample outputs can be large, so loading a workflow should not pay for
+    json.loads on every step up front. Assigning a value stores it as-is;
+    assigning None (the default) leaves the field to be parsed from
+    user_provided_json_output. Invalid JSON parses to None.
+    """
+
+    def __set_name__(self, owner, name):
+        self._slot = '_' + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            # Dataclass default
+            return None
+
+        try:
+            return obj.__dict__[self._slot]
+        except KeyError:
+            pass
+
+        parsed = None
+        raw = obj.__dict__.get('user_provided_json_output')
+        if raw:
+            try:
+                parsed = json.loads(raw)
+            except (json.JSONDecodeError, TypeError):
+                # Keep parsed_json_output as None if JSON is invalid
+                pass
+        obj.__dict__[self._slot] = parsed
+        return parsed
+
+    def __set__(self, obj, value):
+        if value is None:
+            obj.__dict__.pop(self._slot, None)
+        else:
+            obj.__dict__[self._slot] = value
+
+
 @dataclass
 class ActionStep:
     """
@@ -30,7 +73,7 @@ class ActionStep:
         progress_updates: Optional progress update configuration
         delay_config: Optional delay configuration
         user_provided_json_output: Raw JSON string provided by user for this action's output
-        parsed_json_output: Parsed version of user_provided_json_output
+        parsed_json_output: Parsed version of user_provided_json_output (parsed on first access)
     """
     action_name: str
     output_key: str
@@ -39,16 +82,7 @@ class ActionStep:
     progress_updates: Optional[Dict[str, str]] = None
     delay_config: Optional[Dict[str, int]] = None
     user_provided_json_output: Optional[str] = None
-    parsed_json_output: Optional[Any] = None
-
-    def __post_init__(self):
-        """Parse JSON output if provided."""
-        if self.user_provided_json_output and not self.parsed_json_output:
-            try:
-                self.parsed_json_output = json.loads(self.user_provided_json_output)
-            except json.JSONDecodeError:
-                # Keep parsed_json_output as None if JSON is invalid
-                pass
+    parsed_json_output: Optional[Any] = LazyParsedJSON()
 
 
 @dataclass
@@ -62,23 +96,14 @@ class ScriptStep:
         description: Optional description of what this script does
         input_args: Dictionary of input arguments for the script
         user_provided_json_output: Raw JSON string provided by user for this script's output
-        parsed_json_output: Parsed version of user_provided_json_output
+        parsed_json_output: Parsed version of user_provided_json_output (parsed on first access)
     """
     code: str
     output_key: str
     description: Optional[str] = None
     input_args: Dict[str, Any] = field(default_factory=dict)
     user_provided_json_output: Optional[str] = None
-    parsed_json_output: Optional[Any] = None
-
-    def __post_init__(self):
-        """Parse JSON output if provided."""
-        if self.user_provided_json_output and not self.parsed_json_output:
-            try:
-                self.parsed_json_output = json.loads(self.user_provided_json_output)
-            except json.JSONDecodeError:
-                # Keep parsed_json_output as None if JSON is invalid
-                pass
+    parsed_json_output: Optional[Any] = LazyParsedJSON()
 
 
 @dataclass
@@ -280,6 +305,12 @@ class DataContext:
 
     This class simulates the 'data' object that tracks input variables and
     output keys from executed steps, as well as meta_info for user context.
+
+    Availability checks walk the compiled path through the current values
+    without raising, so they cost the path's depth, need no per-value state
+    and always reflect the values as they are. snapshot() returns a copy
+    that shares all data with the original until either adds a step output
+    (copy-on-write), so a context can be kept cheaply for every step.
     """
 
     def __init__(self, initial_inputs: Optional[Dict[str, Any]] = None, meta_info: Optional[Dict[str, Any]] = None):
@@ -304,6 +335,21 @@ class DataContext:
                 "custom_data": {}
             }
         }
+        self._outputs_shared = False
+
+    def snapshot(self) -> 'DataContext':
+        """
+        Return a copy of this context as it is now.
+
+        The copy shares inputs and step outputs with this context; adding a
+        step output to either one no longer affects the other.
+        """
+        copy = DataContext.__new__(DataContext)
+        copy.initial_inputs = self.initial_inputs
+        copy.step_outputs = self.step_outputs
+        copy.meta_info = self.meta_info
+        copy._outputs_shared = self._outputs_shared = True
+        return copy
 
     def add_step_output(self, output_key: str, parsed_json_value: Any) -> None:
         """
@@ -314,6 +360,9 @@ class DataContext:
             parsed_json_value: The parsed JSON output from the step
         """
         if output_key != '_':  # '_' means unused output
+            if self._outputs_shared:
+                self.step_outputs = dict(self.step_outputs)
+                self._outputs_shared = False
             self.step_outputs[output_key] = parsed_json_value
 
     def get_data_value(self, path_string: str) -> Any:
@@ -331,32 +380,51 @@ class DataContext:
         Raises:
             DataPathNotFound: If the path is invalid
         """
+        try:
+            compiled = compile_path(path_string)
+        except JsonPathSyntaxError as e:
+            raise DataPathNotFound(f"Path '{path_string}' is invalid: {str(e)}")
+
         # Handle meta_info paths
-        if path_string.startswith('meta_info.'):
-            meta_path = path_string[10:]  # Remove 'meta_info.' prefix
-            return self._navigate_path(self.meta_info, meta_path.split('.'), path_string)
+        if compiled.root == 'meta_info':
+            return self._resolve(compiled, self.meta_info, 0, path_string)
 
         # Handle data paths (with or without 'data.' prefix)
         if path_string.startswith('data.'):
             path_string = path_string[5:]  # Remove 'data.' prefix
 
-        parts = path_string.split('.')
+        if compiled.steps:
+            key = compiled.steps[0][0]
 
-        # Check initial inputs first
-        if parts[0] in self.initial_inputs:
-            value = self.initial_inputs[parts[0]]
-            return self._navigate_path(value, parts[1:], path_string)
+            # Check initial inputs first
+            if key in self.initial_inputs:
+                return self._resolve(compiled, self.initial_inputs[key], 1, path_string)
 
-        # Check step outputs
-        if parts[0] in self.step_outputs:
-            value = self.step_outputs[parts[0]]
-            return self._navigate_path(value, parts[1:], path_string)
+            # Check step outputs
+            if key in self.step_outputs:
+                return self._resolve(compiled, self.step_outputs[key], 1, path_string)
 
         raise DataPathNotFound(f"Path '{path_string}' not found in data context")
 
+    def get_data_values(self, path_strings: Iterable[str]) -> Dict[str, Any]:
+        """
+        Retrieve many values at once (see json_path.resolve_many).
+
+        Args:
+            path_strings: Paths in any form accepted by get_data_value
+
+        Returns:
+            Values by path string; unavailable paths are left out
+        """
+        return resolve_many(path_strings, self)
+
+    def path_roots(self) -> Dict[str, Any]:
+        """Values of the 'data' and 'meta_info' roots (inputs shadow step outputs)."""
+        return {'data': {**self.step_outputs, **self.initial_inputs}, 'meta_info': self.meta_info}
+
     def is_path_available(self, path_string: str) -> bool:
         """
-        Check if a data path is available in the context.
+        Check if a data path is available in the context, without raising.
 
         Args:
             path_string: Path to check
@@ -365,44 +433,34 @@ class DataContext:
             True if the path exists, False otherwise
         """
         try:
-            self.get_data_value(path_string)
-            return True
-        except (DataPathNotFound, KeyError, IndexError, TypeError):
+            compiled = compile_path(path_string)
+        except JsonPathSyntaxError:
             return False
 
-    def _navigate_path(self, value: Any, remaining_parts: List[str], original_path: str) -> Any:
-        """
-        Navigate through nested dictionaries/lists using remaining path parts.
+        if compiled.root == 'meta_info':
+            return compiled.find(self.meta_info)[0]
+        if not compiled.steps:
+            return False
 
-        Args:
-            value: Current value to navigate from
-            remaining_parts: Remaining parts of the path
-            original_path: Original path string for error messages
+        key = compiled.steps[0][0]
+        if key in self.initial_inputs:
+            value = self.initial_inputs[key]
+        elif key in self.step_outputs:
+            value = self.step_outputs[key]
+        else:
+            return False
+        return compiled.find(value, 1)[0]
 
-        Returns:
-            The value at the final path
+    def _resolve(self, compiled: CompiledPath, value: Any, start: int, original_path: str) -> Any:
+        """
+        Apply a compiled path's accessors from a root value.
 
         Raises:
             DataPathNotFound: If navigation fails
         """
-        if not remaining_parts:
-            return value
-
-        current_part = remaining_parts[0]
-
         try:
-            if isinstance(value, dict):
-                next_value = value[current_part]
-            elif isinstance(value, list):
-                # Handle array indexing
-                index = int(current_part)
-                next_value = value[index]
-            else:
-                raise DataPathNotFound(f"Cannot navigate path '{original_path}': {current_part} is not accessible")
-
-            return self._navigate_path(next_value, remaining_parts[1:], original_path)
-
-        except (KeyError, IndexError, ValueError, TypeError) as e:
+            return compiled.resolve(value, start)
+        except (KeyError, IndexError, TypeError) as e:
             raise DataPathNotFound(f"Path '{original_path}' not found: {str(e)}")
 
     def get_meta_info_paths(self) -> List[str]:
@@ -439,3 +497,47 @@ class DataContext:
         # Add meta_info paths
         paths.extend(self.get_meta_info_paths())
         return paths
+
+
+class DataContextTimeline:
+    """
+    The data context before each top-level step of a workflow.
+
+    Built by replaying the workflow once; each position holds a DataContext
+    snapshot, so the data available at any step can then be queried directly
+    without replaying the steps before it.
+    """
+
+    def __init__(self, workflow: Workflow, initial_context: Optional[DataContext] = None):
+        """
+        Build the timeline.
+
+        Args:
+            workflow: The workflow whose step outputs are added in order
+            initial_context: Context before the first step (not modified)
+        """
+        context = initial_context.snapshot() if initial_context else DataContext()
+        self._snapshots: List[DataContext] = []
+        for step in workflow.steps:
+            self._snapshots.append(context.snapshot())
+            output_key = getattr(step, 'output_key', None)
+            if output_key and output_key != '_' and getattr(step, 'parsed_json_output', None) is not None:
+                context.add_step_output(output_key, step.parsed_json_output)
+        self._snapshots.append(context)
+
+    def __len__(self) -> int:
+        """Number of steps covered."""
+        return len(self._snapshots) - 1
+
+    def before(self, step_index: int) -> DataContext:
+        """Context available to the step at step_index (0-based)."""
+        return self._snapshots[step_index]
+
+    def after(self, step_index: int) -> DataContext:
+        """Context once the step at step_index has run."""
+        return self._snapshots[step_index + 1]
+
+    @property
+    def final(self) -> DataContext:
+        """Context after the last step."""
+        return self._snapshots[-1]
@@ -0,0 +1,387 @@
+"""
+Data-Dependency Graph for the Moveworks YAML Assistant.
+
+This module keeps a persistent graph of how data flows through a workflow:
+which top-level step produces each output_key (including output keys declared
+by nested switch, for, parallel and try/catch steps) and which steps reference
+them through data.* in input_args, conditions, loop sources, output mappers
+and script code.
+
+The graph is updated incrementally. Steps are fingerprinted with the
+incremental validator, and only steps whose content changed are re-scanned.
+After an update, these queries are cheap:
+- "is data.<key> available at step N" is a dictionary lookup
+- "what is available at step N" unions per-step path sets that are computed
+  once per sample output
+- the producer/consumer edges are precomputed
+
+The validators, the data flow visualizer and the JSON selectors query the
+graph instead of re-walking every prior step.
+"""
+
+import re
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from core_structures import Workflow, ScriptStep, SwitchStep, ForLoopStep, ReturnStep
+from dsl_parser import parse_dsl
+from incremental_validator import incremental_validator, iter_nested_steps
+
+
+# Default depth of the JSON paths listed for a step's sample output
+DEFAULT_JSON_PATH_DEPTH = 3
+
+# meta_info paths that are always available
+META_INFO_PATHS = frozenset({"meta_info.user.email", "meta_info.user.name", "meta_info.user.id"})
+
+# data.<root> references in script code and unparseable expressions
+_DATA_ROOT_REGEX = re.compile(r'\bdata\.([A-Za-z_]\w*)')
+
+
+@dataclass(frozen=True)
+class StepDataFlow:
+    """
+    Data flow information for one top-level step.
+
+    Attributes:
+        index: Position of the step in the workflow
+        output_key: The step's own output key ('_' or None if it has none)
+        declared_keys: Output keys the step and its nested steps declare
+        referenced_roots: Top-level data.* names the step and its nested steps reference
+        input_arg_roots: Top-level data.* names referenced from the step's own input_args
+        digest: Content fingerprint of the step
+        output_digest: Fingerprint of the step's sample output, or None
+    """
+    index: int
+    output_key: Optional[str]
+    declared_keys: FrozenSet[str]
+    referenced_roots: FrozenSet[str]
+    input_arg_roots: Tuple[str, ...]
+    digest: str
+    output_digest: Optional[str]
+
+
+@dataclass(frozen=True)
+class DataDependency:
+    """An edge from the step producing an output key to a step referencing it."""
+    producer: int
+    consumer: int
+    key: str
+
+
+def _string_roots(value: str, roots: Set[str]) -> None:
+    """Add the data.* roots referenced from a DSL string."""
+    if 'data.' not in value:
+        return
+    parsed = parse_dsl(value.strip())
+    if parsed.ok:
+        for reference in parsed.references:
+            if reference.root == 'data' and reference.path and isinstance(reference.path[0], str):
+                roots.add(reference.path[0])
+    else:
+        roots.update(_DATA_ROOT_REGEX.findall(value))
+
+
+def _value_roots(value: Any, roots: Set[str]) -> None:
+    """Add the data.* roots referenced anywhere in an input_args/output_mapper structure."""
+    if isinstance(value, str):
+        _string_roots(value, roots)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _value_roots(item, roots)
+    elif isinstance(value, list):
+        for item in value:
+            _value_roots(item, roots)
+
+
+def step_referenced_roots(step: Any) -> FrozenSet[str]:
+    """
+    Get the top-level data.* names a step and its nested steps reference.
+
+    Args:
+        step: Any workflow step
+
+    Returns:
+        Frozen set of referenced output keys / workflow input names
+    """
+    roots: Set[str] = set()
+    for nested in iter_nested_steps(step):
+        _value_roots(getattr(nested, 'input_args', None), roots)
+
+        if isinstance(nested, ScriptStep) and isinstance(nested.code, str):
+            roots.update(_DATA_ROOT_REGEX.findall(nested.code))
+        elif isinstance(nested, SwitchStep):
+            for case in nested.cases or []:
+                if isinstance(case.condition, str):
+                    _string_roots(case.condition, roots)
+        elif isinstance(nested, ForLoopStep):
+            if isinstance(nested.in_source, str):
+                _string_roots(nested.in_source, roots)
+        elif isinstance(nested, ReturnStep):
+            _value_roots(nested.output_mapper, roots)
+
+        for_loop = getattr(nested, 'for_loop', None)
+        if for_loop is not None and isinstance(for_loop.in_source, str):
+            _string_roots(for_loop.in_source, roots)
+
+    return frozenset(roots)
+
+
+def json_paths(data: Any, path_prefix: str, max_depth: int = DEFAULT_JSON_PATH_DEPTH) -> Set[str]:
+    """
+    List the paths inside a JSON value, using [0] for array elements.
+
+    Args:
+        data: Parsed JSON value
+        path_prefix: Path of the value itself (e.g. 'data.user_info')
+        max_depth: Number of levels to descend
+
+    Returns:
+        Set of nested paths (not including path_prefix itself)
+    """
+    paths: Set[str] = set()
+
+    def add(value: Any, prefix: str, depth: int) -> None:
+        if depth <= 0:
+            return
+        if isinstance(value, dict):
+            for key, item in value.items():
+                path = f"{prefix}.{key}"
+                paths.add(path)
+                if isinstance(item, (dict, list)):
+                    add(item, path, depth - 1)
+        elif isinstance(value, list) and value:
+            path = f"{prefix}[0]"
+            paths.add(path)
+            if isinstance(value[0], (dict, list)):
+                add(value[0], path, depth - 1)
+
+    add(data, path_prefix, max_depth)
+    return paths
+
+
+class DataFlowGraph:
+    """
+    Incrementally maintained data-dependency graph of a workflow.
+
+    Call ``update`` after the workflow changes (``get_data_flow_graph`` does
+    this for you); every other method is a query against the current graph.
+    """
+
+    def __init__(self):
+        self.steps: List[StepDataFlow] = []
+        self.producers: Dict[str, int] = {}
+        self.dependencies: Dict[int, FrozenSet[int]] = {}
+        self.dependents: Dict[int, FrozenSet[int]] = {}
+        self.edges: List[DataDependency] = []
+        self.last_rescanned = 0
+        self._references: Dict[str, FrozenSet[str]] = {}
+        self._json_paths: Dict[Tuple[str, str, int], FrozenSet[str]] = {}
+        self._outputs: List[Any] = []
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def update(self, workflow: Workflow, dirty: Optional[Iterable[int]] = None) -> 'DataFlowGraph':
+        """
+        Bring the graph up to date with a workflow.
+
+        Args:
+            workflow: The workflow the graph describes
+            dirty: Indices of top-level steps edited in place since the last
+                update. None re-fingerprints every step, which is always safe.
+
+        Returns:
+            The graph itself
+        """
+        dirty_indices = None if dirty is None else set(dirty)
+        steps = []
+        references = {}
+        self.last_rescanned = 0
+
+        for index, step in enumerate(workflow.steps):
+            refresh = dirty_indices is None or index in dirty_indices
+            fingerprint = incremental_validator.fingerprint(step, refresh=refresh)
+
+            roots = self._references.get(fingerprint.digest)
+            if roots is None:
+                roots = step_referenced_roots(step)
+                self.last_rescanned += 1
+            references[fingerprint.digest] = roots
+
+            output_key = getattr(step, 'output_key', None)
+            steps.append(StepDataFlow(
+                index=index,
+                output_key=output_key if isinstance(output_key, str) and output_key.strip() else None,
+                declared_keys=fingerprint.declared_keys,
+                referenced_roots=roots,
+                input_arg_roots=fingerprint.input_arg_roots,
+                digest=fingerprint.digest,
+                output_digest=fingerprint.output_digest
+            ))
+
+        self._references = references
+        self._outputs = [getattr(step, 'parsed_json_output', None) for step in workflow.steps]
+        self.steps = steps
+        self._link()
+        return self
+
+    def _link(self):
+        """Rebuild the producer index and the dependency edges."""
+        producers: Dict[str, int] = {}
+        for info in self.steps:
+            for key in info.declared_keys:
+                producers.setdefault(key, info.index)
+
+        edges = []
+        dependencies: Dict[int, Set[int]] = {}
+        dependents: Dict[int, Set[int]] = {}
+        for info in self.steps:
+            for root in sorted(info.referenced_roots):
+                producer = producers.get(root)
+                if producer is None or producer >= info.index:
+                    continue
+                edges.append(DataDependency(producer, info.index, root))
+                dependencies.setdefault(info.index, set()).add(producer)
+                dependents.setdefault(producer, set()).add(info.index)
+
+        self.producers = producers
+        self.edges = edges
+        self.dependencies = {index: frozenset(values) for index, values in dependencies.items()}
+        self.dependents = {index: frozenset(values) for index, values in dependents.items()}
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def producer_of(self, key: str) -> Optional[int]:
+        """Index of the top-level step that declares an output key, or None."""
+        return self.producers.get(key)
+
+    def is_available(self, key: str, step_index: int) -> bool:
+        """Whether data.<key> is produced by a step before step_index."""
+        producer = self.producers.get(key)
+        return producer is not None and producer < step_index
+
+    def available_keys(self, step_index: int) -> List[str]:
+        """Output keys produced before a step, in workflow order."""
+        return [
+            key
+            for info in self.steps[:max(step_index, 0)]
+            for key in sorted(info.declared_keys)
+            if self.producers.get(key) == info.index
+        ]
+
+    def available_paths(self, step_index: int, json_depth: int = DEFAULT_JSON_PATH_DEPTH,
+                        include_meta_info: bool = True) -> Set[str]:
+        """
+        Data paths available to a step.
+
+        Args:
+            step_index: Index of the step (negative means after the last step)
+            json_depth: Levels of each prior step's sample output to include
+                (0 lists only data.<output_key>)
+            include_meta_info: Include the standard meta_info.user paths
+
+        Returns:
+            Set of available paths such as 'data.user_info.user.id'
+        """
+        end = len(self.steps) if step_index < 0 else min(step_index, len(self.steps))
+        paths = set(META_INFO_PATHS) if include_meta_info else set()
+        for key in self.available_keys(end):
+            paths.add(f"data.{key}")
+        if json_depth > 0:
+            for info in self.steps[:end]:
+                paths.update(self._step_json_paths(info, json_depth))
+        return paths
+
+    def _step_json_paths(self, info: StepDataFlow, depth: int) -> FrozenSet[str]:
+        """JSON paths of a step's own sample output, cached by output fingerprint."""
+        if info.output_digest is None or not info.output_key or info.output_key == '_':
+            return frozenset()
+        cache_key = (info.output_digest, info.output_key, depth)
+        paths = self._json_paths.get(cache_key)
+        if paths is None:
+            paths = frozenset(json_paths(self._outputs[info.index], f"data.{info.output_key}", depth))
+            if len(self._json_paths) >= 4 * max(len(self.steps), 64):
+                self._json_paths.clear()
+            self._json_paths[cache_key] = paths
+        return paths
+
+    def upstream(self, step_index: int) -> Set[int]:
+        """All steps a step transitively depends on."""
+        return self._closure(step_index, self.dependencies)
+
+    def downstream(self, step_index: int) -> Set[int]:
+        """All steps that transitively depend on a step."""
+        return self._closure(step_index, self.dependents)
+
+    def _closure(self, start: int, adjacency: Dict[int, FrozenSet[int]]) -> Set[int]:
+        seen: Set[int] = set()
+        pending = list(adjacency.get(start, ()))
+        while pending:
+            index = pending.pop()
+            if index not in seen:
+                seen.add(index)
+                pending.extend(adjacency.get(index, ()))
+        return seen
+
+    def forward_references(self) -> List[DataDependency]:
+        """References to output keys that are only produced by the same or a later step."""
+        return [
+            DataDependency(self.producers[root], info.index, root)
+            for info in self.steps
+            for root in sorted(info.referenced_roots)
+            if root in self.producers and self.producers[root] > info.index
+        ]
+
+    def workflow_inputs(self) -> List[str]:
+        """
+        Names referenced from top-level input_args that no top-level step outputs.
+
+        These are treated as compound action inputs. Names are returned in the
+        order they are first referenced.
+        """
+        outputs = {info.output_key for info in self.steps if info.output_key and info.output_key != '_'}
+        names = []
+        for info in self.steps:
+            for root in info.input_arg_roots:
+                if root not in outputs and root not in names:
+                    names.append(root)
+        return names
+
+
+_graphs: Dict[int, Tuple[weakref.ref, DataFlowGraph]] = {}
+
+
+def get_data_flow_graph(workflow: Workflow, dirty: Optional[Iterable[int]] = None) -> DataFlowGraph:
+    """
+    Get the up-to-date data-dependency graph of a workflow.
+
+    One graph is kept per workflow object and updated incrementally, so
+    repeated calls only re-scan the steps that changed.
+
+    Args:
+        workflow: The workflow
+        dirty: Indices of top-level steps edited in place since the last call,
+            or None to re-check every step
+
+    Returns:
+        DataFlowGraph for the workflow
+    """
+    key = id(workflow)
+    cached = _graphs.get(key)
+    if cached is not None and cached[0]() is workflow:
+        return cached[1].update(workflow, dirty)
+
+    graph = DataFlowGraph()
+
+    def forget(ref, key=key):
+        entry = _graphs.get(key)
+        if entry is not None and entry[0] is ref:
+            del _graphs[key]
+
+    _graphs[key] = (weakref.ref(workflow, forget), graph)
+    return graph.update(workflow)
@@ -0,0 +1,71 @@
+"""
+Shared DSL expression classifier for the Moveworks YAML Assistant.
+
+Both the YAML generator (to decide which scalars are double-quoted) and the
+DSL validators (to decide which inputs are validated as DSL) need to know
+whether a string contains Moveworks DSL. This module compiles every DSL
+indicator into a single alternation so a string is scanned once, and caches
+results per string because the same values recur across steps and across
+repeated YAML previews.
+"""
+
+import re
+from functools import lru_cache
+
+
+# Number of classified strings to remember
+DSL_CLASSIFIER_CACHE_SIZE = 8192
+
+# DSL functions that are also recognized with whitespace before the parenthesis
+DSL_SPACED_FUNCTIONS = ('CONCAT', 'IF', 'SPLIT', 'TEXT', 'UPPER', 'LOWER')
+
+# Indicators that a string contains DSL, combined into one pattern
+DSL_INDICATOR_PATTERNS = [
+    # Data and meta_info references (data.field, data.array[0], meta_info.user.email)
+    r'\bdata\.',
+    r'\bmeta_info\.',
+
+    # Comparison and logical operators (also covers "== null" / "!= null")
+    r'==|!=|[<>]',
+    r'&&|\|\|',
+
+    # DSL functions such as $CONCAT(, $MAP(, $IF (
+    r'\$[A-Z_]+\(',
+    r'\$(?:' + '|'.join(DSL_SPACED_FUNCTIONS) + r')\s*\(',
+
+    # Array/object members that are DSL-only
+    r'\.contains\s*\(',
+    r'\.length\b',
+    r'\.size\b',
+
+    # Boolean literals combined with operators on the same line
+    r'\b(?:true|false)\b.*[=!&|]',
+    r'[=!&|].*\b(?:true|false)\b',
+]
+
+DSL_INDICATOR_REGEX = re.compile('|'.join(f'(?:{pattern})' for pattern in DSL_INDICATOR_PATTERNS))
+
+
+@lru_cache(maxsize=DSL_CLASSIFIER_CACHE_SIZE)
+def _classify(value: str) -> bool:
+    return DSL_INDICATOR_REGEX.search(value) is not None
+
+
+def is_dsl_expression(value: str) -> bool:
+    """
+    Check if a string contains Moveworks DSL expressions.
+
+    Args:
+        value: String value to check
+
+    Returns:
+        True if the value contains DSL expressions, False otherwise
+    """
+    if not isinstance(value, str) or not value:
+        return False
+    return _classify(value)
+
+
+def clear_dsl_classifier_cache():
+    """Clear the per-string classification cache."""
+    _classify.cache_clear()
@@ -0,0 +1,643 @@
+"""
+DSL Evaluator for Moveworks Data Mapping Syntax (DSL) expressions.
+
+This module evaluates parsed DSL expressions (see dsl_parser) against sample
+data such as step outputs in a DataContext, so conditions and Bender
+transformations can be previewed before a workflow is deployed.
+
+Evaluation is batched: an expression is compiled once into column functions
+that take a whole batch of records and return one result per record. Each
+AST node therefore runs once per batch rather than once per record, which
+keeps previews over large sample exports fast:
+- evaluate_batch() runs an expression over many records at once
+- $MAP and $FILTER flatten the arrays of every record into a single batch
+  before evaluating the converter or condition
+- && / || and $IF / $CONDITIONAL only evaluate their remaining operands on
+  the records that need them
+
+Missing fields evaluate to null instead of raising, matching how optional
+fields behave at runtime.
+"""
+
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from core_structures import DataContext
+from dsl_parser import (
+    parse_dsl, Literal, Reference, Subscript, UnaryOp, BinaryOp, Call,
+    MethodCall, ListExpr, ObjectExpr
+)
+
+
+# Number of compiled expressions to remember
+DSL_COMPILE_CACHE_SIZE = 1024
+
+# Default name bound to each record by evaluate_batch
+DEFAULT_RECORD_VARIABLE = 'item'
+
+
+class DSLEvaluationError(Exception):
+    """Raised when a DSL expression cannot be evaluated."""
+
+    def __init__(self, message: str, position: int = 0):
+        super().__init__(message)
+        self.message = message
+        self.position = position
+
+
+class _Batch:
+    """
+    A batch of records being evaluated together.
+
+    columns hold one value per record (record variables such as item);
+    roots hold values shared by every record (data, meta_info).
+    """
+
+    __slots__ = ('size', 'columns', 'roots')
+
+    def __init__(self, size: int, columns: Dict[str, list], roots: Dict[str, Any]):
+        self.size = size
+        self.columns = columns
+        self.roots = roots
+
+    def take(self, indices: List[int]) -> '_Batch':
+        """Get the sub-batch of the given record positions."""
+        columns = {name: [column[i] for i in indices] for name, column in self.columns.items()}
+        return _Batch(len(indices), columns, self.roots)
+
+    def expand(self, lengths: List[int], variable: str, values: list) -> '_Batch':
+        """Get a batch with one record per array element, binding variable to the element."""
+        columns = {}
+        for name, column in self.columns.items():
+            if self.size == 1:
+                columns[name] = column * len(values)
+            else:
+                columns[name] = [value for value, count in zip(column, lengths) for _ in range(count)]
+        columns[variable] = values
+        return _Batch(len(values), columns, self.roots)
+
+
+ColumnFunction = Callable[[_Batch], list]
+
+
+# Value access
+
+def _member(value: Any, key: Any) -> Any:
+    """Get a field, index or length from a value, or None if it is missing."""
+    if isinstance(value, dict):
+        if key in value:
+            return value[key]
+        if isinstance(key, int):
+            return value.get(str(key))
+        if key in ('length', 'size'):
+            return len(value)
+        return None
+    if isinstance(value, (list, str)):
+        if isinstance(key, int) and not isinstance(key, bool):
+            return value[key] if -len(value) <= key < len(value) else None
+        if key in ('length', 'size'):
+            return len(value)
+    return None
+
+
+def _walk(value: Any, path) -> Any:
+    for key in path:
+        value = _member(value, key)
+    return value
+
+
+def _truthy(column: list) -> List[bool]:
+    return list(map(bool, column))
+
+
+def _scatter(size: int, parts) -> list:
+    """Combine (indices, values) pairs into one column."""
+    result = [None] * size
+    for indices, values in parts:
+        for i, value in zip(indices, values):
+            result[i] = value
+    return result
+
+
+# Operators
+
+def _ordered(compare: Callable[[Any, Any], bool], symbol: str, position: int):
+    def run(left: list, right: list) -> list:
+        try:
+            return list(map(compare, left, right))
+        except TypeError:
+            pass
+        # Comparisons with null are false
+        try:
+            return [a is not None and b is not None and compare(a, b) for a, b in zip(left, right)]
+        except TypeError as e:
+            raise DSLEvaluationError(f"Cannot compare values with '{symbol}': {e}", position)
+    return run
+
+
+def _add(a: Any, b: Any) -> Any:
+    if a is None or b is None:
+        return None
+    if isinstance(a, str) or isinstance(b, str):
+        return f"{a}{b}"
+    return a + b
+
+
+def _arithmetic(function: Callable[[Any, Any], Any], symbol: str, position: int):
+    def run(left: list, right: list) -> list:
+        try:
+            return list(map(function, left, right))
+        except (TypeError, ZeroDivisionError):
+            pass
+        # Arithmetic with null is null
+        try:
+            return [None if a is None or b is None else function(a, b) for a, b in zip(left, right)]
+        except (TypeError, ZeroDivisionError) as e:
+            raise DSLEvaluationError(f"Cannot apply '{symbol}': {e}", position)
+    return run
+
+
+def _binary_function(op: str, position: int):
+    if op == '==':
+        return lambda left, right: list(map(operator.eq, left, right))
+    if op == '!=':
+        return lambda left, right: list(map(operator.ne, left, right))
+    if op in ('<', '>', '<=', '>='):
+        compare = {'<': operator.lt, '>': operator.gt, '<=': operator.le, '>=': operator.ge}[op]
+        return _ordered(compare, op, position)
+    if op == '+':
+        def run(left: list, right: list) -> list:
+            try:
+                return list(map(_add, left, right))
+            except TypeError as e:
+                raise DSLEvaluationError(f"Cannot apply '+': {e}", position)
+        return run
+    functions = {'-': operator.sub, '*': operator.mul, '/': operator.truediv, '%': operator.mod}
+    return _arithmetic(functions[op], op, position)
+
+
+# Functions
+
+def _concat(values: Any, separator: Any = '', *rest: Any) -> str:
+    if isinstance(values, list) and not rest:
+        parts = values
+    else:
+        # $CONCAT(a, b, c) without a list
+        parts, separator = [values, separator] + list(rest), ''
+    separator = str(separator or '')
+    try:
+        return separator.join(parts)
+    except TypeError:
+        return separator.join('' if part is None else str(part) for part in parts)
+
+
+def _integer(value: Any) -> Optional[int]:
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        return int(float(value.strip()))
+    return int(value)
+
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def _lookup(mapping: Any, key: Any, default: Any = None) -> Any:
+    if isinstance(mapping, dict):
+        if key in mapping:
+            return mapping[key]
+        if str(key) in mapping:
+            return mapping[str(key)]
+    return default
+
+
+def _contains(container: Any, value: Any) -> bool:
+    if container is None:
+        return False
+    if isinstance(container, str):
+        return value is not None and str(value) in container
+    return value in container
+
+
+def _string_function(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a string function so null input yields null."""
+    def run(value: Any, *args: Any) -> Any:
+        if value is None:
+            return None
+        return function(str(value), *args)
+    return run
+
+
+# Functions applied record by record to evaluated arguments: name -> (function, min args, max args)
+ROW_FUNCTIONS = {
+    'CONCAT': (_concat, 1, None),
+    'TEXT': (_text, 1, 1),
+    'UPPER': (_string_function(str.upper), 1, 1),
+    'LOWER': (_string_function(str.lower), 1, 1),
+    'TRIM': (_string_function(str.strip), 1, 1),
+    'SPLIT': (_string_function(lambda value, separator=None: value.split(separator)), 1, 2),
+    'REPLACE': (_string_function(lambda value, old, new: value.replace(str(old), str(new))), 3, 3),
+    'SUBSTRING': (_string_function(lambda value, start, end=None: value[int(start):None if end is None else int(end)]), 2, 3),
+    'LENGTH': (lambda value: None if value is None else len(value), 1, 1),
+    'CONTAINS': (_contains, 2, 2),
+    'STARTSWITH': (_string_function(lambda value, prefix: value.startswith(str(prefix))), 2, 2),
+    'STARTS_WITH': (_string_function(lambda value, prefix: value.startswith(str(prefix))), 2, 2),
+    'ENDSWITH': (_string_function(lambda value, suffix: value.endswith(str(suffix))), 2, 2),
+    'INTEGER': (_integer, 1, 1),
+    'LOOKUP': (_lookup, 2, 3),
+}
+
+# Member calls such as data.tags.contains('vip'): name -> function(target, *args)
+METHOD_FUNCTIONS = {
+    'contains': _contains,
+    'startswith': _string_function(lambda value, prefix: value.startswith(str(prefix))),
+    'endswith': _string_function(lambda value, suffix: value.endswith(str(suffix))),
+    'lower': _string_function(str.lower),
+    'upper': _string_function(str.upper),
+    'trim': _string_function(str.strip),
+    'strip': _string_function(str.strip),
+    'split': _string_function(lambda value, separator=None: value.split(separator)),
+    'length': lambda value: None if value is None else len(value),
+    'size': lambda value: None if value is None else len(value),
+}
+
+
+# Compiler
+
+def _compile(node) -> ColumnFunction:
+    """Compile an AST node into a function from a batch to a result column."""
+    if isinstance(node, Literal):
+        value = node.value
+        return lambda batch: [value] * batch.size
+
+    if isinstance(node, Reference):
+        return _compile_reference(node)
+
+    if isinstance(node, BinaryOp):
+        return _compile_binary(node)
+
+    if isinstance(node, UnaryOp):
+        operand = _compile(node.operand)
+        if node.op == '!':
+            return lambda batch: list(map(operator.not_, operand(batch)))
+
+        def negate(batch: _Batch) -> list:
+            try:
+                return [None if value is None else -value for value in operand(batch)]
+            except TypeError as e:
+                raise DSLEvaluationError(f"Cannot negate value: {e}", node.position)
+        return negate
+
+    if isinstance(node, Subscript):
+        target, index = _compile(node.target), _compile(node.index)
+        return lambda batch: [_member(value, key) for value, key in zip(target(batch), index(batch))]
+
+    if isinstance(node, ListExpr):
+        items = [_compile(item) for item in node.items]
+        if not items:
+            return lambda batch: [[] for _ in range(batch.size)]
+        return lambda batch: list(map(list, zip(*(item(batch) for item in items))))
+
+    if isinstance(node, ObjectExpr):
+        return _compile_object(node, _compile)
+
+    if isinstance(node, Call):
+        return _compile_call(node)
+
+    if isinstance(node, MethodCall):
+        return _compile_method(node)
+
+    raise DSLEvaluationError(f"Cannot evaluate {type(node).__name__}", getattr(node, 'position', 0))
+
+
+def _compile_reference(node: Reference) -> ColumnFunction:
+    root, path, position = node.root, node.path, node.position
+
+    def run(batch: _Batch) -> list:
+        column = batch.columns.get(root)
+        if column is None:
+            if root not in batch.roots:
+                raise DSLEvaluationError(f"Unknown variable '{root}'", position)
+            return [_walk(batch.roots[root], path)] * batch.size
+
+        for key in path:
+            try:
+                # Fast path for records that all have the field
+                column = list(map(operator.itemgetter(key), column))
+            except (KeyError, IndexError, TypeError):
+                column = [_member(value, key) for value in column]
+        return column
+    return run
+
+
+def _compile_binary(node: BinaryOp) -> ColumnFunction:
+    left, right = _compile(node.left), _compile(node.right)
+
+    if node.op in ('&&', '||'):
+        # Evaluate the right side only for records the left side does not decide
+        needs_right = bool if node.op == '&&' else (lambda value: not value)
+
+        def logical(batch: _Batch) -> list:
+            result = _truthy(left(batch))
+            pending = [i for i, value in enumerate(result) if needs_right(value)]
+            if not pending:
+                return result
+            if len(pending) == batch.size:
+                return _truthy(right(batch))
+            for i, value in zip(pending, right(batch.take(pending))):
+                result[i] = bool(value)
+            return result
+        return logical
+
+    function = _binary_function(node.op, node.position)
+    return lambda batch: function(left(batch), right(batch))
+
+
+def _compile_object(node: ObjectExpr, compile_value: Callable[[Any], ColumnFunction]) -> ColumnFunction:
+    keys = [key for key, _ in node.entries]
+    values = [compile_value(value) for _, value in node.entries]
+    if not values:
+        return lambda batch: [{} for _ in range(batch.size)]
+    return lambda batch: [dict(zip(keys, row)) for row in zip(*(value(batch) for value in values))]
+
+
+def _compile_converter(node) -> ColumnFunction:
+    """
+    Compile a Bender converter or condition.
+
+    Bender converters are often written as quoted DSL, e.g.
+    $MAP(data.users, {"id": "item.id"}); string literals that parse as DSL
+    are evaluated as expressions. A bare word that names no variable, as in
+    {"status": "Active"}, is a constant.
+    """
+    if isinstance(node, Literal) and isinstance(node.value, str):
+        parsed = parse_dsl(node.value.strip())
+        if parsed.ok:
+            ast = parsed.ast
+            if isinstance(ast, Reference) and not ast.path:
+                return _compile_word(ast, node.value)
+            return _compile(ast)
+    if isinstance(node, ObjectExpr):
+        return _compile_object(node, _compile_converter)
+    return _compile(node)
+
+
+def _compile_word(node: Reference, text: str) -> ColumnFunction:
+    """Compile a converter string holding one word: the variable it names, or the text itself."""
+    reference = _compile_reference(node)
+
+    def run(batch: _Batch) -> list:
+        if node.root in batch.columns or node.root in batch.roots:
+            return reference(batch)
+        return [text] * batch.size
+    return run
+
+
+def _flatten(column: list, function: str, position: int):
+    """Flatten the arrays of a batch into one list, remembering each record's length."""
+    lengths = []
+    values = []
+    for items in column:
+        if items is None:
+            lengths.append(0)
+            continue
+        if not isinstance(items, list):
+            raise DSLEvaluationError(f"${function} expects an array, got {type(items).__name__}", position)
+        lengths.append(len(items))
+        values.extend(items)
+    return lengths, values
+
+
+def _split(column: list, lengths: List[int], sources: list) -> list:
+    """Split a flattened result back into one list per record (null stays null)."""
+    result = []
+    start = 0
+    for length, source in zip(lengths, sources):
+        if source is None:
+            result.append(None)
+        else:
+            result.append(column[start:start + length])
+        start += length
+    return result
+
+
+def _check_arguments(node: Call, minimum: int, maximum: Optional[int]):
+    count = len(node.args)
+    if node.keywords:
+        raise DSLEvaluationError(f"${node.name} does not accept keyword arguments", node.position)
+    if count < minimum:
+        raise DSLEvaluationError(f"${node.name} requires at least {minimum} argument(s), got {count}", node.position)
+    if maximum is not None and count > maximum:
+        raise DSLEvaluationError(f"${node.name} accepts at most {maximum} argument(s), got {count}", node.position)
+
+
+def _compile_call(node: Call) -> ColumnFunction:
+    name = node.name.upper()
+    if not node.dollar:
+        raise DSLEvaluationError(f"DSL function '{node.name}' should start with '$'", node.position)
+
+    if name == 'MAP':
+        _check_arguments(node, 2, 3)
+        items, converter = _compile(node.args[0]), _compile_converter(node.args[1])
+        context = _compile(node.args[2]) if len(node.args) > 2 else None
+
+        def map_items(batch: _Batch) -> list:
+            sources = items(batch)
+            lengths, values = _flatten(sources, 'MAP', node.position)
+            child = batch.expand(lengths, 'item', values)
+            if context is not None:
+                context_values = context(batch)
+                child.columns['context'] = [value for value, count in zip(context_values, lengths)
+                                            for _ in range(count)]
+            return _split(converter(child), lengths, sources)
+        return map_items
+
+    if name == 'FILTER':
+        _check_arguments(node, 2, 2)
+        items, condition = _compile(node.args[0]), _compile_converter(node.args[1])
+
+        def filter_items(batch: _Batch) -> list:
+            sources = items(batch)
+            lengths, values = _flatten(sources, 'FILTER', node.position)
+            flags = _truthy(condition(batch.expand(lengths, 'item', values))) if values else []
+            result = []
+            start = 0
+            for length, source in zip(lengths, sources):
+                end = start + length
+                if source is None:
+                    result.append(None)
+                else:
+                    result.append([value for value, flag in zip(values[start:end], flags[start:end]) if flag])
+                start = end
+            return result
+        return filter_items
+
+    if name in ('IF', 'CONDITIONAL'):
+        _check_arguments(node, 3, 3)
+        condition = _compile_converter(node.args[0]) if name == 'CONDITIONAL' else _compile(node.args[0])
+        on_pass, on_fail = _compile(node.args[1]), _compile(node.args[2])
+
+        def conditional(batch: _Batch) -> list:
+            flags = _truthy(condition(batch))
+            passed = [i for i, flag in enumerate(flags) if flag]
+            if len(passed) == batch.size:
+                return on_pass(batch)
+            if not passed:
+                return on_fail(batch)
+            failed = [i for i, flag in enumerate(flags) if not flag]
+            return _scatter(batch.size, [
+                (passed, on_pass(batch.take(passed))),
+                (failed, on_fail(batch.take(failed))),
+            ])
+        return conditional
+
+    if name not in ROW_FUNCTIONS:
+        raise DSLEvaluationError(f"Function ${node.name} is not supported by the evaluator", node.position)
+
+    function, minimum, maximum = ROW_FUNCTIONS[name]
+    _check_arguments(node, minimum, maximum)
+    args = [_compile(arg) for arg in node.args]
+
+    def call(batch: _Batch) -> list:
+        try:
+            return list(map(function, *(arg(batch) for arg in args)))
+        except (TypeError, ValueError, AttributeError) as e:
+            raise DSLEvaluationError(f"${node.name} failed: {e}", node.position)
+    return call
+
+
+def _compile_method(node: MethodCall) -> ColumnFunction:
+    function = METHOD_FUNCTIONS.get(node.name.lower())
+    if function is None:
+        raise DSLEvaluationError(f"Method .{node.name}() is not supported by the evaluator", node.position)
+    target = _compile(node.target)
+    args = [_compile(arg) for arg in node.args]
+
+    def call(batch: _Batch) -> list:
+        try:
+            return list(map(function, target(batch), *(arg(batch) for arg in args)))
+        except (TypeError, ValueError, AttributeError) as e:
+            raise DSLEvaluationError(f".{node.name}() failed: {e}", node.position)
+    return call
+
+
+@lru_cache(maxsize=DSL_COMPILE_CACHE_SIZE)
+def compile_dsl(expression: str) -> ColumnFunction:
+    """
+    Compile a DSL expression into a batch column function.
+
+    Args:
+        expression: The DSL expression
+
+    Returns:
+        Compiled column function
+
+    Raises:
+        DSLEvaluationError: If the expression does not parse or uses an
+            unsupported function
+    """
+    parsed = parse_dsl(expression)
+    if not parsed.ok:
+        raise DSLEvaluationError(f"Syntax error: {parsed.error}", parsed.error.position)
+    return _compile(parsed.ast)
+
+
+class DSLEvaluator:
+    """
+    Evaluates DSL expressions against sample data.
+
+    Data can be given as a DataContext (its inputs and step outputs make up
+    'data') or as a plain dictionary used as 'data'.
+    """
+
+    def _roots(self, data: Any, meta_info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if isinstance(data, DataContext):
+            roots = {'data': {**data.initial_inputs, **data.step_outputs}, 'meta_info': data.meta_info}
+        else:
+            roots = {'data': data if data is not None else {}, 'meta_info': {}}
+        if meta_info is not None:
+            roots['meta_info'] = meta_info
+        return roots
+
+    def evaluate(self, expression: str, data: Any = None, meta_info: Optional[Dict[str, Any]] = None,
+                 variables: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Evaluate an expression once.
+
+        Args:
+            expression: The DSL expression
+            data: DataContext or dictionary providing 'data'
+            meta_info: Optional meta_info override
+            variables: Extra variables such as a loop's item
+
+        Returns:
+            The expression's value
+
+        Raises:
+            DSLEvaluationError: If the expression cannot be evaluated
+        """
+        roots = self._roots(data, meta_info)
+        if variables:
+            roots.update(variables)
+        return compile_dsl(expression.strip())(_Batch(1, {}, roots))[0]
+
+    def evaluate_batch(self, expression: str, records: Sequence[Any], variable: str = DEFAULT_RECORD_VARIABLE,
+                       data: Any = None, meta_info: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """
+        Evaluate an expression for every record in one batch.
+
+        Args:
+            expression: The DSL expression
+            records: Records to evaluate against
+            variable: Name bound to each record; use 'data' to evaluate
+                expressions written against data (e.g. switch conditions)
+                with each record as the data object
+            data: DataContext or dictionary providing 'data' when variable
+                is not 'data'
+            meta_info: Optional meta_info override
+
+        Returns:
+            One result per record, in order
+
+        Raises:
+            DSLEvaluationError: If the expression cannot be evaluated
+        """
+        function = compile_dsl(expression.strip())
+        records = list(records)
+        if not records:
+            return []
+        return function(_Batch(len(records), {variable: records}, self._roots(data, meta_info)))
+
+    def filter_records(self, condition: str, records: Sequence[Any], variable: str = DEFAULT_RECORD_VARIABLE,
+                       data: Any = None, meta_info: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """
+        Get the records for which a condition is true.
+
+        Args:
+            condition: DSL condition
+            records: Records to test
+            variable: Name bound to each record
+            data: DataContext or dictionary providing 'data'
+            meta_info: Optional meta_info override
+
+        Returns:
+            Matching records, in order
+        """
+        records = list(records)
+        flags = self.evaluate_batch(condition, records, variable, data, meta_info)
+        return [record for record, flag in zip(records, flags) if flag]
+
+
+def clear_dsl_compile_cache():
+    """Clear the compiled expression cache."""
+    compile_dsl.cache_clear()
+
+
+# Global evaluator instance
+dsl_evaluator = DSLEvaluator()
@@ -17,7 +17,8 @@ from PySide6.QtCore import Signal, Qt, QStringListModel
 from PySide6.QtGui import QIcon, QFont, QPixmap, QPainter, QColor, QAction
 from typing import List, Optional
 
-from dsl_validator import dsl_validator, is_dsl_expression
+from dsl_validator import dsl_validator
+from dsl_classifier import is_dsl_expression
 from dsl_builder_widget import DSLBuilderWidget
 
 
@@ -0,0 +1,623 @@
+"""
+DSL Parser for Moveworks Data Mapping Syntax (DSL) expressions.
+
+This module turns a DSL expression into a typed abstract syntax tree in a
+single left-to-right pass:
+- A tokenizer built on one compiled master pattern
+- A recursive-descent parser with the usual operator precedence
+  (||, &&, comparisons, + -, * / %, unary ! -, member/index/call access)
+- AST nodes for literals, data/meta_info references, operators, $FUNC(...)
+  and Bender calls, lists, objects and method calls such as .contains()
+  or .$TITLECASE()
+
+Parse results are cached per expression, so the validators, the realtime
+widgets and the evaluator can all ask for the same expression's AST without
+re-parsing it.
+
+The parser is stricter than the regex checks it replaced. These are syntax
+errors now, where they used to pass validation:
+- doubled quotes inside a string ('it''s'; escape the quote as \\' instead)
+- template braces ({{data.x}})
+- unterminated strings and characters outside the DSL (data.a @ b)
+- empty path segments (data..x)
+- expressions nested more than MAX_NESTING_DEPTH levels deep
+References are still recovered from the tokens of an expression that does
+not parse, so data paths of invalid expressions are still reported.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+
+# Number of parsed expressions to remember
+DSL_AST_CACHE_SIZE = 4096
+
+# Maximum nesting of groups, operands, arguments and prefix operators
+MAX_NESTING_DEPTH = 100
+
+# Reference roots that address workflow data
+DATA_ROOTS = ('data', 'meta_info')
+
+# Word forms of the logical operators
+KEYWORD_OPERATORS = {'and': '&&', 'or': '||', 'not': '!'}
+
+# Literal keywords
+KEYWORD_LITERALS = {'true': True, 'false': False, 'null': None, 'none': None}
+
+COMPARISON_OPERATORS = frozenset({'==', '!=', '>=', '<=', '>', '<'})
+LOGICAL_OPERATORS = frozenset({'&&', '||'})
+ADDITIVE_OPERATORS = frozenset({'+', '-'})
+MULTIPLICATIVE_OPERATORS = frozenset({'*', '/', '%'})
+
+# Binary operator precedence (higher binds tighter); a single '=' is parsed
+# as a comparison so it can be reported as a mistake for '=='
+BINARY_PRECEDENCE = {'||': 1, '&&': 2, '=': 3, '+': 4, '-': 4, '*': 5, '/': 5, '%': 5}
+BINARY_PRECEDENCE.update(dict.fromkeys(COMPARISON_OPERATORS, 3))
+
+# Token kinds that can come from word operators (and, or, not)
+WORD_OPERATOR_KINDS = frozenset(KEYWORD_OPERATORS.values())
+
+_TOKEN_REGEX = re.compile(r'''
+    (?P<WS>\s+)
+  | (?P<NUMBER>\d+(?:\.\d+)?)
+  | (?P<STRING>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+  | (?P<BADSTRING>['"])
+  | (?P<FUNC>\$[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<NAME>[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)
+  | (?P<SYMBOL>==|!=|>=|<=|&&|\|\||[<>!=+\-*/%()\[\]{},.:])
+  | (?P<MISMATCH>.)
+''', re.VERBOSE | re.DOTALL)
+
+_ESCAPE_REGEX = re.compile(r'\\(.)', re.DOTALL)
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r'}
+
+_IDENTIFIER_REGEX = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+class DSLSyntaxError(Exception):
+    """Raised when a DSL expression cannot be parsed."""
+
+    def __init__(self, message: str, position: int):
+        super().__init__(f"{message} at position {position}")
+        self.message = message
+        self.position = position
+
+
+class Token(NamedTuple):
+    """
+    A lexical token of a DSL expression.
+
+    Operators and punctuation use the operator text as their kind (word
+    operators are normalized, e.g. 'and' has kind '&&'); other kinds are
+    NUMBER, STRING, FUNC, NAME and EOF.
+    """
+    kind: str
+    value: str
+    position: int
+
+
+# AST nodes
+
+@dataclass
+class Literal:
+    """A string, number, boolean or null literal."""
+    value: Any
+    position: int
+
+
+@dataclass
+class Reference:
+    """A dotted reference such as data.users[0].name, meta_info.user or item.id."""
+    root: str
+    path: Tuple[Union[str, int], ...]
+    position: int
+
+    @property
+    def text(self) -> str:
+        """The reference as written, normalized (e.g. data.users[0].name)."""
+        parts = [self.root]
+        for part in self.path:
+            if isinstance(part, int):
+                parts.append(f"[{part}]")
+            elif _IDENTIFIER_REGEX.match(part):
+                parts.append(f".{part}")
+            else:
+                parts.append(f'["{part}"]')
+        return ''.join(parts)
+
+    @property
+    def dotted_path(self) -> str:
+        """The reference in DataContext path form (e.g. data.users.0.name)."""
+        return '.'.join([self.root] + [str(part) for part in self.path])
+
+    @property
+    def is_data_reference(self) -> bool:
+        return self.root in DATA_ROOTS and bool(self.path)
+
+
+@dataclass
+class Subscript:
+    """A computed index such as data.items[data.index]."""
+    target: Any
+    index: Any
+    position: int
+
+
+@dataclass
+class UnaryOp:
+    """A prefix operator (! or -)."""
+    op: str
+    operand: Any
+    position: int
+
+
+@dataclass
+class BinaryOp:
+    """An infix operator; word forms (and/or) are normalized to && and ||."""
+    op: str
+    left: Any
+    right: Any
+    position: int
+
+
+@dataclass
+class Call:
+    """
+    A function call; dollar is False for calls written without the leading '$'.
+
+    A call written on a receiver (item.name.$TITLECASE()) has method set and
+    the receiver as its first argument, as if written $TITLECASE(item.name).
+    """
+    name: str
+    args: Tuple[Any, ...]
+    keywords: Tuple[Tuple[str, Any], ...]
+    dollar: bool
+    position: int
+    method: bool = False
+
+    @property
+    def arg_count(self) -> int:
+        return len(self.args) + len(self.keywords)
+
+
+@dataclass
+class MethodCall:
+    """A member call such as data.tags.contains('vip')."""
+    target: Any
+    name: str
+    args: Tuple[Any, ...]
+    position: int
+
+
+@dataclass
+class ListExpr:
+    """A list literal such as [data.first, ' ', data.last]."""
+    items: Tuple[Any, ...]
+    position: int
+
+
+@dataclass
+class ObjectExpr:
+    """An object literal such as {"id": "item.id"}."""
+    entries: Tuple[Tuple[str, Any], ...]
+    position: int
+
+
+DSLNode = Union[Literal, Reference, Subscript, UnaryOp, BinaryOp, Call, MethodCall, ListExpr, ObjectExpr]
+
+
+@dataclass
+class DSLParseResult:
+    """
+    Outcome of parsing an expression.
+
+    Results are shared between callers through the cache and must be
+    treated as read-only.
+    """
+    expression: str
+    tokens: Tuple[Token, ...]
+    ast: Optional[DSLNode]
+    error: Optional[DSLSyntaxError]
+    diagnostics: Tuple[Tuple[str, int], ...] = ()
+    nodes: Tuple[DSLNode, ...] = ()
+    references: Tuple[Reference, ...] = ()
+    calls: Tuple[Call, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def data_references(self) -> Tuple[Reference, ...]:
+        """References rooted at data or meta_info."""
+        return tuple(node for node in self.references if node.is_data_reference)
+
+
+def _unescape(text: str) -> str:
+    return _ESCAPE_REGEX.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), text)
+
+
+def _scan(expression: str) -> Tuple[List[Token], Optional[DSLSyntaxError]]:
+    """Tokenize an expression, stopping at the first lexical error; the tokens read so far are kept."""
+    tokens = []
+    append = tokens.append
+    for match in _TOKEN_REGEX.finditer(expression):
+        kind = match.lastgroup
+        if kind == 'WS':
+            continue
+        value = match.group()
+        if kind == 'SYMBOL':
+            # Operators and punctuation use their own text as the kind
+            kind = value
+        elif kind == 'NAME':
+            kind = KEYWORD_OPERATORS.get(value.lower(), kind)
+        elif kind == 'BADSTRING':
+            return tokens, DSLSyntaxError("Unterminated string literal", match.start())
+        elif kind == 'MISMATCH':
+            return tokens, DSLSyntaxError(f"Unexpected character '{value}'", match.start())
+        append(Token(kind, value, match.start()))
+    append(Token('EOF', '', len(expression)))
+    return tokens, None
+
+
+def tokenize(expression: str) -> List[Token]:
+    """
+    Split a DSL expression into tokens.
+
+    Args:
+        expression: The DSL expression
+
+    Returns:
+        List of tokens, ending with an EOF token
+
+    Raises:
+        DSLSyntaxError: On an unterminated string or an unexpected character
+    """
+    tokens, error = _scan(expression)
+    if error is not None:
+        raise error
+    return tokens
+
+
+def _token_references(tokens: List[Token]) -> Tuple[Reference, ...]:
+    """Recover the references of an expression that does not parse from its name tokens."""
+    references = []
+    for i, token in enumerate(tokens):
+        if token.kind != 'NAME' or (i and tokens[i - 1].kind == '.'):
+            continue
+        root, *names = token.value.split('.')
+        if i + 1 < len(tokens) and tokens[i + 1].kind == '(':
+            # A function or method name, not a field
+            if not names:
+                continue
+            names.pop()
+        if not names and root.lower() in KEYWORD_LITERALS:
+            continue
+        references.append(Reference(root, tuple(names), token.position))
+    return tuple(references)
+
+
+class _Parser:
+    """Recursive-descent parser over a token list, using precedence climbing for binary operators."""
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.index = 0
+        self.depth = 0
+        self.diagnostics: List[Tuple[str, int]] = []
+
+    # Token helpers
+
+    def advance(self) -> Token:
+        token = self.tokens[self.index]
+        if token.kind != 'EOF':
+            self.index += 1
+        return token
+
+    def expect(self, kind: str, context: str) -> Token:
+        token = self.tokens[self.index]
+        if token.kind != kind:
+            raise DSLSyntaxError(f"Expected '{kind}' {context}, found {self.describe(token)}", token.position)
+        self.index += 1
+        return token
+
+    def nest(self):
+        """Enter one level of nesting, so deeply nested input fails cleanly instead of exhausting the stack."""
+        self.depth += 1
+        if self.depth > MAX_NESTING_DEPTH:
+            raise DSLSyntaxError(f"Expression is nested more than {MAX_NESTING_DEPTH} levels deep",
+                                 self.tokens[self.index].position)
+
+    @staticmethod
+    def describe(token: Token) -> str:
+        return "end of expression" if token.kind == 'EOF' else f"'{token.value}'"
+
+    # Grammar
+
+    def parse(self) -> DSLNode:
+        if self.tokens[0].kind == 'EOF':
+            raise DSLSyntaxError("Expected an expression", self.tokens[0].position)
+        node = self.parse_expression()
+        token = self.tokens[self.index]
+        if token.kind != 'EOF':
+            raise DSLSyntaxError(f"Unexpected {self.describe(token)}", token.position)
+        return node
+
+    def parse_expression(self, min_precedence: int = 1) -> DSLNode:
+        self.nest()
+        node = self.parse_unary()
+        tokens = self.tokens
+        while True:
+            token = tokens[self.index]
+            precedence = BINARY_PRECEDENCE.get(token.kind)
+            if precedence is None or precedence < min_precedence:
+                self.depth -= 1
+                return node
+            self.index += 1
+            op = token.kind
+            if op == '=':
+                # Recover as '==' so the rest of the expression is still checked
+                self.diagnostics.append(("Use '==' for comparison, not '='", token.position))
+                op = '=='
+            node = BinaryOp(op, node, self.parse_expression(precedence + 1), token.position)
+
+    def parse_unary(self) -> DSLNode:
+        token = self.tokens[self.index]
+        if token.kind == '!' or token.kind == '-':
+            self.index += 1
+            self.nest()
+            node = UnaryOp(token.kind, self.parse_unary(), token.position)
+            self.depth -= 1
+            return node
+        return self.parse_postfix(self.parse_primary())
+
+    def parse_postfix(self, node: DSLNode) -> DSLNode:
+        tokens = self.tokens
+        while True:
+            kind = tokens[self.index].kind
+            if kind == '.':
+                dot = self.advance()
+                token = tokens[self.index]
+                if token.kind == 'FUNC':
+                    self.index += 1
+                    node = self.parse_function_method(node, token)
+                    continue
+                # Word operators are valid field names after a dot
+                if token.kind != 'NAME' and not (token.value[:1].isalpha() and token.kind in WORD_OPERATOR_KINDS):
+                    if token.kind == '.':
+                        raise DSLSyntaxError("Data reference contains double dots", dot.position)
+                    raise DSLSyntaxError(f"Expected a field name after '.', found {self.describe(token)}",
+                                         token.position)
+                self.index += 1
+                node = self.parse_members(node, token.value.split('.'), token.position)
+
+            elif kind == '[':
+                bracket = self.advance()
+                index = self.parse_expression()
+                self.expect(']', "to close index")
+                static = isinstance(index, Literal) and isinstance(index.value, (int, str)) \
+                    and not isinstance(index.value, bool)
+                if isinstance(node, Reference) and static:
+                    node = Reference(node.root, node.path + (index.value,), node.position)
+                else:
+                    node = Subscript(node, index, bracket.position)
+
+            else:
+                return node
+
+    def parse_members(self, node: DSLNode, names: List[str], position: int) -> DSLNode:
+        """Apply '.name' accesses; a trailing name followed by '(' is a method call."""
+        is_call = self.tokens[self.index].kind == '('
+        fields = names[:-1] if is_call else names
+        if isinstance(node, Reference):
+            node = Reference(node.root, node.path + tuple(fields), node.position)
+        else:
+            for name in fields:
+                node = Subscript(node, Literal(name, position), position)
+        if is_call:
+            args, _ = self.parse_arguments(f"in call to .{names[-1]}()", allow_keywords=False)
+            node = MethodCall(node, names[-1], args, position)
+        return node
+
+    def parse_function_method(self, receiver: DSLNode, token: Token) -> Call:
+        """Parse '.$FUNC(args)' after a receiver as $FUNC(receiver, args)."""
+        name = token.value[1:]
+        if self.tokens[self.index].kind != '(':
+            raise DSLSyntaxError(f"Expected '(' after ${name}", self.tokens[self.index].position)
+        args, keywords = self.parse_arguments(f"in call to ${name}")
+        return Call(name, (receiver,) + args, keywords, True, token.position, method=True)
+
+    def parse_primary(self) -> DSLNode:
+        token = self.tokens[self.index]
+        kind = token.kind
+
+        if kind == 'NAME':
+            self.index += 1
+            if '.' in token.value:
+                # Dotted names are tokenized whole (data.user.email is one token)
+                root, *names = token.value.split('.')
+                return self.parse_members(Reference(root, (), token.position), names, token.position)
+            lowered = token.value.lower()
+            if lowered in KEYWORD_LITERALS:
+                return Literal(KEYWORD_LITERALS[lowered], token.position)
+            if self.tokens[self.index].kind == '(':
+                args, keywords = self.parse_arguments(f"in call to {token.value}")
+                return Call(token.value, args, keywords, False, token.position)
+            return Reference(token.value, (), token.position)
+
+        if kind == 'STRING':
+            self.index += 1
+            return Literal(_unescape(token.value[1:-1]), token.position)
+
+        if kind == 'NUMBER':
+            self.index += 1
+            value = float(token.value) if '.' in token.value else int(token.value)
+            return Literal(value, token.position)
+
+        if kind == 'FUNC':
+            self.index += 1
+            name = token.value[1:]
+            if self.tokens[self.index].kind != '(':
+                raise DSLSyntaxError(f"Expected '(' after ${name}", self.tokens[self.index].position)
+            args, keywords = self.parse_arguments(f"in call to ${name}")
+            return Call(name, args, keywords, True, token.position)
+
+        if kind == '(':
+            self.index += 1
+            node = self.parse_expression()
+            self.expect(')', "to close group")
+            return node
+
+        if kind == '[':
+            self.index += 1
+            items = []
+            if self.tokens[self.index].kind != ']':
+                items.append(self.parse_expression())
+                while self.tokens[self.index].kind == ',':
+                    self.index += 1
+                    items.append(self.parse_expression())
+            self.expect(']', "to close list")
+            return ListExpr(tuple(items), token.position)
+
+        if kind == '{':
+            return self.parse_object()
+
+        if kind == 'EOF':
+            raise DSLSyntaxError("Expected an expression, found end of expression", token.position)
+        if kind in WORD_OPERATOR_KINDS and token.value[:1].isalpha():
+            raise DSLSyntaxError(f"Unexpected operator '{token.value}'", token.position)
+        raise DSLSyntaxError(f"Unexpected '{token.value}'", token.position)
+
+    def parse_arguments(self, context: str, allow_keywords: bool = True):
+        tokens = self.tokens
+        self.expect('(', context)
+        args = []
+        keywords = []
+        if tokens[self.index].kind != ')':
+            while True:
+                if allow_keywords and tokens[self.index].kind == 'NAME' and tokens[self.index + 1].kind == '=':
+                    name = tokens[self.index].value
+                    self.index += 2
+                    keywords.append((name, self.parse_expression()))
+                else:
+                    args.append(self.parse_expression())
+                if tokens[self.index].kind != ',':
+                    break
+                self.index += 1
+        self.expect(')', context)
+        return tuple(args), tuple(keywords)
+
+    def parse_object(self) -> ObjectExpr:
+        start = self.advance()
+        entries = []
+        if self.tokens[self.index].kind != '}':
+            while True:
+                token = self.tokens[self.index]
+                if token.kind == 'STRING':
+                    key = _unescape(token.value[1:-1])
+                elif token.kind == 'NAME':
+                    key = token.value
+                else:
+                    raise DSLSyntaxError(f"Expected an object key, found {self.describe(token)}", token.position)
+                self.index += 1
+                self.expect(':', "after object key")
+                entries.append((key, self.parse_expression()))
+                if self.tokens[self.index].kind != ',':
+                    break
+                self.index += 1
+        self.expect('}', "to close object")
+        return ObjectExpr(tuple(entries), start.position)
+
+
+def iter_nodes(node: Optional[DSLNode]) -> Iterator[DSLNode]:
+    """
+    Walk an AST in source order (pre-order, children left to right).
+
+    Args:
+        node: Root node, or None
+
+    Yields:
+        Every node in the tree
+    """
+    stack = [node] if node is not None else []
+    while stack:
+        current = stack.pop()
+        yield current
+
+        if isinstance(current, BinaryOp):
+            children = (current.left, current.right)
+        elif isinstance(current, UnaryOp):
+            children = (current.operand,)
+        elif isinstance(current, Call):
+            children = current.args + tuple(value for _, value in current.keywords)
+        elif isinstance(current, MethodCall):
+            children = (current.target,) + current.args
+        elif isinstance(current, Subscript):
+            children = (current.target, current.index)
+        elif isinstance(current, ListExpr):
+            children = current.items
+        elif isinstance(current, ObjectExpr):
+            children = tuple(value for _, value in current.entries)
+        else:
+            continue
+        stack.extend(reversed(children))
+
+
+@lru_cache(maxsize=DSL_AST_CACHE_SIZE)
+def parse_dsl(expression: str) -> DSLParseResult:
+    """
+    Parse a DSL expression, reusing the cached result for repeated expressions.
+
+    Syntax errors do not raise; they are reported on the result, which
+    then has no AST but still lists the references found in the tokens.
+
+    Args:
+        expression: The DSL expression
+
+    Returns:
+        DSLParseResult with the AST (None if parsing failed)
+    """
+    tokens, error = _scan(expression)
+    if error is not None:
+        return DSLParseResult(expression, tuple(tokens), None, error,
+                              references=_token_references(tokens))
+
+    parser = _Parser(tokens)
+    try:
+        ast = parser.parse()
+    except DSLSyntaxError as e:
+        return DSLParseResult(expression, tuple(tokens), None, e, tuple(parser.diagnostics),
+                              references=_token_references(tokens))
+
+    nodes = tuple(iter_nodes(ast))
+    return DSLParseResult(
+        expression, tuple(tokens), ast, None, tuple(parser.diagnostics), nodes,
+        references=tuple(node for node in nodes if type(node) is Reference),
+        calls=tuple(node for node in nodes if type(node) is Call)
+    )
+
+
+def parse_dsl_expression(expression: str) -> DSLNode:
+    """
+    Parse a DSL expression and return its AST.
+
+    Args:
+        expression: The DSL expression
+
+    Returns:
+        Root AST node
+
+    Raises:
+        DSLSyntaxError: If the expression is not valid DSL
+    """
+    result = parse_dsl(expression.strip())
+    if result.error is not None:
+        raise DSLSyntaxError(result.error.message, result.error.position)
+    return result.ast
+
+
+def clear_dsl_parser_cache():
+    """Clear the parsed expression cache."""
+    parse_dsl.cache_clear()
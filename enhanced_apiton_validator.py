@@ -17,10 +17,27 @@ from apiton_validator import (
     validate_apiton_syntax,
     validate_script_step_structure,
     validate_apiton_data_references,
-    detect_import_statements_comprehensive
+    detect_import_statements_comprehensive,
+    get_apiton_analysis
 )
 
 
+# Enhanced import statement detection
+ENHANCED_IMPORT_PATTERNS = [
+    (re.compile(r'\bfrom\s+\w+(\.\w+)*\s+import\s+\w+', re.MULTILINE), "Enhanced: 'from ... import' statements are not allowed in APIthon"),
+    (re.compile(r'\bfrom\s+\w+(\.\w+)*\s+import\s+\*', re.MULTILINE), "Enhanced: 'from ... import *' statements are not allowed in APIthon"),
+    (re.compile(r'\bimport\s+\w+(\.\w+)*(\s+as\s+\w+)?', re.MULTILINE), "Enhanced: Import statements with aliases are not allowed in APIthon"),
+    (re.compile(r'__import__\s*\(\s*["\'][\w\.]+["\']\s*\)', re.MULTILINE), "Enhanced: Dynamic imports with __import__ are not allowed in APIthon"),
+]
+
+# Enhanced class definition detection
+ENHANCED_CLASS_PATTERNS = [
+    (re.compile(r'^\s*class\s+\w+\s*\(.*\)\s*:', re.MULTILINE), "Enhanced: Class definitions with inheritance are not allowed in APIthon"),
+    (re.compile(r'^\s*class\s+\w+\s*:', re.MULTILINE), "Enhanced: Class definitions are not allowed in APIthon"),
+    (re.compile(r'^\s*class\s+\w+\s*\(\s*\)\s*:', re.MULTILINE), "Enhanced: Empty class definitions are not allowed in APIthon"),
+]
+
+
 @dataclass
 class ValidationError:
     """Enhanced validation error with comprehensive location and context information."""
@@ -318,39 +335,34 @@ class EnhancedAPIthonValidator:
 
         Detects any identifiers starting with a single underscore (_) in user-provided APIthon code.
         """
-        lines = code.split('\n')
+        analysis = get_apiton_analysis(code)
+        lines = analysis.lines
         private_violations = []
 
-        # Regex pattern to find private identifiers
-        private_pattern = r'\b_[a-zA-Z_][a-zA-Z0-9_]*\b'
-
-        for line_num, line in enumerate(lines, 1):
-            matches = re.finditer(private_pattern, line)
-            for match in matches:
-                identifier = match.group()
-                # Skip double underscores (dunder methods) as they're handled elsewhere
-                if not identifier.startswith('__'):
-                    violation = {
-                        'identifier': identifier,
-                        'line_number': line_num,
-                        'column': match.start(),
-                        'line_content': line.strip()
-                    }
-                    private_violations.append(violation)
-
-                    # Extract code snippet for context
-                    start_line = max(0, line_num - 2)
-                    end_line = min(len(lines), line_num + 1)
-                    code_snippet = '\n'.join(f"{i+1:3}: {lines[i]}" for i in range(start_line, end_line))
-
-                    result.add_error(
-                        f"Private identifier '{identifier}' detected on line {line_num}",
-                        line_number=line_num,
-                        error_type="private_member",
-                        code_snippet=code_snippet,
-                        remediation=f"Rename '{identifier}' to remove the leading underscore (e.g., '{identifier[1:]}')",
-                        educational_context="APIthon does not allow private identifiers (starting with _) as they are reserved for internal use"
-                    )
+        for identifier, line_num, column in analysis.private_identifiers:
+            # Skip double underscores (dunder methods) as they're handled elsewhere
+            if not identifier.startswith('__'):
+                violation = {
+                    'identifier': identifier,
+                    'line_number': line_num,
+                    'column': column,
+                    'line_content': lines[line_num - 1].strip()
+                }
+                private_violations.append(violation)
+
+                # Extract code snippet for context
+                start_line = max(0, line_num - 2)
+                end_line = min(len(lines), line_num + 1)
+                code_snippet = '\n'.join(f"{i+1:3}: {lines[i]}" for i in range(start_line, end_line))
+
+                result.add_error(
+                    f"Private identifier '{identifier}' detected on line {line_num}",
+                    line_number=line_num,
+                    error_type="private_member",
+                    code_snippet=code_snippet,
+                    remediation=f"Rename '{identifier}' to remove the leading underscore (e.g., '{identifier[1:]}')",
+                    educational_context="APIthon does not allow private identifiers (starting with _) as they are reserved for internal use"
+                )
 
         result.private_member_violations = private_violations
 
@@ -358,7 +370,7 @@ class EnhancedAPIthonValidator:
         """
         Enhanced code length validation with precise byte counting and overage reporting.
         """
-        code_bytes = len(code.encode('utf-8'))
+        code_bytes = get_apiton_analysis(code).code_bytes
         result.code_length_analysis = {
             'code_bytes': code_bytes,
             'code_bytes_limit': self.constraints.max_code_bytes,
@@ -386,43 +398,39 @@ class EnhancedAPIthonValidator:
         """
         Detect large string literals and data structures that might approach size limits.
         """
-        try:
-            tree = ast.parse(code)
-            for node in ast.walk(tree):
-                # Check string literals
-                if isinstance(node, ast.Constant) and isinstance(node.value, str):
-                    string_size = len(node.value.encode('utf-8'))
-                    if string_size > 1000:  # Warn for strings > 1KB
-                        result.add_warning(
-                            f"Large string literal detected: {string_size} bytes",
-                            line_number=getattr(node, 'lineno', None),
-                            error_type="large_literal",
-                            remediation="Consider breaking large strings into smaller parts or using external data sources",
-                            educational_context="Large string literals can impact script performance and readability"
-                        )
-
-                # Check list/dict literals
-                elif isinstance(node, (ast.List, ast.Dict)):
-                    # Estimate size based on number of elements
-                    if isinstance(node, ast.List) and len(node.elts) > 50:
-                        result.add_warning(
-                            f"Large list literal with {len(node.elts)} elements detected",
-                            line_number=getattr(node, 'lineno', None),
-                            error_type="large_literal",
-                            remediation="Consider processing data in smaller chunks or using iteration",
-                            educational_context="Large data structures may approach serialization limits"
-                        )
-                    elif isinstance(node, ast.Dict) and len(node.keys) > 50:
-                        result.add_warning(
-                            f"Large dictionary literal with {len(node.keys)} keys detected",
-                            line_number=getattr(node, 'lineno', None),
-                            error_type="large_literal",
-                            remediation="Consider processing data in smaller chunks or using iteration",
-                            educational_context="Large data structures may approach serialization limits"
-                        )
-        except SyntaxError:
-            # Syntax errors are handled elsewhere
-            pass
+        # Syntax errors are handled elsewhere; unparsable code has no literal nodes
+        for node in get_apiton_analysis(code).literal_nodes:
+            # Check string literals
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                string_size = len(node.value.encode('utf-8'))
+                if string_size > 1000:  # Warn for strings > 1KB
+                    result.add_warning(
+                        f"Large string literal detected: {string_size} bytes",
+                        line_number=getattr(node, 'lineno', None),
+                        error_type="large_literal",
+                        remediation="Consider breaking large strings into smaller parts or using external data sources",
+                        educational_context="Large string literals can impact script performance and readability"
+                    )
+
+            # Check list/dict literals
+            elif isinstance(node, (ast.List, ast.Dict)):
+                # Estimate size based on number of elements
+                if isinstance(node, ast.List) and len(node.elts) > 50:
+                    result.add_warning(
+                        f"Large list literal with {len(node.elts)} elements detected",
+                        line_number=getattr(node, 'lineno', None),
+                        error_type="large_literal",
+                        remediation="Consider processing data in smaller chunks or using iteration",
+                        educational_context="Large data structures may approach serialization limits"
+                    )
+                elif isinstance(node, ast.Dict) and len(node.keys) > 50:
+                    result.add_warning(
+                        f"Large dictionary literal with {len(node.keys)} keys detected",
+                        line_number=getattr(node, 'lineno', None),
+                        error_type="large_literal",
+                        remediation="Consider processing data in smaller chunks or using iteration",
+                        educational_context="Large data structures may approach serialization limits"
+                    )
 
     def _enhanced_code_restrictions(self, code: str) -> List[str]:
         """
@@ -439,24 +447,9 @@ class EnhancedAPIthonValidator:
         # Start with basic restrictions
         errors.extend(validate_apiton_code_restrictions(code))
 
-        # Enhanced import statement detection
-        enhanced_import_patterns = [
-            (r'\bfrom\s+\w+(\.\w+)*\s+import\s+\w+', "Enhanced: 'from ... import' statements are not allowed in APIthon"),
-            (r'\bfrom\s+\w+(\.\w+)*\s+import\s+\*', "Enhanced: 'from ... import *' statements are not allowed in APIthon"),
-            (r'\bimport\s+\w+(\.\w+)*(\s+as\s+\w+)?', "Enhanced: Import statements with aliases are not allowed in APIthon"),
-            (r'__import__\s*\(\s*["\'][\w\.]+["\']\s*\)', "Enhanced: Dynamic imports with __import__ are not allowed in APIthon"),
-        ]
-
-        # Enhanced class definition detection
-        enhanced_class_patterns = [
-            (r'^\s*class\s+\w+\s*\(.*\)\s*:', "Enhanced: Class definitions with inheritance are not allowed in APIthon"),
-            (r'^\s*class\s+\w+\s*:', "Enhanced: Class definitions are not allowed in APIthon"),
-            (r'^\s*class\s+\w+\s*\(\s*\)\s*:', "Enhanced: Empty class definitions are not allowed in APIthon"),
-        ]
-
-        # Check enhanced patterns
-        for pattern, error_message in enhanced_import_patterns + enhanced_class_patterns:
-            if re.search(pattern, code, re.MULTILINE):
+        # Check enhanced import and class definition patterns
+        for pattern, error_message in ENHANCED_IMPORT_PATTERNS + ENHANCED_CLASS_PATTERNS:
+            if pattern.search(code):
                 errors.append(error_message)
 
         return errors
@@ -464,7 +457,7 @@ class EnhancedAPIthonValidator:
     def _validate_resource_constraints(self, code: str, result: APIthonValidationResult):
         """Validate APIthon resource constraints."""
         # Code byte size validation
-        code_bytes = len(code.encode('utf-8'))
+        code_bytes = get_apiton_analysis(code).code_bytes
         result.resource_usage['code_bytes'] = code_bytes
         result.resource_usage['code_bytes_limit'] = self.constraints.max_code_bytes
 
@@ -486,16 +479,8 @@ class EnhancedAPIthonValidator:
 
     def _validate_string_lengths(self, code: str, result: APIthonValidationResult):
         """Validate string literal lengths in the code."""
-        try:
-            tree = ast.parse(code)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Str):  # Python < 3.8
-                    self._check_string_length(node.s, result)
-                elif isinstance(node, ast.Constant) and isinstance(node.value, str):  # Python >= 3.8
-                    self._check_string_length(node.value, result)
-        except SyntaxError:
-            # Syntax errors are handled elsewhere
-            pass
+        for node in get_apiton_analysis(code).string_constants:
+            self._check_string_length(node.value, result)
 
     def _check_string_length(self, string_value: str, result: APIthonValidationResult):
         """Check individual string length against constraints."""
@@ -510,16 +495,8 @@ class EnhancedAPIthonValidator:
 
     def _validate_numeric_values(self, code: str, result: APIthonValidationResult):
         """Validate numeric values are within uint32 range."""
-        try:
-            tree = ast.parse(code)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Num):  # Python < 3.8
-                    self._check_numeric_value(node.n, result)
-                elif isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):  # Python >= 3.8
-                    self._check_numeric_value(node.value, result)
-        except SyntaxError:
-            # Syntax errors are handled elsewhere
-            pass
+        for node in get_apiton_analysis(code).numeric_constants:
+            self._check_numeric_value(node.value, result)
 
     def _check_numeric_value(self, value: Any, result: APIthonValidationResult):
         """Check individual numeric value against uint32 constraints."""
@@ -537,61 +514,60 @@ class EnhancedAPIthonValidator:
         Analyzes the final statement in APIthon code to ensure proper return value handling,
         providing specific warnings and remediation for common patterns that result in None.
         """
-        try:
-            tree = ast.parse(code)
-            statements = tree.body
+        tree = get_apiton_analysis(code).tree
+        if tree is None:
+            # Syntax errors are handled elsewhere
+            return
 
-            if not statements:
-                result.add_error(
-                    "Script must contain at least one statement",
-                    error_type="return_logic",
-                    remediation="Add at least one statement to process data",
-                    educational_context="APIthon scripts need statements to process data and produce output"
-                )
-                return
+        statements = tree.body
 
-            last_statement = statements[-1]
-            last_line_num = getattr(last_statement, 'lineno', len(code.split('\n')))
+        if not statements:
+            result.add_error(
+                "Script must contain at least one statement",
+                error_type="return_logic",
+                remediation="Add at least one statement to process data",
+                educational_context="APIthon scripts need statements to process data and produce output"
+            )
+            return
 
-            # Enhanced return analysis tracking
-            result.return_analysis['has_explicit_return'] = isinstance(last_statement, ast.Return)
-            result.return_analysis['last_statement_type'] = type(last_statement).__name__
-            result.return_analysis['statement_count'] = len(statements)
-            result.return_analysis['last_line_number'] = last_line_num
-            result.return_analysis['is_single_statement'] = len(statements) == 1
-            result.return_analysis['returns_value'] = False  # Will be set to True for valid patterns
+        last_statement = statements[-1]
+        last_line_num = getattr(last_statement, 'lineno', len(code.split('\n')))
 
-            # Comprehensive analysis for different statement types
-            if isinstance(last_statement, ast.Assign):
-                # Last line is an assignment - this will result in None being assigned to output_key
-                self._analyze_assignment_as_last_line(last_statement, last_line_num, result, statements)
+        # Enhanced return analysis tracking
+        result.return_analysis['has_explicit_return'] = isinstance(last_statement, ast.Return)
+        result.return_analysis['last_statement_type'] = type(last_statement).__name__
+        result.return_analysis['statement_count'] = len(statements)
+        result.return_analysis['last_line_number'] = last_line_num
+        result.return_analysis['is_single_statement'] = len(statements) == 1
+        result.return_analysis['returns_value'] = False  # Will be set to True for valid patterns
 
-            elif isinstance(last_statement, ast.Expr):
-                # Expression statement - analyze what type of expression
-                self._analyze_expression_as_last_line(last_statement, last_line_num, result, statements)
+        # Comprehensive analysis for different statement types
+        if isinstance(last_statement, ast.Assign):
+            # Last line is an assignment - this will result in None being assigned to output_key
+            self._analyze_assignment_as_last_line(last_statement, last_line_num, result, statements)
 
-            elif isinstance(last_statement, ast.Return):
-                # Explicit return - good practice
-                self._analyze_explicit_return(last_statement, last_line_num, result, statements)
+        elif isinstance(last_statement, ast.Expr):
+            # Expression statement - analyze what type of expression
+            self._analyze_expression_as_last_line(last_statement, last_line_num, result, statements)
 
-            elif isinstance(last_statement, (ast.If, ast.For, ast.While, ast.With, ast.Try)):
-                # Control flow as last statement - analyze potential return issues
-                self._analyze_control_flow_as_last_line(last_statement, last_line_num, result, statements)
+        elif isinstance(last_statement, ast.Return):
+            # Explicit return - good practice
+            self._analyze_explicit_return(last_statement, last_line_num, result, statements)
 
-            elif isinstance(last_statement, (ast.Pass, ast.Break, ast.Continue)):
-                # Statements that definitely don't return values
-                self._analyze_non_returning_statement(last_statement, last_line_num, result, statements)
+        elif isinstance(last_statement, (ast.If, ast.For, ast.While, ast.With, ast.Try)):
+            # Control flow as last statement - analyze potential return issues
+            self._analyze_control_flow_as_last_line(last_statement, last_line_num, result, statements)
 
-            else:
-                # Other statement types that might not return values
-                self._analyze_other_statement_types(last_statement, last_line_num, result, statements)
+        elif isinstance(last_statement, (ast.Pass, ast.Break, ast.Continue)):
+            # Statements that definitely don't return values
+            self._analyze_non_returning_statement(last_statement, last_line_num, result, statements)
 
-            # Provide comprehensive educational guidance
-            self._provide_return_logic_guidance(result, statements)
+        else:
+            # Other statement types that might not return values
+            self._analyze_other_statement_types(last_statement, last_line_num, result, statements)
 
-        except SyntaxError:
-            # Syntax errors are handled elsewhere
-            pass
+        # Provide comprehensive educational guidance
+        self._provide_return_logic_guidance(result, statements)
 
     def _analyze_assignment_as_last_line(self, assignment: ast.Assign, line_number: int,
                                        result: APIthonValidationResult, statements: list):
@@ -867,34 +843,34 @@ class EnhancedAPIthonValidator:
         result.citation_compliance['required_fields'] = list(self.citation_fields)
 
         # Analyze the return structure
-        try:
-            tree = ast.parse(code)
-            return_nodes = [node for node in ast.walk(tree) if isinstance(node, ast.Return)]
-
-            if not return_nodes:
-                # Check if last statement is a dict expression
-                if tree.body:
-                    last_stmt = tree.body[-1]
-                    if isinstance(last_stmt, ast.Expr) and isinstance(last_stmt.value, ast.Dict):
-                        self._check_citation_dict_structure(last_stmt.value, result, 'single')
-                    else:
-                        result.warnings.append(
-                            "output_key 'result' suggests citation format. "
-                            "Script should return a dictionary with citation fields (id, friendly_id, title, url, snippet)."
-                        )
-            else:
-                # Check return statement structure
-                for return_node in return_nodes:
-                    if return_node.value and isinstance(return_node.value, ast.Dict):
-                        self._check_citation_dict_structure(return_node.value, result, 'single')
+        analysis = get_apiton_analysis(code)
+        if analysis.tree is None:
+            return
 
-        except SyntaxError:
-            pass
+        tree = analysis.tree
+        return_nodes = analysis.return_nodes
+
+        if not return_nodes:
+            # Check if last statement is a dict expression
+            if tree.body:
+                last_stmt = tree.body[-1]
+                if isinstance(last_stmt, ast.Expr) and isinstance(last_stmt.value, ast.Dict):
+                    self._check_citation_dict_structure(last_stmt.value, result, 'single')
+                else:
+                    result.warnings.append(
+                        "output_key 'result' suggests citation format. "
+                        "Script should return a dictionary with citation fields (id, friendly_id, title, url, snippet)."
+                    )
+        else:
+            # Check return statement structure
+            for return_node in return_nodes:
+                if return_node.value and isinstance(return_node.value, ast.Dict):
+                    self._check_citation_dict_structure(return_node.value, result, 'single')
 
     def _validate_resource_limits(self, code: str, result: APIthonValidationResult):
         """Validate resource limits including byte counts, string lengths, and numeric ranges."""
         # Code byte limit validation (4096 bytes)
-        code_bytes = len(code.encode('utf-8'))
+        code_bytes = get_apiton_analysis(code).code_bytes
         result.resource_usage['code_bytes'] = code_bytes
         result.resource_usage['code_byte_limit'] = 4096
 
@@ -915,23 +891,15 @@ class EnhancedAPIthonValidator:
                 remediation="Urgent: Reduce code size to avoid exceeding the 4096 byte limit"
             )
 
+        analysis = get_apiton_analysis(code)
+
         # String length validation (4096 characters maximum)
-        try:
-            tree = ast.parse(code)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Constant) and isinstance(node.value, str):
-                    self._check_string_length(node.value, result)
-        except SyntaxError:
-            pass
+        for node in analysis.string_constants:
+            self._check_string_length(node.value, result)
 
         # Numeric range validation (up to 4294967296)
-        try:
-            tree = ast.parse(code)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
-                    self._check_numeric_range(node.value, result)
-        except SyntaxError:
-            pass
+        for node in analysis.numeric_constants:
+            self._check_numeric_range(node.value, result)
 
         # List serialization size heuristic (2096 byte limit)
         self._validate_list_serialization_size(code, result)
@@ -968,27 +936,22 @@ class EnhancedAPIthonValidator:
 
     def _validate_list_serialization_size(self, code: str, result: APIthonValidationResult):
         """Validate estimated list serialization size using heuristics."""
-        try:
-            tree = ast.parse(code)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.List):
-                    estimated_size = self._estimate_list_size(node)
-                    result.resource_usage['estimated_list_size'] = estimated_size
-                    result.resource_usage['list_size_limit'] = 2096
-
-                    if estimated_size > 2096:
-                        result.add_error(
-                            f"List may exceed 2096 byte serialization limit: ~{estimated_size} bytes",
-                            error_type="resource_limit",
-                            remediation="Reduce list size or use simpler data structures"
-                        )
-                    elif estimated_size > 1676:  # 80% warning
-                        result.add_warning(
-                            f"List approaching serialization limit: ~{estimated_size}/2096 bytes",
-                            remediation="Consider reducing list size to stay under the 2096 byte limit"
-                        )
-        except SyntaxError:
-            pass
+        for node in get_apiton_analysis(code).list_nodes:
+            estimated_size = self._estimate_list_size(node)
+            result.resource_usage['estimated_list_size'] = estimated_size
+            result.resource_usage['list_size_limit'] = 2096
+
+            if estimated_size > 2096:
+                result.add_error(
+                    f"List may exceed 2096 byte serialization limit: ~{estimated_size} bytes",
+                    error_type="resource_limit",
+                    remediation="Reduce list size or use simpler data structures"
+                )
+            elif estimated_size > 1676:  # 80% warning
+                result.add_warning(
+                    f"List approaching serialization limit: ~{estimated_size}/2096 bytes",
+                    remediation="Consider reducing list size to stay under the 2096 byte limit"
+                )
 
     def _estimate_list_size(self, list_node: ast.List) -> int:
         """Estimate the serialized size of a list node."""
@@ -17,25 +17,38 @@ import json
 import logging
 import re
 import os
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QTreeWidget, QTreeWidgetItem, QTextEdit, QSplitter, QGroupBox,
+    QTreeView, QAbstractItemView, QTextEdit, QSplitter, QGroupBox,
     QComboBox, QCheckBox, QFrame, QMessageBox, QApplication, QCompleter,
     QListWidget, QListWidgetItem, QDialog, QTabWidget,
     QTableWidget, QTableWidgetItem, QHeaderView, QProgressBar, QGraphicsView,
     QGraphicsScene, QGraphicsItem, QGraphicsEllipseItem, QGraphicsLineItem,
     QGraphicsTextItem, QGraphicsRectItem, QGraphicsItemGroup, QGraphicsPolygonItem,
-    QScrollArea, QToolButton, QMenu, QFileDialog
+    QGraphicsPathItem, QScrollArea, QToolButton, QMenu, QFileDialog
 )
 from PySide6.QtCore import Qt, Signal, QTimer, QStringListModel, QMimeData, QSettings
-from PySide6.QtGui import (QFont, QIcon, QColor, QPalette, QDrag, QPainter, QPen, QBrush,
+from PySide6.QtGui import (QFont, QIcon, QColor, QPalette, QDrag, QPainter, QPainterPath, QPen, QBrush,
                           QPixmap, QCursor, QValidator, QTextCursor, QSyntaxHighlighter, QTextCharFormat, QAction)
 
+from json_tree_model import (
+    LazyJsonTreeModel, get_json_path_index, json_value_type, lru_lookup, lru_store, output_unchanged,
+    step_output_cache_key, submit_index_task
+)
+from json_path import resolve_path
+from path_trie import DEFAULT_COMPLETION_LIMIT, PathTrie
+from data_flow_graph import get_data_flow_graph
+
 # Set up logging for debugging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Number of step output tree models kept for reuse when switching steps
+JSON_TREE_MODEL_CACHE_SIZE = 8
+
 
 # ============================================================================
 # VISUAL DESIGN CONSTANTS
@@ -140,21 +153,21 @@ class VisualDesignConstants:
     def get_tree_style():
         """Get standard tree widget styling."""
         return f"""
-            QTreeWidget {{
+            QTreeView {{
                 background-color: white;
                 border: 1px solid {VisualDesignConstants.SUBTLE_BORDER};
                 border-radius: 4px;
                 font-size: {VisualDesignConstants.BODY_FONT_SIZE};
                 selection-background-color: {VisualDesignConstants.SELECTED_BACKGROUND};
             }}
-            QTreeWidget::item {{
+            QTreeView::item {{
                 padding: 4px;
                 border-bottom: 1px solid #f0f0f0;
             }}
-            QTreeWidget::item:hover {{
+            QTreeView::item:hover {{
                 background-color: {VisualDesignConstants.HOVER_BACKGROUND};
             }}
-            QTreeWidget::item:selected {{
+            QTreeView::item:selected {{
                 background-color: {VisualDesignConstants.SELECTED_BACKGROUND};
                 color: #333;
             }}
@@ -177,47 +190,80 @@ class ValidationResult:
 
 
 class SmartPathCompleter(QCompleter):
-    """Intelligent auto-completion for JSON paths with fuzzy matching."""
-
-    def __init__(self, json_selector):
+    """
+    Auto-completion for JSON paths with prefix and abbreviation matching.
+
+    Paths live in a PathTrie, so "usr.nm" completes to "data.user.name" and
+    each keystroke only looks at the best max_completions matches, however
+    many paths the selected step output has. The paths of a newly shown
+    output are fed into the trie on the background path index thread, right
+    after its index is built.
+    """
+
+    # Common meta_info paths offered with every step's data
+    META_INFO_PATHS = [
+        "meta_info.user.first_name",
+        "meta_info.user.last_name",
+        "meta_info.user.email_addr",
+        "meta_info.user.department"
+    ]
+
+    def __init__(self, json_selector, max_completions: int = DEFAULT_COMPLETION_LIMIT):
         super().__init__()
         self.json_selector = json_selector
-        self.setCompletionMode(QCompleter.PopupCompletion)
+        self.max_completions = max_completions
+        # The trie does the matching, so Qt shows its results unfiltered
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
         self.setCaseSensitivity(Qt.CaseInsensitive)
         self.setMaxVisibleItems(10)
 
-        # Custom model for path completions
+        self.path_trie = PathTrie()
+        self.path_trie.set_source("meta_info", self.META_INFO_PATHS)
+        self._tree_index = None  # Path index of the JSON data shown, fed into the trie in the background
+        self._trie_lock = threading.Lock()
+
+        # Model holding the completions of the current text
         self.path_model = QStringListModel()
         self.setModel(self.path_model)
 
         logger.debug("SmartPathCompleter initialized")
 
     def update_completions(self):
-        """Update available completions from current JSON data."""
+        """Start feeding the paths of the JSON data currently shown into the trie, if the data changed."""
         if not self.json_selector or not hasattr(self.json_selector, 'json_tree'):
             return
 
-        paths = list(self.json_selector.json_tree.path_map.values())
-
-        # Add common meta_info paths
-        meta_paths = [
-            "meta_info.user.first_name",
-            "meta_info.user.last_name",
-            "meta_info.user.email_addr",
-            "meta_info.user.department"
-        ]
-        paths.extend(meta_paths)
-
-        # Sort paths for better user experience
-        paths.sort()
+        index = self.json_selector.json_tree.json_model.path_index
+        if index is self._tree_index:
+            return
+        self._tree_index = index
 
-        self.path_model.setStringList(paths)
-        logger.debug(f"Updated completions with {len(paths)} paths")
+        if index is not None:
+            index.build_async(then=self._feed_trie)
+        else:
+            submit_index_task(self._feed_trie, None)
+
+    def _feed_trie(self, index):
+        """Replace the tree paths in the trie (runs on the background path index thread)."""
+        if index is not self._tree_index:
+            return  # Other data was shown meanwhile; its own task follows
+        # Only paths that differ from the previous data are added or removed
+        paths = index.paths() if index is not None else []
+        with self._trie_lock:
+            self.path_trie.set_source("json_tree", paths)
+        logger.debug(f"Updated completions with {len(self.path_trie)} paths")
 
     def splitPath(self, path: str) -> List[str]:
-        """Split path for fuzzy matching."""
-        # Support fuzzy matching like "usr.nm" -> "user.name"
-        return path.lower().split('.')
+        """Fill the popup with the best completions of the typed path."""
+        self.update_completions()
+        # While the trie is being fed, the popup keeps its previous completions
+        if self._trie_lock.acquire(blocking=False):
+            try:
+                self.path_model.setStringList(self.path_trie.complete(path, self.max_completions))
+            finally:
+                self._trie_lock.release()
+        # The completions are already matched; Qt must not filter them again
+        return [""]
 
 
 class PathValidator:
@@ -256,68 +302,12 @@ class PathValidator:
         if not data:
             raise ValueError("No data available")
 
-        # Remove 'data.' prefix if present
-        if path.startswith('data.'):
-            path = path[5:]
-
-        if not path:  # Root path
-            return data
-
-        parts = []
-        current_part = ""
-        in_brackets = False
-
-        # Parse path with array indices
-        for char in path:
-            if char == '[':
-                if current_part:
-                    parts.append(current_part)
-                    current_part = ""
-                in_brackets = True
-            elif char == ']':
-                if in_brackets and current_part:
-                    try:
-                        parts.append(int(current_part))
-                    except ValueError:
-                        raise ValueError(f"Invalid array index: '{current_part}' must be a number")
-                    current_part = ""
-                in_brackets = False
-            elif char == '.' and not in_brackets:
-                if current_part:
-                    parts.append(current_part)
-                    current_part = ""
-            else:
-                current_part += char
-
-        if current_part:
-            parts.append(current_part)
-
-        # Navigate through the data
-        current = data
-        for part in parts:
-            if isinstance(current, dict):
-                if part not in current:
-                    available_keys = list(current.keys())
-                    raise KeyError(f"Key '{part}' not found. Available keys: {available_keys}")
-                current = current[part]
-            elif isinstance(current, list):
-                if not isinstance(part, int):
-                    raise TypeError(f"Array index must be integer, got '{part}' (type: {type(part)})")
-                if part >= len(current) or part < 0:
-                    raise IndexError(f"Array index {part} out of range. Array has {len(current)} items")
-                current = current[part]
-            else:
-                raise TypeError(f"Cannot navigate to '{part}' from {type(current).__name__}")
-
-        return current
+        return resolve_path(data, path)
 
     def _generate_suggestions(self, path: str, available_data: Dict[str, Any], error_msg: str) -> List[str]:
         """Generate intelligent suggestions for path fixes."""
         suggestions = []
 
-        # Extract available paths from data
-        available_paths = self._extract_all_paths(available_data)
-
         # Check for typos in the path
         path_parts = path.replace('data.', '').split('.')
 
@@ -329,48 +319,32 @@ class PathValidator:
                 suggestion = 'data.' + '.'.join(corrected_path)
                 suggestions.append(f"Did you mean: {suggestion}")
 
-        # Find similar paths using fuzzy matching
-        path_lower = path.lower()
-        for available_path in available_paths:
-            if self._fuzzy_match(path_lower, available_path.lower()):
-                suggestions.append(f"Similar path: {available_path}")
+        # Find similar paths in the trigram index of each output
+        for similar_path in self._similar_paths(path, available_data, limit=3):
+            suggestions.append(f"Similar path: {similar_path}")
 
         return suggestions[:3]  # Limit to top 3 suggestions
 
-    def _extract_all_paths(self, data: Dict[str, Any], prefix: str = "data") -> List[str]:
-        """Extract all possible paths from data structure."""
-        paths = []
-
-        def _recurse(obj, current_path):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    new_path = f"{current_path}.{key}"
-                    paths.append(new_path)
-                    if isinstance(value, (dict, list)):
-                        _recurse(value, new_path)
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    new_path = f"{current_path}[{i}]"
-                    paths.append(new_path)
-                    if isinstance(item, (dict, list)):
-                        _recurse(item, new_path)
-
-        _recurse(data, prefix)
-        return paths
-
-    def _fuzzy_match(self, query: str, target: str) -> bool:
-        """Simple fuzzy matching algorithm."""
-        # Remove common prefixes for comparison
-        query = query.replace('data.', '')
-        target = target.replace('data.', '')
-
-        # Check if query is a subsequence of target
-        query_idx = 0
-        for char in target:
-            if query_idx < len(query) and char == query[query_idx]:
-                query_idx += 1
+    def _similar_paths(self, path: str, available_data: Dict[str, Any], limit: int) -> List[str]:
+        """
+        Get the available paths most similar to a path, best first.
 
-        return query_idx == len(query)
+        Validation runs on the GUI thread, so an output whose index is not
+        built yet only starts a background build and adds no suggestions
+        until it is ready.
+        """
+        if not isinstance(available_data, dict):
+            return []
+        scored = []
+        for key, value in available_data.items():
+            # Indexes are shared per output object, so they are built once
+            index = get_json_path_index(value, f"data.{key}")
+            if not index.is_built:
+                index.build_async()
+                continue
+            scored.extend(index.suggest(path, limit))
+        scored.sort(key=lambda item: (-item[1], len(item[0])))
+        return [similar_path for similar_path, _ in scored[:limit]]
 
 
 # ============================================================================
@@ -840,6 +814,7 @@ class DataFlowVisualizer(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.workflow = None
+        self._dirty = None
         self.node_positions = {}
         self.connections = []
         self._setup_ui()
@@ -879,9 +854,17 @@ class DataFlowVisualizer(QWidget):
         self.view.setRenderHint(QPainter.Antialiasing)
         layout.addWidget(self.view)
 
-    def set_workflow(self, workflow):
-        """Set the workflow and update the visualization."""
+    def set_workflow(self, workflow, dirty=None):
+        """
+        Set the workflow and update the visualization.
+
+        Args:
+            workflow: The workflow to draw
+            dirty: Indices of steps edited in place since the workflow's graph
+                was last updated, or None to re-check every step
+        """
         self.workflow = workflow
+        self._dirty = dirty
         self._update_visualization()
 
     def _update_visualization(self):
@@ -949,38 +932,68 @@ class DataFlowVisualizer(QWidget):
 
     def _create_connections(self):
         """Create visual connections between steps based on data flow."""
-        # For now, create simple sequential connections
-        # In a real implementation, this would analyze actual data dependencies
+        # Execution order as thin dashed lines
+        order_pen = QPen(QColor("#bdbdbd"), 1, Qt.DashLine)
         for i in range(len(self.workflow.steps) - 1):
             start_pos = self.node_positions[i]
             end_pos = self.node_positions[i + 1]
-
-            # Create arrow line
             line = QGraphicsLineItem(
                 start_pos[0] + 100, start_pos[1] + 80,  # Bottom center of source
                 end_pos[0] + 100, end_pos[1]            # Top center of target
             )
-            line.setPen(QPen(QColor("#666666"), 2))
+            line.setPen(order_pen)
             self.scene.addItem(line)
 
-            # Add arrowhead
-            arrow = self._create_arrowhead(end_pos[0] + 100, end_pos[1])
-            self.scene.addItem(arrow)
-
-    def _create_arrowhead(self, x, y):
+        # Data dependencies as arrows from the producing step to each step
+        # that references its output; longer edges bulge further right
+        graph = get_data_flow_graph(self.workflow, self._dirty)
+        self._dirty = ()
+        for edge in graph.edges:
+            start_x, start_y = self.node_positions[edge.producer]
+            end_x, end_y = self.node_positions[edge.consumer]
+            start_x, start_y = start_x + 200, start_y + 40  # Right middle of source
+            end_x, end_y = end_x + 200, end_y + 40          # Right middle of target
+            bulge = 40 * (edge.consumer - edge.producer)
+
+            path = QPainterPath()
+            path.moveTo(start_x, start_y)
+            path.cubicTo(start_x + bulge, start_y, end_x + bulge, end_y, end_x + 10, end_y)
+            curve = QGraphicsPathItem(path)
+            curve.setPen(QPen(QColor("#1976d2"), 2))
+            self.scene.addItem(curve)
+            self.connections.append(edge)
+
+            label = QGraphicsTextItem(edge.key)
+            label.setFont(QFont("Arial", 8))
+            label.setDefaultTextColor(QColor("#1976d2"))
+            label.setPos(start_x + bulge * 0.75, (start_y + end_y) / 2 - 10)
+            self.scene.addItem(label)
+
+            self.scene.addItem(self._create_arrowhead(end_x, end_y, pointing_left=True))
+
+    def _create_arrowhead(self, x, y, pointing_left=False):
         """Create an arrowhead at the specified position."""
         arrow = QGraphicsPolygonItem()
         from PySide6.QtGui import QPolygonF
         from PySide6.QtCore import QPointF
 
-        points = [
-            QPointF(x, y),
-            QPointF(x - 10, y - 15),
-            QPointF(x + 10, y - 15)
-        ]
+        if pointing_left:
+            points = [
+                QPointF(x, y),
+                QPointF(x + 15, y - 8),
+                QPointF(x + 15, y + 8)
+            ]
+            color = QColor("#1976d2")
+        else:
+            points = [
+                QPointF(x, y),
+                QPointF(x - 10, y - 15),
+                QPointF(x + 10, y - 15)
+            ]
+            color = QColor("#666666")
         arrow.setPolygon(QPolygonF(points))
-        arrow.setBrush(QBrush(QColor("#666666")))
-        arrow.setPen(QPen(QColor("#666666")))
+        arrow.setBrush(QBrush(color))
+        arrow.setPen(QPen(color))
         return arrow
 
     def _zoom_in(self):
@@ -1639,24 +1652,23 @@ class PathBookmarkManager:
         logger.debug(f"Imported bookmarks from {file_path}")
 
 
-class DraggableJsonTree(QTreeWidget):
+class DraggableJsonTree(QTreeView):
     """JSON tree with drag & drop support for path insertion."""
 
     def __init__(self):
         super().__init__()
         self.setDragEnabled(True)
-        self.setDragDropMode(QTreeWidget.DragOnly)
+        self.setDragDropMode(QAbstractItemView.DragOnly)
         logger.debug("DraggableJsonTree initialized")
 
     def startDrag(self, supportedActions):
         """Start drag operation with path data."""
-        current_item = self.currentItem()
-        if not current_item or not hasattr(self, 'path_map'):
+        model = self.model()
+        if not isinstance(model, LazyJsonTreeModel):
             return
 
-        if current_item in self.path_map:
-            path = self.path_map[current_item]
-
+        path = model.path_for_index(self.currentIndex())
+        if path:
             # Create drag with path data
             drag = QDrag(self)
             mime_data = QMimeData()
@@ -1760,214 +1772,188 @@ class DropTargetLineEdit(QLineEdit):
 
 
 class JsonTreeWidget(DraggableJsonTree):
-    """Enhanced tree widget for JSON structure visualization with drag & drop."""
+    """
+    Enhanced tree view for JSON structure visualization with drag & drop.
+
+    Backed by a LazyJsonTreeModel, so rows are only created as nodes are
+    expanded and large sample outputs open immediately.
+    """
 
     path_selected = Signal(str)  # Emits the selected JSON path
 
     def __init__(self):
         super().__init__()
-        self.setHeaderLabels(["Key", "Type", "Value"])
+        self._default_model = LazyJsonTreeModel(self)
+        self.json_model = self._default_model
+        self.setModel(self.json_model)
+        # cache key -> model of a step output, least recently used first
+        self._model_cache: "OrderedDict[Any, LazyJsonTreeModel]" = OrderedDict()
+        self.current_cache_key = None
         self.setAlternatingRowColors(True)
-        self.itemClicked.connect(self._on_item_clicked)
+        self.clicked.connect(self._on_index_clicked)
 
         # Enable single selection for clearer path selection
-        self.setSelectionMode(QTreeWidget.SingleSelection)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
 
-        # Store path information in items
-        self.path_map = {}  # item -> full_path
         self.current_data = {}  # Store current JSON data for validation
 
         # Visual enhancements
         self.setRootIsDecorated(True)
         self.setIndentation(20)
-        self.setUniformRowHeights(False)
+        self.setUniformRowHeights(True)
 
         # Enable tooltips
         self.setMouseTracking(True)
 
         logger.debug("JsonTreeWidget initialized")
 
-    def populate_from_json(self, data: Dict[str, Any], root_path: str = "data"):
-        """Populate tree from JSON data with enhanced logging and error handling."""
+    def populate_from_json(self, data: Dict[str, Any], root_path: str = "data", cache_key: Any = None):
+        """
+        Populate tree from JSON data with enhanced logging and error handling.
+
+        Args:
+            data: JSON data to show
+            root_path: Data path of the root row
+            cache_key: Optional content fingerprint of data. Models built for
+                a key are kept (up to JSON_TREE_MODEL_CACHE_SIZE), so showing
+                the same content again reuses its rows and path index, and
+                re-expands the rows that were expanded when it was last shown.
+        """
         logger.debug(f"populate_from_json called with data type: {type(data)}, root_path: {root_path}")
 
-        self.clear()
-        self.path_map.clear()
+        if data and output_unchanged(self.current_cache_key, cache_key):
+            logger.debug("Tree already shows this content")
+            return
+
         self.current_data = data
 
         if not data:
             logger.debug("No data provided, showing empty tree")
-            # Show a message item for empty data
-            empty_item = QTreeWidgetItem(["No data available", "info", "Select a step with parsed JSON output"])
-            empty_item.setForeground(0, Qt.gray)
-            self.addTopLevelItem(empty_item)
+            # Show a message row for empty data
+            self._use_model(self._default_model, None)
+            self.json_model.set_message("No data available", "info", "Select a step with parsed JSON output", Qt.gray)
             return
 
-        try:
-            # Create root item
-            data_size = len(data) if isinstance(data, (dict, list)) else 1
-            root_display = f"{root_path} ({data_size} items)" if isinstance(data, (dict, list)) else root_path
-            root_item = QTreeWidgetItem([root_display, self._get_value_type(data), ""])
-            self.addTopLevelItem(root_item)
-            self.path_map[root_item] = root_path
-
-            # Set root item styling
-            font = QFont()
-            font.setBold(True)
-            root_item.setFont(0, font)
+        cached = lru_lookup(self._model_cache, cache_key) if cache_key is not None else None
+        if cached is not None:
+            self._use_model(cached, cache_key)
+            self._restore_expanded_rows()
+            logger.debug("Reused cached tree model")
+            return
 
-            # Recursively add items
-            self._add_json_items(root_item, data, root_path)
+        try:
+            model = self._default_model if cache_key is None else LazyJsonTreeModel(self)
+            model.set_json(data, root_path)
+            # Prepare the search index before the user starts typing
+            model.path_index.build_async()
+            if cache_key is not None:
+                self._cache_model(cache_key, model)
+            self._use_model(model, cache_key)
 
             # Expand first level
-            root_item.setExpanded(True)
+            self.expand(self.json_model.index(0, 0))
 
-            logger.debug(f"Successfully populated tree with {len(self.path_map)} items")
+            logger.debug(f"Populated lazy tree for {self._get_value_type(data)} root")
 
         except Exception as e:
             logger.error(f"Error populating JSON tree: {str(e)}")
-            error_item = QTreeWidgetItem(["Error", "error", f"Failed to parse JSON: {str(e)}"])
-            error_item.setForeground(0, Qt.red)
-            self.addTopLevelItem(error_item)
-
-    def _add_json_items(self, parent_item: QTreeWidgetItem, data: Any, parent_path: str):
-        """Recursively add JSON items to the tree."""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{parent_path}.{key}"
-                value_type = self._get_value_type(value)
-
-                # Create display value
-                if isinstance(value, (dict, list)):
-                    display_value = f"({len(value)} items)" if isinstance(value, list) else f"({len(value)} keys)"
-                else:
-                    display_value = str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
-
-                item = QTreeWidgetItem([key, value_type, display_value])
-                parent_item.addChild(item)
-                self.path_map[item] = current_path
-
-                # Set icon based on type
-                self._set_item_icon(item, value_type)
-
-                # Recursively add children for complex types
-                if isinstance(value, (dict, list)):
-                    self._add_json_items(item, value, current_path)
-
-        elif isinstance(data, list):
-            for i, value in enumerate(data):
-                current_path = f"{parent_path}[{i}]"
-                value_type = self._get_value_type(value)
-
-                if isinstance(value, (dict, list)):
-                    display_value = f"({len(value)} items)" if isinstance(value, list) else f"({len(value)} keys)"
-                else:
-                    display_value = str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
-
-                item = QTreeWidgetItem([f"[{i}]", value_type, display_value])
-                parent_item.addChild(item)
-                self.path_map[item] = current_path
+            self._use_model(self._default_model, None)
+            self.json_model.set_message("Error", "error", f"Failed to parse JSON: {str(e)}", Qt.red)
+
+    def _use_model(self, model: LazyJsonTreeModel, cache_key: Any):
+        """Show a model in the view, remembering which rows of the replaced one were expanded."""
+        if model is not self.json_model:
+            previous = self.json_model
+            if previous is not self._default_model:
+                previous.expanded_paths = self._expanded_row_paths()
+            self.json_model = model
+            self.setModel(model)
+            # A model evicted while it was shown is released once replaced
+            if previous is not self._default_model and previous not in self._model_cache.values():
+                previous.deleteLater()
+        self.current_cache_key = cache_key
+
+    def _cache_model(self, cache_key: Any, model: LazyJsonTreeModel):
+        """Remember a model, evicting the least recently used ones."""
+        for evicted in lru_store(self._model_cache, cache_key, model, JSON_TREE_MODEL_CACHE_SIZE):
+            if evicted is not self.json_model:
+                evicted.deleteLater()
+
+    def _expanded_row_paths(self) -> List[str]:
+        """Paths of the expanded rows, parents first (only materialized rows can be expanded)."""
+        model = self.json_model
+        paths = []
+        stack = [model.index(row, 0) for row in reversed(range(model.rowCount()))]
+        while stack:
+            index = stack.pop()
+            if not self.isExpanded(index):
+                continue
+            path = model.path_for_index(index)
+            if path:
+                paths.append(path)
+            stack.extend(model.index(row, 0, index) for row in reversed(range(model.rowCount(index))))
+        return paths
 
-                self._set_item_icon(item, value_type)
+    def _restore_expanded_rows(self):
+        """Expand the rows saved for the current model (setModel collapses everything), or the root."""
+        paths = self.json_model.expanded_paths
+        if not paths:
+            self.expand(self.json_model.index(0, 0))
+        for path in paths:
+            index = self.json_model.index_for_path(path)
+            if index.isValid():
+                self.expand(index)
 
-                if isinstance(value, (dict, list)):
-                    self._add_json_items(item, value, current_path)
+    def all_paths(self) -> List[str]:
+        """Get every path in the current JSON data (the path index is built on first use)."""
+        return self.json_model.all_paths()
 
     def _get_value_type(self, value: Any) -> str:
         """Get the type string for a value."""
-        if isinstance(value, dict):
-            return "object"
-        elif isinstance(value, list):
-            return "array"
-        elif isinstance(value, str):
-            return "string"
-        elif isinstance(value, bool):
-            return "boolean"
-        elif isinstance(value, int):
-            return "integer"
-        elif isinstance(value, float):
-            return "number"
-        elif value is None:
-            return "null"
-        else:
-            return "unknown"
-
-    def _set_item_icon(self, item: QTreeWidgetItem, value_type: str):
-        """Set icon for tree item based on value type."""
-        # You could add icons here for different types
-        # For now, we'll use text styling
-        if value_type == "object":
-            item.setForeground(0, Qt.blue)
-        elif value_type == "array":
-            item.setForeground(0, Qt.darkGreen)
-        elif value_type == "string":
-            item.setForeground(0, Qt.darkRed)
-        elif value_type in ["integer", "number"]:
-            item.setForeground(0, Qt.darkMagenta)
-        elif value_type == "boolean":
-            item.setForeground(0, Qt.darkCyan)
-
-    def _on_item_clicked(self, item: QTreeWidgetItem, column: int):
-        """Handle item click with enhanced feedback."""
-        _ = column  # Unused parameter
-
-        if item in self.path_map:
-            path = self.path_map[item]
-            logger.debug(f"Path selected: {path}")
-
-            # Provide visual feedback
-            self._highlight_selected_item(item)
-
-            # Set tooltip with path information
-            try:
-                value = self._extract_value_by_path(self.current_data, path)
-                value_preview = str(value)[:100] + "..." if len(str(value)) > 100 else str(value)
-                item.setToolTip(0, f"Path: {path}\nValue: {value_preview}")
-            except Exception as e:
-                item.setToolTip(0, f"Path: {path}\nError: {str(e)}")
+        return json_value_type(value)
 
+    def _on_index_clicked(self, index):
+        """Handle row click with enhanced feedback."""
+        path = self.json_model.path_for_index(index)
+        if path:
+            logger.debug(f"Path selected: {path}")
             self.path_selected.emit(path)
         else:
-            logger.debug("Clicked item has no associated path")
-
-    def _highlight_selected_item(self, item: QTreeWidgetItem):
-        """Highlight the selected item visually."""
-        # Reset all items to normal background
-        for tree_item in self.path_map.keys():
-            tree_item.setBackground(0, Qt.transparent)
-            tree_item.setBackground(1, Qt.transparent)
-            tree_item.setBackground(2, Qt.transparent)
-
-        # Highlight selected item
-        highlight_color = Qt.lightGray
-        item.setBackground(0, highlight_color)
-        item.setBackground(1, highlight_color)
-        item.setBackground(2, highlight_color)
+            logger.debug("Clicked row has no associated path")
 
-    def search_paths(self, query: str) -> List[str]:
-        """Search for paths containing the query."""
-        query = query.lower()
-        matching_paths = []
+    def select_path(self, path: str) -> bool:
+        """
+        Select the row for a path, expanding its ancestors, and emit path_selected.
 
-        for item, path in self.path_map.items():
-            # Search in path, key name, and value
-            key_text = item.text(0).lower()
-            value_text = item.text(2).lower()
+        Returns:
+            True if the path exists in the current data
+        """
+        if not self.highlight_path(path):
+            return False
+        self.path_selected.emit(path)
+        return True
 
-            if (query in path.lower() or
-                query in key_text or
-                query in value_text):
-                matching_paths.append(path)
+    def search_paths(self, query: str) -> List[str]:
+        """Search for paths containing the query."""
+        return self.json_model.search_paths(query)
 
-        return matching_paths
+    def suggest_paths(self, query: str, limit: int = 10) -> List[str]:
+        """Get the paths in the current JSON data most similar to a path, best first."""
+        return self.json_model.suggest_paths(query, limit)
 
-    def highlight_path(self, path: str):
+    def highlight_path(self, path: str) -> bool:
         """Highlight a specific path in the tree."""
-        for item, item_path in self.path_map.items():
-            if item_path == path:
-                self.setCurrentItem(item)
-                self.scrollToItem(item)
-                break
+        index = self.json_model.index_for_path(path)
+        if not index.isValid():
+            return False
+
+        parent = index.parent()
+        while parent.isValid():
+            self.expand(parent)
+            parent = parent.parent()
+        self.setCurrentIndex(index)
+        self.scrollTo(index)
+        return True
 
 
 class JsonPathPreviewWidget(QWidget):
@@ -2225,47 +2211,7 @@ class JsonPathPreviewWidget(QWidget):
 
     def _extract_value_by_path(self, data: Dict[str, Any], path: str) -> Any:
         """Extract value from data using dot notation path."""
-        # Remove 'data.' prefix if present
-        if path.startswith('data.'):
-            path = path[5:]
-
-        parts = []
-        current_part = ""
-        in_brackets = False
-
-        # Parse path with array indices
-        for char in path:
-            if char == '[':
-                if current_part:
-                    parts.append(current_part)
-                    current_part = ""
-                in_brackets = True
-            elif char == ']':
-                if in_brackets and current_part:
-                    parts.append(int(current_part))
-                    current_part = ""
-                in_brackets = False
-            elif char == '.' and not in_brackets:
-                if current_part:
-                    parts.append(current_part)
-                    current_part = ""
-            else:
-                current_part += char
-
-        if current_part:
-            parts.append(current_part)
-
-        # Navigate through the data
-        current = data
-        for part in parts:
-            if isinstance(current, dict):
-                current = current[part]
-            elif isinstance(current, list):
-                current = current[int(part)]
-            else:
-                raise ValueError(f"Cannot navigate to {part} in {type(current)}")
-
-        return current
+        return resolve_path(data, path)
 
     def _copy_path(self):
         """Copy the current path to clipboard with enhanced user feedback."""
@@ -2365,6 +2311,9 @@ class EnhancedJsonPathSelector(QWidget):
         super().__init__()
         self.workflow = None
         self.current_step_index = -1
+        self.referenced_steps = frozenset()
+        self._combo_entries: List[Tuple[str, int, bool]] = []  # (text, step index, enabled) per combo item
+        self._step_output_keys: Dict[int, Tuple[Optional[str], Optional[str]]] = {}  # (output_key, output digest)
 
         # Phase 1 components
         self.path_validator = PathValidator()
@@ -2914,28 +2863,45 @@ class EnhancedJsonPathSelector(QWidget):
                 }}
             """)
 
-    def set_workflow(self, workflow, current_step_index: int = -1):
-        """Set the workflow and update available steps."""
+    def set_workflow(self, workflow, current_step_index: int = -1, dirty=None):
+        """
+        Set the workflow and update available steps.
+
+        The step combo box and the tree are only touched where something they
+        show changed, so edits that do not affect earlier steps' outputs
+        (e.g. typing a description) cost almost nothing.
+
+        Args:
+            workflow: The workflow being edited
+            current_step_index: Index of the step being edited, or -1
+            dirty: Indices of steps edited in place since the last call, or
+                None to re-check every step
+        """
         logger.debug(f"set_workflow called with workflow: {workflow is not None}, current_step_index: {current_step_index}")
+        step_changed = workflow is not self.workflow or current_step_index != self.current_step_index
+        previous_referenced = self.referenced_steps
+        selected_step = self.step_combo.currentData() if self.step_combo.currentIndex() >= 0 else None
+
         self.workflow = workflow
         self.current_step_index = current_step_index
-        self._update_step_combo()
+        self._update_step_combo(dirty)
 
-        # Auto-select the most recent step with JSON data
-        self._auto_select_best_step()
+        blocked = self.step_combo.blockSignals(True)
+        try:
+            if step_changed or self.referenced_steps != previous_referenced or not self._select_step(selected_step):
+                # Auto-select the most recent step with JSON data
+                self._auto_select_best_step()
+        finally:
+            self.step_combo.blockSignals(blocked)
 
-    def _update_step_combo(self):
-        """Update the step selection combo box with enhanced filtering."""
-        self.step_combo.clear()
+        # Reloads the tree only if the selected step's output changed
+        self._on_step_changed(self.step_combo.currentIndex())
 
-        if not self.workflow:
-            logger.debug("No workflow provided, combo box cleared")
-            return
-
-        logger.debug(f"Updating combo box for workflow with {len(self.workflow.steps)} steps")
+    def _step_combo_entries(self) -> List[Tuple[str, int, bool]]:
+        """Items the step combo box should show, as (text, step index, enabled)."""
+        entries = []
 
         # Add steps that have JSON output (only previous steps)
-        steps_added = 0
         for i, step in enumerate(self.workflow.steps):
             if self.current_step_index >= 0 and i >= self.current_step_index:
                 continue  # Don't show current or future steps
@@ -2947,26 +2913,88 @@ class EnhancedJsonPathSelector(QWidget):
 
             if has_json:
                 step_name = f"Step {i+1}: {output_key} ({step_type})"
-                self.step_combo.addItem(step_name, i)
-                steps_added += 1
-                logger.debug(f"Added step {i+1} with output key: {output_key}")
+                if i in self.referenced_steps:
+                    step_name += " - referenced here"
+                entries.append((step_name, i, True))
             else:
                 # Still show the step but indicate no JSON data
-                step_name = f"Step {i+1}: {output_key} ({step_type}) - No JSON"
-                self.step_combo.addItem(step_name, i)
-                # Disable this item
-                model = self.step_combo.model()
-                item = model.item(self.step_combo.count() - 1)
-                if item:
-                    item.setEnabled(False)
+                entries.append((f"Step {i+1}: {output_key} ({step_type}) - No JSON", i, False))
 
         # Add initial inputs if available
-        self.step_combo.addItem("Initial Inputs", -1)
+        entries.append(("Initial Inputs", -1, True))
+        return entries
 
-        logger.debug(f"Added {steps_added} steps with JSON data to combo box")
+    def _update_step_combo(self, dirty=None) -> bool:
+        """
+        Update the step selection combo box, changing only the items that differ.
+
+        Args:
+            dirty: Indices of steps edited in place since the last update, or None
+
+        Returns:
+            True if any item changed
+        """
+        if not self.workflow:
+            logger.debug("No workflow provided, combo box cleared")
+            self.referenced_steps = frozenset()
+            self._step_output_keys = {}
+            entries = []
+        else:
+            # Steps whose output the current step already references
+            graph = get_data_flow_graph(self.workflow, dirty)
+            self.referenced_steps = graph.dependencies.get(self.current_step_index, frozenset())
+            self._step_output_keys = {info.index: (info.output_key, info.output_digest) for info in graph.steps}
+            entries = self._step_combo_entries()
+
+        if entries == self._combo_entries:
+            return False
+
+        logger.debug(f"Updating combo box for workflow with {len(self.workflow.steps) if self.workflow else 0} steps")
+        combo = self.step_combo
+        model = combo.model()
+        blocked = combo.blockSignals(True)
+        try:
+            for row, entry in enumerate(entries):
+                text, step_index, enabled = entry
+                if row < combo.count():
+                    if self._combo_entries[row] == entry:
+                        continue
+                    combo.setItemText(row, text)
+                    combo.setItemData(row, step_index)
+                else:
+                    combo.addItem(text, step_index)
+                item = model.item(row)
+                if item:
+                    # Steps without JSON are shown disabled
+                    item.setEnabled(enabled)
+            while combo.count() > len(entries):
+                combo.removeItem(combo.count() - 1)
+        finally:
+            combo.blockSignals(blocked)
+
+        self._combo_entries = entries
+        logger.debug(f"Combo box now lists {sum(1 for entry in entries if entry[2]) - 1} steps with JSON data")
+        return True
+
+    def _select_step(self, step_index) -> bool:
+        """Select the combo item of a step if it is listed and enabled."""
+        if step_index is None:
+            return False
+        for row, (_, item_step_index, enabled) in enumerate(self._combo_entries):
+            if item_step_index == step_index and enabled:
+                self.step_combo.setCurrentIndex(row)
+                return True
+        return False
 
     def _auto_select_best_step(self):
-        """Auto-select the most recent step with JSON data."""
+        """Auto-select the most recent step the current step references, else the first step with JSON data."""
+        referenced = getattr(self, 'referenced_steps', frozenset())
+        for i in reversed(range(self.step_combo.count())):
+            if self.step_combo.itemData(i) in referenced and self.step_combo.model().item(i).isEnabled():
+                self.step_combo.setCurrentIndex(i)
+                logger.debug(f"Auto-selected referenced step at index {i}")
+                return
+
         if self.step_combo.count() > 1:  # More than just "Initial Inputs"
             # Select the first enabled item (most recent step with JSON)
             for i in range(self.step_combo.count()):
@@ -3022,9 +3050,11 @@ class EnhancedJsonPathSelector(QWidget):
                 output_key = getattr(step, 'output_key', 'unknown')
                 logger.debug(f"Found parsed JSON output with key: {output_key}")
 
-                # Wrap the output in the expected structure
+                # Wrap the output in the expected structure; unchanged outputs reuse their tree model
                 data = {output_key: step.parsed_json_output}
-                self.json_tree.populate_from_json(data, "data")
+                output_digest = self._step_output_keys.get(step_index, (None, None))[1]
+                cache_key = step_output_cache_key(output_key, output_digest)
+                self.json_tree.populate_from_json(data, "data", cache_key=cache_key)
 
                 # Count total items for user feedback
                 total_items = self._count_json_items(step.parsed_json_output)
@@ -3098,14 +3128,11 @@ class EnhancedJsonPathSelector(QWidget):
         matching_paths = []
         query_lower = query.lower()
 
-        if hasattr(self.json_tree, 'path_map'):
-            for item, path in self.json_tree.path_map.items():
+        if hasattr(self.json_tree, 'all_paths'):
+            for path in self.json_tree.all_paths():
                 # Search in path
                 if query_lower in path.lower():
                     matching_paths.append(path)
-                # Search in item text
-                elif hasattr(item, 'text') and query_lower in item.text(0).lower():
-                    matching_paths.append(path)
 
         return matching_paths
 
@@ -3114,60 +3141,7 @@ class EnhancedJsonPathSelector(QWidget):
         if not data:
             raise ValueError("No data available")
 
-        # Remove 'data.' prefix if present
-        if path.startswith('data.'):
-            path = path[5:]
-
-        if not path:  # Root path
-            return data
-
-        parts = []
-        current_part = ""
-        in_brackets = False
-
-        # Parse path with array indices
-        for char in path:
-            if char == '[':
-                if current_part:
-                    parts.append(current_part)
-                    current_part = ""
-                in_brackets = True
-            elif char == ']':
-                if in_brackets and current_part:
-                    try:
-                        parts.append(int(current_part))
-                    except ValueError:
-                        raise ValueError(f"Invalid array index: '{current_part}' must be a number")
-                    current_part = ""
-                in_brackets = False
-            elif char == '.' and not in_brackets:
-                if current_part:
-                    parts.append(current_part)
-                    current_part = ""
-            else:
-                current_part += char
-
-        if current_part:
-            parts.append(current_part)
-
-        # Navigate through the data
-        current = data
-        for part in parts:
-            if isinstance(current, dict):
-                if part not in current:
-                    available_keys = list(current.keys())
-                    raise KeyError(f"Key '{part}' not found. Available keys: {available_keys}")
-                current = current[part]
-            elif isinstance(current, list):
-                if not isinstance(part, int):
-                    raise TypeError(f"Array index must be integer, got '{part}' (type: {type(part)})")
-                if part >= len(current) or part < 0:
-                    raise IndexError(f"Array index {part} out of range. Array has {len(current)} items")
-                current = current[part]
-            else:
-                raise TypeError(f"Cannot navigate to '{part}' from {type(current).__name__}")
-
-        return current
+        return resolve_path(data, path)
 
     def _on_path_selected(self, path):
         """Handle path selection from tree."""
@@ -3255,7 +3229,7 @@ class EnhancedJsonPathSelector(QWidget):
             debug_info.append(f"Workflow: {self.workflow is not None}")
             debug_info.append(f"Current step index: {self.current_step_index}")
             debug_info.append(f"Combo box items: {self.step_combo.count()}")
-            debug_info.append(f"Tree items: {len(self.json_tree.path_map)}")
+            debug_info.append(f"Tree root: {self.json_tree.json_model.root_path}")
 
             if self.workflow:
                 debug_info.append(f"Total workflow steps: {len(self.workflow.steps)}")
@@ -3340,12 +3314,8 @@ class EnhancedJsonPathSelector(QWidget):
 
     def _simulate_path_selection(self, path: str):
         """Simulate selecting a path (for bookmark selection)."""
-        # Find the tree item for this path
-        for item, item_path in self.json_tree.path_map.items():
-            if item_path == path:
-                self.json_tree.setCurrentItem(item)
-                self.json_tree._on_item_clicked(item, 0)
-                break
+        # Find and select the tree row for this path
+        self.json_tree.select_path(path)
 
     # ============================================================================
     # PHASE 2: TEMPLATE AND HISTORY MANAGEMENT METHODS
@@ -3457,7 +3427,7 @@ class EnhancedJsonPathSelector(QWidget):
     def _update_smart_suggestions(self, current_path: str):
         """Update smart suggestions based on current context."""
         context = self._get_current_context()
-        available_paths = list(self.json_tree.path_map.values())
+        available_paths = self.json_tree.all_paths()
 
         suggestions = self.intelligent_suggester.suggest_paths(context, available_paths)
 
@@ -3528,8 +3498,9 @@ class EnhancedJsonPathSelector(QWidget):
         layout = QVBoxLayout(dialog)
 
         # Add the visualizer widget
+        # The step combo box update already brought the workflow's graph up to date
         visualizer = DataFlowVisualizer()
-        visualizer.set_workflow(self.workflow)
+        visualizer.set_workflow(self.workflow, dirty=())
         layout.addWidget(visualizer)
 
         # Close button
@@ -7,6 +7,10 @@ features, and advanced functionality.
 """
 
 from typing import Dict, List, Optional, Tuple
+
+from search_index import SearchDocument, SearchIndex
+# Tooltips live in a lightweight module of their own; re-exported here
+from tooltips import TOOLTIPS, get_tooltip
 from dataclasses import dataclass, field
 import json
 
@@ -51,9 +55,16 @@ class ComprehensiveHelpSystem:
     - Multimedia support
     """
 
-    def __init__(self):
+    def __init__(self, search_index_path: Optional[str] = None):
+        """
+        Args:
+            search_index_path: Optional file to cache the search index in; it is
+                reused while the topics are unchanged
+        """
         self.topics: Dict[str, HelpTopic] = {}
         self.sections: Dict[str, HelpSection] = {}
+        self.search_index_path = search_index_path
+        self._search_index: Optional[SearchIndex] = None
         self._initialize_comprehensive_help()
 
     def _initialize_comprehensive_help(self):
@@ -1491,24 +1502,37 @@ Ready to start using DSL? Check out the "Common DSL Patterns" and "DSL Builder"
     def add_topic(self, topic: HelpTopic):
         """Add a help topic to the system."""
         self.topics[topic.title] = topic
+        self._search_index = None
 
     def get_topic(self, title: str) -> Optional[HelpTopic]:
         """Get a help topic by title."""
         return self.topics.get(title)
 
-    def search_topics(self, query: str) -> List[HelpTopic]:
-        """Search for help topics by query."""
-        query_lower = query.lower()
-        results = []
+    @property
+    def search_index(self) -> SearchIndex:
+        """Full-text index of all topics, built (or loaded from search_index_path) on first use."""
+        if self._search_index is None or len(self._search_index) != len(self.topics):
+            documents = [topic_search_document(topic) for topic in self.topics.values()]
+            self._search_index = SearchIndex.load_or_build(
+                self.search_index_path, documents, HELP_SEARCH_FIELD_WEIGHTS)
+        return self._search_index
+
+    def search_topics(self, query: str, limit: Optional[int] = None) -> List[HelpTopic]:
+        """
+        Search for help topics by query.
+
+        Every query word must match the title, keywords or content (the last
+        word may be a prefix); results are ranked by relevance.
 
-        for topic in self.topics.values():
-            # Search in title, content, and keywords
-            if (query_lower in topic.title.lower() or
-                query_lower in topic.content.lower() or
-                any(query_lower in keyword.lower() for keyword in topic.keywords)):
-                results.append(topic)
+        Args:
+            query: Search text
+            limit: Optional maximum number of topics
 
-        return results
+        Returns:
+            Matching topics, most relevant first
+        """
+        hits = self.search_index.search(query, limit=limit, match_all=True)
+        return [self.topics[hit.id] for hit in hits if hit.id in self.topics]
 
     def get_topics_by_category(self, category: str) -> List[HelpTopic]:
         """Get all topics in a specific category."""
@@ -1547,42 +1571,32 @@ Ready to start using DSL? Check out the "Common DSL Patterns" and "DSL Builder"
                 if self.get_topic(topic_title) is not None]
 
 
-# Enhanced tooltip content for UI elements
-TOOLTIPS = {
-    "compound_action_name": "Unique identifier for your entire workflow (required for Moveworks compliance). Use descriptive names like 'user_onboarding_workflow' or 'ticket_escalation_process'. This becomes the top-level 'action_name' field in your YAML.",
-    "action_name": "The name of the action to execute (e.g., 'mw.get_user_by_email')",
-    "output_key": "Unique identifier for storing this step's output (used in data.output_key references)",
-    "description": "Optional human-readable description of what this step does",
-    "input_args": "Key-value pairs passed as arguments to the action or script. Use DSL expressions like 'data.field_name' or 'meta_info.user.email' for dynamic values.",
-    "input_args_dsl": "Enter a Moveworks DSL expression or data path (e.g., 'data.user_info.email', '$CONCAT([data.first, data.last])', 'meta_info.user.name'). DSL expressions will be automatically quoted in the YAML output.",
-    "switch_condition_dsl": "Enter the DSL expression for the switch condition (e.g., 'data.user.status == \"active\"', 'data.age >= 18'). This determines which case will be executed.",
-    "output_mapper_dsl": "Enter a DSL expression to transform the output (e.g., 'data.result.value', '$CONCAT([data.prefix, data.value])'). This maps the step output to the desired format.",
-    "for_loop_iterator_dsl": "Enter a DSL expression that evaluates to an array for iteration (e.g., 'data.items', 'data.user_list'). Each element will be available as 'data.item' in the loop body.",
-    "json_output": "Example JSON that this step will produce when executed",
-    "script_code": "APIthon (Python-like) code that processes data and returns a result",
-    "parse_json": "Validate and save the JSON output for use in variable mapping",
-    "add_action": "Add a new action step that calls a Moveworks action or external API",
-    "add_script": "Add a new script step that executes APIthon code",
-    "add_builtin": "Add a pre-configured Moveworks built-in action with example output",
-    "json_browser": "Browse JSON structure from previous steps to select data paths",
-    "yaml_preview": "Live preview of the generated YAML with Moveworks compliance validation",
-    "validation_status": "Shows validation results including Moveworks compliance - hover for error details",
-    "step_list": "List of workflow steps - click to select and configure",
-    "move_up": "Move the selected step up in the execution order",
-    "move_down": "Move the selected step down in the execution order",
-    "remove_step": "Remove the selected step from the workflow",
-    "save_workflow": "Save the current workflow to a JSON file",
-    "load_workflow": "Load a workflow from a JSON file",
-    "export_yaml": "Export the workflow as Moveworks-compliant YAML with compound action structure",
-    "validate": "Run comprehensive validation including Moveworks compliance checks"
-}
+def topic_search_document(topic: HelpTopic, metadata: Optional[Dict] = None) -> SearchDocument:
+    """
+    Build the search document for a help topic.
 
+    Args:
+        topic: The help topic
+        metadata: Optional extra data stored with the document (e.g. a URL)
 
-def get_tooltip(element_id: str) -> str:
-    """Get tooltip text for a UI element."""
-    return TOOLTIPS.get(element_id, "")
+    Returns:
+        SearchDocument with title, keywords, content and category fields
+    """
+    return SearchDocument(
+        id=topic.title,
+        fields={
+            "title": topic.title,
+            "keywords": topic.keywords,
+            "content": "\n".join([topic.content] + list(topic.examples)),
+            "category": [topic.category, topic.subcategory],
+        },
+        metadata=metadata or {}
+    )
 
 
+# Field weights for help topic search
+HELP_SEARCH_FIELD_WEIGHTS = {"title": 3, "keywords": 2, "category": 1, "content": 1}
+
 def get_contextual_help(context: str) -> str:
     """Get contextual help based on current application state."""
     help_texts = {
@@ -1601,5 +1615,21 @@ def get_contextual_help(context: str) -> str:
     return help_texts.get(context, "")
 
 
-# Global help system instance
-help_system = ComprehensiveHelpSystem()
+# Global help system instance, built on first access so that importing this
+# module for tooltips stays cheap
+_help_system: Optional[ComprehensiveHelpSystem] = None
+
+
+def get_help_system() -> ComprehensiveHelpSystem:
+    """Get the global help system, building its topics on first use."""
+    global _help_system
+    if _help_system is None:
+        _help_system = ComprehensiveHelpSystem()
+    return _help_system
+
+
+def __getattr__(name: str):
+    # Keeps "from help_system import help_system" working without eager construction
+    if name == 'help_system':
+        return get_help_system()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,509 @@
+"""
+Incremental Validation Engine for the Moveworks YAML Assistant.
+
+This module re-validates only the parts of a workflow that changed since the
+previous pass. Every top-level step is fingerprinted (including nested switch,
+for, parallel and try/catch bodies) and its validation results are cached
+against that fingerprint plus the upstream data it actually depends on:
+
+- structural checks depend on which of the step's output keys were already
+  declared by earlier steps
+- data reference checks depend on the values available for the data.* roots
+  the step references
+- all other checks depend on the step alone
+
+Cached per-step results are merged into exactly the output produced by
+validator.comprehensive_validate and
+ComplianceValidator.validate_workflow_compliance, so callers can switch over
+without changing how they display results.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from core_structures import (
+    Workflow, DataContext, SwitchStep, ForLoopStep, ParallelStep,
+    ReturnStep, TryCatchStep
+)
+from validator import (
+    comprehensive_validate, validate_step, validate_step_data_references,
+    collect_input_arg_references, validate_json_outputs, validate_action_names,
+    validate_output_key_format, validate_script_syntax
+)
+
+
+# Keywords that make comprehensive_validate skip data reference validation
+CRITICAL_ERROR_KEYWORDS = ['missing required', 'Unknown step type', 'must contain at least one']
+
+# Prefix the single-step validators put on their messages
+_SINGLE_STEP_PREFIX = "Step 1: "
+
+# Position compliance results are computed at, so cached results do not depend on where the step is
+_UNNUMBERED_STEP = 0
+_UNNUMBERED_STEP_PREFIX = f"Step {_UNNUMBERED_STEP}"
+
+_COMPLIANCE_MESSAGE_LISTS = ('errors', 'warnings', 'suggestions', 'mandatory_field_errors',
+                             'field_naming_errors', 'apiton_errors')
+
+
+@dataclass(frozen=True)
+class StepFingerprint:
+    """
+    Content fingerprint of a top-level workflow step.
+
+    Attributes:
+        digest: Hash of every field of the step and its nested steps
+        output_digest: Hash of the step's sample output, or None if it has none
+        declared_keys: Output keys the step and its nested steps declare
+        data_reference_roots: Top-level data.* names the step's data references resolve against
+        input_arg_roots: Top-level data.* names referenced from the step's input_args
+    """
+    digest: str
+    output_digest: Optional[str]
+    declared_keys: FrozenSet[str]
+    data_reference_roots: FrozenSet[str]
+    input_arg_roots: Tuple[str, ...]
+
+
+@dataclass
+class IncrementalValidationStats:
+    """Statistics about the most recent incremental validation pass."""
+    total_steps: int = 0
+    fingerprinted_steps: int = 0
+    revalidated_steps: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+def _digest(text: str) -> str:
+    """Return a short stable hash of a string."""
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+
+def _canonical(value: Any) -> Any:
+    """
+    Build a hashable, order-preserving representation of a step tree.
+
+    parsed_json_output is reduced to whether it is present; its content is
+    covered by user_provided_json_output and the separate output digest.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        items = []
+        for f in fields(value):
+            field_value = getattr(value, f.name)
+            if f.name == 'parsed_json_output':
+                items.append((f.name, field_value is None))
+            else:
+                items.append((f.name, _canonical(field_value)))
+        return (type(value).__name__, tuple(items))
+    if isinstance(value, dict):
+        return ('dict', tuple((repr(k), _canonical(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_canonical(item) for item in value))
+    return repr(value)
+
+
+def _output_digest(step: Any) -> Optional[str]:
+    """Hash the sample output a step contributes to the data context."""
+    parsed = getattr(step, 'parsed_json_output', None)
+    if parsed is None:
+        return None
+    raw = getattr(step, 'user_provided_json_output', None)
+    if isinstance(raw, str):
+        return 'raw:' + _digest(raw)
+    return 'json:' + _digest(json.dumps(parsed, sort_keys=True, default=str))
+
+
+def iter_nested_steps(step: Any) -> Iterable[Any]:
+    """
+    Yield a step followed by every step nested inside it.
+
+    Args:
+        step: Any workflow step
+
+    Yields:
+        The step itself and all nested steps, depth first
+    """
+    yield step
+
+    children = []
+    if isinstance(step, SwitchStep):
+        for case in step.cases or []:
+            children.extend(case.steps)
+        if step.default_case:
+            children.extend(step.default_case.steps)
+    elif isinstance(step, ForLoopStep):
+        children.extend(step.steps)
+    elif isinstance(step, ParallelStep):
+        for branch in step.branches or []:
+            children.extend(branch.steps)
+        if step.for_loop:
+            children.extend(step.for_loop.steps)
+    elif isinstance(step, TryCatchStep):
+        children.extend(step.try_steps)
+        if step.catch_block:
+            children.extend(step.catch_block.steps)
+
+    for child in children:
+        yield from iter_nested_steps(child)
+
+
+def _declared_keys(step: Any) -> FrozenSet[str]:
+    """Output keys that validate_step registers for a step and its nested steps."""
+    keys = set()
+    for nested in iter_nested_steps(step):
+        output_key = getattr(nested, 'output_key', None)
+        if isinstance(output_key, str) and output_key and output_key != '_' and output_key.strip():
+            keys.add(output_key)
+    return frozenset(keys)
+
+
+def _data_reference_roots(step: Any) -> FrozenSet[str]:
+    """
+    Top-level data context names that the step's data references look up.
+
+    This mirrors the traversal of validator.validate_step_data_references and
+    may over-approximate, which only makes cache keys more specific.
+    """
+    roots = set()
+
+    def add(value: Any) -> None:
+        if isinstance(value, str) and value.startswith('data.'):
+            path = value[5:]
+            roots.add(path.split('.')[0])
+            if path.startswith('data.'):
+                roots.add(path[5:].split('.')[0])
+
+    for nested in iter_nested_steps(step):
+        input_args = getattr(nested, 'input_args', None)
+        if isinstance(input_args, dict):
+            for value in input_args.values():
+                add(value)
+
+        if isinstance(nested, SwitchStep):
+            for case in nested.cases or []:
+                if isinstance(case.condition, str):
+                    for data_ref in re.findall(r'data\.[\w.]+', case.condition):
+                        add(data_ref)
+        elif isinstance(nested, ForLoopStep):
+            add(nested.in_source)
+        elif isinstance(nested, ReturnStep) and isinstance(nested.output_mapper, dict):
+            for value in nested.output_mapper.values():
+                add(value)
+
+    return frozenset(roots)
+
+
+def _strip_single_step_prefix(messages: List[str]) -> List[str]:
+    """Remove the 'Step 1: ' prefix added by single-step validation."""
+    return [
+        message[len(_SINGLE_STEP_PREFIX):] if message.startswith(_SINGLE_STEP_PREFIX) else message
+        for message in messages
+    ]
+
+
+def _number_step_result(step_result: Any, step_num: int) -> Any:
+    """Copy a single-step compliance result computed at _UNNUMBERED_STEP, numbered as step_num."""
+    from compliance_validator import ComplianceValidationResult
+
+    prefix_length = len(_UNNUMBERED_STEP_PREFIX)
+
+    def number(message: str) -> str:
+        if message.startswith(_UNNUMBERED_STEP_PREFIX) and message[prefix_length:prefix_length + 1] in (' ', ':'):
+            return f"Step {step_num}{message[prefix_length:]}"
+        return message
+
+    numbered = ComplianceValidationResult()
+    numbered.is_valid = step_result.is_valid
+    for name in _COMPLIANCE_MESSAGE_LISTS:
+        setattr(numbered, name, [number(message) for message in getattr(step_result, name)])
+    return numbered
+
+
+class IncrementalValidator:
+    """
+    Validation engine that caches per-step results across passes.
+
+    Steps are fingerprinted once and the fingerprint is reused until the step
+    is reported as changed (through ``invalidate`` or the ``dirty`` argument).
+    Validation results are cached by fingerprint and upstream dependencies in a
+    bounded LRU cache, so unchanged steps are never re-validated.
+    """
+
+    def __init__(self, max_cache_entries: int = 8192):
+        self.max_cache_entries = max_cache_entries
+        self.last_stats = IncrementalValidationStats()
+        self._fingerprints: Dict[int, Tuple[weakref.ref, StepFingerprint]] = {}
+        self._results: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._results_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Fingerprints
+    # ------------------------------------------------------------------
+
+    def fingerprint(self, step: Any, refresh: bool = False) -> StepFingerprint:
+        """
+        Get the fingerprint of a top-level step.
+
+        Args:
+            step: The step to fingerprint
+            refresh: Recompute even if a fingerprint is cached for this step
+
+        Returns:
+            StepFingerprint for the step's current content
+        """
+        key = id(step)
+        cached = self._fingerprints.get(key)
+        if cached is not None and not refresh and cached[0]() is step:
+            return cached[1]
+
+        fingerprint = StepFingerprint(
+            digest=_digest(repr(_canonical(step))),
+            output_digest=_output_digest(step),
+            declared_keys=_declared_keys(step),
+            data_reference_roots=_data_reference_roots(step),
+            input_arg_roots=tuple(collect_input_arg_references(step.input_args))
+            if getattr(step, 'input_args', None) else ()
+        )
+
+        def forget(ref, key=key):
+            entry = self._fingerprints.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._fingerprints[key]
+
+        self._fingerprints[key] = (weakref.ref(step, forget), fingerprint)
+        self.last_stats.fingerprinted_steps += 1
+        return fingerprint
+
+    def invalidate(self, steps: Optional[Iterable[Any]] = None):
+        """
+        Forget cached fingerprints so the next pass re-reads step content.
+
+        Args:
+            steps: Steps that were edited in place, or None to forget all steps
+        """
+        if steps is None:
+            self._fingerprints.clear()
+            return
+        for step in steps:
+            self._fingerprints.pop(id(step), None)
+
+    def clear(self):
+        """Drop all fingerprints and cached validation results."""
+        self._fingerprints.clear()
+        with self._results_lock:
+            self._results.clear()
+
+    def _fingerprints_for(self, steps: List[Any], dirty: Optional[Iterable[int]]) -> List[StepFingerprint]:
+        """Fingerprint a step list, refreshing only dirty steps when they are known."""
+        if dirty is None:
+            return [self.fingerprint(step, refresh=True) for step in steps]
+        dirty_indices = set(dirty)
+        return [self.fingerprint(step, refresh=index in dirty_indices) for index, step in enumerate(steps)]
+
+    # ------------------------------------------------------------------
+    # Result cache
+    # ------------------------------------------------------------------
+
+    def _cached(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """Return a cached result or compute and store it (LRU eviction)."""
+        with self._results_lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.last_stats.cache_hits += 1
+                return self._results[key]
+
+        self.last_stats.cache_misses += 1
+        value = compute()
+        with self._results_lock:
+            self._results[key] = value
+            if len(self._results) > self.max_cache_entries:
+                self._results.popitem(last=False)
+        return value
+
+    # ------------------------------------------------------------------
+    # comprehensive_validate
+    # ------------------------------------------------------------------
+
+    def validate(self, workflow: Workflow, initial_data_context: DataContext = None,
+                 dirty: Optional[Iterable[int]] = None) -> List[str]:
+        """
+        Incrementally perform the equivalent of comprehensive_validate.
+
+        Args:
+            workflow: The Workflow instance to validate
+            initial_data_context: Optional initial data context
+            dirty: Indices of top-level steps edited in place since the last
+                pass. None re-fingerprints every step, which is always safe.
+
+        Returns:
+            List of all validation errors found, identical to comprehensive_validate
+        """
+        self.last_stats = IncrementalValidationStats(total_steps=len(workflow.steps))
+
+        if not workflow.steps:
+            return comprehensive_validate(workflow, initial_data_context)
+
+        steps = workflow.steps
+        prints = self._fingerprints_for(steps, dirty)
+        revalidated = set()
+
+        structural_errors = []
+        json_errors = []
+        action_name_errors = []
+        output_key_errors = []
+        script_errors = []
+
+        seen_output_keys = set()
+        if initial_data_context:
+            seen_output_keys.update(initial_data_context.get_available_paths())
+
+        for index, (step, fingerprint) in enumerate(zip(steps, prints)):
+            misses = self.last_stats.cache_misses
+            prefix = f"Step {index + 1}: "
+
+            # Structural errors only depend on which declared keys already exist
+            collisions = frozenset(fingerprint.declared_keys & seen_output_keys)
+            structure = self._cached(
+                ('structure', fingerprint.digest, collisions),
+                lambda: validate_step(step, set(collisions))
+            )
+            seen_output_keys |= fingerprint.declared_keys
+
+            local = self._cached(('local', fingerprint.digest), lambda: self._validate_step_locally(step))
+
+            structural_errors.extend(prefix + error for error in structure)
+            json_errors.extend(prefix + error for error in local[0])
+            action_name_errors.extend(prefix + error for error in local[1])
+            output_key_errors.extend(prefix + error for error in local[2])
+            script_errors.extend(prefix + error for error in local[3])
+
+            if self.last_stats.cache_misses != misses:
+                revalidated.add(index)
+
+        all_errors = structural_errors + json_errors + action_name_errors + output_key_errors + script_errors
+
+        has_critical_errors = any(
+            any(keyword in error for keyword in CRITICAL_ERROR_KEYWORDS) for error in all_errors
+        )
+        if not has_critical_errors:
+            all_errors.extend(self._validate_data_references(steps, prints, initial_data_context, revalidated))
+
+        self.last_stats.revalidated_steps = len(revalidated)
+        return all_errors
+
+    def _validate_step_locally(self, step: Any) -> Tuple[List[str], List[str], List[str], List[str]]:
+        """Run the checks that depend on nothing but the step itself."""
+        single = Workflow(steps=[step])
+        return (
+            _strip_single_step_prefix(validate_json_outputs(single)),
+            _strip_single_step_prefix(validate_action_names(single)),
+            _strip_single_step_prefix(validate_output_key_format(single)),
+            _strip_single_step_prefix(validate_script_syntax(single)),
+        )
+
+    def _validate_data_references(self, steps: List[Any], prints: List[StepFingerprint],
+                                  initial_data_context: Optional[DataContext],
+                                  revalidated: Set[int]) -> List[str]:
+        """Incremental equivalent of validator.validate_data_references."""
+        errors = []
+
+        initial_inputs = initial_data_context.initial_inputs if initial_data_context else {}
+        step_output_keys = {
+            step.output_key for step in steps
+            if hasattr(step, 'output_key') and step.output_key and step.output_key != '_'
+        }
+        inferred_inputs = {
+            var: f"<inferred_input_{var}>"
+            for fingerprint in prints
+            for var in fingerprint.input_arg_roots
+            if var not in step_output_keys
+        }
+        combined_inputs = {**initial_inputs, **inferred_inputs}
+        input_digests: Dict[str, str] = {}
+
+        # output_key -> (step, fingerprint) of the latest step producing it
+        producers: Dict[str, Tuple[Any, StepFingerprint]] = {}
+
+        def root_signature(root: str) -> Tuple:
+            if root in combined_inputs:
+                if root not in input_digests:
+                    input_digests[root] = _digest(json.dumps(combined_inputs[root], sort_keys=True, default=str))
+                return (root, 'input', input_digests[root])
+            if root in producers:
+                return (root, 'output', producers[root][1].output_digest)
+            return (root, 'missing')
+
+        for index, (step, fingerprint) in enumerate(zip(steps, prints)):
+            roots = fingerprint.data_reference_roots
+            signature = tuple(sorted(root_signature(root) for root in roots))
+
+            def compute(step=step, roots=roots):
+                context = DataContext(initial_inputs={
+                    root: combined_inputs[root] for root in roots if root in combined_inputs
+                })
+                for root in roots:
+                    if root not in combined_inputs and root in producers:
+                        context.add_step_output(root, producers[root][0].parsed_json_output)
+                return _strip_single_step_prefix(validate_step_data_references(step, 1, context))
+
+            misses = self.last_stats.cache_misses
+            step_errors = self._cached(('data', fingerprint.digest, signature), compute)
+            if self.last_stats.cache_misses != misses:
+                revalidated.add(index)
+
+            prefix = f"Step {index + 1}: "
+            errors.extend(prefix + error for error in step_errors)
+
+            if hasattr(step, 'output_key') and step.output_key and step.output_key != '_':
+                if getattr(step, 'parsed_json_output', None) is not None:
+                    producers[step.output_key] = (step, fingerprint)
+
+        return errors
+
+    # ------------------------------------------------------------------
+    # Compliance validation
+    # ------------------------------------------------------------------
+
+    def validate_compliance(self, workflow: Workflow, action_name: str = None,
+                            dirty: Optional[Iterable[int]] = None):
+        """
+        Incrementally perform the equivalent of validate_workflow_compliance.
+
+        Args:
+            workflow: The Workflow instance to validate
+            action_name: Optional action name for compound action validation
+            dirty: Indices of top-level steps edited in place since the last
+                pass. None re-fingerprints every step, which is always safe.
+
+        Returns:
+            ComplianceValidationResult identical to the non-incremental result
+        """
+        from compliance_validator import compliance_validator
+
+        self.last_stats = IncrementalValidationStats(total_steps=len(workflow.steps))
+        prints = self._fingerprints_for(workflow.steps, dirty)
+
+        step_results = []
+        for index, (step, fingerprint) in enumerate(zip(workflow.steps, prints)):
+            misses = self.last_stats.cache_misses
+            # Keyed by content only, so inserting or moving steps does not invalidate later ones
+            step_result = self._cached(
+                ('compliance', fingerprint.digest),
+                lambda step=step: compliance_validator.validate_step_compliance(step, _UNNUMBERED_STEP)
+            )
+            step_results.append(_number_step_result(step_result, index + 1))
+            if self.last_stats.cache_misses != misses:
+                self.last_stats.revalidated_steps += 1
+
+        return compliance_validator.validate_workflow_compliance(workflow, action_name, step_results=step_results)
+
+
+# Global instance for easy access
+incremental_validator = IncrementalValidator()
@@ -0,0 +1,229 @@
+"""
+Compiled JSON Path Engine for the Moveworks YAML Assistant.
+
+Data paths such as ``data.users[0].manager.email`` or
+``meta_info.user.email_addr`` are looked up by the DataContext, the path
+validator and the JSON selector widgets, often thousands of times per
+validation pass. This module parses each path once into a CompiledPath:
+
+- an optional root (``data`` or ``meta_info``)
+- a tuple of (key, index) accessors, where key is used on objects and index
+  (None if the segment is not a number) is used on arrays; both
+  ``users[0]`` and ``users.0`` address the first item
+
+Compiled paths are cached per path text, and a lookup only walks the
+accessors of its own path, so checking a path in a large output costs the
+same as in a small one. resolve_many resolves a batch of paths against one
+context and walks each shared prefix only once.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+
+
+# Number of compiled paths to remember
+JSON_PATH_CACHE_SIZE = 4096
+
+# Roots that can prefix a path
+PATH_ROOTS = ('data', 'meta_info')
+
+_SEGMENT_REGEX = re.compile(r'\.?([^.\[\]]+)|\[([^\]]*)\]|(\.)')
+
+_MISSING = object()
+
+
+class JsonPathSyntaxError(ValueError):
+    """Raised when a path cannot be parsed."""
+    pass
+
+
+# (key used on objects, index used on arrays or None)
+PathAccessor = Tuple[Union[str, int], Optional[int]]
+
+
+@dataclass(frozen=True)
+class CompiledPath:
+    """
+    A parsed data path.
+
+    Attributes:
+        text: The original path text
+        root: 'data', 'meta_info', or None when the path has no root prefix
+        steps: Accessors applied in order from the root value
+    """
+    text: str
+    root: Optional[str]
+    steps: Tuple[PathAccessor, ...]
+
+    def resolve(self, value: Any, start: int = 0) -> Any:
+        """
+        Walk the path's accessors from a value.
+
+        Args:
+            value: Value of the path's root (or of the accessor at start)
+            start: Index of the first accessor to apply
+
+        Returns:
+            The value at the end of the path
+
+        Raises:
+            KeyError: If an object does not have the key
+            IndexError: If an array index is out of range
+            TypeError: If a segment cannot be applied to the value
+        """
+        for key, index in self.steps[start:]:
+            value = _step(value, key, index)
+        return value
+
+    def find(self, value: Any, start: int = 0) -> Tuple[bool, Any]:
+        """
+        Walk the path like resolve, without raising.
+
+        Returns:
+            (True, value at the end of the path) or (False, None)
+        """
+        for key, index in self.steps[start:]:
+            if isinstance(value, dict):
+                if key not in value:
+                    return False, None
+                value = value[key]
+            elif isinstance(value, list):
+                if index is None or index >= len(value):
+                    return False, None
+                value = value[index]
+            else:
+                return False, None
+        return True, value
+
+
+def _step(value: Any, key: Union[str, int], index: Optional[int]) -> Any:
+    if isinstance(value, dict):
+        try:
+            return value[key]
+        except KeyError:
+            raise KeyError(f"Key '{key}' not found. Available keys: {list(value.keys())}") from None
+    if isinstance(value, list):
+        if index is None:
+            raise TypeError(f"Array index must be integer, got '{key}' (type: {type(key)})")
+        if index >= len(value):
+            raise IndexError(f"Array index {index} out of range. Array has {len(value)} items")
+        return value[index]
+    raise TypeError(f"Cannot navigate to '{key}' from {type(value).__name__}")
+
+
+@lru_cache(maxsize=JSON_PATH_CACHE_SIZE)
+def compile_path(path: str) -> CompiledPath:
+    """
+    Parse a data path, reusing the cached result for repeated paths.
+
+    Args:
+        path: Path like 'data.users[0].email', 'users.0.email' or 'meta_info.user.email_addr'
+
+    Returns:
+        The CompiledPath
+
+    Raises:
+        JsonPathSyntaxError: If the path is malformed (e.g. a non-numeric array
+            index, or an empty segment as in 'a..b' or 'a.')
+    """
+    steps = []
+    position = 0
+    text = path.strip()
+    while position < len(text):
+        match = _SEGMENT_REGEX.match(text, position)
+        if match is None:
+            raise JsonPathSyntaxError(f"Unexpected '{text[position]}' at position {position} in '{path}'")
+        if match.group(3) is not None:
+            raise JsonPathSyntaxError(f"Empty segment at position {position} in '{path}'")
+        name, bracket = match.group(1), match.group(2)
+        if name is not None:
+            steps.append((name, int(name) if name.isdigit() else None))
+        else:
+            inner = bracket.strip()
+            if len(inner) >= 2 and inner[0] in ('"', "'") and inner[-1] == inner[0]:
+                # Quoted key, e.g. ['first name']
+                steps.append((inner[1:-1], None))
+            elif inner.isdigit():
+                steps.append((int(inner), int(inner)))
+            elif inner:
+                raise JsonPathSyntaxError(f"Invalid array index: '{inner}' must be a number")
+        position = match.end()
+
+    root = None
+    if steps and steps[0][0] in PATH_ROOTS:
+        root = steps[0][0]
+        steps = steps[1:]
+    return CompiledPath(path, root, tuple(steps))
+
+
+def resolve_path(data: Any, path: str) -> Any:
+    """
+    Look up a path in a data value.
+
+    Args:
+        data: The value of 'data'; a 'meta_info.' path is looked up under
+            data['meta_info']
+        path: The path (an empty path or 'data' returns data itself)
+
+    Returns:
+        The value at the path
+
+    Raises:
+        JsonPathSyntaxError: If the path is malformed
+        KeyError, IndexError, TypeError: If the path does not exist in data
+    """
+    compiled = compile_path(path)
+    if compiled.root == 'meta_info':
+        data = _step(data, 'meta_info', None)
+    return compiled.resolve(data)
+
+
+def resolve_many(paths: Iterable[str], context: Any) -> Dict[str, Any]:
+    """
+    Resolve a batch of paths against one context.
+
+    Accessor prefixes shared between paths (e.g. 'data.user' in
+    'data.user.id' and 'data.user.name') are walked once.
+
+    Args:
+        paths: Paths to resolve; unprefixed paths are looked up under 'data'
+        context: Mapping of root name ('data', 'meta_info') to its value, or
+            an object with a path_roots() method returning one (DataContext)
+
+    Returns:
+        Values by path text; paths that do not resolve (or do not parse) are
+        left out
+    """
+    roots: Mapping[str, Any] = context.path_roots() if hasattr(context, 'path_roots') else context
+    # Walked prefixes as a trie of (value, children by accessor), so each
+    # accessor costs one dictionary lookup however deep the path is
+    walked: Dict[str, Tuple[Any, Dict[PathAccessor, Tuple]]] = {}
+    values: Dict[str, Any] = {}
+
+    for path in paths:
+        if path in values:
+            continue
+        try:
+            compiled = compile_path(path)
+        except JsonPathSyntaxError:
+            continue
+        root = compiled.root or 'data'
+        node = walked.get(root)
+        if node is None:
+            node = walked[root] = (roots.get(root, _MISSING), {})
+        for accessor in compiled.steps:
+            value, children = node
+            if value is _MISSING:
+                break
+            node = children.get(accessor)
+            if node is None:
+                try:
+                    child = _step(value, *accessor)
+                except (KeyError, IndexError, TypeError):
+                    child = _MISSING
+                node = children[accessor] = (child, {})
+        if node[0] is not _MISSING:
+            values[path] = node[0]
+    return values
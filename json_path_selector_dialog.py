@@ -397,7 +397,7 @@ class JsonPathSelectorDialog(QDialog):
         # Much larger, enhanced JSON tree
         self.json_tree = JsonTreeWidget()
         self.json_tree.setStyleSheet(f"""
-            QTreeWidget {{
+            QTreeView {{
                 background-color: white;
                 border: 3px solid white;
                 border-radius: 8px;
@@ -408,23 +408,23 @@ class JsonPathSelectorDialog(QDialog):
                 min-height: 500px;
                 font-weight: bold;
             }}
-            QTreeWidget::item {{
+            QTreeView::item {{
                 padding: 12px;
                 border-bottom: 2px solid #f0f0f0;
                 min-height: 30px;
             }}
-            QTreeWidget::item:hover {{
+            QTreeView::item:hover {{
                 background-color: {VisualDesignConstants.HOVER_BACKGROUND};
                 border-left: 4px solid {VisualDesignConstants.ACCENT_COLOR};
             }}
-            QTreeWidget::item:selected {{
+            QTreeView::item:selected {{
                 background-color: {VisualDesignConstants.ACCENT_COLOR};
                 color: white;
                 font-weight: bold;
                 border-left: 4px solid {VisualDesignConstants.SUCCESS_COLOR};
             }}
-            QTreeWidget::branch:has-children:!has-siblings:closed,
-            QTreeWidget::branch:closed:has-children:has-siblings {{
+            QTreeView::branch:has-children:!has-siblings:closed,
+            QTreeView::branch:closed:has-children:has-siblings {{
                 border-image: none;
                 image: none;
                 background-color: {VisualDesignConstants.ACCENT_COLOR};
@@ -432,8 +432,8 @@ class JsonPathSelectorDialog(QDialog):
                 height: 12px;
                 border-radius: 6px;
             }}
-            QTreeWidget::branch:open:has-children:!has-siblings,
-            QTreeWidget::branch:open:has-children:has-siblings {{
+            QTreeView::branch:open:has-children:!has-siblings,
+            QTreeView::branch:open:has-children:has-siblings {{
                 border-image: none;
                 image: none;
                 background-color: {VisualDesignConstants.SUCCESS_COLOR};
@@ -0,0 +1,695 @@
+"""
+Lazy JSON tree model for the Moveworks YAML Assistant.
+
+Sample action outputs can be tens of megabytes, so the JSON explorers do not
+build a widget item per node. Instead a LazyJsonTreeModel (a Qt
+QAbstractItemModel) wraps the parsed JSON and creates lightweight JsonNode
+objects only for rows the view asks for: children are materialized in
+batches when a node is expanded. A JsonPathIndex over every path is built
+only when something needs all paths (search, completion, selecting a path
+that has not been expanded yet), or ahead of time on a background thread.
+Its trigram PathSearchIndex answers substring and fuzzy path queries.
+
+The JSON explorers keep the models of recently shown step outputs in an LRU
+cache keyed by step_output_cache_key, and skip rebuilding the tree when the
+shown output is unchanged. The node and index classes and these cache
+helpers do not depend on Qt; the model is defined only when PySide6 is
+available.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from path_search import PathSearchIndex
+
+try:
+    from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+    from PySide6.QtGui import QFont
+    PYSIDE6_AVAILABLE = True
+except ImportError:
+    PYSIDE6_AVAILABLE = False
+
+
+# Number of children materialized per fetch when a node is expanded
+FETCH_BATCH_SIZE = 256
+
+# Maximum length of a scalar value shown in the tree
+DISPLAY_VALUE_LENGTH = 50
+
+# Number of shared path indexes kept by get_json_path_index
+JSON_PATH_INDEX_CACHE_SIZE = 16
+
+_SEPARATOR_REGEX = re.compile(r'[.\[]')
+
+
+def json_value_type(value: Any) -> str:
+    """Get the type string for a JSON value."""
+    if isinstance(value, dict):
+        return "object"
+    elif isinstance(value, list):
+        return "array"
+    elif isinstance(value, str):
+        return "string"
+    elif isinstance(value, bool):
+        return "boolean"
+    elif isinstance(value, int):
+        return "integer"
+    elif isinstance(value, float):
+        return "number"
+    elif value is None:
+        return "null"
+    else:
+        return "unknown"
+
+
+def json_display_value(value: Any) -> str:
+    """Get the short value text shown next to a key."""
+    if isinstance(value, list):
+        return f"({len(value)} items)"
+    if isinstance(value, dict):
+        return f"({len(value)} keys)"
+    text = str(value)
+    return text[:DISPLAY_VALUE_LENGTH] + "..." if len(text) > DISPLAY_VALUE_LENGTH else text
+
+
+def json_child_key_text(key: Any, is_index: bool) -> str:
+    """Get the key column text for a child entry."""
+    return f"[{key}]" if is_index else str(key)
+
+
+def json_child_path(parent_path: str, key: Any, is_index: bool) -> str:
+    """Build the data path of a child entry."""
+    return f"{parent_path}[{key}]" if is_index else f"{parent_path}.{key}"
+
+
+class JsonNode:
+    """A materialized entry of a JSON tree; children are created on demand."""
+
+    __slots__ = ('parent', 'row', 'key', 'is_index', 'path', 'value', 'label', '_children', '_keys', '_rows')
+
+    def __init__(self, parent: Optional['JsonNode'], row: int, key: Any, is_index: bool,
+                 path: Optional[str], value: Any, label: Optional[str] = None):
+        self.parent = parent
+        self.row = row
+        self.key = key
+        self.is_index = is_index
+        self.path = path
+        self.value = value
+        self.label = label
+        self._children: List['JsonNode'] = []
+        self._keys: Optional[List[Any]] = None
+        self._rows: Optional[Dict[Any, int]] = None
+
+    @property
+    def key_text(self) -> str:
+        if self.label is not None:
+            return self.label
+        return json_child_key_text(self.key, self.is_index)
+
+    @property
+    def is_container(self) -> bool:
+        return isinstance(self.value, (dict, list)) and self.path is not None
+
+    def child_count(self) -> int:
+        """Total number of children, materialized or not."""
+        return len(self.value) if self.is_container else 0
+
+    def fetched_count(self) -> int:
+        """Number of children materialized so far."""
+        return len(self._children)
+
+    def can_fetch_more(self) -> bool:
+        return self.fetched_count() < self.child_count()
+
+    def fetch_more(self, batch_size: int = FETCH_BATCH_SIZE) -> int:
+        """
+        Materialize the next batch of children.
+
+        Args:
+            batch_size: Maximum number of children to create
+
+        Returns:
+            Number of children created
+        """
+        start = len(self._children)
+        end = min(self.child_count(), start + batch_size)
+        if end <= start:
+            return 0
+
+        if isinstance(self.value, dict):
+            if self._keys is None:
+                self._keys = list(self.value)
+            for row in range(start, end):
+                key = self._keys[row]
+                self._children.append(JsonNode(
+                    self, row, key, False, json_child_path(self.path, key, False), self.value[key]
+                ))
+        else:
+            for row in range(start, end):
+                self._children.append(JsonNode(
+                    self, row, row, True, json_child_path(self.path, row, True), self.value[row]
+                ))
+        return end - start
+
+    def child(self, row: int) -> Optional['JsonNode']:
+        """Get a materialized child by row."""
+        if 0 <= row < len(self._children):
+            return self._children[row]
+        return None
+
+    def row_for_key(self, key: Any) -> Optional[int]:
+        """Get the row of a dict key or list index without materializing it."""
+        if not self.is_container:
+            return None
+        if isinstance(self.value, list):
+            if isinstance(key, int) and 0 <= key < len(self.value):
+                return key
+            return None
+        if key not in self.value:
+            return None
+        if self._rows is None:
+            if self._keys is None:
+                self._keys = list(self.value)
+            self._rows = {child_key: row for row, child_key in enumerate(self._keys)}
+        return self._rows[key]
+
+    def child_for_key(self, key: Any) -> Optional['JsonNode']:
+        """Get the child for a dict key or list index, materializing rows up to it."""
+        row = self.row_for_key(key)
+        if row is None:
+            return None
+        if self.fetched_count() <= row:
+            self.fetch_more(row + 1 - self.fetched_count())
+        return self._children[row]
+
+
+class JsonPathIndex:
+    """
+    Index of every path in a JSON document, built on first use.
+
+    Entries are produced in the order a fully expanded tree would show them
+    (pre-order, root first), without creating any tree nodes. Building is
+    thread-safe, so build_async can prepare the index while the GUI thread
+    keeps running; a query made before it finishes waits for it.
+    """
+
+    def __init__(self, data: Any, root_path: str, root_label: Optional[str] = None):
+        self.data = data
+        self.root_path = root_path
+        self.root_label = root_label if root_label is not None else root_path
+        self._paths: Optional[List[str]] = None
+        self._search_index: Optional[PathSearchIndex] = None
+        self._build_lock = threading.Lock()
+        self._build_future: Optional[Future] = None
+
+    def iter_entries(self) -> Iterator[Tuple[str, Tuple[Any, ...], str, Any]]:
+        """
+        Walk the document.
+
+        Yields:
+            Tuples of (path, route, key_text, value) where route is the
+            sequence of keys/indices from the root
+        """
+        stack = [(self.root_path, (), self.root_label, self.data)]
+        while stack:
+            path, route, key_text, value = stack.pop()
+            yield path, route, key_text, value
+
+            if isinstance(value, dict):
+                stack.extend(reversed([
+                    (json_child_path(path, key, False), route + (key,), str(key), child)
+                    for key, child in value.items()
+                ]))
+            elif isinstance(value, list):
+                stack.extend(reversed([
+                    (json_child_path(path, i, True), route + (i,), f"[{i}]", child)
+                    for i, child in enumerate(value)
+                ]))
+
+    def _build(self):
+        with self._build_lock:
+            if self._paths is not None:
+                return
+            paths = []
+            texts = []
+            for path, route, key_text, value in self.iter_entries():
+                paths.append(path)
+                # Keys are part of the path; the root row shows its label and no value
+                texts.append(json_display_value(value) if route else key_text)
+            self._search_index = PathSearchIndex(paths, texts)
+            self._paths = paths
+
+    def build_async(self, then: Optional[Callable[['JsonPathIndex'], Any]] = None) -> Future:
+        """
+        Build the index on a background thread; repeated calls share one build.
+
+        Args:
+            then: Optional function called with the index on the background
+                thread right after it is built (or at once if it already is),
+                so work that needs every path stays off the GUI thread too
+
+        Returns:
+            Future of the build, or of the build followed by then
+        """
+        if then is not None:
+            return submit_index_task(self._build_then, then)
+        if self._build_future is None:
+            self._build_future = submit_index_task(self._build)
+        return self._build_future
+
+    def _build_then(self, then: Callable[['JsonPathIndex'], Any]) -> Any:
+        self._build()
+        return then(self)
+
+    @property
+    def is_built(self) -> bool:
+        """Whether queries can be answered without building the index first."""
+        return self._paths is not None
+
+    def paths(self) -> List[str]:
+        """Get every path in the document."""
+        if self._paths is None:
+            self._build()
+        return self._paths
+
+    def __len__(self) -> int:
+        return len(self.paths())
+
+    def route(self, path: str) -> Optional[Tuple[Any, ...]]:
+        """
+        Get the keys/indices leading from the root to a path, or None.
+
+        The route is resolved by walking the document along the path, so no
+        per-path state is kept and the index does not need to be built.
+        """
+        if not path.startswith(self.root_path):
+            return None
+        return _resolve_route(self.data, path, len(self.root_path), ())
+
+    @property
+    def search_index(self) -> PathSearchIndex:
+        """Trigram index over the paths and displayed values."""
+        if self._search_index is None:
+            self._build()
+        return self._search_index
+
+    def search(self, query: str) -> List[str]:
+        """
+        Find paths whose path, key or displayed value contains the query.
+
+        Args:
+            query: Case-insensitive search text
+
+        Returns:
+            Matching paths in tree order
+        """
+        paths = self.paths()
+        return [paths[entry] for entry in self.search_index.search(query)]
+
+    def suggest(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """
+        Find the paths most similar to a (possibly misspelled) path.
+
+        Args:
+            query: Path or path fragment
+            limit: Maximum number of suggestions
+
+        Returns:
+            (path, score) pairs, best first; see PathSearchIndex.fuzzy
+        """
+        paths = self.paths()
+        return [(paths[entry], score) for entry, score in self.search_index.fuzzy(query, limit)]
+
+
+def _resolve_route(value: Any, path: str, position: int,
+                   route: Tuple[Any, ...]) -> Optional[Tuple[Any, ...]]:
+    """Match path[position:] against the children of value, returning the route to it."""
+    if position == len(path):
+        return route
+
+    if isinstance(value, list):
+        end = path.find(']', position)
+        if path[position] != '[' or end < 0 or not path[position + 1:end].isdigit():
+            return None
+        row = int(path[position + 1:end])
+        if row >= len(value):
+            return None
+        return _resolve_route(value[row], path, end + 1, route + (row,))
+
+    if not isinstance(value, dict) or path[position] != '.':
+        return None
+    start = position + 1
+    end = _SEPARATOR_REGEX.search(path, start)
+    end = end.start() if end else len(path)
+    key = path[start:end]
+    if key in value:
+        found = _resolve_route(value[key], path, end, route + (key,))
+        if found is not None:
+            return found
+    # Keys containing separators do not end at the next one
+    for key in value:
+        key_text = str(key)
+        if len(key_text) > end - start and path.startswith(key_text, start):
+            found = _resolve_route(value[key], path, start + len(key_text), route + (key,))
+            if found is not None:
+                return found
+    return None
+
+
+# Global background executor for building path indexes
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _index_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="json-path-index")
+        return _executor
+
+
+def submit_index_task(function: Callable, *args) -> Future:
+    """Run a function on the background path index thread, after the tasks already queued there."""
+    return _index_executor().submit(function, *args)
+
+
+def lru_lookup(cache: "OrderedDict[Any, Any]", key: Any) -> Any:
+    """Get a cached value and mark it most recently used; None if the key is not cached."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def lru_store(cache: "OrderedDict[Any, Any]", key: Any, value: Any, max_size: int) -> List[Any]:
+    """
+    Cache a value as the most recently used one.
+
+    Returns:
+        The values evicted to keep at most max_size entries, least recently used first
+    """
+    cache[key] = value
+    cache.move_to_end(key)
+    evicted = []
+    while len(cache) > max_size:
+        evicted.append(cache.popitem(last=False)[1])
+    return evicted
+
+
+def step_output_cache_key(output_key: str, output_digest: Optional[str]) -> Optional[Tuple[str, str, str]]:
+    """Cache key of the tree model showing a step output, or None if the output has no digest."""
+    return ('step', output_key, output_digest) if output_digest else None
+
+
+def output_unchanged(shown_key: Any, cache_key: Any) -> bool:
+    """Check whether a tree showing the content of shown_key can skip rebuilding for cache_key."""
+    return cache_key is not None and cache_key == shown_key
+
+
+# Global shared path indexes, least recently used first
+_shared_indexes: "OrderedDict[Tuple[int, str], JsonPathIndex]" = OrderedDict()
+
+
+def get_json_path_index(data: Any, root_path: str = "data") -> JsonPathIndex:
+    """
+    Get the shared path index of a document.
+
+    Indexes are kept per document object (the most recent
+    JSON_PATH_INDEX_CACHE_SIZE of them), so repeated lookups against the same
+    step output reuse one index. Documents must not be modified in place.
+
+    Args:
+        data: Parsed JSON, e.g. a step's parsed_json_output
+        root_path: Data path of the document
+
+    Returns:
+        JsonPathIndex for the document
+    """
+    key = (id(data), root_path)
+    index = lru_lookup(_shared_indexes, key)
+    if index is not None and index.data is data:
+        return index
+
+    index = JsonPathIndex(data, root_path)
+    lru_store(_shared_indexes, key, index, JSON_PATH_INDEX_CACHE_SIZE)
+    return index
+
+
+if PYSIDE6_AVAILABLE:
+
+    # Foreground colors of the key column by value type
+    TYPE_COLORS = {
+        "object": Qt.blue,
+        "array": Qt.darkGreen,
+        "string": Qt.darkRed,
+        "integer": Qt.darkMagenta,
+        "number": Qt.darkMagenta,
+        "boolean": Qt.darkCyan,
+    }
+
+    class LazyJsonTreeModel(QAbstractItemModel):
+        """
+        Item model over parsed JSON that creates rows only when they are shown.
+
+        Columns are Key, Type and Value, or a single label column when
+        compact is set. Qt.UserRole returns a row's data path.
+        """
+
+        HEADERS = ["Key", "Type", "Value"]
+
+        def __init__(self, parent=None, compact: bool = False, compact_header: str = "JSON Structure"):
+            super().__init__(parent)
+            self.compact = compact
+            self.compact_header = compact_header
+            self.data_value: Any = None
+            self.root_path: Optional[str] = None
+            self._root = JsonNode(None, 0, None, False, None, None)
+            self._top: List[JsonNode] = []
+            self._message_type = ""
+            self._message_value = ""
+            self._message_color = None
+            self._path_index: Optional[JsonPathIndex] = None
+            # Rows a view had expanded, restored when the model is shown again
+            self.expanded_paths: List[str] = []
+
+        # --------------------------------------------------------------
+        # Content
+        # --------------------------------------------------------------
+
+        def set_json(self, data: Any, root_path: str, root_label: Optional[str] = None):
+            """
+            Show a JSON document under a single root row.
+
+            Args:
+                data: Parsed JSON
+                root_path: Data path of the root (e.g. "data" or "data.user_info")
+                root_label: Optional text for the root row (defaults to root_path)
+            """
+            self.beginResetModel()
+            self.data_value = data
+            self.root_path = root_path
+            root = JsonNode(None, 0, None, False, root_path, data, label=root_label or root_path)
+            self._top = [root]
+            self._message_type = self._message_value = ""
+            self._message_color = None
+            self._path_index = None
+            self.expanded_paths = []
+            self.endResetModel()
+
+        def set_message(self, text: str, type_text: str = "info", value_text: str = "", color=None):
+            """Replace the content with a single informational row that has no path."""
+            self.beginResetModel()
+            self.data_value = None
+            self.root_path = None
+            self._top = [JsonNode(None, 0, None, False, None, None, label=text)]
+            self._message_type = type_text
+            self._message_value = value_text
+            self._message_color = color
+            self._path_index = None
+            self.endResetModel()
+
+        def clear(self):
+            """Remove all rows."""
+            self.beginResetModel()
+            self.data_value = None
+            self.root_path = None
+            self._top = []
+            self._path_index = None
+            self.endResetModel()
+
+        @property
+        def path_index(self) -> Optional[JsonPathIndex]:
+            """Index of every path in the current document, built on first use."""
+            if self._path_index is None and self.root_path is not None:
+                root = self._top[0]
+                root_label = self._compact_label(root) if self.compact else self._column_text(root, 0)
+                self._path_index = JsonPathIndex(self.data_value, self.root_path, root_label)
+            return self._path_index
+
+        def all_paths(self) -> List[str]:
+            """Get every path in the current document."""
+            index = self.path_index
+            return index.paths() if index is not None else []
+
+        def search_paths(self, query: str) -> List[str]:
+            """Find paths whose path, key or displayed value contains the query."""
+            index = self.path_index
+            return index.search(query) if index is not None else []
+
+        def suggest_paths(self, query: str, limit: int = 10) -> List[str]:
+            """Get the paths most similar to a (possibly misspelled) path, best first."""
+            index = self.path_index
+            return [path for path, _ in index.suggest(query, limit)] if index is not None else []
+
+        # --------------------------------------------------------------
+        # Nodes and indexes
+        # --------------------------------------------------------------
+
+        def node_from_index(self, index: QModelIndex) -> Optional[JsonNode]:
+            """Get the node behind a model index (None for the invisible root)."""
+            if not index.isValid():
+                return None
+            return index.internalPointer()
+
+        def path_for_index(self, index: QModelIndex) -> Optional[str]:
+            """Get the data path of a row."""
+            node = self.node_from_index(index)
+            return node.path if node is not None else None
+
+        def _children_of(self, node: Optional[JsonNode]) -> List[JsonNode]:
+            return self._top if node is None else node._children
+
+        def index_for_path(self, path: str) -> QModelIndex:
+            """
+            Get the index of a path, materializing the rows leading to it.
+
+            Args:
+                path: Data path of the row
+
+            Returns:
+                The row's index, or an invalid index if the path does not exist
+            """
+            if not self._top or self.path_index is None:
+                return QModelIndex()
+            route = self.path_index.route(path)
+            if route is None:
+                return QModelIndex()
+
+            node = self._top[0]
+            node_index = self.index(0, 0, QModelIndex())
+            for key in route:
+                row = node.row_for_key(key)
+                if row is None:
+                    return QModelIndex()
+                if node.fetched_count() <= row:
+                    # Announce the rows materialized on the way
+                    start = node.fetched_count()
+                    self.beginInsertRows(node_index, start, row)
+                    node.fetch_more(row + 1 - start)
+                    self.endInsertRows()
+                node = node._children[row]
+                node_index = self.index(row, 0, node_index)
+            return node_index
+
+        # --------------------------------------------------------------
+        # QAbstractItemModel
+        # --------------------------------------------------------------
+
+        def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+            if not self.hasIndex(row, column, parent):
+                return QModelIndex()
+            children = self._children_of(self.node_from_index(parent))
+            if row >= len(children):
+                return QModelIndex()
+            return self.createIndex(row, column, children[row])
+
+        def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+            node = self.node_from_index(index)
+            if node is None or node.parent is None:
+                return QModelIndex()
+            return self.createIndex(node.parent.row, 0, node.parent)
+
+        def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+            if parent.isValid() and parent.column() != 0:
+                return 0
+            return len(self._children_of(self.node_from_index(parent)))
+
+        def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+            return 1 if self.compact else len(self.HEADERS)
+
+        def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+            node = self.node_from_index(parent)
+            if node is None:
+                return bool(self._top)
+            return node.child_count() > 0
+
+        def canFetchMore(self, parent: QModelIndex) -> bool:
+            node = self.node_from_index(parent)
+            return node is not None and node.can_fetch_more()
+
+        def fetchMore(self, parent: QModelIndex):
+            node = self.node_from_index(parent)
+            if node is None or not node.can_fetch_more():
+                return
+            start = node.fetched_count()
+            end = min(node.child_count(), start + FETCH_BATCH_SIZE)
+            self.beginInsertRows(parent, start, end - 1)
+            node.fetch_more(end - start)
+            self.endInsertRows()
+
+        def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+            if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+                return self.compact_header if self.compact else self.HEADERS[section]
+            return None
+
+        def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+            node = self.node_from_index(index)
+            if node is None:
+                return None
+
+            column = index.column()
+            if role == Qt.DisplayRole:
+                if self.compact:
+                    return self._compact_label(node)
+                return self._column_text(node, column)
+            if role == Qt.UserRole:
+                return node.path
+            if role == Qt.ToolTipRole and node.path is not None:
+                preview = str(node.value)
+                if len(preview) > 100:
+                    preview = preview[:100] + "..."
+                return f"Path: {node.path}\nValue: {preview}"
+            if role == Qt.ForegroundRole and column == 0:
+                if node.path is None:
+                    return self._message_color
+                if node.parent is not None:
+                    return TYPE_COLORS.get(json_value_type(node.value))
+            if role == Qt.FontRole and node.parent is None and node.path is not None:
+                font = QFont()
+                font.setBold(True)
+                return font
+            return None
+
+        def _column_text(self, node: JsonNode, column: int) -> str:
+            if node.path is None:
+                return [node.label, self._message_type, self._message_value][column]
+            if column == 0:
+                if node.parent is None and isinstance(node.value, (dict, list)):
+                    return f"{node.key_text} ({len(node.value)} items)"
+                return node.key_text
+            if column == 1:
+                return json_value_type(node.value)
+            if node.parent is None:
+                return ""
+            return json_display_value(node.value)
+
+        def _compact_label(self, node: JsonNode) -> str:
+            if node.parent is None:
+                return node.key_text
+            if isinstance(node.value, (dict, list)):
+                return f"{node.key_text} ({type(node.value).__name__})"
+            return f"{node.key_text}: {repr(node.value)}"
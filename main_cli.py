@@ -6,11 +6,13 @@ implementing the full PySide6 GUI.
 """
 
 import click
+import sys
 import json
 from typing import List
 from core_structures import ActionStep, ScriptStep, Workflow, DataContext
 from yaml_generator import generate_yaml_string
 from validator import comprehensive_validate
+from workflow_serializer import save_workflow, load_workflow
 
 # Global workflow storage for CLI session
 current_workflow = Workflow()
@@ -192,7 +194,8 @@ def clear():
 
 
 @cli.command()
-def save():
+@click.option("--compact", is_flag=True, help="Write the compact workflow file layout.")
+def save(compact):
     """Save the current workflow to a file."""
     if not current_workflow.steps:
         click.echo("No steps in the current workflow. Add some steps first.")
@@ -201,37 +204,7 @@ def save():
     filename = click.prompt("Filename", default="workflow.json")
     
     try:
-        # Convert workflow to JSON-serializable format
-        workflow_data = {
-            "steps": []
-        }
-        
-        for step in current_workflow.steps:
-            if isinstance(step, ActionStep):
-                step_data = {
-                    "type": "action",
-                    "action_name": step.action_name,
-                    "output_key": step.output_key,
-                    "description": step.description,
-                    "input_args": step.input_args,
-                    "progress_updates": step.progress_updates,
-                    "delay_config": step.delay_config,
-                    "user_provided_json_output": step.user_provided_json_output
-                }
-            elif isinstance(step, ScriptStep):
-                step_data = {
-                    "type": "script",
-                    "code": step.code,
-                    "output_key": step.output_key,
-                    "description": step.description,
-                    "input_args": step.input_args,
-                    "user_provided_json_output": step.user_provided_json_output
-                }
-            
-            workflow_data["steps"].append(step_data)
-        
-        with open(filename, 'w') as f:
-            json.dump(workflow_data, f, indent=2)
+        save_workflow(current_workflow, filename, compact=compact)
         
         click.echo(f"✓ Workflow saved to {filename}")
     
@@ -244,34 +217,24 @@ def load():
     """Load a workflow from a file."""
     filename = click.prompt("Filename", default="workflow.json")
     
+    global current_workflow
+
+    if filename.lower().endswith(('.yaml', '.yml')):
+        from yaml_parser import load_compound_action_file
+        try:
+            parsed = load_compound_action_file(filename)
+        except Exception as e:
+            click.echo(f"Error loading workflow: {e}")
+            return
+
+        current_workflow = parsed.workflow
+        for warning in parsed.warnings:
+            click.echo(f"  ! {warning}")
+        click.echo(f"✓ Workflow loaded from {filename} ({len(current_workflow.steps)} steps)")
+        return
+
     try:
-        with open(filename, 'r') as f:
-            workflow_data = json.load(f)
-        
-        global current_workflow
-        current_workflow = Workflow()
-        
-        for step_data in workflow_data.get("steps", []):
-            if step_data["type"] == "action":
-                step = ActionStep(
-                    action_name=step_data["action_name"],
-                    output_key=step_data["output_key"],
-                    description=step_data.get("description"),
-                    input_args=step_data.get("input_args", {}),
-                    progress_updates=step_data.get("progress_updates"),
-                    delay_config=step_data.get("delay_config"),
-                    user_provided_json_output=step_data.get("user_provided_json_output")
-                )
-            elif step_data["type"] == "script":
-                step = ScriptStep(
-                    code=step_data["code"],
-                    output_key=step_data["output_key"],
-                    description=step_data.get("description"),
-                    input_args=step_data.get("input_args", {}),
-                    user_provided_json_output=step_data.get("user_provided_json_output")
-                )
-            
-            current_workflow.steps.append(step)
+        current_workflow = load_workflow(filename)
         
         click.echo(f"✓ Workflow loaded from {filename} ({len(current_workflow.steps)} steps)")
     
@@ -279,5 +242,111 @@ def load():
         click.echo(f"Error loading workflow: {e}")
 
 
+@cli.command()
+@click.option("--inputs", default=None,
+              help="JSON object of compound action input values (available as data.<name>).")
+@click.option("--latency", default=None,
+              help='JSON object of action latencies, e.g. \'{"mw.get_user_by_email": 120}\' (milliseconds).')
+@click.option("--workers", "-j", type=int, default=8,
+              help="Number of lanes parallel steps run at once (default: 8).")
+@click.option("--script-timeout", type=float, default=5.0,
+              help="Seconds each script may run before it is stopped (default: 5).")
+def simulate(inputs, latency, workers, script_timeout):
+    """Dry-run the current workflow using each step's sample output as the action response."""
+    if not current_workflow.steps:
+        click.echo("No steps in the current workflow. Add some steps first.")
+        return
+
+    from workflow_simulator import simulate_workflow
+
+    try:
+        initial_inputs = json.loads(inputs) if inputs else {}
+        latency_profiles = json.loads(latency) if latency else {}
+    except json.JSONDecodeError as e:
+        click.echo(f"Invalid JSON option: {e}")
+        return
+
+    result = simulate_workflow(current_workflow, initial_inputs,
+                               latency_profiles=latency_profiles, max_workers=workers,
+                               script_timeout=script_timeout)
+    click.echo(result.summary())
+    for warning in result.warnings:
+        click.echo(f"  ! {warning}")
+    if result.returned:
+        click.echo("Output:")
+        click.echo(json.dumps(result.output, indent=2, default=str))
+
+
+@cli.command()
+@click.option("--latency", default=None,
+              help='JSON object of action latencies, e.g. \'{"mw.get_user_by_email": 120}\' (milliseconds).')
+@click.option("--workers", "-j", type=int, default=8,
+              help="Number of branches assumed to run at once (default: 8).")
+@click.option("--apply", "apply_rewrite", is_flag=True,
+              help="Rewrite the current workflow with the suggested parallel steps.")
+def parallelize(latency, workers, apply_rewrite):
+    """Suggest running independent action steps as parallel branches."""
+    global current_workflow
+
+    from parallelization_advisor import ParallelizationAdvisor
+
+    try:
+        latency_profiles = json.loads(latency) if latency else {}
+    except json.JSONDecodeError as e:
+        click.echo(f"Invalid --latency JSON: {e}")
+        return
+
+    # Commands only add steps or replace the workflow, never edit steps in
+    # place, so cached step fingerprints are current
+    advisor = ParallelizationAdvisor(latency_profiles, max_workers=workers)
+    plan = advisor.analyze(current_workflow, dirty=())
+    if not plan.suggestions:
+        click.echo("No independent action steps found.")
+        return
+
+    for suggestion in plan.suggestions:
+        click.echo(suggestion.describe())
+        click.echo(advisor.preview_yaml(current_workflow, suggestion))
+    click.echo(f"Estimated action latency: {plan.serial_ms:.0f} ms -> {plan.parallel_ms:.0f} ms")
+
+    if apply_rewrite:
+        current_workflow = advisor.apply(current_workflow, plan.suggestions)
+        click.echo(f"Applied {len(plan.suggestions)} rewrite(s).")
+
+
+@cli.command()
+@click.argument("patterns", nargs=-1, required=True)
+@click.option("--workers", "-j", type=int, default=None,
+              help="Number of worker processes (default: CPU count, 1 disables multiprocessing).")
+@click.option("--action-name", default=None,
+              help="Compound action name for compliance checks (default: each file's name).")
+@click.option("--output", "-o", type=click.File("w"), default="-",
+              help="File to write JSON-lines results to (default: stdout).")
+def validate_batch(patterns, workers, action_name, output):
+    """Validate workflow files matching PATTERNS and stream JSON-lines results.
+
+    PATTERNS may be files, directories or glob patterns such as
+    'workflows/**/*.json'. Exits with status 1 if any file fails validation
+    and 2 if no files match.
+    """
+    from batch_validator import expand_workflow_paths, iter_batch_validation
+
+    paths = expand_workflow_paths(patterns)
+    if not paths:
+        click.echo("No workflow files matched the given patterns.", err=True)
+        sys.exit(2)
+
+    failed = 0
+    for result in iter_batch_validation(paths, workers=workers, action_name=action_name):
+        if not result.valid:
+            failed += 1
+        output.write(result.to_json_line() + "\n")
+        output.flush()
+
+    click.echo(f"Validated {len(paths)} file(s): {len(paths) - failed} passed, {failed} failed", err=True)
+    if failed:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     cli()
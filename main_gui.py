@@ -3,16 +3,27 @@ Main GUI application for the Moveworks YAML Assistant using PySide6.
 
 This module implements the desktop application interface for creating and
 managing Moveworks Compound Action workflows.
+
+Heavy subsystems (tutorials, the template library, contextual examples, the
+Bender function builder, the enhanced validator, the help topics, the script
+editor and the JSON explorer) are imported and constructed when first used
+or shown rather than at startup. Run with
+--profile-startup to print an import and construction time breakdown.
 """
 
 import sys
 import json
-from typing import Any
+from typing import Any, Dict
+
+from startup_profiler import startup_profiler, PROFILE_STARTUP_FLAG
+if PROFILE_STARTUP_FLAG in sys.argv:
+    startup_profiler.enable()
+
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QListWidget, QListWidgetItem, QTextEdit, QLabel,
     QPushButton, QMessageBox, QDialog,
-    QStackedWidget, QTreeWidget, QTreeWidgetItem, QGroupBox,
+    QStackedWidget, QTreeView, QGroupBox,
     QFormLayout, QLineEdit, QTableWidget, QTableWidgetItem,
     QComboBox, QTabWidget, QScrollArea, QCheckBox, QFrame
 )
@@ -27,21 +38,12 @@ from core_structures import (
 from mw_actions_catalog import MW_ACTIONS_CATALOG, get_action_by_name, get_all_categories
 from yaml_generator import generate_yaml_string
 from validator import comprehensive_validate
+from incremental_validator import incremental_validator
 from error_display import ErrorListWidget, ValidationDialog, StatusIndicator, HelpDialog
-from help_system import get_tooltip, get_contextual_help
-# Unified tutorial system
-from tutorials import UnifiedTutorialManager
-from template_library import TemplateBrowserDialog, template_library
-from enhanced_json_selector import EnhancedJsonPathSelector
-from contextual_examples import ContextualExamplesPanel
-from enhanced_validator import enhanced_validator, ValidationError
-from bender_function_builder import BenderFunctionBuilder
-from enhanced_script_editor import EnhancedScriptEditor
-from enhanced_apiton_validator import enhanced_apiton_validator, APIthonValidationResult
-from error_display import APIthonValidationWidget, EnhancedAPIthonValidationWidget
+from tooltips import get_tooltip
+from enhanced_apiton_validator import APIthonValidationResult
+from error_display import APIthonValidationWidget
 from compliance_validator import compliance_validator, ComplianceValidationResult
-from dsl_input_widget import DSLInputWidget
-from dsl_validator import dsl_validator
 
 
 class WorkflowListWidget(QListWidget):
@@ -485,11 +487,9 @@ class StepConfigurationPanel(QStackedWidget):
 
         script_editor_layout.addLayout(code_field_layout)
 
-        self.enhanced_script_editor = EnhancedScriptEditor()
-        self.enhanced_script_editor.script_changed.connect(self._on_script_data_changed)
-        self.enhanced_script_editor.script_changed.connect(self._validate_script_code_field)
-        self.enhanced_script_editor.validation_updated.connect(self._on_script_validation_updated)
-        script_editor_layout.addWidget(self.enhanced_script_editor)
+        # The enhanced script editor is built when the first script step is shown
+        self.enhanced_script_editor = None
+        self._script_editor_layout = script_editor_layout
 
         layout.addWidget(script_editor_group)
 
@@ -1311,6 +1311,8 @@ class StepConfigurationPanel(QStackedWidget):
         self.script_output_key_edit.setText(step.output_key or "")
 
         # Set the script step in the enhanced editor
+        if self.enhanced_script_editor is None:
+            self._create_script_editor()
         available_data_paths = self._get_available_data_paths_for_step()
         self.enhanced_script_editor.set_script_step(step, available_data_paths)
 
@@ -1323,6 +1325,15 @@ class StepConfigurationPanel(QStackedWidget):
         # Populate JSON output
         self.script_json_edit.setPlainText(step.user_provided_json_output or "")
 
+    def _create_script_editor(self):
+        """Build the enhanced script editor in the script configuration form."""
+        from enhanced_script_editor import EnhancedScriptEditor
+        self.enhanced_script_editor = EnhancedScriptEditor()
+        self.enhanced_script_editor.script_changed.connect(self._on_script_data_changed)
+        self.enhanced_script_editor.script_changed.connect(self._validate_script_code_field)
+        self.enhanced_script_editor.validation_updated.connect(self._on_script_validation_updated)
+        self._script_editor_layout.addWidget(self.enhanced_script_editor)
+
     def _populate_switch_config(self, step: SwitchStep):
         """Populate the switch configuration form with step data."""
         self.switch_description_edit.setText(step.description or "")
@@ -2019,49 +2030,15 @@ class StepConfigurationPanel(QStackedWidget):
 
     def _get_available_data_paths_for_step(self) -> set:
         """Get available data paths for the current step based on previous steps."""
-        available_paths = set()
-
-        # Add meta_info paths
-        available_paths.add("meta_info.user.email")
-        available_paths.add("meta_info.user.name")
-        available_paths.add("meta_info.user.id")
-
-        # Add data paths from previous steps
-        if hasattr(self, 'workflow_list') and self.workflow_list.workflow:
-            current_index = getattr(self, 'current_step_index', -1)
-            for i, step in enumerate(self.workflow_list.workflow.steps):
-                if i >= current_index and current_index >= 0:
-                    break  # Don't include current step or later steps
-
-                if step.output_key:
-                    available_paths.add(f"data.{step.output_key}")
-
-                    # If step has parsed JSON, add nested paths
-                    if hasattr(step, 'parsed_json_output') and step.parsed_json_output:
-                        self._add_json_paths_recursive(
-                            step.parsed_json_output,
-                            f"data.{step.output_key}",
-                            available_paths
-                        )
-
-        return available_paths
-
-    def _add_json_paths_recursive(self, data: Any, path_prefix: str, paths: set, max_depth: int = 3):
-        """Recursively add JSON paths to the available paths set."""
-        if max_depth <= 0:
-            return
+        from data_flow_graph import get_data_flow_graph, META_INFO_PATHS
+        if not (hasattr(self, 'workflow_list') and self.workflow_list.workflow):
+            return set(META_INFO_PATHS)
 
-        if isinstance(data, dict):
-            for key, value in data.items():
-                new_path = f"{path_prefix}.{key}"
-                paths.add(new_path)
-                if isinstance(value, (dict, list)):
-                    self._add_json_paths_recursive(value, new_path, paths, max_depth - 1)
-        elif isinstance(data, list) and data:
-            # Add array access pattern
-            paths.add(f"{path_prefix}[0]")
-            if isinstance(data[0], (dict, list)):
-                self._add_json_paths_recursive(data[0], f"{path_prefix}[0]", paths, max_depth - 1)
+        # Paths come from the workflow's data-dependency graph, which caches
+        # the JSON paths of each step's sample output. Edited steps are
+        # invalidated as they are edited, so no step needs re-reading here.
+        current_index = getattr(self, 'current_step_index', -1)
+        return get_data_flow_graph(self.workflow_list.workflow, dirty=()).available_paths(current_index)
 
     def _add_action_input_arg(self):
         """Add a new row to the action input args table."""
@@ -2277,10 +2254,13 @@ class JsonVariableSelectionPanel(QWidget):
 
         layout.addLayout(step_selection_layout)
 
-        # JSON tree view
-        self.json_tree = QTreeWidget()
-        self.json_tree.setHeaderLabel("JSON Structure")
-        self.json_tree.itemClicked.connect(self._on_tree_item_clicked)
+        # JSON tree view (rows are created lazily as nodes are expanded)
+        from json_tree_model import LazyJsonTreeModel
+        self.json_model = LazyJsonTreeModel(self, compact=True, compact_header="JSON Structure")
+        self.json_tree = QTreeView()
+        self.json_tree.setModel(self.json_model)
+        self.json_tree.setUniformRowHeights(True)
+        self.json_tree.clicked.connect(self._on_tree_item_clicked)
         layout.addWidget(self.json_tree)
 
         # Selected path display
@@ -2322,7 +2302,7 @@ class JsonVariableSelectionPanel(QWidget):
     def _on_step_selection_changed(self, index):
         """Handle step selection change."""
         if index < 0:
-            self.json_tree.clear()
+            self.json_model.clear()
             return
 
         step_index = self.step_combo.itemData(index)
@@ -2332,63 +2312,26 @@ class JsonVariableSelectionPanel(QWidget):
 
     def _populate_json_tree(self, json_data: Any, output_key: str):
         """Populate the JSON tree with the structure of the given JSON data."""
-        self.json_tree.clear()
-
         if json_data is None:
+            self.json_model.clear()
             return
 
-        root_item = QTreeWidgetItem([f"data.{output_key}"])
-        root_item.setData(0, Qt.UserRole, f"data.{output_key}")
-        self.json_tree.addTopLevelItem(root_item)
-
-        self._add_json_items(root_item, json_data, f"data.{output_key}")
-        root_item.setExpanded(True)
-
-    def _add_json_items(self, parent_item: QTreeWidgetItem, data: Any, path_prefix: str):
-        """Recursively add JSON structure items to the tree."""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                child_path = f"{path_prefix}.{key}"
-                child_item = QTreeWidgetItem([key])
-                child_item.setData(0, Qt.UserRole, child_path)
-                parent_item.addChild(child_item)
-
-                # Add type hint
-                if isinstance(value, (dict, list)):
-                    child_item.setText(0, f"{key} ({type(value).__name__})")
-                    self._add_json_items(child_item, value, child_path)
-                else:
-                    child_item.setText(0, f"{key}: {repr(value)}")
-
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                child_path = f"{path_prefix}[{i}]"
-                child_item = QTreeWidgetItem([f"[{i}]"])
-                child_item.setData(0, Qt.UserRole, child_path)
-                parent_item.addChild(child_item)
-
-                if isinstance(item, (dict, list)):
-                    child_item.setText(0, f"[{i}] ({type(item).__name__})")
-                    self._add_json_items(child_item, item, child_path)
-                else:
-                    child_item.setText(0, f"[{i}]: {repr(item)}")
+        self.json_model.set_json(json_data, f"data.{output_key}")
+        self.json_tree.expand(self.json_model.index(0, 0))
 
-    def _on_tree_item_clicked(self, item: QTreeWidgetItem, column: int = 0):
-        """Handle tree item click."""
-        _ = column  # Unused parameter required by Qt signal
-        path = item.data(0, Qt.UserRole)
+    def _on_tree_item_clicked(self, index):
+        """Handle tree row click."""
+        path = self.json_model.path_for_index(index)
         if path:
             self.selected_path_label.setText(f"Selected: {path}")
             self.variable_selected.emit(path)
 
     def _copy_selected_path(self):
         """Copy the selected path to clipboard."""
-        selected_items = self.json_tree.selectedItems()
-        if selected_items:
-            path = selected_items[0].data(0, Qt.UserRole)
-            if path:
-                QApplication.clipboard().setText(path)
-                QMessageBox.information(self, "Copied", f"Path copied to clipboard: {path}")
+        path = self.json_model.path_for_index(self.json_tree.currentIndex())
+        if path:
+            QApplication.clipboard().setText(path)
+            QMessageBox.information(self, "Copied", f"Path copied to clipboard: {path}")
 
 
 class YamlPreviewPanel(QWidget):
@@ -2661,13 +2604,20 @@ class YamlPreviewPanel(QWidget):
 
         self.export_requested.emit()
 
-    def set_workflow(self, workflow: Workflow):
-        """Set the workflow and update the YAML preview."""
+    def set_workflow(self, workflow: Workflow, dirty=None):
+        """
+        Set the workflow and update the YAML preview.
+
+        Args:
+            workflow: The workflow to show
+            dirty: Indices of steps edited in place since the last call, or
+                None to re-check every step
+        """
         self.workflow = workflow
 
         # Update validation manager
         if hasattr(self, 'validation_manager'):
-            self.validation_manager.set_workflow(workflow)
+            self.validation_manager.set_workflow(workflow, dirty)
 
         self.refresh_yaml()
 
@@ -2679,7 +2629,8 @@ class YamlPreviewPanel(QWidget):
 
         try:
             from yaml_generator import generate_yaml_string
-            yaml_output = generate_yaml_string(self.workflow, "compound_action")
+            # The preview only gates on mandatory fields; full compliance runs on export
+            yaml_output = generate_yaml_string(self.workflow, "compound_action", emit_only=True)
 
             # Apply syntax highlighting (basic)
             self._apply_yaml_highlighting(yaml_output)
@@ -2759,6 +2710,9 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Moveworks YAML Assistant")
         self.setGeometry(100, 100, 1400, 900)
 
+        # Steps edited in place since the last compliance pass, by id()
+        self._edited_steps: Dict[int, Any] = {}
+
         # Set comprehensive application styling
         self.setStyleSheet("""
             /* Main Window */
@@ -3124,13 +3078,8 @@ class MainWindow(QMainWindow):
 
 
 
-        # Initialize unified tutorial system
-        try:
-            self.unified_tutorial_manager = UnifiedTutorialManager(self)
-            print("✓ Unified tutorial system initialized successfully")
-        except Exception as e:
-            print(f"✗ Failed to initialize unified tutorial system: {e}")
-            self.unified_tutorial_manager = None
+        # The unified tutorial system is created the first time it is opened
+        self._unified_tutorial_manager = None
 
         # Create central widget and main layout
         central_widget = QWidget()
@@ -3142,29 +3091,49 @@ class MainWindow(QMainWindow):
         central_widget_layout.addWidget(main_splitter)
 
         # Left panel: Step list and controls
-        left_panel = self._create_left_panel()
+        with startup_profiler.phase("left panel"):
+            left_panel = self._create_left_panel()
         main_splitter.addWidget(left_panel)
 
         # Center panel: Step configuration with examples
-        center_panel = self._create_center_panel()
+        with startup_profiler.phase("center panel"):
+            center_panel = self._create_center_panel()
         main_splitter.addWidget(center_panel)
 
         # Right panel: Enhanced JSON selector and YAML preview
-        right_panel = self._create_right_panel()
+        with startup_profiler.phase("right panel"):
+            right_panel = self._create_right_panel()
         main_splitter.addWidget(right_panel)
 
         # Set splitter proportions
         main_splitter.setSizes([300, 600, 400])
 
         # Create menu bar
-        self._create_menu_bar()
+        with startup_profiler.phase("menu bar"):
+            self._create_menu_bar()
 
         # Connect signals
         self.workflow_list.step_selected.connect(self._on_step_selected)
-        self.enhanced_json_panel.path_selected.connect(self._on_variable_selected)
 
         # Initialize with empty workflow
-        self._update_all_panels()
+        with startup_profiler.phase("initial panel update"):
+            self._update_all_panels()
+
+        # The JSON explorer is the tab shown at startup; build it once the window is up
+        QTimer.singleShot(0, lambda: self._on_right_tab_changed(self.right_tabs.currentIndex()))
+
+    @property
+    def unified_tutorial_manager(self):
+        """The unified tutorial system, created on first access (None if it fails to load)."""
+        if self._unified_tutorial_manager is None:
+            try:
+                from tutorials import UnifiedTutorialManager
+                self._unified_tutorial_manager = UnifiedTutorialManager(self)
+                print("✓ Unified tutorial system initialized successfully")
+            except Exception as e:
+                print(f"✗ Failed to initialize unified tutorial system: {e}")
+                self._unified_tutorial_manager = False
+        return self._unified_tutorial_manager or None
 
     def _create_left_panel(self):
         """Create the left panel with step list and controls."""
@@ -3445,15 +3414,14 @@ class MainWindow(QMainWindow):
                 background-color: #f8f8f8;
             }
         """)
-        examples_layout = QVBoxLayout(examples_tab)
-        examples_layout.setContentsMargins(8, 8, 8, 8)
-        examples_layout.setSpacing(8)
-
-        self.examples_panel = ContextualExamplesPanel()
-        self.examples_panel.example_applied.connect(self._on_example_applied)
-        examples_layout.addWidget(self.examples_panel)
+        self._examples_layout = QVBoxLayout(examples_tab)
+        self._examples_layout.setContentsMargins(8, 8, 8, 8)
+        self._examples_layout.setSpacing(8)
 
-        center_tabs.addTab(examples_tab, "💡 Examples")
+        # The examples panel is built when the tab is first opened
+        self.examples_panel = None
+        self._examples_context = "general"
+        self._examples_tab_index = center_tabs.addTab(examples_tab, "💡 Examples")
 
         # Bender Function Builder tab
         bender_tab = QWidget()
@@ -3462,18 +3430,37 @@ class MainWindow(QMainWindow):
                 background-color: #f8f8f8;
             }
         """)
-        bender_layout = QVBoxLayout(bender_tab)
-        bender_layout.setContentsMargins(8, 8, 8, 8)
-        bender_layout.setSpacing(8)
+        self._bender_layout = QVBoxLayout(bender_tab)
+        self._bender_layout.setContentsMargins(8, 8, 8, 8)
+        self._bender_layout.setSpacing(8)
 
-        self.bender_builder = BenderFunctionBuilder()
-        self.bender_builder.function_built.connect(self._on_bender_function_built)
-        bender_layout.addWidget(self.bender_builder)
-
-        center_tabs.addTab(bender_tab, "🔧 Bender Functions")
+        # The Bender function builder is built when the tab is first opened
+        self.bender_builder = None
+        self._bender_tab_index = center_tabs.addTab(bender_tab, "🔧 Bender Functions")
 
+        center_tabs.currentChanged.connect(self._on_center_tab_changed)
         return center_tabs
 
+    def _on_center_tab_changed(self, index: int):
+        """Build the examples panel and Bender function builder the first time their tab is shown."""
+        if index == self._examples_tab_index and self.examples_panel is None:
+            from contextual_examples import ContextualExamplesPanel
+            self.examples_panel = ContextualExamplesPanel()
+            self.examples_panel.example_applied.connect(self._on_example_applied)
+            self.examples_panel.set_context(self._examples_context)
+            self._examples_layout.addWidget(self.examples_panel)
+        elif index == self._bender_tab_index and self.bender_builder is None:
+            from bender_function_builder import BenderFunctionBuilder
+            self.bender_builder = BenderFunctionBuilder()
+            self.bender_builder.function_built.connect(self._on_bender_function_built)
+            self._bender_layout.addWidget(self.bender_builder)
+
+    def _set_examples_context(self, context: str):
+        """Set the examples context, applying it when the examples panel is built."""
+        self._examples_context = context
+        if self.examples_panel is not None:
+            self.examples_panel.set_context(context)
+
     def _create_right_panel(self):
         """Create the right panel with clean tabbed interface and YAML preview."""
         panel = QWidget()
@@ -3516,11 +3503,14 @@ class MainWindow(QMainWindow):
             }
         """)
 
-        # JSON Path Selector Tab
-        from tabbed_json_selector import TabbedJsonPathSelector
-        self.enhanced_json_panel = TabbedJsonPathSelector()
-        self.enhanced_json_panel.setObjectName("json_path_selector_button")  # For tutorial targeting
-        right_tabs.addTab(self.enhanced_json_panel, "🔍 JSON Explorer")
+        # JSON Path Selector Tab, built the first time the tab is shown
+        json_explorer_tab = QWidget()
+        json_explorer_tab.setObjectName("json_path_selector_button")  # For tutorial targeting
+        self._json_explorer_layout = QVBoxLayout(json_explorer_tab)
+        self._json_explorer_layout.setContentsMargins(0, 0, 0, 0)
+        self.enhanced_json_panel = None
+        self._json_explorer_step_index = 0
+        self._json_explorer_tab_index = right_tabs.addTab(json_explorer_tab, "🔍 JSON Explorer")
 
         # YAML Preview Tab
         self.yaml_panel = YamlPreviewPanel()
@@ -3535,9 +3525,26 @@ class MainWindow(QMainWindow):
         self.apiton_validation_widget = APIthonValidationWidget()
         right_tabs.addTab(self.apiton_validation_widget, "🐍 APIthon")
 
+        self.right_tabs = right_tabs
+        right_tabs.currentChanged.connect(self._on_right_tab_changed)
         layout.addWidget(right_tabs)
         return panel
 
+    def _on_right_tab_changed(self, index: int):
+        """Build the JSON explorer the first time its tab is shown."""
+        if index == self._json_explorer_tab_index and self.enhanced_json_panel is None:
+            from tabbed_json_selector import TabbedJsonPathSelector
+            self.enhanced_json_panel = TabbedJsonPathSelector()
+            self.enhanced_json_panel.path_selected.connect(self._on_variable_selected)
+            self.enhanced_json_panel.set_workflow(self.workflow_list.workflow, self._json_explorer_step_index)
+            self._json_explorer_layout.addWidget(self.enhanced_json_panel)
+
+    def _set_json_explorer_step(self, step_index: int = 0, dirty=None):
+        """Show the workflow in the JSON explorer, applying it when the explorer is built."""
+        self._json_explorer_step_index = step_index
+        if self.enhanced_json_panel is not None:
+            self.enhanced_json_panel.set_workflow(self.workflow_list.workflow, step_index, dirty=dirty)
+
     def _create_validation_panel(self):
         """Create the validation results panel."""
         panel = QWidget()
@@ -3829,20 +3836,19 @@ class MainWindow(QMainWindow):
         # Tutorial submenu
         tutorials_submenu = tools_menu.addMenu("📚 Tutorials")
 
-        # Unified Tutorial System (Plugin-based architecture)
-        if self.unified_tutorial_manager:
-            unified_tutorial_action = QAction("🎓 Interactive Tutorial System", self)
-            unified_tutorial_action.triggered.connect(self._show_unified_tutorials)
-            unified_tutorial_action.setToolTip("Plugin-based tutorial system with comprehensive content migration and enhanced features")
-            tutorials_submenu.addAction(unified_tutorial_action)
+        # Unified Tutorial System (Plugin-based architecture, loaded on first use)
+        unified_tutorial_action = QAction("🎓 Interactive Tutorial System", self)
+        unified_tutorial_action.triggered.connect(self._show_unified_tutorials)
+        unified_tutorial_action.setToolTip("Plugin-based tutorial system with comprehensive content migration and enhanced features")
+        tutorials_submenu.addAction(unified_tutorial_action)
 
-            tutorials_submenu.addSeparator()
+        tutorials_submenu.addSeparator()
 
-            # Tutorial Builder
-            create_tutorial_action = QAction("✨ Create New Tutorial...", self)
-            create_tutorial_action.triggered.connect(self._show_tutorial_builder)
-            create_tutorial_action.setToolTip("Visual tutorial builder for creating custom tutorials without programming")
-            tutorials_submenu.addAction(create_tutorial_action)
+        # Tutorial Builder
+        create_tutorial_action = QAction("✨ Create New Tutorial...", self)
+        create_tutorial_action.triggered.connect(self._show_tutorial_builder)
+        create_tutorial_action.setToolTip("Visual tutorial builder for creating custom tutorials without programming")
+        tutorials_submenu.addAction(create_tutorial_action)
 
 
 
@@ -4075,44 +4081,56 @@ class MainWindow(QMainWindow):
             self.config_panel.set_step(step, step_index)
 
             # Enhanced JSON panel integration with better step handling
-            self.enhanced_json_panel.set_workflow(self.workflow_list.workflow, step_index)
+            self._set_json_explorer_step(step_index)
 
             # Update examples context based on step type
             if isinstance(step, ActionStep):
-                self.examples_panel.set_context("action_step")
+                self._set_examples_context("action_step")
             elif isinstance(step, ScriptStep):
-                self.examples_panel.set_context("script_step")
+                self._set_examples_context("script_step")
             else:
-                self.examples_panel.set_context("general")
+                self._set_examples_context("general")
         else:
             self.config_panel.clear_selection()
-            self.examples_panel.set_context("general")
+            self._set_examples_context("general")
             # Clear the JSON panel when no step is selected
-            self.enhanced_json_panel.set_workflow(self.workflow_list.workflow, -1)
+            self._set_json_explorer_step(-1)
 
     def _on_step_updated(self):
         """Handle updates to step configuration with enhanced JSON selector refresh."""
         self.workflow_list.update_workflow_display()
         self.yaml_panel.refresh_yaml()
 
-        # Refresh the JSON selector to pick up any new parsed JSON data
+        # Forget the edited step's fingerprint, so every later pass re-reads it
+        # and the other steps' cached fingerprints stay trustworthy
         current_step_index = self.workflow_list.currentRow()
         if current_step_index >= 0:
-            self.enhanced_json_panel.set_workflow(self.workflow_list.workflow, current_step_index)
+            step = self.workflow_list.workflow.steps[current_step_index]
+            self._edited_steps[id(step)] = step
+            incremental_validator.invalidate([step])
 
-        # Update validation
-        self._update_validation()
+            # Refresh the JSON selector to pick up any new parsed JSON data; unchanged outputs are not rebuilt
+            self._set_json_explorer_step(current_step_index, dirty=())
 
-    def _update_validation(self):
-        """Update the validation panel with current workflow status."""
+        # Update validation; only the edited step needs to be re-read
+        self._update_validation(dirty=() if current_step_index >= 0 else None)
+
+    def _update_validation(self, dirty=None):
+        """
+        Update the validation panel with current workflow status.
+
+        Args:
+            dirty: Optional indices of the steps edited since the last update.
+                None re-checks every step.
+        """
         if not self.workflow_list.workflow.steps:
             self.validation_status.set_status("ready", "No steps to validate")
             self.error_display.clear_errors()
             return
 
         try:
-            # Validate workflow
-            errors = comprehensive_validate(self.workflow_list.workflow)
+            # Validate workflow, re-validating only steps affected by the edit
+            errors = incremental_validator.validate(self.workflow_list.workflow, dirty=dirty)
 
             if errors:
                 self.validation_status.set_error_count(len(errors))
@@ -4139,11 +4157,19 @@ class MainWindow(QMainWindow):
 
     def _update_all_panels(self):
         """Update all panels with the current workflow."""
-        self.enhanced_json_panel.set_workflow(self.workflow_list.workflow)
+        self._set_json_explorer_step()
         self.yaml_panel.set_workflow(self.workflow_list.workflow)
         self._update_validation()
         self._update_compliance_validation()
 
+    def _validate_compliance(self, action_name: str):
+        """Run compliance validation, re-reading only the steps edited since the last pass."""
+        workflow = self.workflow_list.workflow
+        # Steps are tracked by identity, so moves and insertions since the edit do not matter
+        dirty = [index for index, step in enumerate(workflow.steps) if id(step) in self._edited_steps]
+        self._edited_steps = {}
+        return incremental_validator.validate_compliance(workflow, action_name, dirty=dirty)
+
     def _update_compliance_validation(self):
         """Update the compliance validation display."""
         if not hasattr(self, 'compliance_display'):
@@ -4154,10 +4180,7 @@ class MainWindow(QMainWindow):
         action_name_value = action_name.text() if action_name else "compound_action"
 
         # Perform compliance validation
-        result = compliance_validator.validate_workflow_compliance(
-            self.workflow_list.workflow,
-            action_name_value
-        )
+        result = self._validate_compliance(action_name_value)
 
         # Update overall compliance status
         if result.is_valid:
@@ -4241,10 +4264,7 @@ class MainWindow(QMainWindow):
 
         # Perform compliance validation before export
         action_name_value = self.action_name_edit.text() if hasattr(self, 'action_name_edit') else "compound_action"
-        result = compliance_validator.validate_workflow_compliance(
-            self.workflow_list.workflow,
-            action_name_value
-        )
+        result = self._validate_compliance(action_name_value)
 
         # Check if there are compliance issues
         if not result.is_valid:
@@ -4276,7 +4296,8 @@ class MainWindow(QMainWindow):
 
         if filename:
             try:
-                yaml_content = generate_yaml_string(self.workflow_list.workflow, action_name_value)
+                yaml_content = generate_yaml_string(self.workflow_list.workflow, action_name_value,
+                                                    validation_result=result)
                 with open(filename, 'w', encoding='utf-8') as f:
                     f.write(yaml_content)
 
@@ -4394,12 +4415,14 @@ class MainWindow(QMainWindow):
 
     def _show_template_library(self):
         """Show the template library dialog."""
+        from template_library import TemplateBrowserDialog
         dialog = TemplateBrowserDialog(self)
         dialog.template_selected.connect(self._load_template)
         dialog.exec()
 
     def _load_template(self, template_id: str):
         """Load a template into the current workflow."""
+        from template_library import template_library
         template = template_library.get_template(template_id)
         if template:
             reply = QMessageBox.question(
@@ -4501,37 +4524,16 @@ class MainWindow(QMainWindow):
         from PySide6.QtWidgets import QFileDialog
 
         filename, _ = QFileDialog.getOpenFileName(
-            self, "Open Workflow", "", "JSON Files (*.json);;All Files (*)"
+            self, "Open Workflow", "",
+            "Workflow Files (*.json *.yaml *.yml);;JSON Files (*.json);;YAML Files (*.yaml *.yml);;All Files (*)"
         )
 
-        if filename:
+        if filename and filename.lower().endswith(('.yaml', '.yml')):
+            self._open_yaml_workflow(filename)
+        elif filename:
             try:
-                with open(filename, 'r') as f:
-                    workflow_data = json.load(f)
-
-                # Load workflow from JSON data
-                workflow = Workflow()
-                for step_data in workflow_data.get("steps", []):
-                    if step_data["type"] == "action":
-                        step = ActionStep(
-                            action_name=step_data["action_name"],
-                            output_key=step_data["output_key"],
-                            description=step_data.get("description"),
-                            input_args=step_data.get("input_args", {}),
-                            progress_updates=step_data.get("progress_updates"),
-                            delay_config=step_data.get("delay_config"),
-                            user_provided_json_output=step_data.get("user_provided_json_output")
-                        )
-                    elif step_data["type"] == "script":
-                        step = ScriptStep(
-                            code=step_data["code"],
-                            output_key=step_data["output_key"],
-                            description=step_data.get("description"),
-                            input_args=step_data.get("input_args", {}),
-                            user_provided_json_output=step_data.get("user_provided_json_output")
-                        )
-
-                    workflow.steps.append(step)
+                from workflow_serializer import load_workflow
+                workflow = load_workflow(filename)
 
                 self.workflow_list.workflow = workflow
                 self.workflow_list.update_workflow_display()
@@ -4543,6 +4545,28 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to load workflow: {str(e)}")
 
+    def _open_yaml_workflow(self, filename: str):
+        """Open a compound action YAML file."""
+        from yaml_parser import load_compound_action_file
+
+        try:
+            parsed = load_compound_action_file(filename)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load workflow: {str(e)}")
+            return
+
+        self.workflow_list.workflow = parsed.workflow
+        if parsed.action_name and hasattr(self, 'action_name_edit'):
+            self.action_name_edit.setText(parsed.action_name)
+        self.workflow_list.update_workflow_display()
+        self.config_panel.clear_selection()
+        self._update_all_panels()
+
+        message = f"Workflow loaded from {filename}"
+        if parsed.warnings:
+            message += "\n\nWarnings:\n" + "\n".join(f"• {warning}" for warning in parsed.warnings)
+        QMessageBox.information(self, "Success", message)
+
     def _save_workflow(self):
         """Save the current workflow to file."""
         from PySide6.QtWidgets import QFileDialog
@@ -4553,35 +4577,8 @@ class MainWindow(QMainWindow):
 
         if filename:
             try:
-                # Convert workflow to JSON-serializable format
-                workflow_data = {"steps": []}
-
-                for step in self.workflow_list.workflow.steps:
-                    if isinstance(step, ActionStep):
-                        step_data = {
-                            "type": "action",
-                            "action_name": step.action_name,
-                            "output_key": step.output_key,
-                            "description": step.description,
-                            "input_args": step.input_args,
-                            "progress_updates": step.progress_updates,
-                            "delay_config": step.delay_config,
-                            "user_provided_json_output": step.user_provided_json_output
-                        }
-                    elif isinstance(step, ScriptStep):
-                        step_data = {
-                            "type": "script",
-                            "code": step.code,
-                            "output_key": step.output_key,
-                            "description": step.description,
-                            "input_args": step.input_args,
-                            "user_provided_json_output": step.user_provided_json_output
-                        }
-
-                    workflow_data["steps"].append(step_data)
-
-                with open(filename, 'w') as f:
-                    json.dump(workflow_data, f, indent=2)
+                from workflow_serializer import save_workflow
+                save_workflow(self.workflow_list.workflow, filename)
 
                 QMessageBox.information(self, "Success", f"Workflow saved to {filename}")
 
@@ -4600,6 +4597,7 @@ class MainWindow(QMainWindow):
             return
 
         # Use enhanced validator for better error messages and suggestions
+        from enhanced_validator import enhanced_validator
         enhanced_errors = enhanced_validator.validate_with_suggestions(self.workflow_list.workflow)
 
         # Convert enhanced errors to basic error messages for existing dialog
@@ -4750,6 +4748,13 @@ def show_environment_error(error_message: str):
         print("4. Follow the on-screen instructions")
 
 
+def _report_startup_profile():
+    """Print the --profile-startup breakdown and stop timing imports."""
+    startup_profiler.mark("first window shown")
+    startup_profiler.disable()
+    print(startup_profiler.report(), file=sys.stderr)
+
+
 def main():
     """Main application entry point with environment validation."""
     # Check environment before importing PySide6 components
@@ -4760,7 +4765,8 @@ def main():
         sys.exit(1)
 
     # Environment is OK, proceed with normal startup
-    app = QApplication(sys.argv)
+    with startup_profiler.phase("QApplication"):
+        app = QApplication([arg for arg in sys.argv if arg != PROFILE_STARTUP_FLAG])
 
     # Set application properties
     app.setApplicationName("Moveworks YAML Assistant")
@@ -4769,8 +4775,12 @@ def main():
 
     # Create and show main window
     try:
-        window = MainWindow()
+        with startup_profiler.phase("main window"):
+            window = MainWindow()
         window.show()
+        if startup_profiler.enabled:
+            # Report once the event loop has painted the first window
+            QTimer.singleShot(0, _report_startup_profile)
     except Exception as e:
         # Handle any startup errors gracefully
         from PySide6.QtWidgets import QMessageBox
@@ -7,6 +7,8 @@ input argument specifications and typical JSON output examples.
 Based on Section 7 and Table 2 of the Source of Truth Document.
 """
 
+from bisect import bisect_left
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 
@@ -271,32 +273,283 @@ MW_ACTIONS_CATALOG = [
 ]
 
 
+# Search ranking weights, by field and match kind
+SEARCH_SCORES = {
+    ('action_name', 'exact'): 100,
+    ('action_name', 'prefix'): 60,
+    ('action_name', 'contains'): 40,
+    ('display_name', 'exact'): 50,
+    ('display_name', 'prefix'): 30,
+    ('display_name', 'contains'): 20,
+    ('description', 'exact'): 10,
+    ('description', 'prefix'): 10,
+    ('description', 'contains'): 5,
+}
+
+# Fields covered by search_actions
+SEARCH_FIELDS = ('action_name', 'display_name', 'description')
+
+# Length of the n-grams in the search index
+NGRAM_SIZE = 3
+
+# Minimum share of a misspelled name's n-grams a suggested action name must contain
+MIN_SUGGESTION_SIMILARITY = 0.5
+
+# Default number of names returned by suggest
+DEFAULT_SUGGESTION_LIMIT = 3
+
+
+def _name_ngrams(name_lower: str) -> set:
+    """N-grams of a lowercased action name, padded so its start and end are indexed too."""
+    padded = f" {name_lower} "
+    return {padded[i:i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+
+
+class ActionCatalogIndex:
+    """
+    Lookup and search index over a list of MWAction entries.
+
+    Provides O(1) lookup by name, a category index, a sorted name list for
+    prefix completion, a trigram inverted index over action_name,
+    display_name and description for substring search, and a trigram index
+    over action names for fuzzy suggestions. Lowercased field values are
+    computed once when an action is indexed.
+
+    Actions appended to the underlying list (for example by catalog
+    extensions through register_actions) are indexed on the next query.
+    """
+
+    def __init__(self, actions: List[MWAction]):
+        self._actions = actions
+        self._by_name: Dict[str, MWAction] = {}
+        self._positions: Dict[str, int] = {}
+        self._by_category: Dict[str, List[MWAction]] = {}
+        self._lowered: List[tuple] = []
+        self._ngrams: Dict[str, set] = {}
+        self._name_ngrams: Dict[str, set] = {}
+        self._sorted_names: List[tuple] = []
+        self._indexed_count = 0
+        self._refresh()
+
+    def _refresh(self):
+        """Index any actions added since the last refresh."""
+        if self._indexed_count == len(self._actions):
+            return
+
+        for position in range(self._indexed_count, len(self._actions)):
+            action = self._actions[position]
+            # First definition wins, like the original linear scan
+            if action.action_name not in self._by_name:
+                self._by_name[action.action_name] = action
+                self._positions[action.action_name] = position
+            self._by_category.setdefault(action.category, []).append(action)
+
+            lowered = tuple((getattr(action, name) or "").lower() for name in SEARCH_FIELDS)
+            self._lowered.append(lowered)
+            for text in lowered:
+                for start in range(len(text) - NGRAM_SIZE + 1):
+                    self._ngrams.setdefault(text[start:start + NGRAM_SIZE], set()).add(position)
+            for gram in _name_ngrams(lowered[0]):
+                self._name_ngrams.setdefault(gram, set()).add(position)
+
+        self._sorted_names = sorted((lowered[0], position) for position, lowered in enumerate(self._lowered))
+        self._indexed_count = len(self._actions)
+
+    def get(self, action_name: str) -> Optional[MWAction]:
+        """Get an action by its exact name."""
+        self._refresh()
+        return self._by_name.get(action_name)
+
+    def __contains__(self, action_name: str) -> bool:
+        return self.get(action_name) is not None
+
+    def by_category(self, category: str) -> List[MWAction]:
+        """Get all actions in a category, in catalog order."""
+        self._refresh()
+        return list(self._by_category.get(category, []))
+
+    def categories(self) -> List[str]:
+        """Get all category names, sorted."""
+        self._refresh()
+        return sorted(self._by_category)
+
+    def _candidates(self, query_lower: str) -> List[int]:
+        """Positions of actions that may contain query_lower in a search field, in catalog order."""
+        grams = {query_lower[i:i + NGRAM_SIZE] for i in range(len(query_lower) - NGRAM_SIZE + 1)}
+        if not grams:
+            return list(range(len(self._lowered)))
+
+        postings = sorted((self._ngrams.get(gram, set()) for gram in grams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return sorted(candidates)
+
+    def names_with_prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Get action names starting with a prefix (case-insensitive), sorted.
+
+        Args:
+            prefix: Name prefix to complete
+            limit: Optional maximum number of names to return
+
+        Returns:
+            Matching action names
+        """
+        self._refresh()
+        prefix_lower = prefix.lower()
+        start = bisect_left(self._sorted_names, (prefix_lower, -1))
+        names = []
+        for name_lower, position in self._sorted_names[start:]:
+            if not name_lower.startswith(prefix_lower) or (limit is not None and len(names) >= limit):
+                break
+            names.append(self._actions[position].action_name)
+        return names
+
+    def names_containing(self, fragment: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Get action names containing a fragment (case-insensitive), in catalog order.
+
+        Args:
+            fragment: Text to look for in action names
+            limit: Optional maximum number of names to return
+
+        Returns:
+            Matching action names
+        """
+        self._refresh()
+        fragment_lower = fragment.lower()
+        names = []
+        for position in self._candidates(fragment_lower):
+            if fragment_lower in self._lowered[position][0]:
+                names.append(self._actions[position].action_name)
+                if limit is not None and len(names) >= limit:
+                    break
+        return names
+
+    def suggest(self, name: str, limit: int = DEFAULT_SUGGESTION_LIMIT,
+                min_similarity: float = MIN_SUGGESTION_SIMILARITY) -> List[str]:
+        """
+        Get action names similar to a possibly misspelled name.
+
+        Names are ranked by the share of the name's n-grams they contain,
+        then by length, so 'mw.get_usr_by_email' suggests
+        'mw.get_user_by_email'.
+
+        Args:
+            name: Action name as typed
+            limit: Maximum number of names to return
+            min_similarity: Minimum share of n-grams a suggestion must contain
+
+        Returns:
+            Similar action names, most similar first
+        """
+        self._refresh()
+        name_lower = name.strip().lower()
+        if len(name_lower) < NGRAM_SIZE or limit <= 0:
+            return []
+
+        grams = _name_ngrams(name_lower)
+        counts = Counter()
+        for gram in grams:
+            counts.update(self._name_ngrams.get(gram, ()))
+
+        scored = sorted(
+            (-shared / len(grams), len(self._lowered[position][0]), position)
+            for position, shared in counts.items()
+            if shared / len(grams) >= min_similarity
+        )
+        names = dict.fromkeys(self._actions[position].action_name for _, _, position in scored)
+        return list(names)[:limit]
+
+    def complete(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Get action names completing typed text.
+
+        Names starting with the text come first, then names containing it.
+        If no name contains the text, similar names are offered instead (see
+        suggest), so typos still complete.
+
+        Args:
+            text: Action name typed so far (case-insensitive)
+            limit: Optional maximum number of names to return
+
+        Returns:
+            Matching action names, best first
+        """
+        names = dict.fromkeys(self.names_with_prefix(text, limit))
+        if limit is None or len(names) < limit:
+            names.update(dict.fromkeys(self.names_containing(text)))
+        if not names:
+            names.update(dict.fromkeys(self.suggest(text, limit if limit is not None else len(self._actions))))
+        completions = list(names)
+        return completions[:limit] if limit is not None else completions
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[MWAction]:
+        """
+        Search actions by name, display name or description.
+
+        Results are ranked by where the query matched (see SEARCH_SCORES);
+        ties keep catalog order.
+
+        Args:
+            query: Case-insensitive text to search for
+            limit: Optional maximum number of results
+
+        Returns:
+            Matching actions, best match first
+        """
+        self._refresh()
+        query_lower = query.lower()
+        scored = []
+        for position in self._candidates(query_lower):
+            score = 0
+            for name, text in zip(SEARCH_FIELDS, self._lowered[position]):
+                if text == query_lower:
+                    kind = 'exact'
+                elif text.startswith(query_lower):
+                    kind = 'prefix'
+                elif query_lower in text:
+                    kind = 'contains'
+                else:
+                    continue
+                score += SEARCH_SCORES[(name, kind)]
+            if score:
+                scored.append((-score, position))
+
+        scored.sort()
+        if limit is not None:
+            scored = scored[:limit]
+        return [self._actions[position] for _, position in scored]
+
+
+# Index over MW_ACTIONS_CATALOG, built at import time
+catalog_index = ActionCatalogIndex(MW_ACTIONS_CATALOG)
+
+
+def register_actions(actions: List[MWAction]):
+    """Add actions (e.g. from a catalog extension) to MW_ACTIONS_CATALOG and its index."""
+    MW_ACTIONS_CATALOG.extend(actions)
+    catalog_index._refresh()
+
+
 def get_action_by_name(action_name: str) -> Optional[MWAction]:
     """Get a Moveworks action by its name."""
-    for action in MW_ACTIONS_CATALOG:
-        if action.action_name == action_name:
-            return action
-    return None
+    return catalog_index.get(action_name)
 
 
 def get_actions_by_category(category: str) -> List[MWAction]:
     """Get all actions in a specific category."""
-    return [action for action in MW_ACTIONS_CATALOG if action.category == category]
+    return catalog_index.by_category(category)
 
 
 def get_all_categories() -> List[str]:
     """Get all available action categories."""
-    categories = set(action.category for action in MW_ACTIONS_CATALOG)
-    return sorted(list(categories))
-
-
-def search_actions(query: str) -> List[MWAction]:
-    """Search actions by name or description."""
-    query_lower = query.lower()
-    results = []
-    for action in MW_ACTIONS_CATALOG:
-        if (query_lower in action.action_name.lower() or 
-            query_lower in action.display_name.lower() or 
-            query_lower in action.description.lower()):
-            results.append(action)
-    return results
+    return catalog_index.categories()
+
+
+def search_actions(query: str, limit: Optional[int] = None) -> List[MWAction]:
+    """Search actions by name or description, best match first."""
+    return catalog_index.search(query, limit)
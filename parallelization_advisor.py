@@ -0,0 +1,236 @@
+"""
+Parallelization Advisor for the Moveworks YAML Assistant.
+
+Compound actions often chain independent lookups one after another. This
+module finds runs of consecutive top-level ActionSteps, then uses the
+data-dependency graph to group the actions that do not depend on each other
+into layers:
+
+- an action depends on an earlier action in the run if it references that
+  action's output key, or if the earlier action references one of its keys
+- each action goes in the first layer after everything it depends on, so no
+  action moves ahead of its data
+- a layer with two or more actions becomes a ParallelStep with one
+  ParallelBranch per action
+
+Latency is estimated from per-action latency profiles (see
+workflow_simulator.LatencyProfile). The serial estimate is the sum of the
+run; the parallel estimate is the makespan of each layer on the available
+workers.
+"""
+
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+import yaml
+
+from core_structures import Workflow, ActionStep, ParallelStep, ParallelBranch
+from data_flow_graph import get_data_flow_graph
+from workflow_simulator import DEFAULT_PARALLEL_WORKERS, latency_profile, makespan
+from yaml_generator import step_to_yaml_dict, WorkflowDumper, YAML_DUMP_OPTIONS
+
+
+# Estimated latency of an action without a latency profile, in milliseconds
+DEFAULT_ACTION_LATENCY_MS = 200.0
+
+
+@dataclass
+class ParallelizationSuggestion:
+    """
+    A proposed rewrite of a run of consecutive ActionSteps.
+
+    Attributes:
+        start: Index of the first top-level step in the run
+        end: Index after the last top-level step in the run
+        layers: Step indices per layer; layers run one after another and the
+            steps within a layer run in parallel
+        serial_ms: Estimated latency of the run as written
+        parallel_ms: Estimated latency of the rewritten run
+    """
+    start: int
+    end: int
+    layers: List[List[int]]
+    serial_ms: float
+    parallel_ms: float
+
+    @property
+    def saved_ms(self) -> float:
+        """Estimated latency reduction."""
+        return self.serial_ms - self.parallel_ms
+
+    @property
+    def parallel_steps(self) -> int:
+        """Number of actions that would run in parallel branches."""
+        return sum(len(layer) for layer in self.layers if len(layer) > 1)
+
+    def describe(self) -> str:
+        """Human-readable one-line description."""
+        layer_text = " -> ".join(
+            "[" + ", ".join(str(index + 1) for index in layer) + "]" for layer in self.layers
+        )
+        return (f"Steps {self.start + 1}-{self.end}: {layer_text} "
+                f"({self.serial_ms:.0f} ms -> {self.parallel_ms:.0f} ms, saves {self.saved_ms:.0f} ms)")
+
+
+@dataclass
+class ParallelizationPlan:
+    """All suggestions for a workflow, with whole-workflow latency estimates."""
+    suggestions: List[ParallelizationSuggestion] = field(default_factory=list)
+    serial_ms: float = 0.0
+    parallel_ms: float = 0.0
+
+    @property
+    def saved_ms(self) -> float:
+        return self.serial_ms - self.parallel_ms
+
+
+class ParallelizationAdvisor:
+    """
+    Proposes and applies ParallelStep rewrites of independent ActionSteps.
+
+    Args:
+        latency_profiles: Optional latency by action name, as LatencyProfile
+            instances, dicts of their fields or milliseconds
+        default_latency_ms: Latency assumed for actions without a profile
+        max_workers: Number of branches assumed to run at once
+    """
+
+    def __init__(self, latency_profiles: Optional[Dict[str, Any]] = None,
+                 default_latency_ms: float = DEFAULT_ACTION_LATENCY_MS,
+                 max_workers: int = DEFAULT_PARALLEL_WORKERS):
+        self.latency_profiles = {name: latency_profile(value) for name, value in (latency_profiles or {}).items()}
+        self.default_latency_ms = default_latency_ms
+        self.max_workers = max(1, max_workers)
+
+    def action_latency(self, step: ActionStep) -> float:
+        """Estimated latency of an action step, in milliseconds."""
+        profile = self.latency_profiles.get(step.action_name)
+        return profile.mean_ms if profile is not None else self.default_latency_ms
+
+    def analyze(self, workflow: Workflow, dirty: Optional[Iterable[int]] = None) -> ParallelizationPlan:
+        """
+        Find runs of ActionSteps that can be partly or fully parallelized.
+
+        Args:
+            workflow: The workflow to analyze
+            dirty: Indices of steps edited in place since the workflow's graph
+                was last updated, or None to re-check every step
+
+        Returns:
+            ParallelizationPlan whose suggestions are ordered by position
+        """
+        graph = get_data_flow_graph(workflow, dirty)
+        steps = workflow.steps
+        plan = ParallelizationPlan()
+
+        index = 0
+        while index < len(steps):
+            if not isinstance(steps[index], ActionStep):
+                index += 1
+                continue
+            end = index
+            while end < len(steps) and isinstance(steps[end], ActionStep):
+                end += 1
+
+            layers = self._layers(graph, index, end)
+            serial_ms = sum(self.action_latency(steps[i]) for i in range(index, end))
+            parallel_ms = sum(
+                makespan([self.action_latency(steps[i]) for i in layer], self.max_workers) for layer in layers
+            )
+            plan.serial_ms += serial_ms
+            plan.parallel_ms += parallel_ms
+            if any(len(layer) > 1 for layer in layers):
+                plan.suggestions.append(ParallelizationSuggestion(index, end, layers, serial_ms, parallel_ms))
+            index = end
+
+        return plan
+
+    def _layers(self, graph, start: int, end: int) -> List[List[int]]:
+        """Group a run of steps into dependency layers, preserving order within each layer."""
+        layer_of: Dict[int, int] = {}
+        for i in range(start, end):
+            info = graph.steps[i]
+            layer = 0
+            for j in range(start, i):
+                earlier = graph.steps[j]
+                if (info.referenced_roots & earlier.declared_keys
+                        or earlier.referenced_roots & info.declared_keys
+                        or info.declared_keys & earlier.declared_keys):
+                    layer = max(layer, layer_of[j] + 1)
+            layer_of[i] = layer
+
+        layers: List[List[int]] = [[] for _ in range(max(layer_of.values()) + 1)] if layer_of else []
+        for i in range(start, end):
+            layers[layer_of[i]].append(i)
+        return layers
+
+    def rewrite_steps(self, workflow: Workflow, suggestion: ParallelizationSuggestion) -> List[Any]:
+        """
+        Build the steps that replace a suggestion's run.
+
+        Args:
+            workflow: The analyzed workflow
+            suggestion: One of its suggestions
+
+        Returns:
+            ActionSteps and ParallelSteps in execution order (the original
+            step objects are wrapped, not copied)
+        """
+        replacement = []
+        for layer in suggestion.layers:
+            if len(layer) == 1:
+                replacement.append(workflow.steps[layer[0]])
+                continue
+            replacement.append(ParallelStep(
+                description=f"Run {len(layer)} independent actions in parallel",
+                branches=[
+                    ParallelBranch(name=workflow.steps[i].output_key or workflow.steps[i].action_name,
+                                   steps=[workflow.steps[i]])
+                    for i in layer
+                ]
+            ))
+        return replacement
+
+    def preview_yaml(self, workflow: Workflow, suggestion: ParallelizationSuggestion) -> str:
+        """
+        Render the rewritten steps of a suggestion as YAML.
+
+        Args:
+            workflow: The analyzed workflow
+            suggestion: One of its suggestions
+
+        Returns:
+            YAML list of the replacement steps
+        """
+        step_dicts = [step_to_yaml_dict(step) for step in self.rewrite_steps(workflow, suggestion)]
+        return yaml.dump(step_dicts, Dumper=WorkflowDumper, **YAML_DUMP_OPTIONS)
+
+    def apply(self, workflow: Workflow,
+              suggestions: Optional[List[ParallelizationSuggestion]] = None,
+              dirty: Optional[Iterable[int]] = None) -> Workflow:
+        """
+        Rewrite a workflow with parallel branches.
+
+        Args:
+            workflow: The workflow to rewrite (left unchanged)
+            suggestions: Suggestions to apply; defaults to all of them
+            dirty: Indices of steps edited in place since the workflow's graph
+                was last updated, or None to re-check every step (only used
+                when suggestions are not given)
+
+        Returns:
+            A new Workflow with each suggested run replaced by its parallel form
+        """
+        if suggestions is None:
+            suggestions = self.analyze(workflow, dirty).suggestions
+        rewritten = copy.deepcopy(workflow)
+
+        # Replace from the end so earlier indices stay valid
+        for suggestion in sorted(suggestions, key=lambda s: s.start, reverse=True):
+            rewritten.steps[suggestion.start:suggestion.end] = self.rewrite_steps(rewritten, suggestion)
+        return rewritten
+
+
+# Global advisor instance
+parallelization_advisor = ParallelizationAdvisor()
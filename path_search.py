@@ -0,0 +1,156 @@
+"""
+Trigram Path Search for the Moveworks YAML Assistant.
+
+The JSON explorers search every path of a step output on each keystroke,
+and path validation looks for similar paths whenever a lookup fails.
+Scanning a 100k-node output each time is too slow, so a PathSearchIndex is
+built once per output:
+
+- every path and the text shown next to it is lowercased once
+- a trigram index maps each three-character substring to the entries that
+  contain it, so a substring query only checks entries containing all of
+  the query's trigrams
+- fuzzy queries rank paths by the share of the query's trigrams they
+  contain, so 'data.user.emial' still finds 'data.user.email' and
+  'managr.name' finds 'data.users[0].manager.name'
+
+Queries shorter than a trigram scan the prepared lowercase texts instead.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+
+# Length of the substrings that are indexed
+TRIGRAM_LENGTH = 3
+
+# Trigrams found in more than this fraction of paths do not select fuzzy candidates
+COMMON_TRIGRAM_FRACTION = 0.25
+
+# Number of candidates scored exactly per requested fuzzy result
+FUZZY_CANDIDATES_PER_RESULT = 20
+
+# Minimum share of the query's trigrams a fuzzy match must contain
+MIN_FUZZY_SIMILARITY = 0.5
+
+
+def trigrams(text: str) -> Set[str]:
+    """Get the distinct trigrams of a text."""
+    return {text[i:i + TRIGRAM_LENGTH] for i in range(len(text) - TRIGRAM_LENGTH + 1)}
+
+
+def path_trigrams(path: str) -> Set[str]:
+    """Get the trigrams of a path, padded so that its start and short paths are indexed too."""
+    return trigrams(f"  {path} ")
+
+
+class PathSearchIndex:
+    """
+    Trigram index over the paths of one JSON document.
+
+    Entries are identified by their position in the paths passed in, and
+    every query returns entry positions in that order (or by rank).
+
+    Args:
+        paths: Data paths, e.g. in tree order
+        texts: Additional searchable text per path (e.g. the displayed value),
+            or None
+    """
+
+    def __init__(self, paths: Sequence[str], texts: Optional[Sequence[str]] = None):
+        self.paths = list(paths)
+        self._paths_lower = [path.lower() for path in self.paths]
+        self._texts = [text.lower() for text in texts] if texts is not None else [""] * len(self.paths)
+        self._path_postings: Dict[str, List[int]] = {}
+        self._text_postings: Dict[str, List[int]] = {}
+
+        for entry, path in enumerate(self._paths_lower):
+            for gram in path_trigrams(path):
+                self._path_postings.setdefault(gram, []).append(entry)
+        for entry, text in enumerate(self._texts):
+            for gram in trigrams(text):
+                self._text_postings.setdefault(gram, []).append(entry)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    @staticmethod
+    def _candidates(postings: Dict[str, List[int]], grams: Iterable[str]) -> Set[int]:
+        """Entries whose postings contain every trigram."""
+        lists = sorted((postings.get(gram, ()) for gram in grams), key=len)
+        if not lists or not lists[0]:
+            return set()
+        candidates = set(lists[0])
+        for entries in lists[1:]:
+            candidates.intersection_update(entries)
+            if not candidates:
+                break
+        return candidates
+
+    def search(self, query: str) -> List[int]:
+        """
+        Find entries whose path or text contains the query.
+
+        Args:
+            query: Case-insensitive search text
+
+        Returns:
+            Positions of the matching entries, in order
+        """
+        query = query.lower()
+        paths, texts = self._paths_lower, self._texts
+        if len(query) < TRIGRAM_LENGTH:
+            return [entry for entry in range(len(paths)) if query in paths[entry] or query in texts[entry]]
+
+        grams = trigrams(query)
+        candidates = self._candidates(self._path_postings, grams) | self._candidates(self._text_postings, grams)
+        return sorted(entry for entry in candidates if query in paths[entry] or query in texts[entry])
+
+    def fuzzy(self, query: str, limit: int = 10,
+              min_similarity: float = MIN_FUZZY_SIMILARITY) -> List[Tuple[int, float]]:
+        """
+        Find the paths most similar to a query.
+
+        Paths containing the query rank first, then paths by the share of
+        the query's trigrams they contain; ties go to the path with the
+        closest overall trigram set (Jaccard similarity), then the shorter one.
+
+        Args:
+            query: Path or path fragment, possibly misspelled
+            limit: Maximum number of results
+            min_similarity: Minimum similarity of paths not containing the query
+
+        Returns:
+            (entry position, score) pairs, best first. Scores are the share
+            of query trigrams found (0-1), plus 1 for paths containing the query.
+        """
+        query = query.strip().lower()
+        if not query or not self.paths or limit <= 0:
+            return []
+
+        # Fragments rarely start where a path starts, so only the query's end is padded
+        grams = trigrams(f"{query} ") if len(query) >= TRIGRAM_LENGTH else path_trigrams(query)
+        postings = [self._path_postings[gram] for gram in grams if gram in self._path_postings]
+        if not postings:
+            return []
+        # Trigrams most paths share (like the 'data.' root) only add noise to candidate selection
+        threshold = len(self.paths) * COMMON_TRIGRAM_FRACTION
+        selective = [entries for entries in postings if len(entries) <= threshold] or postings
+        counts = Counter()
+        for entries in selective:
+            counts.update(entries)
+
+        scored = []
+        for entry, _ in counts.most_common(limit * FUZZY_CANDIDATES_PER_RESULT):
+            path = self._paths_lower[entry]
+            target = path_trigrams(path)
+            shared = len(grams & target)
+            score = shared / len(grams)
+            if query in path:
+                score += 1.0
+            elif score < min_similarity:
+                continue
+            jaccard = shared / (len(grams) + len(target) - shared)
+            scored.append((-score, -jaccard, len(path), entry))
+        scored.sort()
+        return [(entry, -score) for score, _, _, entry in scored[:limit]]
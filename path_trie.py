@@ -0,0 +1,296 @@
+"""
+Path Trie for data path completion in the Moveworks YAML Assistant.
+
+The path completer offers every path of the selected step output plus the
+common meta_info paths, which can run into hundreds of thousands of
+entries. A PathTrie stores the paths by segment ('data.users[0].email' is
+data -> users -> [0] -> email), so a completion query only visits the
+branches its segments select:
+
+- each query segment matches a path segment exactly, by prefix, or as an
+  abbreviation (the query's letters appear in order and the first letters
+  agree), so 'usr.nm' completes to 'user.name'
+- queries are also matched below the roots ('data', 'meta_info'), so
+  'usr.nm' finds 'data.user.name'
+- results are produced lazily, matching paths first and then their
+  descendants, so asking for the top N costs about N steps
+- paths are added and removed one at a time, and PathTrie.set_source
+  replaces one source's paths by adding and removing only the difference
+"""
+
+import bisect
+import re
+from collections import deque
+from itertools import chain, islice
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+
+# Default number of completions returned
+DEFAULT_COMPLETION_LIMIT = 50
+
+_SEGMENT_REGEX = re.compile(r'\[[^\]]*\]|[^.\[\]]+')
+
+_LAST_SEGMENT_REGEX = re.compile(r'(\[[^\]]*\]|[^.\[\]]+)$')
+
+
+def split_path(path: str) -> List[str]:
+    """Split a path into segments; array indices keep their brackets ('[0]')."""
+    return _SEGMENT_REGEX.findall(path)
+
+
+def is_abbreviation(query: str, name: str) -> bool:
+    """Check if the query's characters appear in order in name, starting with its first character."""
+    if not query or not name or query[0] != name[0]:
+        return False
+    remaining = iter(name)
+    return all(char in remaining for char in query)
+
+
+class _TrieNode:
+    """A path segment; holds the full path text if that path was added."""
+
+    __slots__ = ('children', 'count', 'path', '_sorted')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.count = 0
+        self.path: Optional[str] = None
+        self._sorted: Optional[List[Tuple[str, str]]] = None
+
+    def sorted_children(self) -> List[Tuple[str, str]]:
+        """Children as (lowercase name, name), sorted; rebuilt only after the children change."""
+        if self._sorted is None:
+            self._sorted = sorted((name.lower(), name) for name in self.children)
+        return self._sorted
+
+    def add_child(self, name: str) -> '_TrieNode':
+        child = self.children.get(name)
+        if child is None:
+            child = self.children[name] = _TrieNode()
+            self._sorted = None
+        return child
+
+    def remove_child(self, name: str):
+        del self.children[name]
+        self._sorted = None
+
+
+class PathTrie:
+    """
+    Data paths indexed by segment for prefix and abbreviation completion.
+
+    Paths are reference counted, so the same path can come from several
+    sources and stays until every source removed it.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._size = 0
+        self._sources: Dict[Hashable, Dict[str, None]] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, path: str) -> bool:
+        node = self._find(path)
+        return node is not None and node.count > 0
+
+    def _find(self, path: str) -> Optional[_TrieNode]:
+        node = self._root
+        for segment in split_path(path):
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def add(self, path: str):
+        """Add a path (or another reference to it)."""
+        segments = split_path(path)
+        if segments:
+            node = self._root
+            for segment in segments:
+                node = node.add_child(segment)
+            self._reference(node, path)
+
+    def _reference(self, node: _TrieNode, path: str):
+        if node.count == 0:
+            node.path = path
+            self._size += 1
+        node.count += 1
+
+    def remove(self, path: str) -> bool:
+        """
+        Remove one reference to a path.
+
+        Returns:
+            True if the path was in the trie
+        """
+        nodes = [self._root]
+        segments = split_path(path)
+        for segment in segments:
+            child = nodes[-1].children.get(segment)
+            if child is None:
+                return False
+            nodes.append(child)
+        node = nodes[-1]
+        if node.count == 0:
+            return False
+
+        node.count -= 1
+        if node.count == 0:
+            node.path = None
+            self._size -= 1
+            # Prune the branch up to the first node still in use
+            for parent, segment in zip(reversed(nodes[:-1]), reversed(segments)):
+                child = parent.children[segment]
+                if child.count or child.children:
+                    break
+                parent.remove_child(segment)
+        return True
+
+    def add_paths(self, paths: Iterable[str]):
+        """Add several paths; a path listed after its parent is attached without walking from the root."""
+        nodes: Dict[str, _TrieNode] = {}
+        for path in paths:
+            match = _LAST_SEGMENT_REGEX.search(path)
+            parent = nodes.get(path[:match.start()].rstrip('.')) if match else None
+            if parent is None:
+                self.add(path)
+                node = self._find(path)
+            else:
+                node = parent.add_child(match.group())
+                self._reference(node, path)
+            if node is not None:
+                nodes[path] = node
+
+    def remove_paths(self, paths: Iterable[str]):
+        """Remove one reference to each of several paths."""
+        for path in paths:
+            self.remove(path)
+
+    def set_source(self, source: Hashable, paths: Iterable[str]):
+        """
+        Replace the paths contributed by a source (e.g. one step output).
+
+        Only the paths that were added or dropped since the source's last
+        update are touched.
+
+        Args:
+            source: Key identifying the source
+            paths: The source's current paths (an empty iterable removes the source)
+        """
+        # Kept in order, so children are added in the order the paths were given
+        new_paths = dict.fromkeys(paths)
+        old_paths = self._sources.get(source, {})
+        self.remove_paths(path for path in old_paths if path not in new_paths)
+        self.add_paths(path for path in new_paths if path not in old_paths)
+        if new_paths:
+            self._sources[source] = new_paths
+        else:
+            self._sources.pop(source, None)
+
+    def sources(self) -> List[Hashable]:
+        """Get the keys of the sources currently contributing paths."""
+        return list(self._sources)
+
+    # ------------------------------------------------------------------
+    # Completion
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _matching_children(node: _TrieNode, query: str, partial: bool) -> Iterator[_TrieNode]:
+        """
+        Children of a node matching one query segment, best match kind first.
+
+        Args:
+            node: Node whose children are matched
+            query: Lowercase query segment
+            partial: Whether the segment may still be incomplete; array
+                indices in earlier segments must match exactly
+        """
+        is_index = query.isdigit() or query.startswith('[')
+        if query.isdigit():
+            query = f"[{query}"
+        exact_query = query + ']' if is_index and not query.endswith(']') else query
+        children = node.sorted_children()
+
+        start = bisect.bisect_left(children, (exact_query,))
+        exact = start < len(children) and children[start][0] == exact_query
+        if exact:
+            yield node.children[children[start][1]]
+        if is_index and not partial:
+            return
+
+        position = bisect.bisect_left(children, (query,))
+        while position < len(children) and children[position][0].startswith(query):
+            if not (exact and position == start):
+                yield node.children[children[position][1]]
+            position += 1
+        if is_index:
+            return
+
+        # Abbreviations start with the same character, so only that range is scanned
+        first = bisect.bisect_left(children, (query[0],))
+        for position in range(first, len(children)):
+            name = children[position][0]
+            if name[0] != query[0]:
+                break
+            if not name.startswith(query) and is_abbreviation(query, name):
+                yield node.children[children[position][1]]
+
+    def _match(self, node: _TrieNode, segments: List[str], depth: int = 0) -> Iterator[_TrieNode]:
+        """Nodes reached by matching segments[depth:] from a node, best first."""
+        partial = depth == len(segments) - 1
+        for child in self._matching_children(node, segments[depth], partial):
+            if partial:
+                yield child
+            else:
+                yield from self._match(child, segments, depth + 1)
+
+    def iter_completions(self, query: str) -> Iterator[str]:
+        """
+        Lazily generate the completions of a query.
+
+        Paths matching the query come first, then the paths below them,
+        shallowest first.
+
+        Args:
+            query: Path typed so far (case-insensitive)
+
+        Yields:
+            Completed paths
+        """
+        segments = [segment.lower() for segment in split_path(query)]
+        if not segments:
+            return
+
+        # Matches from the top first, then matches below each root ('usr' for 'data.user')
+        roots = list(self._root.children.values())
+        matched = chain(self._match(self._root, segments),
+                        (node for root in roots for node in self._match(root, segments)))
+
+        seen = set()
+        expanded = deque()
+        for node in matched:
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            expanded.append(node)
+            if node.count:
+                yield node.path
+
+        # Then descend breadth-first below the matches
+        while expanded:
+            node = expanded.popleft()
+            for child in node.children.values():
+                if id(child) in seen:
+                    continue
+                seen.add(id(child))
+                expanded.append(child)
+                if child.count:
+                    yield child.path
+
+    def complete(self, query: str, limit: int = DEFAULT_COMPLETION_LIMIT) -> List[str]:
+        """Get the first completions of a query (see iter_completions)."""
+        return list(islice(self.iter_completions(query), limit))
+
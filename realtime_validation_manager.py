@@ -6,7 +6,7 @@ real-time feedback with location-specific error messages and auto-fix capabiliti
 """
 
 import re
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import List, Dict, Any, Iterable, Optional, Tuple, Set
 from dataclasses import dataclass
 from PySide6.QtCore import QObject, Signal, QTimer
 
@@ -14,7 +14,8 @@ from core_structures import Workflow, ActionStep, ScriptStep
 from enhanced_apiton_validator import enhanced_apiton_validator, ValidationError, APIthonValidationResult
 from compliance_validator import compliance_validator, ComplianceValidationResult
 from dsl_validator import dsl_validator, DSLValidationResult
-from mw_actions_catalog import MW_ACTIONS_CATALOG
+from mw_actions_catalog import catalog_index
+from data_flow_graph import DataFlowGraph, get_data_flow_graph
 
 
 @dataclass
@@ -56,13 +57,26 @@ class RealtimeValidationManager(QObject):
         super().__init__()
         self.current_workflow = None
         self.validation_cache = {}
+        # Indices of steps edited since the last validation pass, or None for all
+        self._dirty_steps: Optional[Set[int]] = None
         self.debounce_timer = QTimer()
         self.debounce_timer.setSingleShot(True)
         self.debounce_timer.timeout.connect(self._perform_full_validation)
         self.debounce_delay = 300  # ms
 
-    def set_workflow(self, workflow: Workflow):
-        """Set the current workflow for validation."""
+    def set_workflow(self, workflow: Workflow, dirty: Optional[Iterable[int]] = None):
+        """
+        Set the current workflow for validation.
+
+        Args:
+            workflow: The workflow to validate
+            dirty: Indices of steps edited in place since the last call, or
+                None to re-check every step
+        """
+        if workflow is not self.current_workflow or dirty is None:
+            self._dirty_steps = None
+        elif self._dirty_steps is not None:
+            self._dirty_steps.update(dirty)
         self.current_workflow = workflow
         self.validation_cache.clear()
         self._trigger_validation()
@@ -136,17 +150,15 @@ class RealtimeValidationManager(QObject):
             return False, f"Step {step_index + 1} (Action) → action_name: Field is required", ["Select an action from the catalog"]
 
         # Check if it's a known action
-        known_actions = [action.action_name for action in MW_ACTIONS_CATALOG]
-
-        if value in known_actions:
+        if value in catalog_index:
             return True, f"✓ Known Moveworks action: {value}", []
 
         # Check for similar actions (typo detection)
-        similar_actions = [action for action in known_actions if value.lower() in action.lower()]
+        similar_actions = catalog_index.names_containing(value, limit=3)
         suggestions = []
 
         if similar_actions:
-            suggestions = [f"Did you mean: {action}" for action in similar_actions[:3]]
+            suggestions = [f"Did you mean: {action}" for action in similar_actions]
         else:
             suggestions = ["Browse available actions in the catalog", "Check action name spelling"]
 
@@ -237,9 +249,20 @@ class RealtimeValidationManager(QObject):
         all_errors = []
         all_warnings = []
 
-        # Validate each step
+        # Validate each step, reusing cached results for unchanged steps
+        graph = get_data_flow_graph(self.current_workflow, self._dirty_steps)
+        self._dirty_steps = set()
         for step_index, step in enumerate(self.current_workflow.steps):
-            step_errors, step_warnings = self._validate_step(step, step_index)
+            cache_key = (
+                step_index,
+                graph.steps[step_index].digest,
+                tuple(graph.available_keys(step_index))
+            )
+            if cache_key not in self.validation_cache:
+                if len(self.validation_cache) >= 1024:
+                    self.validation_cache.clear()
+                self.validation_cache[cache_key] = self._validate_step(step, step_index, graph)
+            step_errors, step_warnings = self.validation_cache[cache_key]
 
             if step_errors:
                 summary.errors_by_step[step_index] = step_errors
@@ -272,7 +295,7 @@ class RealtimeValidationManager(QObject):
         # Emit validation update
         self.validation_updated.emit(summary)
 
-    def _validate_step(self, step, step_index: int) -> Tuple[List[ValidationError], List[ValidationError]]:
+    def _validate_step(self, step, step_index: int, graph: DataFlowGraph) -> Tuple[List[ValidationError], List[ValidationError]]:
         """Validate a single step and return errors and warnings."""
         errors = []
         warnings = []
@@ -306,7 +329,7 @@ class RealtimeValidationManager(QObject):
 
         elif isinstance(step, ScriptStep):
             # Use enhanced APIthon validator
-            available_paths = self._get_available_data_paths(step_index)
+            available_paths = self._get_available_data_paths(step_index, graph)
             result = enhanced_apiton_validator.comprehensive_validate(step, available_paths)
 
             # Add step context to APIthon validation errors
@@ -322,24 +345,9 @@ class RealtimeValidationManager(QObject):
 
         return errors, warnings
 
-    def _get_available_data_paths(self, step_index: int) -> Set[str]:
-        """Get available data paths for a step based on previous steps."""
-        available_paths = set()
-
-        # Add meta_info paths
-        available_paths.add("meta_info.user.email")
-        available_paths.add("meta_info.user.name")
-        available_paths.add("meta_info.user.id")
-
-        # Add data paths from previous steps
-        for i, step in enumerate(self.current_workflow.steps):
-            if i >= step_index:
-                break
-
-            if step.output_key:
-                available_paths.add(f"data.{step.output_key}")
-
-        return available_paths
+    def _get_available_data_paths(self, step_index: int, graph: DataFlowGraph) -> Set[str]:
+        """Get available data paths for a step from the graph of the current validation pass."""
+        return graph.available_paths(step_index, json_depth=0)
 
     def apply_auto_fix(self, error: ValidationError) -> bool:
         """Apply an automatic fix for the given error."""
@@ -12,11 +12,16 @@ from PySide6.QtWidgets import (
     QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QWidget, QHBoxLayout,
     QLabel, QToolTip, QCompleter, QFrame
 )
-from PySide6.QtCore import Signal, QTimer, Qt, QPoint
+from PySide6.QtCore import Signal, QTimer, Qt, QPoint, QStringListModel
 from PySide6.QtGui import QValidator, QPalette, QFont
 
-from dsl_validator import dsl_validator, is_dsl_expression
-from mw_actions_catalog import MW_ACTIONS_CATALOG
+from dsl_validator import dsl_validator
+from dsl_classifier import is_dsl_expression
+from mw_actions_catalog import MW_ACTIONS_CATALOG, catalog_index
+
+
+# Maximum number of action names offered by ActionNameComboBox's completer
+ACTION_COMPLETION_LIMIT = 20
 
 
 class ValidationState:
@@ -271,12 +276,18 @@ class ActionNameComboBox(QComboBox, EnhancedValidationMixin):
         for action in MW_ACTIONS_CATALOG:
             self.addItem(action.action_name)
 
-        # Set up auto-completion
-        action_names = [self.itemText(i) for i in range(1, self.count())]
-        completer = QCompleter(action_names)
+        # Set up auto-completion; the catalog index ranks the completions,
+        # so the completer shows them as given instead of filtering them
+        self._completion_model = QStringListModel(catalog_index.complete(""), self)
+        completer = QCompleter(self._completion_model, self)
         completer.setCaseSensitivity(Qt.CaseInsensitive)
-        completer.setCompletionMode(QCompleter.PopupCompletion)
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
         self.setCompleter(completer)
+        self.lineEdit().textEdited.connect(self._update_completions)
+
+    def _update_completions(self, text: str):
+        """Offer prefix, substring and fuzzy matches of the typed name."""
+        self._completion_model.setStringList(catalog_index.complete(text, ACTION_COMPLETION_LIMIT))
 
     def _validate_action_name(self, value: str) -> tuple:
         """Validate action name."""
@@ -284,16 +295,14 @@ class ActionNameComboBox(QComboBox, EnhancedValidationMixin):
             return True, "Action name required", []
 
         # Check if it's a known action
-        known_actions = [action.action_name for action in MW_ACTIONS_CATALOG]
-
-        if value in known_actions:
+        if value in catalog_index:
             return True, f"✓ Known Moveworks action: {value}", []
 
         # Check for similar actions (typo detection)
-        similar_actions = [action for action in known_actions if value.lower() in action.lower()]
+        similar_actions = catalog_index.complete(value, limit=3)
 
         if similar_actions:
-            suggestions = [f"Did you mean: {action}" for action in similar_actions[:3]]
+            suggestions = [f"Did you mean: {action}" for action in similar_actions]
             return False, f"Unknown action: {value}", suggestions
         else:
             return False, f"Unknown action: {value}", ["Check action name spelling", "Browse available actions"]
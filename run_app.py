@@ -301,6 +301,7 @@ def show_help():
     print("  python run_app.py setup              # Set up environment")
     print("  python run_app.py --setup-only       # Set up environment only")
     print("  python run_app.py gui --setup-only   # Set up then launch GUI")
+    print("  python run_app.py --profile-startup  # Print a startup time breakdown")
     print()
     print("Environment Management:")
     print("  The script automatically detects and manages virtual environments.")
@@ -326,6 +327,9 @@ def main():
             setup_only = True
         elif arg == "--force-setup":
             force_setup = True
+        elif arg == "--profile-startup":
+            # Read by main_gui from sys.argv when it is imported
+            pass
         elif arg.startswith("-"):
             if arg in ["-h", "--help"]:
                 show_help()
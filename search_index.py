@@ -0,0 +1,343 @@
+"""
+Full-Text Search Index for the Moveworks YAML Assistant.
+
+A small inverted index with BM25 ranking, used by the in-app help search and
+by the search-index.json written with the generated HTML documentation.
+
+- Text is lowercased and split into word tokens. snake_case identifiers are
+  indexed whole and also as their parts, so "output_key" matches both
+  "output_key" and "key". A trailing plural "s" is dropped.
+- Each document has named fields (e.g. title, keywords, content). Term
+  frequencies are weighted per field, so title matches rank above body matches.
+- The last query term also matches as a prefix, so results update sensibly
+  while the user is still typing.
+- The index serializes to a JSON dictionary. The dictionary records a digest
+  of the indexed corpus, so a saved index is only reused while the documents
+  are unchanged.
+"""
+
+import bisect
+import hashlib
+import json
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+
+# Version of the serialized index format
+SEARCH_INDEX_FORMAT_VERSION = 1
+
+# Default field weights
+DEFAULT_FIELD_WEIGHTS = {"title": 3, "keywords": 2, "content": 1}
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_REGEX = re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*")
+
+
+def _normalize(token: str) -> str:
+    if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into normalized search terms.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms in order of appearance (snake_case parts follow the
+        whole identifier)
+    """
+    terms = []
+    for token in _TOKEN_REGEX.findall(text.lower()):
+        terms.append(_normalize(token))
+        if '_' in token:
+            terms.extend(_normalize(part) for part in token.split('_') if part)
+    return terms
+
+
+@dataclass
+class SearchDocument:
+    """
+    A document to index.
+
+    Attributes:
+        id: Unique document identifier (e.g. the help topic title)
+        fields: Text per field name; list values are joined
+        metadata: JSON-serializable data stored with the document
+    """
+    id: str
+    fields: Dict[str, Union[str, List[str]]]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SearchHit:
+    """A ranked search result."""
+    id: str
+    score: float
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class SearchIndex:
+    """
+    Inverted index with field-weighted BM25 ranking.
+
+    Args:
+        field_weights: Weight per field name; fields without a weight are not indexed
+    """
+
+    def __init__(self, field_weights: Optional[Dict[str, float]] = None):
+        self.field_weights = dict(field_weights or DEFAULT_FIELD_WEIGHTS)
+        self.doc_ids: List[str] = []
+        self.doc_metadata: List[Dict[str, Any]] = []
+        self.doc_lengths: List[float] = []
+        self.postings: Dict[str, Dict[int, float]] = {}
+        self.digest = ""
+        self._positions: Dict[str, int] = {}
+        self._sorted_terms: Optional[List[str]] = None
+        self._hasher = hashlib.blake2b(digest_size=16)
+
+    @classmethod
+    def build(cls, documents: Iterable[SearchDocument],
+              field_weights: Optional[Dict[str, float]] = None) -> 'SearchIndex':
+        """
+        Build an index from documents.
+
+        Args:
+            documents: Documents to index
+            field_weights: Optional field weights (see DEFAULT_FIELD_WEIGHTS)
+
+        Returns:
+            The populated index
+        """
+        index = cls(field_weights)
+        for document in documents:
+            index.add(document)
+        return index
+
+    @staticmethod
+    def corpus_digest(documents: Iterable[SearchDocument]) -> str:
+        """Digest of a document set, matching the digest of an index built from it."""
+        hasher = hashlib.blake2b(digest_size=16)
+        for document in documents:
+            _update_digest(hasher, document)
+        return hasher.hexdigest()
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._positions
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def add(self, document: SearchDocument):
+        """
+        Add a document to the index.
+
+        Raises:
+            ValueError: If a document with the same id is already indexed
+        """
+        if document.id in self._positions:
+            raise ValueError(f"Document '{document.id}' is already indexed")
+
+        doc = len(self.doc_ids)
+        frequencies: Counter = Counter()
+        for field_name, weight in self.field_weights.items():
+            for term in tokenize(_field_text(document.fields.get(field_name))):
+                frequencies[term] += weight
+
+        for term, frequency in frequencies.items():
+            self.postings.setdefault(term, {})[doc] = frequency
+
+        self.doc_ids.append(document.id)
+        self.doc_metadata.append(dict(document.metadata))
+        self.doc_lengths.append(float(sum(frequencies.values())))
+        self._positions[document.id] = doc
+        self._sorted_terms = None
+        if self._hasher is not None:
+            _update_digest(self._hasher, document)
+            self.digest = self._hasher.hexdigest()
+        else:
+            # Extended after loading; the saved corpus digest no longer applies
+            self.digest = ""
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _expand(self, term: str, prefix: bool) -> List[str]:
+        """Indexed terms matching a query term (itself, or every term it prefixes)."""
+        if not prefix:
+            return [term] if term in self.postings else []
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.postings)
+        terms = self._sorted_terms
+        start = bisect.bisect_left(terms, term)
+        end = bisect.bisect_left(terms, term + '\uffff', start)
+        return terms[start:end]
+
+    def search(self, query: str, limit: Optional[int] = None, match_all: bool = False,
+               prefix_last: bool = True) -> List[SearchHit]:
+        """
+        Rank documents against a query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of hits to return
+            match_all: Only return documents that match every query term
+            prefix_last: Let the last query term match as a prefix
+
+        Returns:
+            Hits ordered by descending BM25 score (ties keep insertion order)
+        """
+        query_terms = list(dict.fromkeys(tokenize(query)))
+        if not query_terms or not self.doc_ids:
+            return []
+
+        count = len(self.doc_ids)
+        average_length = sum(self.doc_lengths) / count or 1.0
+        scores: Dict[int, float] = {}
+        matched_terms: Counter = Counter()
+
+        for position, query_term in enumerate(query_terms):
+            prefix = prefix_last and position == len(query_terms) - 1
+            best: Dict[int, float] = {}
+            for term in self._expand(query_term, prefix):
+                postings = self.postings[term]
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc, frequency in postings.items():
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lengths[doc] / average_length)
+                    score = idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+                    if score > best.get(doc, 0.0):
+                        best[doc] = score
+            for doc, score in best.items():
+                scores[doc] = scores.get(doc, 0.0) + score
+                matched_terms[doc] += 1
+
+        if match_all:
+            scores = {doc: score for doc, score in scores.items() if matched_terms[doc] == len(query_terms)}
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [SearchHit(self.doc_ids[doc], score, self.doc_metadata[doc]) for doc, score in ranked]
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the index to a JSON-compatible dictionary."""
+        return {
+            "version": SEARCH_INDEX_FORMAT_VERSION,
+            "digest": self.digest,
+            "bm25": {"k1": BM25_K1, "b": BM25_B},
+            "field_weights": self.field_weights,
+            "documents": [
+                {"id": doc_id, "length": length, **metadata}
+                for doc_id, length, metadata in zip(self.doc_ids, self.doc_lengths, self.doc_metadata)
+            ],
+            "terms": {
+                term: [[doc, frequency] for doc, frequency in postings.items()]
+                for term, postings in sorted(self.postings.items())
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SearchIndex':
+        """
+        Load an index serialized with to_dict.
+
+        Raises:
+            ValueError: If the data is not a supported index format
+        """
+        if not isinstance(data, dict) or data.get("version") != SEARCH_INDEX_FORMAT_VERSION:
+            raise ValueError("Unsupported search index format")
+
+        index = cls(data.get("field_weights"))
+        for position, document in enumerate(data["documents"]):
+            metadata = {key: value for key, value in document.items() if key not in ("id", "length")}
+            index.doc_ids.append(document["id"])
+            index.doc_lengths.append(float(document["length"]))
+            index.doc_metadata.append(metadata)
+            index._positions[document["id"]] = position
+        index.postings = {
+            term: {int(doc): frequency for doc, frequency in postings}
+            for term, postings in data["terms"].items()
+        }
+        index.digest = data.get("digest", "")
+        index._hasher = None
+        return index
+
+    def save(self, path: Union[str, Path]):
+        """Write the index to a JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'SearchIndex':
+        """
+        Read an index written with save.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a supported index
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def load_or_build(cls, path: Optional[Union[str, Path]], documents: List[SearchDocument],
+                      field_weights: Optional[Dict[str, float]] = None) -> 'SearchIndex':
+        """
+        Load a saved index if it matches the documents, otherwise build and save one.
+
+        Args:
+            path: Cache file, or None to always build in memory
+            documents: Documents the index must cover
+            field_weights: Optional field weights
+
+        Returns:
+            An index of the documents
+        """
+        if path is not None:
+            try:
+                index = cls.load(path)
+                if index.digest == cls.corpus_digest(documents):
+                    return index
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+        index = cls.build(documents, field_weights)
+        if path is not None:
+            try:
+                index.save(path)
+            except OSError:
+                pass
+        return index
+
+
+def _field_text(value: Union[str, List[str], None]) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(item) for item in value)
+    return str(value)
+
+
+def _update_digest(hasher, document: SearchDocument):
+    hasher.update(json.dumps([document.id, document.fields, document.metadata],
+                             sort_keys=True, default=str).encode("utf-8"))
@@ -0,0 +1,146 @@
+"""
+Startup Profiler for the Moveworks YAML Assistant.
+
+Enabled with ``--profile-startup``, this records how long each module takes
+to import and how long each named construction phase of the main window
+takes, and prints a breakdown once the first window is shown.
+
+Import times are measured by wrapping ``builtins.__import__`` while the
+profiler is enabled. Each module's self time excludes the modules it imports
+in turn, so the breakdown shows where time is actually spent (similar to
+``python -X importtime``). When the profiler is disabled, ``phase`` is a
+no-op and nothing is wrapped.
+"""
+
+import builtins
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+
+# Command line flag that enables startup profiling
+PROFILE_STARTUP_FLAG = "--profile-startup"
+
+
+@dataclass
+class ImportTiming:
+    """Time spent importing one module."""
+    module: str
+    self_ms: float
+    cumulative_ms: float
+
+
+@dataclass
+class PhaseTiming:
+    """Time spent in one named startup phase."""
+    label: str
+    elapsed_ms: float
+    depth: int
+
+
+class StartupProfiler:
+    """Records import and construction times during application startup."""
+
+    def __init__(self):
+        self.enabled = False
+        self.start = time.perf_counter()
+        self.imports: Dict[str, ImportTiming] = {}
+        self.phases: List[PhaseTiming] = []
+        self._import_stack: List[float] = []
+        self._phase_depth = 0
+        self._original_import = None
+
+    def enable(self):
+        """Start recording imports and phases."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.start = time.perf_counter()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def disable(self):
+        """Stop recording imports (recorded timings are kept)."""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+        self.enabled = False
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        # Time spent in nested imports is subtracted from the parent's self time
+        self._import_stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            children = self._import_stack.pop()
+            if self._import_stack:
+                self._import_stack[-1] += elapsed
+            if name not in self.imports:
+                self.imports[name] = ImportTiming(name, elapsed - children, elapsed)
+
+    @contextmanager
+    def phase(self, label: str) -> Iterator[None]:
+        """
+        Time a named startup phase.
+
+        Args:
+            label: Name shown in the report (phases may be nested)
+        """
+        if not self.enabled:
+            yield
+            return
+
+        timing = PhaseTiming(label, 0.0, self._phase_depth)
+        self.phases.append(timing)
+        self._phase_depth += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing.elapsed_ms = (time.perf_counter() - started) * 1000
+            self._phase_depth -= 1
+
+    def mark(self, label: str):
+        """Record a point in time, measured from when profiling started."""
+        if self.enabled:
+            self.phases.append(PhaseTiming(label, (time.perf_counter() - self.start) * 1000, -1))
+
+    def report(self, top: int = 25, prefixes: Optional[List[str]] = None) -> str:
+        """
+        Format the recorded timings.
+
+        Args:
+            top: Number of slowest imports to list
+            prefixes: Only list modules whose name starts with one of these
+
+        Returns:
+            Multi-line report
+        """
+        imports = [timing for timing in self.imports.values()
+                   if not prefixes or timing.module.startswith(tuple(prefixes))]
+        total_import_ms = sum(timing.self_ms for timing in self.imports.values())
+
+        lines = [f"Startup profile ({len(self.imports)} modules imported in {total_import_ms:.1f} ms)", "",
+                 f"  {'self ms':>9} {'cumulative':>11}  module"]
+        for timing in sorted(imports, key=lambda timing: timing.self_ms, reverse=True)[:top]:
+            lines.append(f"  {timing.self_ms:9.1f} {timing.cumulative_ms:11.1f}  {timing.module}")
+
+        if self.phases:
+            lines.extend(["", f"  {'ms':>9}  phase"])
+            for timing in self.phases:
+                if timing.depth < 0:
+                    lines.append(f"  {timing.elapsed_ms:9.1f}  @ {timing.label}")
+                else:
+                    lines.append(f"  {timing.elapsed_ms:9.1f}  {'  ' * timing.depth}{timing.label}")
+        return "\n".join(lines)
+
+
+# Global startup profiler instance
+startup_profiler = StartupProfiler()
@@ -9,7 +9,7 @@ and collapsible sections to reduce clutter and improve usability.
 import sys
 import json
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
@@ -26,6 +26,8 @@ from enhanced_json_selector import (
     PathBookmarkManager, IntelligentPathSuggester
 )
 from core_structures import Workflow
+from data_flow_graph import get_data_flow_graph
+from json_tree_model import step_output_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +54,8 @@ class TabbedJsonPathSelector(QWidget):
         self.workflow = None
         self.current_step_index = 0
         self.selected_path = ""
+        self._combo_texts: List[str] = []
+        self._output_digests: Dict[int, Optional[str]] = {}  # Fingerprint of each step's sample output
 
         # Initialize managers
         self.bookmark_manager = PathBookmarkManager()
@@ -429,7 +433,7 @@ class TabbedJsonPathSelector(QWidget):
         # JSON tree
         self.json_tree = JsonTreeWidget()
         self.json_tree.setStyleSheet(f"""
-            QTreeWidget {{
+            QTreeView {{
                 font-family: {VisualDesignConstants.MONOSPACE_FONT};
                 font-size: {VisualDesignConstants.BODY_FONT_SIZE};
                 background-color: white;
@@ -439,11 +443,11 @@ class TabbedJsonPathSelector(QWidget):
                 selection-color: white;
                 min-height: 300px;
             }}
-            QTreeWidget::item {{
+            QTreeView::item {{
                 padding: 4px;
                 border-bottom: 1px solid {VisualDesignConstants.LIGHT_BACKGROUND};
             }}
-            QTreeWidget::item:hover {{
+            QTreeView::item:hover {{
                 background-color: {VisualDesignConstants.HOVER_BACKGROUND};
             }}
         """)
@@ -677,8 +681,8 @@ class TabbedJsonPathSelector(QWidget):
 
         # JSON tree selection - connect to the proper path_selected signal
         self.json_tree.path_selected.connect(self._on_path_selected_from_tree)
-        # Also keep the item click for additional handling
-        self.json_tree.itemClicked.connect(self._on_tree_item_clicked)
+        # Also keep the row click for additional handling
+        self.json_tree.clicked.connect(self._on_tree_item_clicked)
 
     def _on_step_changed(self, index):
         """Handle step selection change."""
@@ -706,12 +710,11 @@ class TabbedJsonPathSelector(QWidget):
         if hasattr(self.json_tree, 'filter_items'):
             self.json_tree.filter_items(text)
 
-    def _on_tree_item_clicked(self, item, column):
-        """Handle JSON tree item click - for additional processing."""
-        _ = column  # Unused parameter
+    def _on_tree_item_clicked(self, index):
+        """Handle JSON tree row click - for additional processing."""
         # The actual path selection is handled by _on_path_selected_from_tree
         # This method can be used for additional click handling if needed
-        logger.debug(f"Tree item clicked: {item.text(0) if item else 'None'}")
+        logger.debug(f"Tree row clicked: {index.data() if index.isValid() else 'None'}")
 
     def _on_path_selected_from_tree(self, path):
         """Handle path selection from the JSON tree."""
@@ -762,7 +765,10 @@ class TabbedJsonPathSelector(QWidget):
             logger.debug(f"Found parsed JSON output for step: {step_name}")
             output_key = getattr(step, 'output_key', f'step_{self.current_step_index}')
             data = {output_key: step.parsed_json_output}
-            self.json_tree.populate_from_json(data, "data")
+            # Unchanged outputs keep their tree model
+            output_digest = self._output_digests.get(self.current_step_index)
+            cache_key = step_output_cache_key(output_key, output_digest)
+            self.json_tree.populate_from_json(data, "data", cache_key=cache_key)
 
             # Update status with success message
             item_count = len(step.parsed_json_output) if isinstance(step.parsed_json_output, (dict, list)) else 1
@@ -774,33 +780,66 @@ class TabbedJsonPathSelector(QWidget):
             self.step_status.setText(f"⚠️ {step_name} has no JSON output")
             self.step_status.setStyleSheet(f"color: {VisualDesignConstants.WARNING_COLOR};")
 
-    def set_workflow(self, workflow, current_step_index=0):
-        """Set the workflow and update the UI."""
+    def set_workflow(self, workflow, current_step_index=0, dirty=None):
+        """
+        Set the workflow and update the UI.
+
+        Only combo items whose text changed are rewritten, and the tree is
+        rebuilt only if the selected step's output changed.
+
+        Args:
+            workflow: The workflow being edited
+            current_step_index: Index of the step to show
+            dirty: Indices of steps edited in place since the last call, or
+                None to re-check every step
+        """
         self.workflow = workflow
         self.current_step_index = current_step_index
 
-        # Update step combo
-        self.step_combo.clear()
+        # Update step combo without emitting a selection change per item
+        texts = []
+        self._output_digests = {}
         if workflow:
+            graph = get_data_flow_graph(workflow, dirty)
+            self._output_digests = {info.index: info.output_digest for info in graph.steps}
             for i, step in enumerate(workflow.steps):
                 has_json = hasattr(step, 'parsed_json_output') and step.parsed_json_output
                 status = "✅" if has_json else "❌"
                 step_name = getattr(step, 'description', f'Step {i+1}')
                 output_key = getattr(step, 'output_key', 'unknown')
-                self.step_combo.addItem(f"{status} {step_name} ({output_key})")
-
-            self.step_status.setText(f"Loaded {len(workflow.steps)} steps")
-            self.step_status.setStyleSheet(f"color: {VisualDesignConstants.SUCCESS_COLOR};")
+                texts.append(f"{status} {step_name} ({output_key})")
 
+        blocked = self.step_combo.blockSignals(True)
+        try:
+            self._update_step_combo(texts)
             # Set current step
-            if 0 <= current_step_index < len(workflow.steps):
+            if 0 <= current_step_index < len(texts):
                 self.step_combo.setCurrentIndex(current_step_index)
+        finally:
+            self.step_combo.blockSignals(blocked)
+
+        if workflow:
+            self.step_status.setText(f"Loaded {len(workflow.steps)} steps")
+            self.step_status.setStyleSheet(f"color: {VisualDesignConstants.SUCCESS_COLOR};")
         else:
             self.step_status.setText("No workflow loaded")
             self.step_status.setStyleSheet(f"color: {VisualDesignConstants.WARNING_COLOR};")
 
         self._update_json_tree()
 
+    def _update_step_combo(self, texts: List[str]):
+        """Make the step combo box list texts, changing only the items that differ."""
+        if texts == self._combo_texts:
+            return
+        for row, text in enumerate(texts):
+            if row >= self.step_combo.count():
+                self.step_combo.addItem(text)
+            elif self._combo_texts[row] != text:
+                self.step_combo.setItemText(row, text)
+        while self.step_combo.count() > len(texts):
+            self.step_combo.removeItem(self.step_combo.count() - 1)
+        self._combo_texts = texts
+
     def get_selected_path(self):
         """Get the currently selected path."""
         return self.selected_path
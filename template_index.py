@@ -0,0 +1,324 @@
+"""
+Template Metadata Index for the Moveworks YAML Assistant.
+
+The template library used to parse every file under ``templates/`` and build
+its full Workflow at startup. This index keeps only the metadata the template
+browser needs (name, description, category, difficulty, tags, ...) and caches
+it on disk in ``templates/.template_index.json``:
+
+- Each cached entry records the file's modification time and size. On refresh
+  the directory is only listed and stat'ed; a file is read again only when
+  its stat no longer matches, or when it is new.
+- Full template bodies are read on demand with load_data, typically when a
+  template is selected.
+- Lookups by category and tag use dictionaries, and text search uses a
+  SearchIndex (BM25) over name, tags, category and description that is built
+  on the first search after the templates change.
+
+The index does not depend on Qt, so it can be used and tested without the
+template browser dialog.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from search_index import SearchDocument, SearchIndex
+
+
+# File name of the metadata cache inside the templates directory
+TEMPLATE_INDEX_FILENAME = ".template_index.json"
+
+# Version of the metadata cache format
+TEMPLATE_INDEX_FORMAT_VERSION = 1
+
+# Field weights for template text search
+TEMPLATE_SEARCH_FIELD_WEIGHTS = {"name": 3, "tags": 2, "category": 2, "description": 1}
+
+
+@dataclass
+class TemplateInfo:
+    """
+    Metadata of a workflow template, without its workflow.
+
+    Attributes:
+        id: Template ID (the file name without .json for user templates)
+        step_count: Number of top-level workflow steps
+        path: Template file, or None for built-in templates
+    """
+    id: str
+    name: str
+    description: str = ""
+    category: str = "General"
+    difficulty: str = "Beginner"
+    tags: List[str] = field(default_factory=list)
+    author: str = "System"
+    version: str = "1.0"
+    created_date: str = ""
+    step_count: int = 0
+    path: Optional[str] = None
+
+    @property
+    def builtin(self) -> bool:
+        """Whether the template is built into the application."""
+        return self.path is None
+
+    @classmethod
+    def from_template(cls, template_id: str, template: Any, path: Optional[str] = None) -> 'TemplateInfo':
+        """Create metadata from a WorkflowTemplate."""
+        return cls(
+            id=template_id,
+            name=template.name,
+            description=template.description,
+            category=template.category,
+            difficulty=template.difficulty,
+            tags=list(template.tags),
+            author=template.author,
+            version=template.version,
+            created_date=template.created_date,
+            step_count=len(template.workflow.steps),
+            path=path
+        )
+
+    @classmethod
+    def from_template_data(cls, template_id: str, data: Dict[str, Any],
+                           path: Optional[str] = None) -> 'TemplateInfo':
+        """Create metadata from a template dictionary (see WorkflowTemplate.to_dict)."""
+        return cls(
+            id=template_id,
+            name=data.get("name", ""),
+            description=data.get("description", ""),
+            category=data.get("category", "General"),
+            difficulty=data.get("difficulty", "Beginner"),
+            tags=list(data.get("tags", [])),
+            author=data.get("author", "System"),
+            version=data.get("version", "1.0"),
+            created_date=data.get("created_date", ""),
+            step_count=len(data.get("workflow", {}).get("steps", [])),
+            path=path
+        )
+
+
+class TemplateIndex:
+    """
+    Metadata of built-in and user templates, with an on-disk cache.
+
+    Args:
+        templates_dir: Directory holding user template JSON files
+        index_filename: Cache file name inside templates_dir
+    """
+
+    def __init__(self, templates_dir: str, index_filename: str = TEMPLATE_INDEX_FILENAME):
+        self.templates_dir = templates_dir
+        self.index_path = os.path.join(templates_dir, index_filename)
+        self.infos: Dict[str, TemplateInfo] = {}
+        self.last_scanned: List[str] = []
+        self._builtin: Dict[str, TemplateInfo] = {}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._by_category: Dict[str, List[str]] = {}
+        self._by_tag: Dict[str, List[str]] = {}
+        self._search_index: Optional[SearchIndex] = None
+
+    def __len__(self) -> int:
+        return len(self.infos)
+
+    def __contains__(self, template_id: str) -> bool:
+        return template_id in self.infos
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def add_builtin(self, info: TemplateInfo):
+        """Register a built-in template (user templates with the same ID take precedence)."""
+        self._builtin[info.id] = info
+        if info.id not in self._files:
+            self.infos[info.id] = info
+            self._invalidate()
+
+    def refresh(self) -> List[str]:
+        """
+        Bring the index up to date with the templates directory.
+
+        Files whose modification time and size match the cache are not read.
+
+        Returns:
+            IDs of user templates that were added, changed or removed
+        """
+        cached = self._files or self._read_cache()
+        files: Dict[str, Dict[str, Any]] = {}
+        scanned: List[str] = []
+        changed: List[str] = []
+
+        for filename, stat in self._list_template_files():
+            template_id = filename[:-5]  # Remove .json extension
+            entry = cached.get(filename)
+            if entry is None or entry.get("mtime_ns") != stat.st_mtime_ns or entry.get("size") != stat.st_size:
+                path = os.path.join(self.templates_dir, filename)
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    info = TemplateInfo.from_template_data(template_id, data, path)
+                except Exception as e:
+                    print(f"Error loading template {filename}: {e}")
+                    continue
+                entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "template": asdict(info)}
+                scanned.append(template_id)
+                changed.append(template_id)
+            files[filename] = entry
+
+        changed.extend(filename[:-5] for filename in cached if filename not in files)
+        cache_changed = files != cached
+        self._files = files
+        self.last_scanned = scanned
+        self._rebuild_infos()
+        if cache_changed:
+            self._write_cache()
+        return changed
+
+    def record_file(self, info: TemplateInfo):
+        """Record a template file that was just written, without reading it back."""
+        filename = os.path.basename(info.path)
+        stat = os.stat(info.path)
+        self._files[filename] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "template": asdict(info)}
+        self._rebuild_infos()
+        self._write_cache()
+
+    def forget_file(self, template_id: str):
+        """Drop a deleted template file from the index."""
+        if self._files.pop(f"{template_id}.json", None) is not None:
+            self._rebuild_infos()
+            self._write_cache()
+
+    def load_data(self, template_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the full dictionary of a user template.
+
+        Returns:
+            The parsed template file, or None for unknown and built-in templates
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid JSON
+        """
+        info = self.infos.get(template_id)
+        if info is None or info.path is None:
+            return None
+        with open(info.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _list_template_files(self) -> Iterable:
+        if not os.path.isdir(self.templates_dir):
+            return []
+        with os.scandir(self.templates_dir) as entries:
+            return sorted(
+                ((entry.name, entry.stat()) for entry in entries
+                 if entry.name.endswith('.json') and entry.is_file()
+                 and entry.name != os.path.basename(self.index_path)),
+                key=lambda item: item[0]
+            )
+
+    def _read_cache(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != TEMPLATE_INDEX_FORMAT_VERSION:
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def _write_cache(self):
+        try:
+            with open(self.index_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": TEMPLATE_INDEX_FORMAT_VERSION, "files": self._files}, f,
+                          separators=(",", ":"))
+        except OSError:
+            pass
+
+    def _rebuild_infos(self):
+        infos = dict(self._builtin)
+        for filename, entry in self._files.items():
+            try:
+                info = TemplateInfo(**entry["template"])
+            except (KeyError, TypeError):
+                continue
+            info.path = os.path.join(self.templates_dir, filename)
+            infos[info.id] = info
+        self.infos = infos
+        self._invalidate()
+
+    def _invalidate(self):
+        self._by_category = {}
+        self._by_tag = {}
+        for info in self.infos.values():
+            self._by_category.setdefault(info.category, []).append(info.id)
+            for tag in info.tags:
+                self._by_tag.setdefault(tag.lower(), []).append(info.id)
+        self._search_index = None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def categories(self) -> List[str]:
+        """All template categories, sorted."""
+        return sorted(self._by_category)
+
+    def tags(self) -> List[str]:
+        """All template tags (lowercased), sorted."""
+        return sorted(self._by_tag)
+
+    def in_category(self, category: str) -> List[TemplateInfo]:
+        """Templates in a category."""
+        return [self.infos[template_id] for template_id in self._by_category.get(category, [])]
+
+    def with_tag(self, tag: str) -> List[TemplateInfo]:
+        """Templates with a tag (case-insensitive)."""
+        return [self.infos[template_id] for template_id in self._by_tag.get(tag.lower(), [])]
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Text index over the template metadata, built on first use."""
+        if self._search_index is None:
+            self._search_index = SearchIndex.build(
+                (SearchDocument(info.id, {"name": info.name, "tags": info.tags,
+                                          "category": info.category, "description": info.description})
+                 for info in self.infos.values()),
+                TEMPLATE_SEARCH_FIELD_WEIGHTS
+            )
+        return self._search_index
+
+    def search(self, query: str = "", category: Optional[str] = None,
+               tags: Optional[List[str]] = None, limit: Optional[int] = None) -> List[TemplateInfo]:
+        """
+        Find templates.
+
+        Args:
+            query: Free text matched against name, tags, category and
+                description; every term must match and the last may be a prefix
+            category: Only return templates in this category
+            tags: Only return templates that have all of these tags
+
+        Returns:
+            Matching templates, best text match first (index order without a query)
+        """
+        if category is not None:
+            allowed = set(self._by_category.get(category, []))
+        else:
+            allowed = None
+        for tag in tags or []:
+            tagged = set(self._by_tag.get(tag.lower(), []))
+            allowed = tagged if allowed is None else allowed & tagged
+
+        if query.strip():
+            ids = [hit.id for hit in self.search_index.search(query, match_all=True)]
+        else:
+            ids = list(self.infos)
+        if allowed is not None:
+            ids = [template_id for template_id in ids if template_id in allowed]
+        if limit is not None:
+            ids = ids[:limit]
+        return [self.infos[template_id] for template_id in ids]
@@ -2,10 +2,15 @@
 Template Library System for the Moveworks YAML Assistant.
 
 This module provides workflow templates to help users get started quickly.
+
+Template metadata comes from a TemplateIndex (see template_index.py), which
+caches the metadata of user templates on disk. A user template's file is
+only parsed into a WorkflowTemplate when the template is requested.
 """
 
 import json
 import os
+from collections.abc import Mapping
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
 from PySide6.QtWidgets import (
@@ -21,6 +26,7 @@ from core_structures import (
     ForLoopStep, ParallelStep, ParallelBranch, ParallelForLoop, ReturnStep,
     RaiseStep, TryCatchStep, CatchBlock
 )
+from template_index import TemplateIndex, TemplateInfo
 
 
 @dataclass
@@ -82,16 +88,45 @@ class WorkflowTemplate:
         )
 
 
+class _TemplateMapping(Mapping):
+    """Read-only view of a library's templates that loads each template when accessed."""
+
+    def __init__(self, library: 'TemplateLibrary'):
+        self._library = library
+
+    def __getitem__(self, template_id: str) -> WorkflowTemplate:
+        template = self._library.get_template(template_id)
+        if template is None:
+            raise KeyError(template_id)
+        return template
+
+    def __iter__(self):
+        return iter(list(self._library.index.infos))
+
+    def __len__(self) -> int:
+        return len(self._library.index)
+
+    def __contains__(self, template_id) -> bool:
+        return template_id in self._library.index
+
+
 class TemplateLibrary:
     """Manages workflow templates."""
 
-    def __init__(self):
-        self.templates: Dict[str, WorkflowTemplate] = {}
-        self.templates_dir = "templates"
+    def __init__(self, templates_dir: str = "templates"):
+        self.templates_dir = templates_dir
+        self.index = TemplateIndex(templates_dir)
+        self._builtin_templates: Dict[str, WorkflowTemplate] = {}
+        self._loaded_templates: Dict[str, WorkflowTemplate] = {}
         self._ensure_templates_dir()
         self._load_builtin_templates()
         self._load_user_templates()
 
+    @property
+    def templates(self) -> Mapping:
+        """Templates by ID; user templates are read from disk on first access."""
+        return _TemplateMapping(self)
+
     def _ensure_templates_dir(self):
         """Ensure templates directory exists."""
         if not os.path.exists(self.templates_dir):
@@ -456,32 +491,28 @@ else:
         )
 
         # Add templates to library
-        self.templates["user_lookup"] = user_lookup_template
-        self.templates["ticket_creation"] = ticket_creation_template
-        self.templates["error_handling"] = error_handling_template
-        self.templates["switch_statement"] = switch_template
-        self.templates["for_loop_processing"] = for_loop_template
-        self.templates["parallel_processing"] = parallel_template
-        self.templates["try_catch_handling"] = try_catch_template
-        self.templates["return_data_mapping"] = return_template
+        self._add_builtin_template("user_lookup", user_lookup_template)
+        self._add_builtin_template("ticket_creation", ticket_creation_template)
+        self._add_builtin_template("error_handling", error_handling_template)
+        self._add_builtin_template("switch_statement", switch_template)
+        self._add_builtin_template("for_loop_processing", for_loop_template)
+        self._add_builtin_template("parallel_processing", parallel_template)
+        self._add_builtin_template("try_catch_handling", try_catch_template)
+        self._add_builtin_template("return_data_mapping", return_template)
+
+    def _add_builtin_template(self, template_id: str, template: WorkflowTemplate):
+        """Register a built-in template."""
+        self._builtin_templates[template_id] = template
+        self.index.add_builtin(TemplateInfo.from_template(template_id, template))
 
     def _load_user_templates(self):
-        """Load user-created templates from files."""
-        if not os.path.exists(self.templates_dir):
-            return
-
-        for filename in os.listdir(self.templates_dir):
-            if filename.endswith('.json'):
-                try:
-                    filepath = os.path.join(self.templates_dir, filename)
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+        """Index user-created template files (their workflows are loaded on demand)."""
+        for template_id in self.index.refresh():
+            self._loaded_templates.pop(template_id, None)
 
-                    template = WorkflowTemplate.from_dict(data)
-                    template_id = filename[:-5]  # Remove .json extension
-                    self.templates[template_id] = template
-                except Exception as e:
-                    print(f"Error loading template {filename}: {e}")
+    def reload(self):
+        """Pick up template files that were added, changed or removed on disk."""
+        self._load_user_templates()
 
     def save_template(self, template_id: str, template: WorkflowTemplate) -> bool:
         """Save a template to file."""
@@ -490,7 +521,8 @@ else:
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(template.to_dict(), f, indent=2)
 
-            self.templates[template_id] = template
+            self.index.record_file(TemplateInfo.from_template(template_id, template, filepath))
+            self._loaded_templates[template_id] = template
             return True
         except Exception as e:
             print(f"Error saving template: {e}")
@@ -503,38 +535,53 @@ else:
             if os.path.exists(filepath):
                 os.remove(filepath)
 
-            if template_id in self.templates:
-                del self.templates[template_id]
+            self.index.forget_file(template_id)
+            self._loaded_templates.pop(template_id, None)
             return True
         except Exception as e:
             print(f"Error deleting template: {e}")
             return False
 
     def get_template(self, template_id: str) -> Optional[WorkflowTemplate]:
-        """Get a template by ID."""
-        return self.templates.get(template_id)
+        """Get a template by ID, reading it from disk on first use."""
+        info = self.index.infos.get(template_id)
+        if info is None:
+            return None
+        if info.builtin:
+            return self._builtin_templates.get(template_id)
+
+        template = self._loaded_templates.get(template_id)
+        if template is None:
+            try:
+                template = WorkflowTemplate.from_dict(self.index.load_data(template_id))
+            except Exception as e:
+                print(f"Error loading template {template_id}: {e}")
+                return None
+            self._loaded_templates[template_id] = template
+        return template
+
+    def get_template_info(self, template_id: str) -> Optional[TemplateInfo]:
+        """Get a template's metadata without loading its workflow."""
+        return self.index.infos.get(template_id)
 
     def get_templates_by_category(self, category: str) -> List[WorkflowTemplate]:
         """Get all templates in a category."""
-        return [t for t in self.templates.values() if t.category == category]
+        templates = (self.get_template(info.id) for info in self.index.in_category(category))
+        return [t for t in templates if t is not None]
 
     def get_all_categories(self) -> List[str]:
         """Get all template categories."""
-        categories = set(t.category for t in self.templates.values())
-        return sorted(list(categories))
-
-    def search_templates(self, query: str) -> List[WorkflowTemplate]:
-        """Search templates by name, description, or tags."""
-        query = query.lower()
-        results = []
+        return self.index.categories()
 
-        for template in self.templates.values():
-            if (query in template.name.lower() or
-                query in template.description.lower() or
-                any(query in tag.lower() for tag in template.tags)):
-                results.append(template)
+    def search_template_infos(self, query: str = "", category: Optional[str] = None,
+                              tags: Optional[List[str]] = None) -> List[TemplateInfo]:
+        """Search template metadata by text, category and tags (see TemplateIndex.search)."""
+        return self.index.search(query, category=category, tags=tags)
 
-        return results
+    def search_templates(self, query: str) -> List[WorkflowTemplate]:
+        """Search templates by name, description, category or tags."""
+        templates = (self.get_template(info.id) for info in self.index.search(query))
+        return [t for t in templates if t is not None]
 
     def export_template(self, template_id: str, filepath: str) -> bool:
         """Export a template to a file."""
@@ -562,7 +609,7 @@ else:
             base_id = template.name.lower().replace(' ', '_')
             template_id = base_id
             counter = 1
-            while template_id in self.templates:
+            while template_id in self.index:
                 template_id = f"{base_id}_{counter}"
                 counter += 1
 
@@ -845,7 +892,8 @@ class TemplateBrowserDialog(QDialog):
         # Load categories
         categories = self.library.get_all_categories()
         for category in categories:
-            self.category_combo.addItem(category)
+            if self.category_combo.findText(category) < 0:
+                self.category_combo.addItem(category)
 
         # Load all templates
         self._filter_templates()
@@ -857,26 +905,20 @@ class TemplateBrowserDialog(QDialog):
         search_text = self.search_edit.text().strip()
         selected_category = self.category_combo.currentText()
 
-        # Get templates to show
-        if search_text:
-            templates = self.library.search_templates(search_text)
-        else:
-            templates = list(self.library.templates.values())
-
-        # Filter by category
-        if selected_category != "All Categories":
-            templates = [t for t in templates if t.category == selected_category]
+        # Get templates to show (metadata only; workflows load on selection)
+        category = selected_category if selected_category != "All Categories" else None
+        infos = self.library.search_template_infos(search_text, category=category)
 
         # Add to list
-        for template in templates:
-            item = QListWidgetItem(f"{template.name} ({template.difficulty})")
-            item.setData(Qt.UserRole, template)
+        for info in infos:
+            item = QListWidgetItem(f"{info.name} ({info.difficulty})")
+            item.setData(Qt.UserRole, info.id)
             self.template_list.addItem(item)
 
     def _on_template_selection_changed(self, current, previous):
         """Handle template selection change."""
-        if current:
-            template = current.data(Qt.UserRole)
+        template = self.library.get_template(current.data(Qt.UserRole)) if current else None
+        if template:
             self._show_template_details(template)
             self.use_template_btn.setEnabled(True)
         else:
@@ -907,13 +949,8 @@ class TemplateBrowserDialog(QDialog):
         """Use the selected template."""
         current_item = self.template_list.currentItem()
         if current_item:
-            template = current_item.data(Qt.UserRole)
-            # Find template ID
-            for template_id, t in self.library.templates.items():
-                if t == template:
-                    self.template_selected.emit(template_id)
-                    self.accept()
-                    break
+            self.template_selected.emit(current_item.data(Qt.UserRole))
+            self.accept()
 
     def _export_template(self):
         """Export the selected template."""
@@ -922,20 +959,17 @@ class TemplateBrowserDialog(QDialog):
             QMessageBox.warning(self, "No Selection", "Please select a template to export.")
             return
 
-        template = current_item.data(Qt.UserRole)
+        template_id = current_item.data(Qt.UserRole)
+        info = self.library.get_template_info(template_id)
         filename, _ = QFileDialog.getSaveFileName(
-            self, "Export Template", f"{template.name}.json", "JSON Files (*.json)"
+            self, "Export Template", f"{info.name if info else template_id}.json", "JSON Files (*.json)"
         )
 
         if filename:
-            # Find template ID
-            for template_id, t in self.library.templates.items():
-                if t == template:
-                    if self.library.export_template(template_id, filename):
-                        QMessageBox.information(self, "Success", "Template exported successfully!")
-                    else:
-                        QMessageBox.critical(self, "Error", "Failed to export template.")
-                    break
+            if self.library.export_template(template_id, filename):
+                QMessageBox.information(self, "Success", "Template exported successfully!")
+            else:
+                QMessageBox.critical(self, "Error", "Failed to export template.")
 
     def _import_template(self):
         """Import a template from file."""
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for exception-free DataContext availability checks and copy-on-write snapshots.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_structures import DataContext, DataContextTimeline, DataPathNotFound, Workflow, ActionStep, ScriptStep
+
+
+USERS = {"users": [{"id": "u1", "email": "a@company.com"}, {"id": "u2", "email": "b@company.com"}]}
+
+
+def test_availability_matches_value_lookup():
+    """is_path_available agrees with get_data_value for found and missing paths."""
+    context = DataContext(initial_inputs={"email": "a@company.com"})
+    context.add_step_output("user_list", USERS)
+
+    paths = [
+        "data.email", "email", "data.user_list.users[1].email", "user_list.users.0.id",
+        "data.user_list.users[2]", "data.user_list.users.email", "data.email.length",
+        "data.missing", "meta_info.user.email_addr", "meta_info.user.manager", "data.user_list.users[x]",
+    ]
+    for path in paths:
+        try:
+            context.get_data_value(path)
+            expected = True
+        except DataPathNotFound:
+            expected = False
+        assert context.is_path_available(path) == expected, path
+
+
+def test_availability_walks_only_the_checked_path():
+    """Checks keep no per-value state, so they follow edits and cost the same for large outputs."""
+    rows = {"rows": [{"id": i, "tags": {"a": i}} for i in range(100000)]}
+    context = DataContext()
+    context.add_step_output("table", rows)
+    assert not hasattr(context, "_path_indexes")
+
+    assert context.is_path_available("data.table.rows[99999].tags.a")
+    rows["rows"][0]["extra"] = 1
+    assert context.is_path_available("data.table.rows[0].extra")
+    del rows["rows"][5:]
+    assert not context.is_path_available("data.table.rows[99999]")
+    assert context.snapshot().is_path_available("data.table.rows.4.id")
+
+
+def test_numeric_object_keys_are_looked_up_by_key():
+    """Objects keyed by digits are looked up by key, like get_data_value does."""
+    context = DataContext()
+    context.add_step_output("lookup", {"by_id": {"0": "zero", "7": "seven"}})
+    assert context.is_path_available("data.lookup.by_id.7")
+    assert not context.is_path_available("data.lookup.by_id[7]")
+
+
+def test_snapshots_are_copy_on_write():
+    """Adding an output after a snapshot does not change the snapshot, and vice versa."""
+    context = DataContext(initial_inputs={"email": "a@company.com"})
+    before = context.snapshot()
+    assert before.step_outputs is context.step_outputs
+
+    context.add_step_output("user_list", USERS)
+    assert context.is_path_available("data.user_list.users")
+    assert not before.is_path_available("data.user_list.users")
+
+    before.add_step_output("other", {"x": 1})
+    assert "other" not in context.step_outputs
+    assert before.initial_inputs is context.initial_inputs
+
+
+def test_timeline_answers_any_step_position():
+    """The timeline holds the data available before and after each step."""
+    workflow = Workflow(steps=[
+        ActionStep(action_name="list_users", output_key="user_list", parsed_json_output=USERS),
+        ScriptStep(code="return 1", output_key="count", parsed_json_output={"total": 2}),
+        ActionStep(action_name="notify", output_key="_", parsed_json_output={"ok": True}),
+    ])
+    initial = DataContext(initial_inputs={"email": "a@company.com"})
+    timeline = DataContextTimeline(workflow, initial)
+
+    assert len(timeline) == 3
+    assert not timeline.before(0).is_path_available("data.user_list")
+    assert timeline.before(1).is_path_available("data.user_list.users[0].id")
+    assert not timeline.before(1).is_path_available("data.count.total")
+    assert timeline.before(2).is_path_available("data.count.total")
+    assert timeline.after(2).step_outputs.keys() == {"user_list", "count"}
+    assert timeline.final is timeline.after(2)
+    assert initial.step_outputs == {}
+
+
+if __name__ == "__main__":
+    test_availability_matches_value_lookup()
+    test_availability_walks_only_the_checked_path()
+    test_numeric_object_keys_are_looked_up_by_key()
+    test_snapshots_are_copy_on_write()
+    test_timeline_answers_any_step_position()
+    print("All data context snapshot tests passed")
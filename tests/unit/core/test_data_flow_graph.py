@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for the workflow data-dependency graph.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_structures import (
+    Workflow, ActionStep, ScriptStep, SwitchStep, SwitchCase, ForLoopStep, ReturnStep
+)
+from data_flow_graph import DataDependency, get_data_flow_graph
+from incremental_validator import incremental_validator
+from validator import _infer_workflow_inputs
+
+
+def build_workflow():
+    return Workflow(steps=[
+        ActionStep(action_name="mw.get_user_by_email", output_key="user_info",
+                   input_args={"email": "data.input_email"},
+                   user_provided_json_output='{"user": {"id": "u1", "tickets": [{"id": 1}]}}'),
+        SwitchStep(cases=[
+            SwitchCase(condition='data.user_info.user.id != null', steps=[
+                ActionStep(action_name="mw.get_manager", output_key="manager",
+                           input_args={"user_id": "data.user_info.user.id"})
+            ])
+        ]),
+        ForLoopStep(each="ticket", in_source="data.user_info.user.tickets", output_key="updates", steps=[
+            ScriptStep(code="return data.manager", output_key="update")
+        ]),
+        ReturnStep(output_mapper={"updates": "data.updates", "label": "$CONCAT(['data.', data.missing])"}),
+    ])
+
+
+def test_dependencies_include_nested_steps():
+    """Nested output keys and references are attributed to their top-level step."""
+    graph = get_data_flow_graph(build_workflow())
+
+    assert graph.producer_of("manager") == 1
+    assert graph.is_available("manager", 2) and not graph.is_available("manager", 1)
+    assert DataDependency(0, 1, "user_info") in graph.edges
+    assert DataDependency(1, 2, "manager") in graph.edges
+    assert graph.dependencies[3] == {2}
+    assert graph.upstream(3) == {0, 1, 2}
+    assert graph.downstream(0) == {1, 2, 3}
+    assert graph.workflow_inputs() == ["input_email"]
+
+    paths = graph.available_paths(2)
+    assert {"data.user_info.user.id", "data.user_info.user.tickets[0]", "data.manager"} <= paths
+    assert "data.updates" not in paths
+
+
+def test_incremental_update():
+    """Only edited steps are rescanned, and edits change the edges."""
+    workflow = build_workflow()
+    graph = get_data_flow_graph(workflow)
+    assert graph.last_rescanned == len(workflow.steps)
+
+    assert get_data_flow_graph(workflow) is graph
+    assert graph.last_rescanned == 0
+
+    workflow.steps[2].in_source = "data.input_tickets"
+    get_data_flow_graph(workflow, dirty=[2])
+    assert graph.last_rescanned == 1
+    assert DataDependency(0, 2, "user_info") not in graph.edges
+
+    workflow.steps.insert(0, ScriptStep(code="return data.updates", output_key="early"))
+    get_data_flow_graph(workflow)
+    assert graph.last_rescanned == 1
+    assert graph.forward_references() == [DataDependency(3, 0, "updates")]
+
+
+def test_invalidated_steps_are_rescanned_without_a_dirty_set():
+    """Steps invalidated when edited are re-read by callers that pass no dirty steps."""
+    workflow = build_workflow()
+    graph = get_data_flow_graph(workflow)
+
+    workflow.steps[2].in_source = "data.input_tickets"
+    incremental_validator.invalidate([workflow.steps[2]])
+    get_data_flow_graph(workflow, dirty=())
+    assert graph.last_rescanned == 1
+    assert DataDependency(0, 2, "user_info") not in graph.edges
+
+
+def test_inferred_inputs_match_the_graph():
+    """Workflow inputs inferred by the validator equal the graph's, in reference order."""
+    workflow = build_workflow()
+    workflow.steps[0].input_args["tenant"] = "data.tenant_id"
+    expected = get_data_flow_graph(workflow).workflow_inputs()
+    assert expected == ["input_email", "tenant_id"]
+    assert list(_infer_workflow_inputs(workflow)) == expected
+
+
+if __name__ == "__main__":
+    test_dependencies_include_nested_steps()
+    test_incremental_update()
+    test_invalidated_steps_are_rescanned_without_a_dirty_set()
+    test_inferred_inputs_match_the_graph()
+    print("All data flow graph tests passed")
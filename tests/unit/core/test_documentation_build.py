@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental documentation builds.
+"""
+
+import json
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import comprehensive_documentation_generator as docs
+from comprehensive_documentation_generator import (
+    ComprehensiveDocumentationGenerator, DocumentationConfig, DocumentationPage, DOC_BUILD_MANIFEST
+)
+from help_system import ComprehensiveHelpSystem, HelpTopic
+
+
+def _build(output_dir, max_workers=2):
+    generator = ComprehensiveDocumentationGenerator(DocumentationConfig(output_dir=output_dir,
+                                                                        max_workers=max_workers))
+    assert generator.generate_complete_documentation()
+    return generator.last_build
+
+
+def _with_help_system(test):
+    """Run a test against a private help system so topic edits do not leak."""
+    def wrapper():
+        original = docs.help_system
+        docs.help_system = ComprehensiveHelpSystem()
+        try:
+            with tempfile.TemporaryDirectory() as output_dir:
+                test(docs.help_system, output_dir)
+        finally:
+            docs.help_system = original
+    wrapper.__name__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
+@_with_help_system
+def test_unchanged_topics_are_skipped(help_system, output_dir):
+    """A second build renders and writes nothing; the manifest covers every page."""
+    first = _build(output_dir)
+    topic_count = len(help_system.topics)
+    assert len(first.rendered) == 2 * topic_count and not first.skipped
+    assert (Path(output_dir) / "markdown" / "action-steps.md").read_text(encoding="utf-8").startswith("# Action Steps")
+
+    second = _build(output_dir)
+    assert second.rendered == [] and second.written == []
+    assert len(second.skipped) == 2 * topic_count
+
+    manifest = json.loads((Path(output_dir) / DOC_BUILD_MANIFEST).read_text(encoding="utf-8"))
+    assert "html/action-steps.html" in manifest["pages"] and "html/search-index.json" in manifest["pages"]
+
+
+@_with_help_system
+def test_changed_topic_is_rebuilt_serially(help_system, output_dir):
+    """Only the edited topic's pages and the search index are rewritten."""
+    _build(output_dir, max_workers=1)
+    help_system.topics["Action Steps"].content += "\nUpdated."
+
+    build = _build(output_dir, max_workers=1)
+    assert build.rendered == ["html/action-steps.html", "markdown/action-steps.md"]
+    assert sorted(build.written) == ["html/action-steps.html", "html/search-index.json", "markdown/action-steps.md"]
+    assert "Updated." in (Path(output_dir) / "markdown" / "action-steps.md").read_text(encoding="utf-8")
+
+
+@_with_help_system
+def test_removed_topic_pages_are_deleted(help_system, output_dir):
+    """Pages of topics that no longer exist are removed from the output."""
+    help_system.add_topic(HelpTopic(title="Temporary Topic", content="Short-lived."))
+    _build(output_dir)
+    assert (Path(output_dir) / "html" / "temporary-topic.html").exists()
+
+    del help_system.topics["Temporary Topic"]
+    build = _build(output_dir)
+    assert sorted(build.removed) == ["html/temporary-topic.html", "markdown/temporary-topic.md"]
+    assert not (Path(output_dir) / "html" / "temporary-topic.html").exists()
+
+
+@_with_help_system
+def test_pages_do_not_depend_on_the_build_date(help_system, output_dir):
+    """Rebuilding on a later day rewrites no page; the build time only goes into the manifest."""
+    _build(output_dir)
+
+    class NextDay(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2031, 1, 2, 0, 0, 1)
+
+    original = docs.datetime
+    docs.datetime = NextDay
+    try:
+        build = _build(output_dir)
+    finally:
+        docs.datetime = original
+    assert build.written == []
+    manifest = json.loads((Path(output_dir) / DOC_BUILD_MANIFEST).read_text(encoding="utf-8"))
+    assert manifest["generated"] == "2031-01-02T00:00:01"
+
+    generator = ComprehensiveDocumentationGenerator(DocumentationConfig(output_dir=output_dir,
+                                                                        release_date="June 1, 2025"))
+    assert generator.generate_complete_documentation()
+    assert "Version 2.0 • Released June 1, 2025" in (Path(output_dir) / "markdown" / "README.md").read_text(encoding="utf-8")
+    assert sorted(generator.last_build.written) == ["html/index.html", "markdown/README.md"]
+
+
+def test_cache_key_tracks_topic_and_related_pages():
+    """The cache key changes with the topic, its format and its existing related topics."""
+    topic = HelpTopic(title="Topic", content="Body")
+    page = DocumentationPage("html/topic.html", "html", topic)
+
+    assert page.cache_key() == DocumentationPage("html/topic.html", "html", HelpTopic(title="Topic", content="Body")).cache_key()
+    assert page.cache_key() != DocumentationPage("html/topic.html", "html", HelpTopic(title="Topic", content="Other")).cache_key()
+    assert page.cache_key() != DocumentationPage("markdown/topic.md", "markdown", topic).cache_key()
+    assert page.cache_key() != DocumentationPage("html/topic.html", "html", topic, ("Other Topic",)).cache_key()
+
+
+if __name__ == "__main__":
+    test_unchanged_topics_are_skipped()
+    test_changed_topic_is_rebuilt_serially()
+    test_removed_topic_pages_are_deleted()
+    test_pages_do_not_depend_on_the_build_date()
+    test_cache_key_tracks_topic_and_related_pages()
+    print("All documentation build tests passed")
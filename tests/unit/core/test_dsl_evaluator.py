@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched DSL evaluator.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_structures import DataContext
+from dsl_evaluator import dsl_evaluator, DSLEvaluationError
+
+
+def build_context():
+    context = DataContext(initial_inputs={"min_age": 18})
+    context.add_step_output("users", {
+        "items": [
+            {"id": "u1", "name": "Ann", "age": 34, "status": "active", "tags": ["vip"]},
+            {"id": "u2", "name": "Bob", "age": 16, "status": "active", "tags": []},
+            {"id": "u3", "name": "Cy", "age": None, "status": "inactive", "tags": ["vip"]},
+        ],
+        "roles": {"u1": "admin"},
+    })
+    return context
+
+
+def test_bender_functions():
+    """$MAP, $FILTER, $LOOKUP and $CONDITIONAL evaluate against step outputs."""
+    context = build_context()
+
+    assert dsl_evaluator.evaluate('$MAP(data.users.items, {"id": "item.id", "upper": $UPPER(item.name)})', context) == [
+        {"id": "u1", "upper": "ANN"}, {"id": "u2", "upper": "BOB"}, {"id": "u3", "upper": "CY"}
+    ]
+    adults = dsl_evaluator.evaluate("$FILTER(data.users.items, item.age >= data.min_age)", context)
+    assert [user["id"] for user in adults] == ["u1"]
+    assert dsl_evaluator.evaluate("$LOOKUP(data.users.roles, data.users.items[1].id, 'member')", context) == "member"
+    assert dsl_evaluator.evaluate(
+        "$CONDITIONAL(data.users.items.length > 2, 'many', 'few')", context
+    ) == "many"
+    assert dsl_evaluator.evaluate("$CONCAT([meta_info.user.first_name, ' ', meta_info.user.last_name])",
+                                  context) == "John Doe"
+
+
+def test_converter_words_are_constants():
+    """Converter strings naming no variable are constants; words naming a variable still resolve."""
+    context = build_context()
+    mapped = dsl_evaluator.evaluate(
+        '$MAP(data.users.items, {"id": "item.id", "status": "Active", "source": "context"}, data.min_age)', context
+    )
+    assert mapped[0] == {"id": "u1", "status": "Active", "source": 18}
+    assert dsl_evaluator.evaluate('$MAP(data.users.items, "Active")', context) == ["Active"] * 3
+    assert dsl_evaluator.evaluate('$MAP(data.users.items[0].tags, "item")', context) == ["vip"]
+
+
+def test_batch_matches_single_evaluation():
+    """Batched evaluation gives the same result as evaluating each record alone."""
+    records = build_context().step_outputs["users"]["items"] * 50
+    expressions = [
+        "item.age >= 18 && item.tags.contains('vip')",
+        "!(item.status == 'active') || item.age < 20",
+        "$IF(item.age > 30, $UPPER(item.name), item.missing.field)",
+        "$MAP(item.tags, $CONCAT([item, '!']))",
+    ]
+    for expression in expressions:
+        batched = dsl_evaluator.evaluate_batch(expression, records)
+        single = [dsl_evaluator.evaluate(expression, variables={"item": record}) for record in records]
+        assert batched == single, expression
+
+    matches = dsl_evaluator.filter_records("data.status == 'inactive'", records, variable="data")
+    assert len(matches) == 50
+
+
+def test_evaluation_errors():
+    """Unsupported or invalid expressions raise DSLEvaluationError."""
+    for expression in ["data.a ==", "$REGEX(data.a, 'x')", "item.name", "$MAP(data.a)"]:
+        try:
+            dsl_evaluator.evaluate(expression, {"a": 1})
+        except DSLEvaluationError:
+            pass
+        else:
+            raise AssertionError(f"{expression!r} should fail")
+
+
+if __name__ == "__main__":
+    test_bender_functions()
+    test_converter_words_are_constants()
+    test_batch_matches_single_evaluation()
+    test_evaluation_errors()
+    print("All DSL evaluator tests passed")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled JSON path engine.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from json_path import JsonPathSyntaxError, compile_path, resolve_many, resolve_path
+from core_structures import ActionStep, DataContext, DataPathNotFound, Workflow
+from validator import comprehensive_validate
+
+
+SAMPLE = {
+    "users": [
+        {"name": "Ana", "manager": {"email": "boss@company.com"}},
+        {"name": "Ben", "manager": None},
+    ],
+    "first name": "Ana",
+}
+
+
+def test_paths_compile_once_into_accessors():
+    """Bracket and dotted indices compile to the same accessors, and results are cached."""
+    compiled = compile_path("data.users[0].manager.email")
+    assert compiled.root == "data"
+    assert compiled.steps == (("users", None), (0, 0), ("manager", None), ("email", None))
+    assert compile_path("data.users[0].manager.email") is compiled
+
+    assert compile_path("users.0.name").steps[1] == ("0", 0)
+    assert compile_path("meta_info.user.email_addr").root == "meta_info"
+    assert compile_path("data['first name']").steps == (("first name", None),)
+    with pytest.raises(JsonPathSyntaxError):
+        compile_path("data.users[first]")
+
+
+def test_resolve_path_reports_where_lookup_failed():
+    """Lookups return the value or raise with a message naming the failing segment."""
+    assert resolve_path(SAMPLE, "data.users[0].manager.email") == "boss@company.com"
+    assert resolve_path(SAMPLE, "users.1.name") == "Ben"
+    assert resolve_path(SAMPLE, "data") is SAMPLE
+
+    with pytest.raises(KeyError, match="Available keys"):
+        resolve_path(SAMPLE, "data.users[0].boss")
+    with pytest.raises(IndexError, match="out of range"):
+        resolve_path(SAMPLE, "data.users[5]")
+    with pytest.raises(TypeError):
+        resolve_path(SAMPLE, "data.users[1].manager.email")
+
+
+def test_resolve_many_skips_unresolvable_paths():
+    """Batch resolution returns only the paths that exist."""
+    context = {"data": SAMPLE, "meta_info": {"user": {"email_addr": "ana@company.com"}}}
+    values = resolve_many([
+        "data.users[0].name",
+        "data.users[0].manager.email",
+        "users[1].name",
+        "data.users[9].name",
+        "data.users[x]",
+        "meta_info.user.email_addr",
+    ], context)
+
+    assert values == {
+        "data.users[0].name": "Ana",
+        "data.users[0].manager.email": "boss@company.com",
+        "users[1].name": "Ben",
+        "meta_info.user.email_addr": "ana@company.com",
+    }
+
+
+def test_data_context_uses_compiled_paths():
+    """DataContext lookups accept both index forms and keep raising DataPathNotFound."""
+    context = DataContext(initial_inputs={"email": "ana@company.com"})
+    context.add_step_output("user_info", {"users": SAMPLE["users"]})
+
+    assert context.get_data_value("data.user_info.users[0].name") == "Ana"
+    assert context.get_data_value("user_info.users.1.name") == "Ben"
+    assert context.get_data_value("meta_info.user.first_name") == "John"
+    assert context.is_path_available("data.email")
+    assert not context.is_path_available("data.user_info.users[2]")
+    with pytest.raises(DataPathNotFound):
+        context.get_data_value("data.user_info.users[first]")
+
+    values = context.get_data_values(["data.email", "user_info.users[0].name", "data.missing"])
+    assert values == {"data.email": "ana@company.com", "user_info.users[0].name": "Ana"}
+
+
+def test_empty_segments_are_syntax_errors():
+    """'a..b' and a trailing dot do not parse, so validation reports them as unavailable."""
+    for path in ["data.x..a", "data.x.", "data.x.[0]", "data.x]"]:
+        with pytest.raises(JsonPathSyntaxError):
+            compile_path(path)
+    assert resolve_many(["data.users..name", "data.users."], {"data": SAMPLE}) == {}
+
+    workflow = Workflow(steps=[
+        ActionStep(action_name="mw.get_user", output_key="user_info"),
+        ActionStep(action_name="mw.notify", output_key="notified",
+                   input_args={"broken": "data.user_info..a.b", "valid": "data.user_info.a.b"}),
+    ])
+    workflow.steps[0].parsed_json_output = {"a": {"b": 1}}
+    errors = comprehensive_validate(workflow)
+    assert "Step 2: input_args['broken'] references unavailable data path 'data.user_info..a.b'" in errors
+    assert not any("'data.user_info.a.b'" in error for error in errors)
+
+
+def test_resolve_many_walks_deep_paths_incrementally():
+    """Every prefix of a deep path resolves, sharing the walk of the longer path."""
+    deep = value = {}
+    for _ in range(200):
+        value["n"] = {}
+        value = value["n"]
+    value["leaf"] = 1
+    paths = ["data" + ".n" * depth for depth in range(201)] + ["data" + ".n" * 200 + ".leaf"]
+    values = resolve_many(paths, {"data": deep})
+    assert len(values) == len(paths) and values[paths[-1]] == 1
+
+
+if __name__ == "__main__":
+    test_paths_compile_once_into_accessors()
+    test_resolve_path_reports_where_lookup_failed()
+    test_resolve_many_skips_unresolvable_paths()
+    test_data_context_uses_compiled_paths()
+    test_empty_segments_are_syntax_errors()
+    test_resolve_many_walks_deep_paths_incrementally()
+    print("All JSON path tests passed")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for the parallelization advisor.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_structures import Workflow, ActionStep, ScriptStep, ParallelStep, ReturnStep
+from parallelization_advisor import ParallelizationAdvisor
+from workflow_simulator import WorkflowSimulator
+
+
+def build_workflow():
+    lookups = [
+        ActionStep(action_name=f"mw.lookup_{i}", output_key=f"lookup_{i}",
+                   input_args={"id": "data.input_id"}, user_provided_json_output=f'{{"value": {i}}}')
+        for i in range(4)
+    ]
+    return Workflow(steps=lookups[:2] + [
+        ActionStep(action_name="mw.dependent", output_key="dependent",
+                   input_args={"value": "data.lookup_0.value"}, user_provided_json_output='{"value": 10}'),
+    ] + lookups[2:] + [
+        ScriptStep(code="return data.dependent.value", output_key="total"),
+        ActionStep(action_name="mw.single", output_key="single"),
+        ReturnStep(output_mapper={"total": "data.total", "last": "data.lookup_3.value"}),
+    ])
+
+
+def test_analyze_groups_independent_actions():
+    """Independent actions share a layer; dependent actions follow their producers."""
+    advisor = ParallelizationAdvisor({"mw.dependent": 50}, default_latency_ms=100)
+    plan = advisor.analyze(build_workflow())
+
+    assert len(plan.suggestions) == 1
+    suggestion = plan.suggestions[0]
+    assert (suggestion.start, suggestion.end) == (0, 5)
+    assert suggestion.layers == [[0, 1, 3, 4], [2]]
+    assert suggestion.serial_ms == 450 and suggestion.parallel_ms == 150
+
+    # The single action after the script is counted but not rewritten
+    assert plan.serial_ms == 550 and plan.saved_ms == 300
+
+    assert ParallelizationAdvisor(default_latency_ms=100, max_workers=2).analyze(
+        build_workflow()).suggestions[0].parallel_ms == 300
+
+
+def test_apply_preserves_results():
+    """The rewritten workflow returns the same output with a shorter critical path."""
+    workflow = build_workflow()
+    advisor = ParallelizationAdvisor(default_latency_ms=100)
+    rewritten = advisor.apply(workflow)
+
+    assert isinstance(rewritten.steps[0], ParallelStep)
+    assert [branch.name for branch in rewritten.steps[0].branches] == [
+        "lookup_0", "lookup_1", "lookup_2", "lookup_3"
+    ]
+    assert len(workflow.steps) == 8 and len(rewritten.steps) == 5
+    assert "parallel:" in advisor.preview_yaml(workflow, advisor.analyze(workflow).suggestions[0])
+
+    simulator = WorkflowSimulator(default_latency=100)
+    before = simulator.run(workflow, {"input_id": 1})
+    after = simulator.run(rewritten, {"input_id": 1})
+    assert before.output == after.output == {"total": 10, "last": 3}
+    assert after.critical_path_ms < before.critical_path_ms
+
+
+if __name__ == "__main__":
+    test_analyze_groups_independent_actions()
+    test_apply_preserves_results()
+    print("All parallelization advisor tests passed")
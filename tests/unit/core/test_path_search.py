@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for the trigram path search index.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from path_search import PathSearchIndex
+from path_trie import PathTrie
+from json_tree_model import JsonPathIndex, get_json_path_index, json_display_value
+
+
+OUTPUT = {
+    "user": {"email": "ana@company.com", "name": "Ana", "manager": {"email": "boss@company.com"}},
+    "tickets": [{"id": f"T{i}", "status": "open" if i % 2 else "closed"} for i in range(50)],
+}
+
+
+def test_substring_search_matches_a_full_scan():
+    """Trigram candidates are verified, so results equal a scan of every path, key and value."""
+    index = JsonPathIndex(OUTPUT, "data.lookup")
+    for query in ["email", "EMAIL", "tickets[4", "closed", "t4", "s", "boss@", "no such text", ".user.m"]:
+        expected = [
+            path for path, route, key_text, value in index.iter_entries()
+            if any(query.lower() in text.lower()
+                   for text in (path, key_text, json_display_value(value) if route else ""))
+        ]
+        assert index.search(query) == expected, query
+
+
+def test_fuzzy_suggestions_rank_contained_and_similar_paths():
+    """Paths containing the query rank first; misspelled paths still find their target."""
+    index = JsonPathIndex(OUTPUT, "data.lookup")
+    assert index.suggest("data.lookup.user.emial", limit=1)[0][0] == "data.lookup.user.email"
+    best, runner_up = index.suggest("manager.email", limit=2)
+    assert best[0] == "data.lookup.user.manager.email" and best[1] > 1 > runner_up[1]
+
+    ranked = [path for path, _ in index.suggest("user.name", limit=3)]
+    assert ranked[0] == "data.lookup.user.name"
+    assert index.suggest("zzzz") == []
+
+
+def test_index_is_built_once_in_the_background():
+    """build_async prepares the index once; the shared index is reused per output object."""
+    index = JsonPathIndex(OUTPUT, "data.lookup")
+    assert not index.is_built
+    future = index.build_async()
+    assert index.build_async() is future
+    future.result()
+    assert index.is_built and index._search_index is not None
+
+    index = get_json_path_index(OUTPUT, "data.lookup")
+    assert get_json_path_index(OUTPUT, "data.lookup") is index
+    assert get_json_path_index(dict(OUTPUT), "data.lookup") is not index
+
+
+def test_follow_up_work_runs_after_the_background_build():
+    """build_async(then=...) hands the built index to the function on the index thread."""
+    index = JsonPathIndex(OUTPUT, "data.lookup")
+    trie = PathTrie()
+
+    def feed(built):
+        assert built.is_built and threading.current_thread() is not threading.main_thread()
+        trie.set_source("json_tree", built.paths())
+        return len(trie)
+
+    assert index.build_async(then=feed).result() == len(index.paths())
+    assert trie.complete("lookup.usr.nm") == ["data.lookup.user.name"]
+
+
+def test_short_queries_scan_prepared_text():
+    """Queries shorter than a trigram still match paths and texts."""
+    search = PathSearchIndex(["data.a", "data.ab", "data.x"], ["", "1", "A!"])
+    assert search.search("a") == [0, 1, 2]
+    assert search.search("!") == [2]
+    assert search.search("") == [0, 1, 2]
+
+
+if __name__ == "__main__":
+    test_substring_search_matches_a_full_scan()
+    test_fuzzy_suggestions_rank_contained_and_similar_paths()
+    test_index_is_built_once_in_the_background()
+    test_follow_up_work_runs_after_the_background_build()
+    test_short_queries_scan_prepared_text()
+    print("All path search tests passed")
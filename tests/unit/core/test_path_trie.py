@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the path completion trie.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from path_trie import PathTrie, is_abbreviation, split_path
+
+
+PATHS = [
+    "data.user", "data.user.name", "data.user.email", "data.user.email_address",
+    "data.users", "data.users[0]", "data.users[0].id", "data.users[1]", "data.users[1].id",
+    "data.users[10]", "data.users[10].id",
+]
+META_PATHS = ["meta_info.user.first_name", "meta_info.user.email_addr"]
+
+
+def _trie():
+    trie = PathTrie()
+    trie.set_source("output", PATHS)
+    trie.set_source("meta_info", META_PATHS)
+    return trie
+
+
+def test_segments_and_abbreviations():
+    """Paths split at dots and brackets; abbreviations keep the first letter and letter order."""
+    assert split_path("data.users[10].id") == ["data", "users", "[10]", "id"]
+    assert is_abbreviation("usr", "user") and is_abbreviation("nm", "name")
+    assert not is_abbreviation("sr", "user") and not is_abbreviation("nma", "name")
+
+
+def test_prefix_and_abbreviation_completion():
+    """Segments match by prefix or abbreviation, with or without the data root."""
+    trie = _trie()
+    assert trie.complete("usr.nm") == ["data.user.name"]
+    assert trie.complete("data.user.em") == ["data.user.email", "data.user.email_address"]
+    assert trie.complete("usr.em") == ["data.user.email", "data.user.email_address", "meta_info.user.email_addr"]
+    assert trie.complete("users.1") == ["data.users[1]", "data.users[10]", "data.users[1].id", "data.users[10].id"]
+    assert trie.complete("users[1].id") == ["data.users[1].id"]
+    assert trie.complete("zz") == []
+
+
+def test_matches_come_before_descendants_and_stop_at_the_limit():
+    """Matching paths are returned first, then their children breadth-first, up to the limit."""
+    trie = _trie()
+    assert trie.complete("data.us", limit=4) == ["data.user", "data.users", "data.user.name", "data.user.email"]
+    assert next(trie.iter_completions("data")) == "data.user"
+
+
+def test_sources_update_incrementally():
+    """Replacing a source only adds and removes the difference; shared paths are reference counted."""
+    trie = _trie()
+    assert len(trie) == len(PATHS) + len(META_PATHS)
+
+    trie.set_source("output", PATHS[:4] + ["data.user.manager"])
+    assert "data.user.manager" in trie and "data.users[0]" not in trie
+    assert trie.complete("users") == []
+    assert len(trie) == 5 + len(META_PATHS)
+
+    trie.set_source("other", ["data.user.name"])
+    trie.set_source("output", [])
+    assert "data.user.name" in trie and "data.user.email" not in trie
+    assert trie.sources() == ["meta_info", "other"]
+
+
+if __name__ == "__main__":
+    test_segments_and_abbreviations()
+    test_prefix_and_abbreviation_completion()
+    test_matches_come_before_descendants_and_stop_at_the_limit()
+    test_sources_update_incrementally()
+    print("All path trie tests passed")
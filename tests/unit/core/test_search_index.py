@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for the BM25 search index and help topic search.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from search_index import SearchDocument, SearchIndex, tokenize
+from help_system import ComprehensiveHelpSystem, HelpTopic
+
+
+DOCUMENTS = [
+    SearchDocument("Switch Steps", {"title": "Switch Steps", "content": "Branch on conditions using DSL."}),
+    SearchDocument("Output Keys", {"title": "Output Keys", "keywords": ["output_key"],
+                                   "content": "Each step stores its result under an output key."}),
+    SearchDocument("Scripts", {"title": "Scripts", "content": "Scripts return values. Conditions are rare here."},
+                   {"url": "scripts.html"}),
+]
+
+
+def test_tokenize():
+    """Identifiers are indexed whole and by part; plurals are folded."""
+    assert tokenize("Use output_keys and $CONCAT(data.items)") == [
+        "use", "output_key", "output", "key", "and", "concat", "data", "item"
+    ]
+
+
+def test_bm25_ranking_and_prefix():
+    """Title matches outrank body matches, and the last word may be a prefix."""
+    index = SearchIndex.build(DOCUMENTS)
+
+    assert [hit.id for hit in index.search("step")] == ["Switch Steps", "Output Keys"]
+    assert {hit.id for hit in index.search("conditions")} == {"Switch Steps", "Scripts"}
+    assert [hit.id for hit in index.search("outp")] == ["Output Keys"]
+    assert [hit.id for hit in index.search("output", prefix_last=False)] == ["Output Keys"]
+    assert [hit.id for hit in index.search("step conditions", match_all=True)] == ["Switch Steps"]
+    assert len(index.search("step conditions")) == 3
+    assert index.search("nothing matches") == []
+
+
+def test_serialization_round_trip():
+    """A saved index ranks identically and is reused only while the corpus is unchanged."""
+    index = SearchIndex.build(DOCUMENTS)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "index.json"
+        index.save(path)
+        loaded = SearchIndex.load(path)
+        assert [(hit.id, hit.score) for hit in loaded.search("conditions")] == \
+               [(hit.id, hit.score) for hit in index.search("conditions")]
+        assert loaded.search("scripts")[0].metadata == {"url": "scripts.html"}
+
+        assert SearchIndex.load_or_build(path, DOCUMENTS).digest == index.digest
+        rebuilt = SearchIndex.load_or_build(path, DOCUMENTS[:2])
+        assert len(rebuilt) == 2 and len(SearchIndex.load(path)) == 2
+
+
+def test_help_topic_search():
+    """Help search ranks topics and picks up topics added later."""
+    help_system = ComprehensiveHelpSystem()
+    results = help_system.search_topics("valid")
+    assert results and "Validation" in [topic.title for topic in results[:3]]
+
+    help_system.add_topic(HelpTopic(title="Quokka Integration", content="Connect the quokka service."))
+    assert [topic.title for topic in help_system.search_topics("quokka")] == ["Quokka Integration"]
+
+
+if __name__ == "__main__":
+    test_tokenize()
+    test_bm25_ranking_and_prefix()
+    test_serialization_round_trip()
+    test_help_topic_search()
+    print("All search index tests passed")
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Tests for the startup profiler.
+"""
+
+import builtins
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from startup_profiler import StartupProfiler
+
+
+def test_import_and_phase_timings():
+    """Imports made while enabled are timed, and phases nest."""
+    original_import = builtins.__import__
+    sys.modules.pop('colorsys', None)
+
+    profiler = StartupProfiler()
+    with profiler.phase("ignored while disabled"):
+        pass
+    profiler.enable()
+    try:
+        with profiler.phase("window"):
+            with profiler.phase("panel"):
+                import colorsys  # noqa: F401
+        profiler.mark("shown")
+    finally:
+        profiler.disable()
+
+    assert builtins.__import__ is original_import
+    assert 'colorsys' in profiler.imports
+    assert profiler.imports['colorsys'].cumulative_ms >= profiler.imports['colorsys'].self_ms >= 0
+    assert [(phase.label, phase.depth) for phase in profiler.phases] == [("window", 0), ("panel", 1), ("shown", -1)]
+
+    report = profiler.report()
+    assert "colorsys" in report and "    panel" in report and "@ shown" in report
+
+
+if __name__ == "__main__":
+    test_import_and_phase_timings()
+    print("All startup profiler tests passed")
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for the template metadata index.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from template_index import TemplateIndex, TemplateInfo, TEMPLATE_INDEX_FILENAME
+
+
+def _write_template(directory, template_id, name, category="General", tags=(), description=""):
+    path = os.path.join(directory, f"{template_id}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "name": name,
+            "description": description,
+            "category": category,
+            "tags": list(tags),
+            "workflow": {"steps": [{"action_name": "mw.get_user_by_email", "output_key": "user_info"}]},
+        }, f)
+    return path
+
+
+def _make_index(directory):
+    index = TemplateIndex(directory)
+    index.add_builtin(TemplateInfo("user_lookup", "User Lookup", "Look up a user by email",
+                                   "User Management", tags=["user", "lookup", "email"]))
+    index.refresh()
+    return index
+
+
+def test_refresh_reads_metadata_and_caches_it():
+    """Template files are read once; an unchanged directory is served from the cache file."""
+    with tempfile.TemporaryDirectory() as directory:
+        _write_template(directory, "reset_password", "Password Reset", "IT Service Management",
+                        ["password", "itsm"], "Reset a user's password")
+
+        index = _make_index(directory)
+        assert index.last_scanned == ["reset_password"]
+        assert os.path.exists(os.path.join(directory, TEMPLATE_INDEX_FILENAME))
+        info = index.infos["reset_password"]
+        assert info.name == "Password Reset" and info.step_count == 1 and not info.builtin
+
+        reopened = _make_index(directory)
+        assert reopened.last_scanned == []
+        assert reopened.infos["reset_password"].category == "IT Service Management"
+        assert reopened.load_data("reset_password")["workflow"]["steps"][0]["output_key"] == "user_info"
+        assert reopened.load_data("user_lookup") is None
+
+
+def test_changed_and_removed_files_are_detected():
+    """Only files whose modification time or size changed are read again."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_template(directory, "reset_password", "Password Reset")
+        _write_template(directory, "onboarding", "Onboarding")
+        index = _make_index(directory)
+
+        _write_template(directory, "reset_password", "Password Reset v2", tags=["password"])
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        os.remove(os.path.join(directory, "onboarding.json"))
+
+        changed = index.refresh()
+        assert index.last_scanned == ["reset_password"]
+        assert sorted(changed) == ["onboarding", "reset_password"]
+        assert index.infos["reset_password"].name == "Password Reset v2"
+        assert "onboarding" not in index
+
+
+def test_user_template_overrides_builtin_until_deleted():
+    """A file with a built-in template's ID replaces it; forgetting the file restores it."""
+    with tempfile.TemporaryDirectory() as directory:
+        _write_template(directory, "user_lookup", "Custom Lookup")
+        index = _make_index(directory)
+        assert index.infos["user_lookup"].name == "Custom Lookup"
+
+        os.remove(os.path.join(directory, "user_lookup.json"))
+        index.forget_file("user_lookup")
+        assert index.infos["user_lookup"].builtin
+
+
+def test_search_by_text_category_and_tag():
+    """Search is indexed by text, category and tag."""
+    with tempfile.TemporaryDirectory() as directory:
+        _write_template(directory, "reset_password", "Password Reset", "IT Service Management",
+                        ["password", "itsm"], "Reset a user's password")
+        _write_template(directory, "create_ticket", "Ticket Creation", "IT Service Management",
+                        ["ticket", "itsm"], "Create an incident ticket")
+        index = _make_index(directory)
+
+        assert [info.id for info in index.search("passw")] == ["reset_password"]
+        assert [info.id for info in index.search("user")][0] == "user_lookup"
+        assert {info.id for info in index.search(category="IT Service Management")} == {
+            "reset_password", "create_ticket"}
+        assert [info.id for info in index.search("incident", tags=["ITSM"])] == ["create_ticket"]
+        assert index.search("ticket", category="User Management") == []
+        assert index.categories() == ["IT Service Management", "User Management"]
+        assert [info.id for info in index.with_tag("email")] == ["user_lookup"]
+
+
+def test_corrupt_cache_is_rebuilt():
+    """An unreadable cache file is ignored and replaced."""
+    with tempfile.TemporaryDirectory() as directory:
+        _write_template(directory, "reset_password", "Password Reset")
+        with open(os.path.join(directory, TEMPLATE_INDEX_FILENAME), "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        index = _make_index(directory)
+        assert index.last_scanned == ["reset_password"]
+        assert _make_index(directory).last_scanned == []
+
+
+if __name__ == "__main__":
+    test_refresh_reads_metadata_and_caches_it()
+    test_changed_and_removed_files_are_detected()
+    test_user_template_overrides_builtin_until_deleted()
+    test_search_by_text_category_and_tag()
+    test_corrupt_cache_is_rebuilt()
+    print("All template index tests passed")
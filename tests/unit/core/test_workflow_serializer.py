@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for versioned workflow file serialization.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_structures import (
+    Workflow, ActionStep, ScriptStep, SwitchStep, SwitchCase, DefaultCase,
+    ForLoopStep, ParallelStep, ParallelBranch, ReturnStep, RaiseStep,
+    TryCatchStep, CatchBlock
+)
+from workflow_serializer import (
+    SCHEMA_VERSION, dumps_workflow, loads_workflow, save_workflow, load_workflow,
+    workflow_from_dict
+)
+
+
+def build_workflow():
+    """Build a workflow with nested control-flow steps."""
+    return Workflow(steps=[
+        ActionStep(action_name="mw.get_user_by_email", output_key="user_info",
+                   input_args={"email": "data.input_email"},
+                   user_provided_json_output='{"user": {"id": "1", "active": true}}'),
+        SwitchStep(
+            cases=[SwitchCase(condition="data.user_info.user.active",
+                              steps=[ScriptStep(code="return 1", output_key="flag")])],
+            default_case=DefaultCase(steps=[RaiseStep(output_key="inactive_error", message="Inactive")])
+        ),
+        ForLoopStep(each="item", index="idx", in_source="data.items", output_key="results",
+                    steps=[ParallelStep(branches=[ParallelBranch(
+                        name="notify", steps=[ActionStep(action_name="mw.notify", output_key="sent")])])]),
+        TryCatchStep(try_steps=[ActionStep(action_name="mw.risky", output_key="risky_out")],
+                     catch_block=CatchBlock(on_status_code=["500"],
+                                            steps=[ReturnStep(output_mapper={"ok": "false"})])),
+    ])
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_round_trip_all_step_types(compact):
+    """Every step type survives a save/load cycle in both layouts."""
+    workflow = build_workflow()
+    text = dumps_workflow(workflow, compact=compact)
+
+    assert json.loads(text)["schema_version"] == SCHEMA_VERSION
+    assert loads_workflow(text) == workflow
+
+
+def test_compact_layout_is_smaller(tmp_path):
+    """The compact layout omits defaults and interns field names."""
+    workflow = build_workflow()
+    standard = tmp_path / "standard.json"
+    compact = tmp_path / "compact.json"
+    save_workflow(workflow, str(standard))
+    save_workflow(workflow, str(compact), compact=True)
+
+    assert compact.stat().st_size < standard.stat().st_size / 1.5
+    assert load_workflow(str(compact)) == workflow
+
+
+def test_standard_saves_are_indented(tmp_path):
+    """User-facing saves stay human readable; compact saves are a single line."""
+    workflow = build_workflow()
+    standard = tmp_path / "standard.json"
+    compact = tmp_path / "compact.json"
+    save_workflow(workflow, str(standard))
+    save_workflow(workflow, str(compact), compact=True)
+
+    assert standard.read_text().startswith('{\n  "')
+    assert "\n" not in compact.read_text()
+    assert load_workflow(str(standard)) == workflow
+
+
+def test_legacy_files_and_lazy_outputs():
+    """Unversioned files load, and sample outputs are parsed on first access."""
+    legacy = {"steps": [{
+        "type": "action", "action_name": "mw.lookup", "output_key": "lookup",
+        "description": None, "input_args": {}, "progress_updates": None, "delay_config": None,
+        "user_provided_json_output": '{"id": 7}'
+    }]}
+    step = workflow_from_dict(legacy).steps[0]
+
+    assert "_parsed_json_output" not in vars(step)
+    assert step.parsed_json_output == {"id": 7}
+
+    with pytest.raises(ValueError):
+        workflow_from_dict({"schema_version": SCHEMA_VERSION + 1, "steps": []})
+    with pytest.raises(ValueError):
+        workflow_from_dict({"steps": [{"type": "unknown"}]})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for the local workflow simulator.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_structures import (
+    Workflow, ActionStep, ScriptStep, SwitchStep, SwitchCase, DefaultCase, ForLoopStep,
+    ReturnStep, RaiseStep, TryCatchStep, CatchBlock, ParallelStep, ParallelBranch, ParallelForLoop
+)
+from workflow_simulator import (
+    ActionFailure, LatencyProfile, SimulationError, WorkflowSimulator, run_apiton_script, simulate_workflow
+)
+from apiton_validator import validate_apiton_code_restrictions
+
+
+def build_workflow():
+    return Workflow(steps=[
+        ActionStep(
+            action_name="mw.get_user_by_email",
+            output_key="user_info",
+            input_args={"email": "meta_info.user.email_addr"},
+            user_provided_json_output='{"user": {"id": "u1", "tickets": [{"id": 1, "open": true}, {"id": 2, "open": false}]}}'
+        ),
+        ScriptStep(
+            code="open_ids = [t.id for t in tickets if t.open]\n{'open_ids': open_ids, 'count': len(open_ids)}",
+            output_key="summary",
+            input_args={"tickets": "data.user_info.user.tickets"}
+        ),
+        ForLoopStep(each="ticket", index="i", in_source="data.user_info.user.tickets", output_key="updates", steps=[
+            ActionStep(action_name="mw.update_ticket", output_key="updated",
+                       input_args={"ticket_id": "ticket.id"}, user_provided_json_output='{"ok": true}')
+        ]),
+        SwitchStep(cases=[
+            SwitchCase(condition="data.summary.count > 5", steps=[RaiseStep(message="Too many tickets")])
+        ], default_case=DefaultCase(steps=[
+            ScriptStep(code="return 'ok'", output_key="status")
+        ])),
+        ReturnStep(output_mapper={"user_id": "data.user_info.user.id", "open": "data.summary.open_ids",
+                                  "status": "data.status", "updated": "$MAP(data.updates, item.ok)"}),
+        ActionStep(action_name="mw.never_runs", output_key="never"),
+    ])
+
+
+def test_simulation_runs_to_return():
+    """Steps run in order, loops iterate and the return output_mapper is evaluated."""
+    result = simulate_workflow(build_workflow())
+    assert result.success and result.returned
+    assert result.output == {"user_id": "u1", "open": [1], "status": "ok", "updated": [True, True]}
+    assert "never" not in result.context.step_outputs
+    assert [trace.path for trace in result.traces][:4] == [
+        "steps[0]", "steps[1]", "steps[2]", "steps[2].iterations[0].steps[0]"
+    ]
+    assert all(trace.elapsed_ms >= 0 for trace in result.traces)
+
+
+def test_try_catch_and_raise():
+    """Failures are caught by matching try_catch blocks and otherwise end the run."""
+    workflow = Workflow(steps=[
+        TryCatchStep(
+            try_steps=[ActionStep(action_name="mw.flaky", output_key="flaky")],
+            catch_block=CatchBlock(on_status_code=["404"], steps=[
+                ScriptStep(code="return 'fallback'", output_key="recovered")
+            ])
+        ),
+    ])
+
+    caught = WorkflowSimulator({"mw.flaky": ActionFailure("404", "Not found")}).run(workflow)
+    assert caught.success and caught.context.step_outputs["recovered"] == "fallback"
+
+    failed = WorkflowSimulator({"mw.flaky": ActionFailure("500", "Server error")}).run(workflow)
+    assert not failed.success and "Server error" in failed.error
+
+
+def test_scripts_are_restricted():
+    """Scripts that break APIthon rules are rejected instead of executed."""
+    for code in ["import os\nreturn os.getcwd()", "return open('x')", "return ().__class__"]:
+        result = simulate_workflow(Workflow(steps=[ScriptStep(code=code, output_key="out")]))
+        assert not result.success, code
+
+
+def test_scripts_cannot_reach_interpreter_internals():
+    """Generator, frame and code attributes are rejected, so scripts cannot climb to the simulator's globals."""
+    escape = ("g = (g.gi_frame.f_back for x in [1])\n"
+              "fr = list(g)[0].f_back\n"
+              "b = fr.f_globals['builtins']\n"
+              "o = b.open\n"
+              "return o('/etc/hostname').read()")
+    for code in [escape, "return '{0.gi_frame}'.format(x)", "return f'{x.gi_code.co_consts}'"]:
+        try:
+            run_apiton_script(code, {"x": 1}, {}, {})
+        except SimulationError as e:
+            assert "interpreter internals" in e.message
+        else:
+            raise AssertionError(f"{code!r} should be rejected")
+    assert any("gi_frame" in error for error in validate_apiton_code_restrictions(escape))
+    assert run_apiton_script("return data.user['f_name']", {}, {"user": {"f_name": "Ann"}}, {}) == "Ann"
+
+
+def test_scripts_are_stopped_at_the_time_limit():
+    """A script that never finishes fails the run once its time limit passes."""
+    workflow = Workflow(steps=[ScriptStep(code="while True:\n    pass", output_key="out")])
+    result = WorkflowSimulator(script_timeout=0.5).run(workflow)
+    assert not result.success and "0.5s time limit" in result.error
+
+    logs = []
+    assert run_apiton_script("print('worker', n)\nreturn n + 1", {"n": 1}, {}, {}, logs) == 2
+    assert logs == ["worker 1"]
+
+
+def test_parallel_latency():
+    """Parallel lanes overlap on the simulated clock, limited by the worker count."""
+    workflow = Workflow(steps=[
+        ActionStep(action_name="mw.lookup", output_key="lookup", user_provided_json_output='{"ids": [1, 2, 3, 4]}'),
+        ParallelStep(branches=[
+            ParallelBranch(steps=[ActionStep(action_name="mw.slow", output_key="slow")]),
+            ParallelBranch(steps=[ActionStep(action_name="mw.fast", output_key="fast"),
+                                  ActionStep(action_name="mw.fast", output_key="fast_again")]),
+        ]),
+        ParallelStep(for_loop=ParallelForLoop(each="id", in_source="data.lookup.ids", output_key="details", steps=[
+            ScriptStep(code="return id * 10", output_key="detail"),
+            ActionStep(action_name="mw.fast", output_key="_"),
+        ])),
+    ])
+    profiles = {"mw.lookup": 100, "mw.slow": LatencyProfile(50), "mw.fast": {"mean_ms": 20}}
+
+    result = WorkflowSimulator(latency_profiles=profiles, max_workers=2).run(workflow)
+    assert result.success
+    assert result.context.step_outputs["details"] == [10, 20, 30, 40]
+    assert result.serial_ms == 100 + 50 + 20 * 2 + 20 * 4
+    # lookup, max(50, 20 + 20), then four 20 ms iterations on two workers
+    assert result.critical_path_ms == 100 + 50 + 40
+
+    serial = WorkflowSimulator(latency_profiles=profiles, max_workers=1).run(workflow)
+    assert serial.critical_path_ms == serial.serial_ms
+
+    failing = WorkflowSimulator({"mw.slow": ActionFailure("500", "Down")}, latency_profiles=profiles).run(workflow)
+    assert not failing.success and failing.error.startswith("steps[1].branches[0].steps[0]")
+
+
+if __name__ == "__main__":
+    test_simulation_runs_to_return()
+    test_try_catch_and_raise()
+    test_scripts_are_restricted()
+    test_scripts_cannot_reach_interpreter_internals()
+    test_scripts_are_stopped_at_the_time_limit()
+    test_parallel_latency()
+    print("All workflow simulator tests passed")
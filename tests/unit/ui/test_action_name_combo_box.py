@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for the action name combo box completion and validation.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from mw_actions_catalog import catalog_index
+from realtime_validation_widgets import ACTION_COMPLETION_LIMIT, ActionNameComboBox
+
+
+def _combo_box():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    return app, ActionNameComboBox()
+
+
+def test_completions_follow_the_typed_text():
+    """Typing refreshes the completer with the catalog index's ranked completions."""
+    app, combo = _combo_box()
+    assert combo.completer().model() is combo._completion_model
+
+    combo.lineEdit().textEdited.emit("get_user_by_emial")
+    expected = catalog_index.complete("get_user_by_emial", ACTION_COMPLETION_LIMIT)
+    assert combo._completion_model.stringList() == expected
+    assert expected[0] == "mw.get_user_by_email"
+
+
+def test_unknown_names_suggest_close_actions():
+    """Validation accepts catalog actions and suggests close matches for typos."""
+    app, combo = _combo_box()
+    assert combo._validate_action_name("mw.get_user_by_email")[0]
+
+    valid, message, suggestions = combo._validate_action_name("mw.get_user_by_emial")
+    assert not valid and message == "Unknown action: mw.get_user_by_emial"
+    assert suggestions[0] == "Did you mean: mw.get_user_by_email"
+
+
+if __name__ == "__main__":
+    test_completions_follow_the_typed_text()
+    test_unknown_names_suggest_close_actions()
+    print("All action name combo box tests passed")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the lazy JSON tree nodes and path index.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from collections import OrderedDict
+
+from core_structures import ActionStep, Workflow
+from data_flow_graph import get_data_flow_graph
+from json_tree_model import (
+    JsonNode, JsonPathIndex, lru_lookup, lru_store, output_unchanged, step_output_cache_key
+)
+
+
+SAMPLE = {
+    "user": {"id": "123", "name": "John"},
+    "tickets": [{"id": "T1", "status": "open"}, {"id": "T2", "status": "closed"}],
+    "count": 2,
+}
+
+
+def test_children_are_fetched_in_batches():
+    """Only the requested rows are materialized when a node is expanded."""
+    root = JsonNode(None, 0, None, False, "data.items", list(range(1000)))
+    assert root.child_count() == 1000
+    assert root.fetched_count() == 0
+
+    assert root.fetch_more(256) == 256
+    assert root.fetched_count() == 256 and root.can_fetch_more()
+    assert root.child(255).path == "data.items[255]"
+    assert root.child(256) is None
+
+    node = root.child_for_key(900)
+    assert node.path == "data.items[900]" and node.value == 900
+    assert root.fetched_count() == 901
+
+
+def test_path_index_matches_tree_order():
+    """Paths are listed root first, in pre-order, with routes back to the data."""
+    index = JsonPathIndex(SAMPLE, "data.step")
+    assert index.paths() == [
+        "data.step",
+        "data.step.user", "data.step.user.id", "data.step.user.name",
+        "data.step.tickets",
+        "data.step.tickets[0]", "data.step.tickets[0].id", "data.step.tickets[0].status",
+        "data.step.tickets[1]", "data.step.tickets[1].id", "data.step.tickets[1].status",
+        "data.step.count",
+    ]
+    assert index.route("data.step.tickets[1].status") == ("tickets", 1, "status")
+    assert index.route("data.step.missing") is None
+
+
+def test_routes_are_resolved_from_the_document():
+    """Routes match the walk for every path, including keys containing separators."""
+    document = dict(SAMPLE, **{"a.b": {"c": 1}, "a": {"x": 2}, "odd[key]": [5]})
+    index = JsonPathIndex(document, "data.step")
+    for path, route, _, _ in index.iter_entries():
+        assert index.route(path) == route, path
+    assert index._paths is None
+    assert index.route("data.step.a.b.c") == ("a.b", "c")
+    assert index.route("data.step.tickets[2]") is None
+    assert index.route("data.step.count.x") is None
+    assert index.route("data.other") is None
+
+
+def test_row_for_key_uses_a_key_map():
+    """Dict rows are looked up by key; unknown keys and list indices out of range give None."""
+    node = JsonNode(None, 0, None, False, "data.big", {f"k{i}": i for i in range(1000)})
+    assert node.row_for_key("k999") == 999
+    assert node.row_for_key("missing") is None
+    assert node.child_for_key("k3").path == "data.big.k3"
+    assert JsonNode(None, 0, None, False, "data.list", [1, 2]).row_for_key(2) is None
+
+
+def test_path_index_search():
+    """Search matches paths, keys and displayed values case-insensitively."""
+    index = JsonPathIndex(SAMPLE, "data.step")
+    assert index.search("STATUS") == ["data.step.tickets[0].status", "data.step.tickets[1].status"]
+    assert index.search("closed") == ["data.step.tickets[1].status"]
+    assert index.search("john") == ["data.step.user.name"]
+
+
+def test_model_cache_hits_and_evicts_least_recently_used():
+    """A hit marks the entry most recently used, so eviction drops the oldest untouched one."""
+    cache = OrderedDict()
+    assert lru_store(cache, "a", 1, max_size=2) == []
+    assert lru_store(cache, "b", 2, max_size=2) == []
+    assert lru_lookup(cache, "a") == 1
+    assert lru_lookup(cache, "missing") is None
+
+    assert lru_store(cache, "c", 3, max_size=2) == [2]
+    assert list(cache) == ["a", "c"]
+    assert lru_store(cache, "a", 4, max_size=1) == [3]
+    assert cache == {"a": 4}
+
+
+def test_unchanged_output_skips_the_rebuild():
+    """Editing a step without touching its output keeps the tree's cache key; output edits change it."""
+    step = ActionStep(action_name="mw.get_user", output_key="user_info", parsed_json_output=SAMPLE)
+    workflow = Workflow(steps=[step])
+
+    def cache_key():
+        info = get_data_flow_graph(workflow, dirty=[0]).steps[0]
+        return step_output_cache_key(info.output_key, info.output_digest)
+
+    shown = cache_key()
+    assert shown is not None and not output_unchanged(None, shown)
+
+    step.description = "Look up the requester"
+    assert output_unchanged(shown, cache_key())
+
+    step.parsed_json_output = {**SAMPLE, "count": 3}
+    assert not output_unchanged(shown, cache_key())
+    assert step_output_cache_key("user_info", None) is None and not output_unchanged(None, None)
+
+
+if __name__ == "__main__":
+    test_children_are_fetched_in_batches()
+    test_path_index_matches_tree_order()
+    test_routes_are_resolved_from_the_document()
+    test_row_for_key_uses_a_key_map()
+    test_path_index_search()
+    test_model_cache_hits_and_evicts_least_recently_used()
+    test_unchanged_output_skips_the_rebuild()
+    print("All JSON tree model tests passed")
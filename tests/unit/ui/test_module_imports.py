@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Import smoke tests for the project modules and the validation widgets.
+"""
+
+import ast
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+# Widget modules that only load when PySide6 is installed
+WIDGET_MODULES = ["dsl_input_widget", "realtime_validation_widgets"]
+
+# Modules the main window imports on first use rather than at startup
+DEFERRED_MAIN_GUI_MODULES = [
+    "help_system", "enhanced_script_editor", "json_tree_model", "data_flow_graph",
+    "tabbed_json_selector", "enhanced_json_selector", "tutorials", "template_library",
+    "contextual_examples", "bender_function_builder", "enhanced_validator",
+]
+
+
+def _module_names(path: Path) -> set:
+    """Names a module defines or imports at any level (None if it resolves names dynamically)."""
+    names = set()
+    for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            if node.name == "__getattr__":
+                return None
+            names.add(node.name)
+        elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            names.add(node.id)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            names.update((alias.asname or alias.name).split(".")[0] for alias in node.names)
+    return names
+
+
+def test_module_level_imports_between_project_modules_resolve():
+    """Every name a module imports at module level from another project module exists there."""
+    modules = {path.stem: path for path in PROJECT_ROOT.glob("*.py")}
+    defined = {}
+    missing = []
+    for name, path in modules.items():
+        for node in ast.parse(path.read_text(encoding="utf-8")).body:
+            if not (isinstance(node, ast.ImportFrom) and node.level == 0 and node.module in modules):
+                continue
+            if node.module not in defined:
+                defined[node.module] = _module_names(modules[node.module])
+            names = defined[node.module]
+            missing.extend(f"{name}:{node.lineno} {node.module}.{alias.name}" for alias in node.names
+                           if names is not None and alias.name != "*" and alias.name not in names)
+    assert missing == []
+
+
+def _module_level_imports(path: Path) -> set:
+    """Top-level module names a module imports at module level."""
+    imported = set()
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Import):
+            imported.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            imported.add(node.module.split(".")[0])
+    return imported
+
+
+def test_main_gui_defers_heavy_modules():
+    """Importing main_gui does not load, even indirectly, the modules it defers to first use."""
+    modules = {path.stem: path for path in PROJECT_ROOT.glob("*.py")}
+    loaded, pending = set(), ["main_gui"]
+    while pending:
+        name = pending.pop()
+        if name in loaded or name not in modules:
+            continue
+        loaded.add(name)
+        pending.extend(_module_level_imports(modules[name]))
+    assert sorted(loaded & set(DEFERRED_MAIN_GUI_MODULES)) == []
+
+
+def test_help_system_still_exports_tooltips():
+    """Tooltips moved to their own module stay importable from help_system."""
+    import help_system
+    import tooltips
+    assert help_system.get_tooltip is tooltips.get_tooltip
+    assert tooltips.get_tooltip("add_action")
+    assert tooltips.get_tooltip("no_such_element") == ""
+
+
+@pytest.mark.parametrize("module_name", WIDGET_MODULES)
+def test_widget_modules_import(module_name):
+    """The DSL input and realtime validation widget modules load."""
+    pytest.importorskip("PySide6.QtWidgets")
+    importlib.import_module(module_name)
+
+
+if __name__ == "__main__":
+    test_module_level_imports_between_project_modules_resolve()
+    test_main_gui_defers_heavy_modules()
+    test_help_system_still_exports_tooltips()
+    for module_name in WIDGET_MODULES:
+        try:
+            test_widget_modules_import(module_name)
+        except pytest.skip.Exception:
+            print(f"Skipped importing {module_name}: PySide6 is not installed")
+    print("All module import tests passed")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for the indexed Moveworks action catalog.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from mw_actions_catalog import ActionCatalogIndex, MWAction, MW_ACTIONS_CATALOG, search_actions
+
+
+def test_search_matches_linear_scan_and_ranks():
+    """Search returns the same actions as a linear scan, best match first."""
+    for query in ["user", "TICKET", "e", "http request", "no_such_action"]:
+        query_lower = query.lower()
+        expected = {
+            action.action_name for action in MW_ACTIONS_CATALOG
+            if query_lower in action.action_name.lower()
+            or query_lower in action.display_name.lower()
+            or query_lower in action.description.lower()
+        }
+        assert {action.action_name for action in search_actions(query)} == expected
+
+    assert search_actions("mw.get_user_by_id")[0].action_name == "mw.get_user_by_id"
+
+
+def test_index_lookup_and_extension():
+    """Name, category, prefix and substring lookups include appended actions."""
+    actions = [
+        MWAction("mw.get_user_by_email", "Get User by Email", "Look up a user", category="User Management"),
+        MWAction("mw.create_ticket", "Create Ticket", "Open a ticket", category="Ticketing"),
+    ]
+    index = ActionCatalogIndex(actions)
+    actions.append(MWAction("acme.get_user_groups", "Get User Groups", "Connector action", category="Connectors"))
+
+    assert index.get("acme.get_user_groups").category == "Connectors"
+    assert "mw.unknown" not in index
+    assert index.categories() == ["Connectors", "Ticketing", "User Management"]
+    assert index.names_with_prefix("MW.") == ["mw.create_ticket", "mw.get_user_by_email"]
+    assert index.names_containing("get_user") == ["mw.get_user_by_email", "acme.get_user_groups"]
+    assert index.names_containing("get_user", limit=1) == ["mw.get_user_by_email"]
+
+
+def test_fuzzy_suggestions_and_completion():
+    """Completion offers prefix matches, then substring matches, then similar names for typos."""
+    index = ActionCatalogIndex(list(MW_ACTIONS_CATALOG))
+    assert index.suggest("mw.get_usr_by_email")[0] == "mw.get_user_by_email"
+    assert index.suggest("mw.creat_tiket") == ["mw.create_ticket"]
+    assert index.suggest("zzzz") == [] and index.suggest("mw") == []
+
+    assert index.complete("MW.GET") == ["mw.get_all_users", "mw.get_user_by_email", "mw.get_user_by_id"]
+    assert index.complete("ticket") == ["mw.create_ticket", "mw.update_ticket"]
+    assert index.complete("get_usr", limit=1) == ["mw.get_user_by_id"]
+    assert len(index.complete("")) == len({action.action_name for action in MW_ACTIONS_CATALOG})
+
+
+if __name__ == "__main__":
+    test_search_matches_linear_scan_and_ranks()
+    test_index_lookup_and_extension()
+    test_fuzzy_suggestions_and_completion()
+    print("✓ All action catalog index tests passed!")
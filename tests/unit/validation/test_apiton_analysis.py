@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared single-parse APIthon analysis.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from apiton_validator import (
+    get_apiton_analysis, validate_apiton_syntax, validate_apiton_code_restrictions,
+    detect_import_statements_comprehensive
+)
+
+
+def test_analysis_is_shared_by_code():
+    """The same code yields the same analysis object."""
+    code = "total = data.order.amount * 2\nreturn total"
+    assert get_apiton_analysis(code) is get_apiton_analysis(code)
+    assert get_apiton_analysis(code) is not get_apiton_analysis(code + "\n")
+
+
+def test_analysis_buckets():
+    """Nodes are collected once for every validator."""
+    analysis = get_apiton_analysis("items = [1, 'a']\nreturn {'count': len(items)}")
+    assert analysis.tree is not None
+    assert [node.value for node in analysis.string_constants] == ['a', 'count']
+    assert [node.value for node in analysis.numeric_constants] == [1]
+    assert len(analysis.list_nodes) == 1
+    assert len(analysis.dict_nodes) == 1
+    assert len(analysis.return_nodes) == 1
+
+
+def test_module_level_return_is_valid_syntax():
+    """Module-level returns are allowed, other syntax errors are still reported."""
+    assert validate_apiton_syntax("x = 1\nreturn x") == []
+    errors = validate_apiton_syntax("return 1\nbreak")
+    assert errors == ["Script syntax error - 'break' outside loop (<apiton_script_wrapped>, line 2)"]
+
+
+def test_restrictions_and_imports():
+    """Import detection reports both pattern and AST findings."""
+    code = "import os\nreturn os.name"
+    errors = validate_apiton_code_restrictions(code)
+    assert "Import statement 'import os' is not allowed in APIthon" in errors
+    assert "OS module operations are not allowed in APIthon" in errors
+
+    violations = detect_import_statements_comprehensive(code)
+    assert [v['type'] for v in violations] == ['simple_import', 'ast_import']
+    assert all(v['line_number'] == 1 for v in violations)
+
+
+if __name__ == "__main__":
+    test_analysis_is_shared_by_code()
+    test_analysis_buckets()
+    test_module_level_return_is_valid_syntax()
+    test_restrictions_and_imports()
+    print("✓ All APIthon analysis tests passed!")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for headless batch validation of workflow files.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from batch_validator import expand_workflow_paths, iter_batch_validation, validate_workflow_file
+
+
+VALID_WORKFLOW = {
+    "steps": [
+        {
+            "type": "action",
+            "action_name": "mw.get_user_by_email",
+            "output_key": "user_info",
+            "description": "Look up the requesting user",
+            "input_args": {"email": "data.input_email"},
+            "user_provided_json_output": '{"user": {"id": "12345"}}'
+        }
+    ]
+}
+
+INVALID_WORKFLOW = {
+    "steps": [
+        {"type": "action", "action_name": "mw.get_user_by_email", "output_key": "user_info"},
+        {"type": "action", "action_name": "mw.get_user_by_email", "output_key": "user_info"}
+    ]
+}
+
+
+def write_workflows(tmp_path):
+    """Write a valid, an invalid and an unreadable workflow file."""
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "valid_action.json").write_text(json.dumps(VALID_WORKFLOW))
+    (tmp_path / "nested" / "duplicate_keys.json").write_text(json.dumps(INVALID_WORKFLOW))
+    (tmp_path / "broken.json").write_text("{not json")
+    (tmp_path / "notes.txt").write_text("ignored")
+
+
+def test_expand_workflow_paths(tmp_path):
+    """Directories and recursive globs expand to workflow files only."""
+    write_workflows(tmp_path)
+    from_dir = expand_workflow_paths([str(tmp_path)])
+    from_glob = expand_workflow_paths([str(tmp_path / "**" / "*.json")])
+    assert from_dir == from_glob
+    assert [Path(path).name for path in from_dir] == ["broken.json", "duplicate_keys.json", "valid_action.json"]
+
+
+def test_validate_workflow_file(tmp_path):
+    """Each file reports its own validation outcome."""
+    write_workflows(tmp_path)
+
+    valid = validate_workflow_file(str(tmp_path / "valid_action.json"))
+    assert valid.load_error is None
+    assert valid.step_count == 1
+    assert valid.errors == []
+
+    invalid = validate_workflow_file(str(tmp_path / "nested" / "duplicate_keys.json"))
+    assert not invalid.valid
+    assert "Step 2: Duplicate output_key 'user_info' found" in invalid.errors
+
+    broken = validate_workflow_file(str(tmp_path / "broken.json"))
+    assert not broken.valid
+    assert broken.load_error.startswith("JSONDecodeError")
+    assert json.loads(broken.to_json_line())["path"] == str(tmp_path / "broken.json")
+
+
+def test_parallel_matches_serial(tmp_path):
+    """Worker processes produce the same results as serial validation."""
+    write_workflows(tmp_path)
+    paths = expand_workflow_paths([str(tmp_path)])
+
+    def key(result):
+        return (result.path, result.valid, result.errors, result.compliance_errors, result.load_error)
+
+    serial = sorted(key(result) for result in iter_batch_validation(paths, workers=1))
+    parallel = sorted(key(result) for result in iter_batch_validation(paths, workers=2))
+    assert serial == parallel
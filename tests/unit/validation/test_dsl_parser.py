@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for the DSL parser and the AST-based DSL validator.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from dsl_parser import (
+    parse_dsl, parse_dsl_expression, DSLSyntaxError, BinaryOp, Call, Literal, MethodCall, Reference,
+    MAX_NESTING_DEPTH
+)
+from dsl_validator import dsl_validator
+
+
+def test_parse_precedence_and_references():
+    """Operators bind with the usual precedence and references keep their full path."""
+    ast = parse_dsl_expression("data.age >= 18 && data.users[0].status == 'active' || not data.blocked")
+    assert isinstance(ast, BinaryOp) and ast.op == '||'
+    assert ast.left.op == '&&'
+    assert ast.left.right.left == Reference('data', ('users', 0, 'status'), 18)
+    assert ast.right.op == '!'
+
+    ast = parse_dsl_expression("data.tags.contains('vip')")
+    assert isinstance(ast, MethodCall) and ast.name == 'contains'
+    assert ast.target.text == "data.tags"
+
+
+def test_parse_bender_calls():
+    """Bender arguments are split on top-level commas only."""
+    ast = parse_dsl_expression('$MAP(data.users, {"label": $CONCAT([item.first, ", ", item.last])})')
+    assert isinstance(ast, Call) and ast.dollar and ast.name == 'MAP'
+    assert len(ast.args) == 2
+    assert ast.args[1].entries[0][1].args[0].items[1] == Literal(", ", 48)
+
+    result = parse_dsl("$CONDITIONAL(data.a == 'x, y', 'yes', 'no')")
+    assert result.ok and result.calls[0].arg_count == 3
+
+
+def test_syntax_errors_and_cache():
+    """Syntax errors carry positions and parse results are cached per expression."""
+    for expression, position in [("data..name", 4), ("'abc", 0), ("data.a &&", 9), ("$MAP data.a", 5)]:
+        try:
+            parse_dsl_expression(expression)
+        except DSLSyntaxError as e:
+            assert e.position == position
+        else:
+            raise AssertionError(f"{expression!r} should not parse")
+
+    assert parse_dsl("data.a == 1") is parse_dsl("data.a == 1")
+
+
+def test_validator_uses_ast():
+    """Validator messages come from the AST rather than from text patterns."""
+    result = dsl_validator.validate_dsl_expression("$CONDITIONAL(data.score > 5, 'a, b', 'c')")
+    assert result.is_valid and result.function_calls == ['$CONDITIONAL']
+    assert not result.warnings
+
+    result = dsl_validator.validate_dsl_expression("CONCAT([data.a, data.b])")
+    assert not result.is_valid
+    assert "DSL function 'CONCAT' should start with '$' (use '$CONCAT')" in result.errors
+
+    result = dsl_validator.validate_dsl_expression("data.status = 'active'")
+    assert result.errors == ["Use '==' for comparison, not '=' at position 12"]
+
+    result = dsl_validator.validate_dsl_expression("$FILTER(data.users)")
+    assert "$FILTER requires at least 2 argument(s), got 1" in result.errors
+
+    result = dsl_validator.validate_dsl_expression("$CONCAT([data.a, data.b]")
+    assert result.errors == ["Unmatched opening parenthesis at position 7"]
+
+    result = dsl_validator.validate_dsl_expression("'data.fake' == meta_info.user.email")
+    assert result.data_references == ['meta_info.user.email']
+
+
+def test_deep_nesting_is_a_syntax_error():
+    """Deeply nested input is rejected with a DSLSyntaxError instead of exhausting the stack."""
+    for expression in ["(" * 400 + "data.a" + ")" * 400, "!" * 5000 + "data.a", "[" * 400 + "1" + "]" * 400]:
+        result = parse_dsl(expression)
+        assert not result.ok and "nested more than" in result.error.message
+        assert dsl_validator.validate_dsl_expression(expression).is_valid is False
+
+    depth = MAX_NESTING_DEPTH - 1
+    assert parse_dsl("(" * depth + "data.a" + ")" * depth).ok
+    assert parse_dsl("!" * depth + "data.a").ok
+
+
+def test_stricter_syntax_keeps_data_references():
+    """Inputs the old regex checks accepted are syntax errors now, but their data paths are still reported."""
+    cases = {
+        "data.x == 'it''s'": ['data.x'],
+        "{{data.x}}": ['data.x'],
+        '"unterminated': [],
+        "data.a @ b": ['data.a'],
+        "data..x": [],
+        "$MAP(data.users, item.id) ==": ['data.users'],
+        "data.tags.contains('x') &&": ['data.tags'],
+    }
+    for expression, references in cases.items():
+        result = dsl_validator.validate_dsl_expression(expression)
+        assert not result.is_valid and result.errors[0].startswith("Syntax error:"), expression
+        assert result.data_references == references, expression
+
+    assert parse_dsl("data.x == 'it\\'s'").ok
+
+
+def test_function_calls_on_a_receiver():
+    """'.$FUNC(args)' calls the function with the receiver as its first argument, and chains."""
+    ast = parse_dsl_expression("item.name.$TITLECASE()")
+    assert isinstance(ast, Call) and ast.name == 'TITLECASE' and ast.dollar and ast.method
+    assert ast.args == (Reference('item', ('name',), 0),)
+
+    ast = parse_dsl_expression("data.text.$REPLACE('a', 'b')")
+    assert ast.name == 'REPLACE' and ast.args[0].text == "data.text"
+    assert [arg.value for arg in ast.args[1:]] == ['a', 'b']
+
+    ast = parse_dsl_expression("data.x.$TRIM().$LOWERCASE() == 'vip'")
+    outer = ast.left
+    assert outer.name == 'LOWERCASE' and outer.args[0].name == 'TRIM'
+    assert outer.args[0].args == (Reference('data', ('x',), 0),)
+    assert [call.name for call in parse_dsl("data.x.$TRIM().$LOWERCASE()").calls] == ['LOWERCASE', 'TRIM']
+
+    result = dsl_validator.validate_dsl_expression("item.name.$TITLECASE()")
+    assert result.is_valid and result.function_calls == ["$TITLECASE"]
+    assert not parse_dsl("data.x.$LOWERCASE").ok
+
+
+if __name__ == "__main__":
+    test_parse_precedence_and_references()
+    test_parse_bender_calls()
+    test_syntax_errors_and_cache()
+    test_validator_uses_ast()
+    test_deep_nesting_is_a_syntax_error()
+    test_stricter_syntax_keeps_data_references()
+    test_function_calls_on_a_receiver()
+    print("All DSL parser tests passed")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental validation engine.
+
+Checks that incremental results match comprehensive_validate and the
+compliance validator exactly, and that unchanged steps are served from cache.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_structures import (
+    ActionStep, ScriptStep, Workflow, DataContext, SwitchStep, SwitchCase,
+    DefaultCase, ForLoopStep, ReturnStep
+)
+from validator import comprehensive_validate
+from compliance_validator import compliance_validator
+from incremental_validator import IncrementalValidator
+
+
+def build_workflow():
+    """Build a workflow mixing valid steps, errors and nested control flow."""
+    return Workflow(steps=[
+        ActionStep(
+            action_name="mw.get_user_by_email",
+            output_key="user_info",
+            input_args={"email": "data.input_email"},
+            user_provided_json_output='{"user": {"id": "12345", "name": "John Doe"}}'
+        ),
+        ScriptStep(
+            code="return {'processed': True}",
+            output_key="result",
+            input_args={"user_id": "data.user_info.user.id", "missing": "data.user_info.user.phone"},
+            user_provided_json_output='{"processed": true}'
+        ),
+        SwitchStep(
+            output_key="route",
+            cases=[SwitchCase(
+                condition="data.result.processed == True",
+                steps=[ActionStep(action_name="mw.send_notification", output_key="notified")]
+            )],
+            default_case=DefaultCase(steps=[ActionStep(action_name="mw.log", output_key="logged")])
+        ),
+        ForLoopStep(
+            each="item", index="idx", in_source="data.user_info.items",
+            output_key="loop_results",
+            steps=[ActionStep(action_name="mw.process_item", output_key="item_result")]
+        ),
+        ActionStep(action_name="mw.get_user_by_email", output_key="user_info"),
+        ReturnStep(output_mapper={"name": "data.user_info.user.name"}),
+    ])
+
+
+def test_matches_comprehensive_validate():
+    """Incremental validation reproduces comprehensive_validate exactly."""
+    workflow = build_workflow()
+    context = DataContext({"input_email": "test@example.com"})
+    validator = IncrementalValidator()
+
+    expected = comprehensive_validate(workflow, context)
+    assert validator.validate(workflow, context) == expected
+    assert validator.last_stats.revalidated_steps == len(workflow.steps)
+
+    # Second pass with nothing changed is served entirely from cache
+    assert validator.validate(workflow, context, dirty=[]) == expected
+    assert validator.last_stats.revalidated_steps == 0
+    assert validator.last_stats.cache_misses == 0
+
+
+def test_edit_revalidates_dependents_only():
+    """Editing a step's output re-validates only steps that read it."""
+    workflow = build_workflow()
+    validator = IncrementalValidator()
+    validator.validate(workflow)
+
+    first = workflow.steps[0]
+    first.user_provided_json_output = '{"user": {"id": "1", "name": "A", "phone": "555"}, "items": []}'
+    first.parsed_json_output = {"user": {"id": "1", "name": "A", "phone": "555"}, "items": []}
+
+    errors = validator.validate(workflow, dirty=[0])
+    assert errors == comprehensive_validate(workflow)
+    # Step 1 changed; steps 2, 4 and 6 read data.user_info; step 3 and 5 are reused
+    assert validator.last_stats.revalidated_steps == 4
+
+
+def test_compliance_matches_full_validation():
+    """Incremental compliance results match validate_workflow_compliance."""
+    workflow = build_workflow()
+    validator = IncrementalValidator()
+
+    expected = compliance_validator.validate_workflow_compliance(workflow, "test_action")
+    result = validator.validate_compliance(workflow, "test_action")
+    assert result.errors == expected.errors
+    assert result.warnings == expected.warnings
+    assert result.suggestions == expected.suggestions
+    assert result.is_valid == expected.is_valid
+
+    validator.validate_compliance(workflow, "test_action", dirty=[])
+    assert validator.last_stats.revalidated_steps == 0
+
+
+def test_compliance_cache_survives_inserted_steps():
+    """Inserting a step only validates the new step; later steps are renumbered from cache."""
+    workflow = build_workflow()
+    validator = IncrementalValidator()
+    validator.validate_compliance(workflow, "test_action")
+
+    workflow.steps.insert(0, ActionStep(action_name="mw.lookup", output_key="BadKey"))
+    result = validator.validate_compliance(workflow, "test_action", dirty=[])
+    assert validator.last_stats.revalidated_steps == 1
+
+    expected = compliance_validator.validate_workflow_compliance(workflow, "test_action")
+    assert result.errors == expected.errors
+    assert result.field_naming_errors == expected.field_naming_errors
+    assert result.mandatory_field_errors == expected.mandatory_field_errors
+    assert any(error.startswith("Step 1 ") for error in result.field_naming_errors)
+
+
+if __name__ == "__main__":
+    test_matches_comprehensive_validate()
+    test_edit_revalidates_dependents_only()
+    test_compliance_matches_full_validation()
+    test_compliance_cache_survives_inserted_steps()
+    print("✓ All incremental validation tests passed!")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared DSL expression classifier.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from dsl_classifier import is_dsl_expression
+from core_structures import Workflow, ActionStep
+from yaml_generator import generate_yaml_string
+
+
+def test_dsl_detection():
+    """DSL references, operators and functions are detected; plain text is not."""
+    for value in ["data.user.email", "meta_info.user.email_addr", "data.count > 5",
+                  "$CONCAT([data.a, data.b])", "$IF (x)", "items.length", "flag = true"]:
+        assert is_dsl_expression(value), value
+
+    for value in ["", "plain text", "metadata.value", "true", "$lower(x)", None, 42]:
+        assert not is_dsl_expression(value), value
+
+
+def test_generator_quotes_dsl_scalars():
+    """Generated YAML double-quotes DSL values and leaves plain values alone."""
+    workflow = Workflow(steps=[ActionStep(
+        action_name="mw.get_user_by_email", output_key="user_info",
+        input_args={"email": "data.input_email", "note": "plain"}
+    )])
+    yaml_text = generate_yaml_string(workflow, "lookup_user")
+
+    assert 'email: "data.input_email"' in yaml_text
+    assert "note: plain" in yaml_text
+
+
+if __name__ == "__main__":
+    test_dsl_detection()
+    test_generator_quotes_dsl_scalars()
+    print("✓ All DSL classifier tests passed!")
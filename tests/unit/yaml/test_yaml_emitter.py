@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the workflow YAML Dumper and concurrent generation.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_structures import Workflow, ActionStep, ScriptStep
+from yaml_generator import generate_yaml_string, generate_yaml_many
+
+
+def build_workflow(index):
+    """Build a small workflow with a DSL argument and a multiline script."""
+    return Workflow(steps=[
+        ActionStep(action_name="mw.get_user_by_email", output_key=f"user_{index}",
+                   input_args={"email": "data.input_email"}),
+        ScriptStep(code=f"value = {index}\nreturn value", output_key=f"result_{index}"),
+    ])
+
+
+def test_global_representers_untouched():
+    """Generating YAML leaves PyYAML's global Dumper alone."""
+    before = yaml.Dumper.yaml_representers.get(str)
+    yaml_text = generate_yaml_string(build_workflow(0), "demo")
+
+    assert yaml.Dumper.yaml_representers.get(str) is before
+    assert yaml.dump("data.x") == "data.x\n...\n"
+    assert 'email: "data.input_email"' in yaml_text
+    assert "code: |-\n" in yaml_text
+
+
+def test_generate_yaml_many_matches_sequential():
+    """Concurrent generation returns the same YAML, in order."""
+    workflows = [build_workflow(i) for i in range(40)]
+    names = [f"action_{i}" for i in range(40)]
+
+    results = generate_yaml_many(workflows, names, workers=8)
+
+    assert results == [generate_yaml_string(w, n) for w, n in zip(workflows, names)]
+
+    invalid = Workflow(steps=[ActionStep(action_name="", output_key="")])
+    mixed = generate_yaml_many([invalid, workflows[0]], workers=2, return_exceptions=True)
+    assert isinstance(mixed[0], ValueError)
+    assert isinstance(mixed[1], str)
+
+
+def test_emit_only_gates_on_mandatory_fields():
+    """emit_only and precomputed results gate generation like full validation."""
+    from compliance_validator import ComplianceValidationResult
+
+    workflow = build_workflow(1)
+    assert generate_yaml_string(workflow, "demo", emit_only=True) == generate_yaml_string(workflow, "demo")
+
+    missing = Workflow(steps=[ActionStep(action_name="mw.get_user_by_email", output_key="")])
+    with pytest.raises(ValueError, match="output_key"):
+        generate_yaml_string(missing, "demo", emit_only=True)
+
+    precomputed = ComplianceValidationResult()
+    precomputed.mandatory_field_errors.append("Compound action must have a non-empty action_name")
+    with pytest.raises(ValueError, match="action_name"):
+        generate_yaml_string(workflow, "demo", validation_result=precomputed)
+
+
+if __name__ == "__main__":
+    test_global_representers_untouched()
+    test_generate_yaml_many_matches_sequential()
+    test_emit_only_gates_on_mandatory_fields()
+    print("✓ All YAML emitter tests passed!")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for parsing compound action YAML back into workflows.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_structures import (
+    Workflow, ActionStep, ScriptStep, SwitchStep, SwitchCase, DefaultCase,
+    ForLoopStep, ParallelStep, ParallelBranch, ParallelForLoop, ReturnStep,
+    RaiseStep, TryCatchStep, CatchBlock
+)
+from yaml_generator import generate_yaml_string, workflow_to_yaml_dict
+import yaml_parser
+from yaml_parser import parse_compound_action_yaml, iter_compound_actions, WorkflowYAMLError
+
+
+def build_workflow():
+    """Build a workflow that uses every step type."""
+    return Workflow(steps=[
+        ActionStep(action_name="mw.get_user_by_email", output_key="user_info",
+                   input_args={"email": "data.input_email"}, description="Look up user",
+                   delay_config={"delay_seconds": 5}),
+        ScriptStep(code="name = data.user_info.user.name\nreturn name", output_key="user_name",
+                   input_args={"user": "data.user_info.user"}),
+        SwitchStep(
+            cases=[SwitchCase(condition="data.user_info.active == true",
+                              steps=[ActionStep(action_name="mw.notify", output_key="notified")])],
+            default_case=DefaultCase(steps=[RaiseStep(output_key="inactive_error", message="Inactive")]),
+            output_key="routing"
+        ),
+        ForLoopStep(each="item", index="idx", in_source="data.user_info.items", output_key="items_out",
+                    steps=[ScriptStep(code="return item", output_key="item_out")]),
+        ParallelStep(branches=[ParallelBranch(name="lookup",
+                                              steps=[ActionStep(action_name="mw.lookup", output_key="lookup_out")])]),
+        ParallelStep(for_loop=ParallelForLoop(each="ticket", index_key="i", in_source="data.tickets",
+                                              output_key="ticket_results",
+                                              steps=[ActionStep(action_name="mw.close", output_key="closed")])),
+        TryCatchStep(try_steps=[ActionStep(action_name="mw.risky", output_key="risky_out")],
+                     catch_block=CatchBlock(on_status_code=[400, 500],
+                                            steps=[RaiseStep(output_key="risky_error", message="Failed")])),
+        ReturnStep(output_mapper={"user_name": "data.user_name"}),
+    ])
+
+
+def test_round_trip_all_step_types():
+    """Generated YAML parses back into an equivalent workflow."""
+    workflow = build_workflow()
+    yaml_text = generate_yaml_string(workflow, "lookup_user")
+
+    parsed = parse_compound_action_yaml(yaml_text)
+
+    assert parsed.action_name == "lookup_user"
+    assert parsed.warnings == []
+    assert [type(step) for step in parsed.workflow.steps] == [type(step) for step in workflow.steps]
+    assert workflow_to_yaml_dict(parsed.workflow, parsed.action_name) == workflow_to_yaml_dict(workflow, "lookup_user")
+
+
+def test_source_locations():
+    """Objects and fields keep their line and column."""
+    yaml_text = (
+        "action_name: demo\n"
+        "steps:\n"
+        "  - action:\n"
+        "      action_name: mw.get_user_by_email\n"
+        "      output_key: user_info\n"
+    )
+    parsed = parse_compound_action_yaml(yaml_text)
+    step = parsed.workflow.steps[0]
+
+    location = parsed.source_map.get(step, "output_key")
+    assert (location.line, location.column) == (5, 19)
+    assert location.path == "steps[0].action.output_key"
+    assert parsed.source_map.get(step).line == 4
+
+
+def test_multiple_documents_and_errors():
+    """Streams yield one compound action per document; bad steps report their location."""
+    documents = "steps:\n  - return: {}\n---\nsteps:\n  - raise:\n      output_key: err\n"
+    parsed = list(iter_compound_actions(documents))
+    assert [type(p.workflow.steps[0]) for p in parsed] == [ReturnStep, RaiseStep]
+
+    with pytest.raises(WorkflowYAMLError) as excinfo:
+        parse_compound_action_yaml("steps:\n  - unknown_step:\n      output_key: x\n")
+    assert excinfo.value.location.line == 2
+
+
+def test_constructed_objects_do_not_accumulate_across_documents():
+    """The loader forgets each document's constructed objects before the next one is read."""
+    loaders = []
+
+    class RecordingLoader(yaml_parser.SafeLoader):
+        def __init__(self, stream):
+            super().__init__(stream)
+            loaders.append(self)
+
+    document = generate_yaml_string(build_workflow(), "compound_action")
+    stream = "---\n".join([document] * 5)
+    original = yaml_parser.SafeLoader
+    yaml_parser.SafeLoader = RecordingLoader
+    try:
+        sizes = [len(loaders[0].constructed_objects) + len(loaders[0].recursive_objects)
+                 for _ in iter_compound_actions(stream)]
+    finally:
+        yaml_parser.SafeLoader = original
+    assert sizes == [0] * 5
+
+
+if __name__ == "__main__":
+    test_round_trip_all_step_types()
+    test_source_locations()
+    test_multiple_documents_and_errors()
+    test_constructed_objects_do_not_accumulate_across_documents()
+    print("✓ All YAML parser tests passed!")
@@ -0,0 +1,44 @@
+"""
+Tooltip text for the main window's controls.
+
+Kept apart from help_system so that the main window can label its controls
+at startup without loading the help topics.
+"""
+
+from typing import Dict
+
+
+# Enhanced tooltip content for UI elements
+TOOLTIPS: Dict[str, str] = {
+    "compound_action_name": "Unique identifier for your entire workflow (required for Moveworks compliance). Use descriptive names like 'user_onboarding_workflow' or 'ticket_escalation_process'. This becomes the top-level 'action_name' field in your YAML.",
+    "action_name": "The name of the action to execute (e.g., 'mw.get_user_by_email')",
+    "output_key": "Unique identifier for storing this step's output (used in data.output_key references)",
+    "description": "Optional human-readable description of what this step does",
+    "input_args": "Key-value pairs passed as arguments to the action or script. Use DSL expressions like 'data.field_name' or 'meta_info.user.email' for dynamic values.",
+    "input_args_dsl": "Enter a Moveworks DSL expression or data path (e.g., 'data.user_info.email', '$CONCAT([data.first, data.last])', 'meta_info.user.name'). DSL expressions will be automatically quoted in the YAML output.",
+    "switch_condition_dsl": "Enter the DSL expression for the switch condition (e.g., 'data.user.status == \"active\"', 'data.age >= 18'). This determines which case will be executed.",
+    "output_mapper_dsl": "Enter a DSL expression to transform the output (e.g., 'data.result.value', '$CONCAT([data.prefix, data.value])'). This maps the step output to the desired format.",
+    "for_loop_iterator_dsl": "Enter a DSL expression that evaluates to an array for iteration (e.g., 'data.items', 'data.user_list'). Each element will be available as 'data.item' in the loop body.",
+    "json_output": "Example JSON that this step will produce when executed",
+    "script_code": "APIthon (Python-like) code that processes data and returns a result",
+    "parse_json": "Validate and save the JSON output for use in variable mapping",
+    "add_action": "Add a new action step that calls a Moveworks action or external API",
+    "add_script": "Add a new script step that executes APIthon code",
+    "add_builtin": "Add a pre-configured Moveworks built-in action with example output",
+    "json_browser": "Browse JSON structure from previous steps to select data paths",
+    "yaml_preview": "Live preview of the generated YAML with Moveworks compliance validation",
+    "validation_status": "Shows validation results including Moveworks compliance - hover for error details",
+    "step_list": "List of workflow steps - click to select and configure",
+    "move_up": "Move the selected step up in the execution order",
+    "move_down": "Move the selected step down in the execution order",
+    "remove_step": "Remove the selected step from the workflow",
+    "save_workflow": "Save the current workflow to a JSON file",
+    "load_workflow": "Load a workflow from a JSON file",
+    "export_yaml": "Export the workflow as Moveworks-compliant YAML with compound action structure",
+    "validate": "Run comprehensive validation including Moveworks compliance checks"
+}
+
+
+def get_tooltip(element_id: str) -> str:
+    """Get tooltip text for a UI element."""
+    return TOOLTIPS.get(element_id, "")
@@ -7,12 +7,14 @@ structured and comply with Moveworks requirements.
 Based on Sections 8.1, 8.2, and 11.1 of the Source of Truth Document.
 """
 
+import re
 from typing import List, Set, Union, Dict
 from core_structures import (
-    Workflow, ActionStep, ScriptStep, DataContext, SwitchStep, ForLoopStep,
+    Workflow, ActionStep, ScriptStep, DataContext, DataContextTimeline, SwitchStep, ForLoopStep,
     ParallelStep, ReturnStep, SwitchCase, DefaultCase, ParallelBranch,
     RaiseStep, TryCatchStep, CatchBlock
 )
+from dsl_parser import parse_dsl
 
 
 def validate_step(step, existing_output_keys: Set[str]) -> List[str]:
@@ -225,25 +227,42 @@ def _infer_workflow_inputs(workflow: Workflow) -> Dict[str, str]:
     Returns:
         Dictionary of inferred input variables with placeholder values
     """
+    # Scanned directly rather than through the data-flow graph, which would
+    # re-fingerprint every step just to answer this one pass
+    step_output_keys = {
+        step.output_key for step in workflow.steps
+        if getattr(step, 'output_key', None) and step.output_key != '_'
+    }
+
+    # Anything that is not a step output is likely a workflow input; use a
+    # placeholder value for validation, in order of first reference
     inferred_inputs = {}
-    step_output_keys = set()
-
-    # First pass: collect all step output keys
     for step in workflow.steps:
-        if hasattr(step, 'output_key') and step.output_key and step.output_key != '_':
-            step_output_keys.add(step.output_key)
+        if getattr(step, 'input_args', None):
+            for var in collect_input_arg_references(step.input_args):
+                if var not in step_output_keys and var not in inferred_inputs:
+                    inferred_inputs[var] = f"<inferred_input_{var}>"
+    return inferred_inputs
+
+
+def collect_input_arg_references(obj) -> List[str]:
+    """
+    Recursively extract the top-level variable names of data.* references.
+
+    Args:
+        obj: An input_args structure (dict, list or scalar)
+
+    Returns:
+        List of top-level variable names in the order they are referenced
+    """
+    found = []
 
     def extract_data_references(obj):
         """Recursively extract data references from nested structures."""
         if isinstance(obj, str) and obj.startswith('data.'):
             # Extract the top-level variable name
             data_path = obj[5:]  # Remove 'data.' prefix
-            top_level_var = data_path.split('.')[0]
-
-            # If it's not a step output, it's likely a workflow input
-            if top_level_var not in step_output_keys:
-                # Use a placeholder value for validation
-                inferred_inputs[top_level_var] = f"<inferred_input_{top_level_var}>"
+            found.append(data_path.split('.')[0])
         elif isinstance(obj, dict):
             for value in obj.values():
                 extract_data_references(value)
@@ -251,12 +270,8 @@ def _infer_workflow_inputs(workflow: Workflow) -> Dict[str, str]:
             for item in obj:
                 extract_data_references(item)
 
-    # Second pass: extract data references from all steps
-    for step in workflow.steps:
-        if hasattr(step, 'input_args') and step.input_args:
-            extract_data_references(step.input_args)
-
-    return inferred_inputs
+    extract_data_references(obj)
+    return found
 
 
 def validate_data_references(workflow: Workflow, initial_data_context: DataContext = None) -> List[str]:
@@ -276,7 +291,6 @@ def validate_data_references(workflow: Workflow, initial_data_context: DataConte
     """
     errors = []
 
-    # Create a running data context to track available data as we process steps
     # Start with any provided initial inputs
     initial_inputs = initial_data_context.initial_inputs if initial_data_context else {}
 
@@ -286,9 +300,31 @@ def validate_data_references(workflow: Workflow, initial_data_context: DataConte
     # Combine explicit and inferred inputs
     combined_inputs = {**initial_inputs, **inferred_inputs}
 
-    running_context = DataContext(initial_inputs=combined_inputs)
+    # Snapshot of the data available before each step
+    timeline = DataContextTimeline(workflow, DataContext(initial_inputs=combined_inputs))
+
+    for i, step in enumerate(workflow.steps):
+        # Validate this step's data references
+        errors.extend(validate_step_data_references(step, i + 1, timeline.before(i)))
+
+    return errors
+
+
+def validate_step_data_references(step, step_num: int, running_context: DataContext) -> List[str]:
+    """
+    Validate the data references of a single step (including nested steps).
+
+    Args:
+        step: The step to validate
+        step_num: 1-based position of the top-level step, used in error messages
+        running_context: DataContext holding the data available before this step
 
-    def validate_data_reference(value: str, context_description: str, step_num: int) -> None:
+    Returns:
+        List of data reference error messages
+    """
+    errors = []
+
+    def validate_data_reference(value: str, context_description: str) -> None:
         """Helper function to validate a single data reference."""
         if isinstance(value, str) and value.startswith('data.'):
             # Extract the data path (remove 'data.' prefix)
@@ -304,7 +340,7 @@ def validate_data_references(workflow: Workflow, initial_data_context: DataConte
                     f"unavailable data path 'data.{data_path}'"
                 )
 
-    def validate_step_data_references(step, step_num: int) -> None:
+    def validate_nested(step) -> None:
         """Recursively validate data references in a step and its nested steps."""
 
         # Check input_args for data references
@@ -312,7 +348,7 @@ def validate_data_references(workflow: Workflow, initial_data_context: DataConte
             # Only validate if input_args is a dictionary
             if isinstance(step.input_args, dict):
                 for arg_name, arg_value in step.input_args.items():
-                    validate_data_reference(arg_value, f"input_args['{arg_name}']", step_num)
+                    validate_data_reference(arg_value, f"input_args['{arg_name}']")
 
         # Check specific step type fields
         if isinstance(step, SwitchStep):
@@ -321,11 +357,15 @@ def validate_data_references(workflow: Workflow, initial_data_context: DataConte
                 # For switch conditions, we need to extract data references more carefully
                 condition = case.condition
                 if condition and 'data.' in condition:
-                    # Extract data references from condition expressions
-                    import re
-                    data_refs = re.findall(r'data\.[\w.]+', condition)
-                    for data_ref in data_refs:
-                        data_path = data_ref[5:]  # Remove 'data.' prefix
+                    # Extract data references from the parsed condition; string
+                    # literals and method calls such as .contains() are not paths
+                    parsed = parse_dsl(condition.strip())
+                    if parsed.ok:
+                        data_refs = [(ref.text, ref.dotted_path[5:]) for ref in parsed.references
+                                     if ref.root == 'data' and ref.path]
+                    else:
+                        data_refs = [(ref, ref[5:]) for ref in re.findall(r'data\.[\w.]+', condition)]
+                    for data_ref, data_path in data_refs:
                         if not running_context.is_path_available(data_path):
                             errors.append(
                                 f"Step {step_num}: switch case {i+1} condition references "
@@ -333,53 +373,43 @@ def validate_data_references(workflow: Workflow, initial_data_context: DataConte
                             )
                 # Recursively validate nested steps
                 for nested_step in case.steps:
-                    validate_step_data_references(nested_step, step_num)
+                    validate_nested(nested_step)
 
             # Validate default case
             if step.default_case:
                 for nested_step in step.default_case.steps:
-                    validate_step_data_references(nested_step, step_num)
+                    validate_nested(nested_step)
 
         elif isinstance(step, ForLoopStep):
             # Validate in_source for for loops
-            validate_data_reference(step.in_source, "for loop 'in' source", step_num)
+            validate_data_reference(step.in_source, "for loop 'in' source")
             # Recursively validate nested steps
             for nested_step in step.steps:
-                validate_step_data_references(nested_step, step_num)
+                validate_nested(nested_step)
 
         elif isinstance(step, ParallelStep):
             # Recursively validate nested steps in parallel branches
             for i, branch in enumerate(step.branches):
                 for nested_step in branch.steps:
-                    validate_step_data_references(nested_step, step_num)
+                    validate_nested(nested_step)
 
         elif isinstance(step, ReturnStep):
             # Validate output_mapper values
             if isinstance(step.output_mapper, dict):
                 for key, value in step.output_mapper.items():
-                    validate_data_reference(value, f"return output_mapper['{key}']", step_num)
+                    validate_data_reference(value, f"return output_mapper['{key}']")
 
         elif isinstance(step, TryCatchStep):
             # Validate try steps
             for nested_step in step.try_steps:
-                validate_step_data_references(nested_step, step_num)
+                validate_nested(nested_step)
 
             # Validate catch steps
             if step.catch_block:
                 for nested_step in step.catch_block.steps:
-                    validate_step_data_references(nested_step, step_num)
-
-    for i, step in enumerate(workflow.steps):
-        step_num = i + 1
-
-        # Validate this step's data references
-        validate_step_data_references(step, step_num)
-
-        # Add this step's output to the running context for future steps
-        if hasattr(step, 'output_key') and step.output_key and step.output_key != '_':
-            if hasattr(step, 'parsed_json_output') and step.parsed_json_output is not None:
-                running_context.add_step_output(step.output_key, step.parsed_json_output)
+                    validate_nested(nested_step)
 
+    validate_nested(step)
     return errors
 
 
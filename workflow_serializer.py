@@ -0,0 +1,292 @@
+"""
+Workflow Serialization for the Moveworks YAML Assistant.
+
+This module saves and loads workflows in the assistant's JSON workflow file
+format. Every step type in core_structures is covered, including nested
+control-flow steps, and files carry a schema version so older files keep
+loading as the format evolves.
+
+Two layouts are written:
+- Standard: one object per step with full field names (version 1 files,
+  which only contained action and script steps, use the same layout)
+- Compact: default-valued fields are omitted and field names are interned
+  through a key table stored in the file header
+
+Sample outputs (user_provided_json_output) are kept as raw strings and only
+parsed when a step's parsed_json_output is first accessed.
+"""
+
+import json
+from dataclasses import MISSING, fields
+from typing import Any, Dict, List, Optional, Tuple
+
+from core_structures import (
+    Workflow, ActionStep, ScriptStep, SwitchStep, SwitchCase, DefaultCase,
+    ForLoopStep, ParallelStep, ParallelBranch, ParallelForLoop, ReturnStep,
+    RaiseStep, TryCatchStep, CatchBlock
+)
+
+
+# Current schema version; files without a version are version 1
+SCHEMA_VERSION = 2
+
+# Indentation of workflow files saved in the standard layout
+SAVE_INDENT = 2
+
+# Step type tags, matching the compound action YAML keys
+STEP_TYPE_TAGS = {
+    ActionStep: 'action',
+    ScriptStep: 'script',
+    SwitchStep: 'switch',
+    ForLoopStep: 'for',
+    ParallelStep: 'parallel',
+    ReturnStep: 'return',
+    RaiseStep: 'raise',
+    TryCatchStep: 'try_catch',
+}
+STEP_TYPES_BY_TAG = {tag: cls for cls, tag in STEP_TYPE_TAGS.items()}
+
+# Fields holding nested objects: (class, field) -> (nested class, is_list)
+NESTED_FIELDS = {
+    (SwitchStep, 'cases'): (SwitchCase, True),
+    (SwitchStep, 'default_case'): (DefaultCase, False),
+    (ParallelStep, 'branches'): (ParallelBranch, True),
+    (ParallelStep, 'for_loop'): (ParallelForLoop, False),
+    (TryCatchStep, 'catch_block'): (CatchBlock, False),
+}
+
+# Fields holding lists of steps
+STEP_LIST_FIELDS = frozenset({'steps', 'try_steps'})
+
+# Derived fields that are rebuilt on load instead of being stored
+DERIVED_FIELDS = frozenset({'parsed_json_output'})
+
+# Field kinds used by the precomputed specs
+_VALUE, _STEPS, _NESTED = 0, 1, 2
+
+
+def _build_spec(cls) -> Tuple[Tuple[str, Any, int, Any], ...]:
+    """Precompute (name, default, kind, nested_info) for each stored field of a dataclass."""
+    spec = []
+    for f in fields(cls):
+        if f.name in DERIVED_FIELDS:
+            continue
+        if f.default is not MISSING:
+            default = f.default
+        elif f.default_factory is not MISSING:
+            default = f.default_factory()
+        else:
+            default = MISSING
+
+        if f.name in STEP_LIST_FIELDS:
+            spec.append((f.name, default, _STEPS, None))
+        elif (cls, f.name) in NESTED_FIELDS:
+            spec.append((f.name, default, _NESTED, NESTED_FIELDS[(cls, f.name)]))
+        else:
+            spec.append((f.name, default, _VALUE, None))
+    return tuple(spec)
+
+
+_SPECS = {
+    cls: _build_spec(cls)
+    for cls in list(STEP_TYPE_TAGS) + [SwitchCase, DefaultCase, ParallelBranch, ParallelForLoop, CatchBlock]
+}
+
+# Interned key table for compact files; it is written into each file, so readers
+# never depend on this ordering
+COMPACT_KEYS: Tuple[str, ...] = tuple(dict.fromkeys(
+    ['type'] + [name for spec in _SPECS.values() for name, _, _, _ in spec]
+))
+
+
+class _Encoder:
+    """Converts workflow objects to JSON-compatible data."""
+
+    def __init__(self, compact: bool):
+        self.compact = compact
+        self.keys = {name: str(index) for index, name in enumerate(COMPACT_KEYS)} if compact else None
+
+    def key(self, name: str) -> str:
+        return self.keys[name] if self.compact else name
+
+    def step(self, step: Any) -> Dict[str, Any]:
+        tag = STEP_TYPE_TAGS.get(type(step))
+        if tag is None:
+            raise ValueError(f"Unsupported step type '{type(step).__name__}'")
+        data = {self.key('type'): tag}
+        self.fields(step, data)
+        return data
+
+    def steps(self, steps: Optional[List[Any]]) -> List[Dict[str, Any]]:
+        return [self.step(step) for step in steps or []]
+
+    def fields(self, obj: Any, data: Dict[str, Any]) -> Dict[str, Any]:
+        for name, default, kind, nested in _SPECS[type(obj)]:
+            value = getattr(obj, name)
+            if self.compact and default is not MISSING and value == default:
+                continue
+
+            if kind == _STEPS:
+                value = self.steps(value)
+            elif kind == _NESTED and value is not None:
+                if nested[1]:
+                    value = [self.fields(item, {}) for item in value]
+                else:
+                    value = self.fields(value, {})
+            data[self.key(name)] = value
+        return data
+
+
+class _Decoder:
+    """Builds workflow objects from JSON-compatible data."""
+
+    def __init__(self, keys: Optional[List[str]] = None):
+        self.keys = {str(index): name for index, name in enumerate(keys)} if keys else None
+
+    def translate(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if self.keys is None:
+            return data
+        return {self.keys.get(key, key): value for key, value in data.items()}
+
+    def step(self, data: Dict[str, Any]) -> Any:
+        if not isinstance(data, dict):
+            raise ValueError(f"Step must be a mapping, got {type(data).__name__}")
+        data = self.translate(data)
+        step_type = data.get('type')
+        cls = STEP_TYPES_BY_TAG.get(step_type)
+        if cls is None:
+            raise ValueError(f"Unsupported step type '{step_type}'")
+        return self.build(cls, data)
+
+    def steps(self, items: Optional[List[Any]]) -> List[Any]:
+        return [self.step(item) for item in items or []]
+
+    def build(self, cls, data: Dict[str, Any]) -> Any:
+        kwargs = {}
+        for name, default, kind, nested in _SPECS[cls]:
+            if name not in data:
+                if default is MISSING:
+                    raise ValueError(f"{cls.__name__} is missing required field '{name}'")
+                continue
+
+            value = data[name]
+            if kind == _STEPS:
+                value = self.steps(value)
+            elif kind == _NESTED and value is not None:
+                nested_cls, is_list = nested
+                if is_list:
+                    value = [self.build(nested_cls, self.translate(item)) for item in value]
+                else:
+                    value = self.build(nested_cls, self.translate(value))
+            kwargs[name] = value
+        return cls(**kwargs)
+
+
+def workflow_to_dict(workflow: Workflow, compact: bool = False) -> Dict[str, Any]:
+    """
+    Convert a workflow to the versioned workflow file structure.
+
+    Args:
+        workflow: The workflow to convert
+        compact: Omit default-valued fields and intern field names
+
+    Returns:
+        JSON-serializable dictionary
+    """
+    encoder = _Encoder(compact)
+    data = {"schema_version": SCHEMA_VERSION}
+    if compact:
+        data["keys"] = list(COMPACT_KEYS)
+    data["steps"] = encoder.steps(workflow.steps)
+    return data
+
+
+def workflow_from_dict(data: Dict[str, Any]) -> Workflow:
+    """
+    Build a workflow from a workflow file structure of any supported version.
+
+    Args:
+        data: Parsed workflow file contents
+
+    Returns:
+        The loaded Workflow
+
+    Raises:
+        ValueError: If the data is not a workflow or uses a newer schema
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Workflow file must contain a mapping with a 'steps' list")
+
+    version = data.get("schema_version", 1)
+    if not isinstance(version, int) or version > SCHEMA_VERSION:
+        raise ValueError(
+            f"Workflow file uses schema version {version}, "
+            f"but this version of the assistant supports up to {SCHEMA_VERSION}"
+        )
+
+    decoder = _Decoder(data.get("keys"))
+    return Workflow(steps=decoder.steps(data.get("steps", [])))
+
+
+def dumps_workflow(workflow: Workflow, compact: bool = False, indent: Optional[int] = None) -> str:
+    """
+    Serialize a workflow to a JSON string.
+
+    Args:
+        workflow: The workflow to serialize
+        compact: Omit default-valued fields and intern field names
+        indent: Optional indentation for human-readable output; indented
+            output is noticeably slower for large sample outputs
+
+    Returns:
+        JSON string
+    """
+    separators = (',', ':') if compact else None
+    return json.dumps(workflow_to_dict(workflow, compact), indent=indent,
+                      separators=separators)
+
+
+def loads_workflow(text: str) -> Workflow:
+    """
+    Deserialize a workflow from a JSON string.
+
+    Args:
+        text: JSON workflow file contents
+
+    Returns:
+        The loaded Workflow
+    """
+    return workflow_from_dict(json.loads(text))
+
+
+def save_workflow(workflow: Workflow, path: str, compact: bool = False) -> None:
+    """
+    Save a workflow to a JSON file.
+
+    The document is encoded in one pass and written with a single call, so
+    saving is bound by I/O rather than by incremental JSON encoding. The
+    standard layout is indented for readability; the compact layout is
+    written on one line for speed.
+
+    Args:
+        workflow: The workflow to save
+        path: Destination file path
+        compact: Write the compact layout
+    """
+    text = dumps_workflow(workflow, compact=compact, indent=None if compact else SAVE_INDENT)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def load_workflow(path: str) -> Workflow:
+    """
+    Load a workflow from a JSON file.
+
+    Args:
+        path: Path to the workflow file
+
+    Returns:
+        The loaded Workflow
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return loads_workflow(f.read())
@@ -0,0 +1,763 @@
+"""
+Workflow Simulation for the Moveworks YAML Assistant.
+
+This module dry-runs a workflow locally. Each step is executed against a
+DataContext, with mocked action responses taken from the sample outputs the
+user already provides (ActionStep.parsed_json_output):
+- Actions return their mocked response (or an ActionFailure to simulate an error)
+- Scripts run in a restricted APIthon interpreter, in a worker process
+  that is stopped when a script exceeds its time limit
+- Switch conditions, loop sources, input_args and return output_mapper
+  values are evaluated with the DSL evaluator
+- try_catch, raise and return behave as they do at runtime
+- Parallel branches and parallel for-loop iterations run concurrently on a
+  thread pool with a configurable number of workers
+
+Actions can be given latency profiles. Latency is tracked on a simulated
+clock per execution lane, so a run reports both its critical-path latency
+(parallel lanes overlap, limited by the worker count) and its serial latency
+(every action one after another) without having to wait for either.
+
+A SimulationResult reports the final output, the resulting data context and
+per-step timings, so data-shape bugs show up before a workflow is deployed
+and script-heavy workflows can be profiled.
+"""
+
+import ast
+import builtins
+import heapq
+import multiprocessing
+import random
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from core_structures import (
+    Workflow, DataContext, ActionStep, ScriptStep, SwitchStep, ForLoopStep,
+    ParallelStep, ReturnStep, RaiseStep, TryCatchStep
+)
+from dsl_classifier import is_dsl_expression
+from dsl_evaluator import dsl_evaluator, DSLEvaluationError
+from dsl_parser import parse_dsl
+
+
+# Default number of concurrent lanes for parallel steps
+DEFAULT_PARALLEL_WORKERS = 8
+
+# Default wall-clock limit of one script run, in seconds
+DEFAULT_SCRIPT_TIMEOUT = 5.0
+
+# Seconds to wait for a new script worker process to start
+SCRIPT_WORKER_START_TIMEOUT = 30.0
+
+
+class SimulationError(Exception):
+    """An error raised while simulating a workflow; try_catch blocks can catch it."""
+
+    def __init__(self, message: str, status_code: Optional[str] = None, step_path: Optional[str] = None):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.step_path = step_path
+
+
+@dataclass
+class ActionFailure:
+    """A mocked action response that makes the action fail."""
+    status_code: str = "500"
+    message: str = "Action failed"
+
+
+@dataclass
+class LatencyProfile:
+    """Mocked latency of an action, in milliseconds."""
+    mean_ms: float = 0.0
+    jitter_ms: float = 0.0
+
+    def sample(self, seed: str) -> float:
+        """
+        Sample a latency.
+
+        Args:
+            seed: Seed for the jitter, so repeated runs sample the same values
+
+        Returns:
+            Latency in milliseconds (never negative)
+        """
+        if not self.jitter_ms:
+            return max(0.0, self.mean_ms)
+        return max(0.0, self.mean_ms + random.Random(seed).uniform(-self.jitter_ms, self.jitter_ms))
+
+
+def latency_profile(value: Union[LatencyProfile, Dict[str, float], float]) -> LatencyProfile:
+    """Accept a LatencyProfile, a dict of its fields or a plain number of milliseconds."""
+    if isinstance(value, LatencyProfile):
+        return value
+    if isinstance(value, dict):
+        return LatencyProfile(**value)
+    return LatencyProfile(float(value))
+
+
+@dataclass
+class StepTrace:
+    """Timing and outcome of one executed step."""
+    path: str
+    step_type: str
+    label: str
+    output_key: Optional[str]
+    started_ms: float
+    elapsed_ms: float = 0.0
+    latency_ms: float = 0.0
+    status: str = "ok"
+    error: Optional[str] = None
+    warnings: List[str] = field(default_factory=list)
+    logs: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of a simulated workflow run."""
+    success: bool
+    output: Any
+    returned: bool
+    context: DataContext
+    traces: List[StepTrace] = field(default_factory=list)
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+    critical_path_ms: float = 0.0
+    serial_ms: float = 0.0
+
+    @property
+    def parallel_speedup(self) -> float:
+        """Serial latency divided by critical-path latency (1.0 without latency)."""
+        if not self.critical_path_ms:
+            return 1.0
+        return self.serial_ms / self.critical_path_ms
+
+    @property
+    def warnings(self) -> List[str]:
+        """Warnings from every step, prefixed with the step path."""
+        return [f"{trace.path}: {warning}" for trace in self.traces for warning in trace.warnings]
+
+    def slowest_steps(self, count: int = 5, step_type: Optional[str] = None) -> List[StepTrace]:
+        """
+        Get the slowest steps.
+
+        Args:
+            count: Number of steps to return
+            step_type: Only include steps of this type (e.g. 'script')
+
+        Returns:
+            Step traces ordered by elapsed time, slowest first
+        """
+        traces = [trace for trace in self.traces if step_type is None or trace.step_type == step_type]
+        return sorted(traces, key=lambda trace: trace.elapsed_ms, reverse=True)[:count]
+
+    def summary(self) -> str:
+        """Human-readable summary of the run."""
+        status = "succeeded" if self.success else f"failed: {self.error}"
+        lines = [f"Simulation {status} in {self.elapsed_ms:.1f} ms ({len(self.traces)} steps executed)"]
+        if self.serial_ms:
+            lines.append(f"Simulated latency: {self.critical_path_ms:.1f} ms critical path, "
+                         f"{self.serial_ms:.1f} ms serial ({self.parallel_speedup:.2f}x)")
+        for trace in self.traces:
+            line = f"  {trace.path:<40} {trace.step_type:<10} {trace.elapsed_ms:8.2f} ms  {trace.status}"
+            if trace.error:
+                line += f" - {trace.error}"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+class _Return(Exception):
+    """Unwinds the simulation when a return step runs."""
+
+    def __init__(self, output: Any):
+        super().__init__("return")
+        self.output = output
+
+
+# APIthon script execution
+
+def _script_builtins() -> Dict[str, Any]:
+    """Built-ins available to scripts (see apiton_validator.APITON_ALLOWED_BUILTINS)."""
+    from apiton_validator import APITON_ALLOWED_BUILTINS
+    return {name: getattr(builtins, name) for name in APITON_ALLOWED_BUILTINS if hasattr(builtins, name)}
+
+
+class ScriptObject(dict):
+    """Dictionary that also allows attribute access (data.user.name) inside scripts."""
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return wrap_script_value(self[name])
+        except KeyError:
+            raise AttributeError(f"'{name}' is not available") from None
+
+    def __getitem__(self, key: Any) -> Any:
+        return wrap_script_value(dict.__getitem__(self, key))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return wrap_script_value(dict.get(self, key, default))
+
+    def values(self):
+        return [wrap_script_value(value) for value in dict.values(self)]
+
+    def items(self):
+        return [(key, wrap_script_value(value)) for key, value in dict.items(self)]
+
+
+class ScriptList(list):
+    """List whose items allow attribute access inside scripts."""
+
+    def __getitem__(self, index: Any) -> Any:
+        value = list.__getitem__(self, index)
+        return ScriptList(value) if isinstance(index, slice) else wrap_script_value(value)
+
+    def __iter__(self):
+        return map(wrap_script_value, list.__iter__(self))
+
+
+def wrap_script_value(value: Any) -> Any:
+    """Wrap dictionaries and lists for attribute-style access; wrapping is lazy and shallow."""
+    if type(value) is dict:
+        return ScriptObject(value)
+    if type(value) is list:
+        return ScriptList(value)
+    return value
+
+
+@lru_cache(maxsize=256)
+def _compile_script(code: str, parameters: Tuple[str, ...]):
+    """Compile a script into a function taking the given parameters."""
+    from apiton_validator import get_apiton_analysis
+
+    analysis = get_apiton_analysis(code)
+    if analysis.has_syntax_error:
+        raise SimulationError("; ".join(analysis.syntax_errors) or "Script syntax error")
+    restricted = list(analysis.prohibited_pattern_messages)
+    restricted += [f"attribute '{name}' on line {line} reaches interpreter internals"
+                   for name, line in sorted(analysis.internal_attributes, key=lambda entry: entry[1])]
+    if analysis.restricted_nodes or restricted:
+        raise SimulationError("Script uses constructs that are not allowed in APIthon: " +
+                              "; ".join(restricted or ["imports, classes or function definitions"]))
+
+    body = list(analysis.tree.body) or [ast.Pass()]
+    if isinstance(body[-1], ast.Expr):
+        # The value of a trailing expression is the script's result
+        body[-1] = ast.copy_location(ast.Return(value=body[-1].value), body[-1])
+
+    function = ast.FunctionDef(
+        name='apiton_script',
+        args=ast.arguments(posonlyargs=[], args=[ast.arg(arg=name) for name in parameters],
+                           kwonlyargs=[], kw_defaults=[], defaults=[]),
+        body=body, decorator_list=[], returns=None
+    )
+    module = ast.fix_missing_locations(ast.Module(body=[function], type_ignores=[]))
+    namespace = {'__builtins__': {}}
+    exec(compile(module, '<apiton_script>', 'exec'), namespace)
+    return namespace['apiton_script'].__code__
+
+
+def _execute_script(code: str, parameters: Tuple[str, ...], arguments: List[Any]) -> Tuple[bool, Any, List[str]]:
+    """
+    Run a script in the current process.
+
+    Returns:
+        (succeeded, return value or error message, print() output)
+    """
+    logs = []
+    script_builtins = _script_builtins()
+    script_builtins['print'] = lambda *args, sep=' ', **kwargs: logs.append(sep.join(str(arg) for arg in args))
+    try:
+        # Each run gets its own globals, so concurrent runs do not share print()
+        function = types.FunctionType(_compile_script(code, parameters), {'__builtins__': script_builtins})
+        return True, function(*map(wrap_script_value, arguments)), logs
+    except SimulationError as e:
+        return False, e.message, logs
+    except Exception as e:
+        return False, f"Script failed: {type(e).__name__}: {e}", logs
+
+
+def _script_worker_main(connection):
+    """Entry point of a script worker process: run the scripts sent over the pipe until it closes."""
+    connection.send('ready')
+    while True:
+        try:
+            code, parameters, arguments = connection.recv()
+        except EOFError:
+            return
+        succeeded, value, logs = _execute_script(code, parameters, arguments)
+        try:
+            connection.send((succeeded, value, logs))
+        except Exception as e:
+            # The return value could not be pickled (e.g. a generator)
+            connection.send((False, f"Script result cannot be returned: {type(e).__name__}: {e}", logs))
+
+
+class _ScriptWorker:
+    """A worker process running scripts; a runaway script is stopped by terminating its worker."""
+
+    def __init__(self):
+        # Spawned rather than forked, so the worker does not inherit GUI threads
+        context = multiprocessing.get_context('spawn')
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=_script_worker_main, args=(child,),
+                                       name="apiton-script", daemon=True)
+        self.process.start()
+        child.close()
+        try:
+            if not self.connection.poll(SCRIPT_WORKER_START_TIMEOUT):
+                raise EOFError
+            self.connection.recv()
+        except (EOFError, OSError):
+            self.close()
+            raise SimulationError("Script worker process did not start") from None
+
+    def run(self, request: Tuple[str, Tuple[str, ...], List[Any]],
+            timeout: float) -> Optional[Tuple[bool, Any, List[str]]]:
+        """Run a script; returns None if it does not finish within timeout seconds."""
+        self.connection.send(request)
+        if not self.connection.poll(timeout):
+            return None
+        return self.connection.recv()
+
+    def close(self):
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+# Global idle script workers, reused across runs
+_idle_workers: List[_ScriptWorker] = []
+_workers_lock = threading.Lock()
+
+
+def _run_in_worker(request: Tuple[str, Tuple[str, ...], List[Any]], timeout: float) -> Tuple[bool, Any, List[str]]:
+    """Run a script in an idle worker process (starting one if needed), enforcing the time limit."""
+    worker = None
+    with _workers_lock:
+        while _idle_workers and worker is None:
+            worker = _idle_workers.pop()
+            if not worker.process.is_alive():
+                worker.close()
+                worker = None
+    if worker is None:
+        worker = _ScriptWorker()
+
+    try:
+        result = worker.run(request, timeout)
+    except (EOFError, OSError) as e:
+        worker.close()
+        raise SimulationError(f"Script worker process stopped: {type(e).__name__}") from e
+    if result is None:
+        worker.close()
+        raise SimulationError(f"Script exceeded the {timeout:g}s time limit")
+
+    with _workers_lock:
+        _idle_workers.append(worker)
+    return result
+
+
+def run_apiton_script(code: str, variables: Dict[str, Any], data: Dict[str, Any],
+                      meta_info: Dict[str, Any], logs: Optional[List[str]] = None,
+                      timeout: Optional[float] = DEFAULT_SCRIPT_TIMEOUT) -> Any:
+    """
+    Run an APIthon script in a restricted interpreter.
+
+    Scripts that fail APIthon's restrictions (imports, classes, private
+    identifiers, interpreter internals such as gi_frame, ...) are rejected
+    before they run, and only the APIthon built-ins are available. Scripts
+    run in a separate worker process, which is killed when the time limit
+    is exceeded; the inputs and the result are copied between processes.
+
+    Args:
+        code: The APIthon script
+        variables: Evaluated input_args, bound as local variables
+        data: The 'data' object
+        meta_info: The 'meta_info' object
+        logs: Optional list collecting print() output
+        timeout: Wall-clock limit in seconds; None runs the script in this
+            process without a limit
+
+    Returns:
+        The script's return value (or the value of its last expression)
+
+    Raises:
+        SimulationError: If the script is not valid APIthon, fails or times out
+    """
+    parameters = tuple(name for name in variables if name not in ('data', 'meta_info')) + ('data', 'meta_info')
+    # Invalid scripts are rejected here, before anything is sent to a worker
+    _compile_script(code, parameters)
+    arguments = [variables[name] for name in parameters[:-2]] + [data, meta_info]
+
+    if timeout is None:
+        succeeded, value, script_logs = _execute_script(code, parameters, arguments)
+    else:
+        succeeded, value, script_logs = _run_in_worker((code, parameters, arguments), timeout)
+    if logs is not None:
+        logs.extend(script_logs)
+    if not succeeded:
+        raise SimulationError(value)
+    return value
+
+
+# Simulator
+
+# Step type names used in traces
+STEP_TYPE_NAMES = {
+    ActionStep: 'action',
+    ScriptStep: 'script',
+    SwitchStep: 'switch',
+    ForLoopStep: 'for',
+    ParallelStep: 'parallel',
+    ReturnStep: 'return',
+    RaiseStep: 'raise',
+    TryCatchStep: 'try_catch',
+}
+
+
+def makespan(durations: List[float], workers: int) -> float:
+    """Completion time of lanes started in order on the first free worker."""
+    if not durations:
+        return 0.0
+    finish = [0.0] * min(workers, len(durations))
+    for duration in durations:
+        heapq.heappush(finish, heapq.heappop(finish) + duration)
+    return max(finish)
+
+
+class _Run:
+    """
+    State of a single simulation run.
+
+    Parallel lanes get a fork that shares the context and traces but keeps
+    its own simulated clock.
+    """
+
+    def __init__(self, context: DataContext, traces: Optional[List[StepTrace]] = None,
+                 start: Optional[float] = None):
+        self.context = context
+        self.traces: List[StepTrace] = [] if traces is None else traces
+        self.start = time.perf_counter() if start is None else start
+        self.clock_ms = 0.0
+
+    def fork(self) -> '_Run':
+        return _Run(self.context, self.traces, self.start)
+
+    def now_ms(self) -> float:
+        return (time.perf_counter() - self.start) * 1000
+
+    def data(self) -> Dict[str, Any]:
+        return {**self.context.initial_inputs, **self.context.step_outputs}
+
+
+class WorkflowSimulator:
+    """
+    Executes workflows locally against mocked action responses.
+
+    Args:
+        action_responses: Optional mocked responses by action name; these
+            override each step's parsed_json_output. Use ActionFailure to
+            make an action fail.
+        latency_profiles: Optional latency by action name, as LatencyProfile
+            instances, dicts of their fields or milliseconds
+        default_latency: Latency of actions without a profile
+        max_workers: Number of lanes a parallel step runs at once
+        sleep_latency: Also sleep for each sampled latency, so wall-clock
+            timings reflect the concurrency
+        seed: Seed for latency jitter
+        script_timeout: Wall-clock limit of each script run in seconds (None
+            runs scripts in this process without a limit)
+    """
+
+    def __init__(self, action_responses: Optional[Dict[str, Any]] = None,
+                 latency_profiles: Optional[Dict[str, Any]] = None,
+                 default_latency: Optional[Any] = None,
+                 max_workers: int = DEFAULT_PARALLEL_WORKERS,
+                 sleep_latency: bool = False,
+                 seed: int = 0,
+                 script_timeout: Optional[float] = DEFAULT_SCRIPT_TIMEOUT):
+        self.action_responses = dict(action_responses or {})
+        self.latency_profiles = {name: latency_profile(value) for name, value in (latency_profiles or {}).items()}
+        self.default_latency = latency_profile(default_latency) if default_latency is not None else None
+        self.max_workers = max(1, max_workers)
+        self.sleep_latency = sleep_latency
+        self.seed = seed
+        self.script_timeout = script_timeout
+
+    def run(self, workflow: Workflow, initial_inputs: Optional[Dict[str, Any]] = None,
+            meta_info: Optional[Dict[str, Any]] = None) -> SimulationResult:
+        """
+        Simulate a workflow.
+
+        Args:
+            workflow: The workflow to run
+            initial_inputs: Compound action input values available as data.<name>
+            meta_info: Optional meta_info (defaults to the DataContext sample user)
+
+        Returns:
+            SimulationResult with the output, final context and step traces
+        """
+        run = _Run(DataContext(initial_inputs=dict(initial_inputs or {}), meta_info=meta_info))
+        output, returned, error = None, False, None
+
+        try:
+            self._run_steps(workflow.steps, "steps", run, {})
+        except _Return as result:
+            output, returned = result.output, True
+        except SimulationError as e:
+            error = f"{e.step_path}: {e.message}" if e.step_path else e.message
+
+        return SimulationResult(
+            success=error is None,
+            output=output,
+            returned=returned,
+            context=run.context,
+            traces=run.traces,
+            error=error,
+            elapsed_ms=run.now_ms(),
+            critical_path_ms=run.clock_ms,
+            serial_ms=sum(trace.latency_ms for trace in run.traces if trace.step_type == 'action')
+        )
+
+    # Step execution
+
+    def _run_steps(self, steps: List[Any], path: str, run: _Run, scope: Dict[str, Any]) -> Any:
+        """Run a list of steps; returns the output of the last step that produced one."""
+        last_output = None
+        for index, step in enumerate(steps or []):
+            output = self._run_step(step, f"{path}[{index}]", run, scope)
+            if getattr(step, 'output_key', '_') not in ('_', '', None):
+                last_output = output
+        return last_output
+
+    def _run_step(self, step: Any, path: str, run: _Run, scope: Dict[str, Any]) -> Any:
+        step_type = STEP_TYPE_NAMES.get(type(step), type(step).__name__)
+        trace = StepTrace(
+            path=path,
+            step_type=step_type,
+            label=getattr(step, 'action_name', None) or getattr(step, 'description', None) or step_type,
+            output_key=getattr(step, 'output_key', None),
+            started_ms=run.now_ms()
+        )
+        run.traces.append(trace)
+        started = time.perf_counter()
+        clock_start = run.clock_ms
+
+        try:
+            runner = getattr(self, f"_run_{step_type}", None)
+            if runner is None:
+                raise SimulationError(f"Unsupported step type '{step_type}'")
+            output = runner(step, path, run, scope, trace)
+        except _Return:
+            trace.status = "returned"
+            raise
+        except SimulationError as e:
+            trace.status = "raised" if isinstance(step, RaiseStep) else "error"
+            trace.error = e.message
+            if e.step_path is None:
+                e.step_path = path
+            raise
+        finally:
+            trace.elapsed_ms = (time.perf_counter() - started) * 1000
+            trace.latency_ms = run.clock_ms - clock_start
+
+        if trace.output_key not in ('_', '', None):
+            run.context.add_step_output(trace.output_key, output)
+        return output
+
+    def _run_action(self, step: ActionStep, path: str, run: _Run, scope: Dict[str, Any], trace: StepTrace) -> Any:
+        self._evaluate_value(step.input_args, run, scope, trace, "input_args")
+        profile = self.latency_profiles.get(step.action_name, self.default_latency)
+        if profile is not None:
+            latency = profile.sample(f"{self.seed}:{path}")
+            run.clock_ms += latency
+            if self.sleep_latency:
+                time.sleep(latency / 1000)
+        response = self.action_responses.get(step.action_name, step.parsed_json_output)
+        if isinstance(response, ActionFailure):
+            raise SimulationError(response.message, status_code=str(response.status_code))
+        if response is None:
+            trace.warnings.append(f"No sample output for action '{step.action_name}'; using null")
+        return response
+
+    def _run_script(self, step: ScriptStep, path: str, run: _Run, scope: Dict[str, Any], trace: StepTrace) -> Any:
+        variables = dict(scope)
+        variables.update(self._evaluate_value(step.input_args, run, scope, trace, "input_args") or {})
+        return run_apiton_script(step.code, variables, run.data(), run.context.meta_info, trace.logs,
+                                 timeout=self.script_timeout)
+
+    def _run_switch(self, step: SwitchStep, path: str, run: _Run, scope: Dict[str, Any], trace: StepTrace) -> Any:
+        for index, case in enumerate(step.cases):
+            if self._evaluate(case.condition, run, scope, f"cases[{index}].condition"):
+                trace.logs.append(f"case {index + 1} matched")
+                return self._run_steps(case.steps, f"{path}.cases[{index}].steps", run, scope)
+        if step.default_case is not None:
+            trace.logs.append("default case")
+            return self._run_steps(step.default_case.steps, f"{path}.default.steps", run, scope)
+        return None
+
+    def _run_for(self, step: ForLoopStep, path: str, run: _Run, scope: Dict[str, Any], trace: StepTrace) -> Any:
+        items = self._loop_items(step.in_source, run, scope)
+        results = []
+        for index, item in enumerate(items):
+            results.append(self._run_iteration(step.steps, f"{path}.iterations[{index}].steps", run, scope,
+                                               step.each, step.index, item, index))
+        return results
+
+    def _run_parallel(self, step: ParallelStep, path: str, run: _Run, scope: Dict[str, Any], trace: StepTrace) -> Any:
+        if step.for_loop is not None:
+            loop = step.for_loop
+            items = self._loop_items(loop.in_source, run, scope)
+            tasks = [
+                lambda lane, index=index, item=item: self._run_iteration(
+                    loop.steps, f"{path}.for.iterations[{index}].steps", lane, scope,
+                    loop.each, loop.index_key, item, index)
+                for index, item in enumerate(items)
+            ]
+            results = self._run_lanes(tasks, run, trace)
+            if loop.output_key:
+                run.context.add_step_output(loop.output_key, results)
+            return results
+
+        tasks = [
+            lambda lane, index=index, branch=branch: self._run_steps(
+                branch.steps, f"{path}.branches[{index}].steps", lane, scope)
+            for index, branch in enumerate(step.branches or [])
+        ]
+        return self._run_lanes(tasks, run, trace)
+
+    def _run_return(self, step: ReturnStep, path: str, run: _Run, scope: Dict[str, Any], trace: StepTrace) -> Any:
+        raise _Return(self._evaluate_value(step.output_mapper, run, scope, trace, "output_mapper"))
+
+    def _run_raise(self, step: RaiseStep, path: str, run: _Run, scope: Dict[str, Any], trace: StepTrace) -> Any:
+        message = step.message or "Workflow raised an error"
+        if step.output_key not in ('_', '', None):
+            run.context.add_step_output(step.output_key, {"message": message})
+        raise SimulationError(message)
+
+    def _run_try_catch(self, step: TryCatchStep, path: str, run: _Run, scope: Dict[str, Any],
+                       trace: StepTrace) -> Any:
+        try:
+            return self._run_steps(step.try_steps, f"{path}.try.steps", run, scope)
+        except SimulationError as e:
+            catch = step.catch_block
+            codes = (catch.on_status_code if catch else None) or step.on_status_code
+            if codes and str(e.status_code) not in {str(code) for code in codes}:
+                raise
+            trace.status = "caught"
+            trace.logs.append(f"caught: {e.message}")
+            if catch is None:
+                return None
+            return self._run_steps(catch.steps, f"{path}.catch.steps", run, scope)
+
+    # Helpers
+
+    def _run_lanes(self, tasks: List[Callable[[_Run], Any]], run: _Run, trace: StepTrace) -> List[Any]:
+        """
+        Run parallel lanes on a thread pool.
+
+        The simulated clock advances by the lanes' makespan on max_workers
+        workers. Once every lane has finished, the first failure (in lane
+        order) is re-raised.
+        """
+        lanes = [run.fork() for _ in tasks]
+        workers = min(self.max_workers, len(tasks))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="simulator-lane") as executor:
+                outcomes = list(executor.map(self._run_lane, tasks, lanes))
+        else:
+            outcomes = [self._run_lane(task, lane) for task, lane in zip(tasks, lanes)]
+
+        run.clock_ms += makespan([lane.clock_ms for lane in lanes], max(workers, 1))
+        trace.logs.append(f"{len(tasks)} lanes on {workers} workers")
+
+        for _, error in outcomes:
+            if error is not None:
+                raise error
+        return [output for output, _ in outcomes]
+
+    def _run_lane(self, task: Callable[[_Run], Any], lane: _Run) -> Tuple[Any, Optional[Exception]]:
+        try:
+            return task(lane), None
+        except (SimulationError, _Return) as e:
+            return None, e
+
+    def _run_iteration(self, steps: List[Any], path: str, run: _Run, scope: Dict[str, Any], each: str,
+                       index_name: Optional[str], item: Any, index: int) -> Any:
+        iteration_scope = dict(scope)
+        if each:
+            iteration_scope[each] = item
+        if index_name:
+            iteration_scope[index_name] = index
+        return self._run_steps(steps, path, run, iteration_scope)
+
+    def _loop_items(self, in_source: str, run: _Run, scope: Dict[str, Any]) -> List[Any]:
+        items = self._evaluate(in_source, run, scope, "in")
+        if items is None:
+            raise SimulationError(f"Loop source '{in_source}' is null")
+        if isinstance(items, dict):
+            return list(items.values())
+        if not isinstance(items, list):
+            raise SimulationError(f"Loop source '{in_source}' is a {type(items).__name__}, not an array")
+        return items
+
+    def _is_expression(self, value: str, scope: Dict[str, Any]) -> bool:
+        """Whether a string field value is DSL (rather than a literal string)."""
+        if is_dsl_expression(value):
+            return True
+        parsed = parse_dsl(value.strip())
+        # Bare references to loop variables, e.g. user.id
+        return parsed.ok and any(reference.root in scope for reference in parsed.references)
+
+    def _evaluate(self, expression: str, run: _Run, scope: Dict[str, Any], field_name: str) -> Any:
+        try:
+            return dsl_evaluator.evaluate(expression, run.context, variables=scope)
+        except DSLEvaluationError as e:
+            raise SimulationError(f"{field_name}: cannot evaluate '{expression}': {e.message}")
+
+    def _evaluate_value(self, value: Any, run: _Run, scope: Dict[str, Any], trace: StepTrace,
+                        field_name: str) -> Any:
+        """Evaluate DSL strings inside an input_args/output_mapper structure."""
+        if isinstance(value, str):
+            if not value.strip() or not self._is_expression(value, scope):
+                return value
+            result = self._evaluate(value, run, scope, field_name)
+            if result is None:
+                trace.warnings.append(f"{field_name} '{value}' evaluated to null")
+            return result
+        if isinstance(value, dict):
+            return {key: self._evaluate_value(item, run, scope, trace, f"{field_name}.{key}")
+                    for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._evaluate_value(item, run, scope, trace, f"{field_name}[{index}]")
+                    for index, item in enumerate(value)]
+        return value
+
+
+def simulate_workflow(workflow: Workflow, initial_inputs: Optional[Dict[str, Any]] = None,
+                      action_responses: Optional[Dict[str, Any]] = None,
+                      latency_profiles: Optional[Dict[str, Any]] = None,
+                      max_workers: int = DEFAULT_PARALLEL_WORKERS,
+                      script_timeout: Optional[float] = DEFAULT_SCRIPT_TIMEOUT) -> SimulationResult:
+    """
+    Simulate a workflow with its sample outputs as mocked action responses.
+
+    Args:
+        workflow: The workflow to run
+        initial_inputs: Compound action input values
+        action_responses: Optional mocked responses by action name
+        latency_profiles: Optional action latencies by action name
+        max_workers: Number of lanes a parallel step runs at once
+        script_timeout: Wall-clock limit of each script run in seconds
+
+    Returns:
+        SimulationResult
+    """
+    simulator = WorkflowSimulator(action_responses, latency_profiles=latency_profiles, max_workers=max_workers,
+                                  script_timeout=script_timeout)
+    return simulator.run(workflow, initial_inputs)
@@ -10,69 +10,55 @@ Based on Sections 2.1, 8.1, and 11.1 of the Source of Truth Document.
 
 import yaml
 import re
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Iterable, Optional, Sequence, Union
 from core_structures import (
     Workflow, ActionStep, ScriptStep, SwitchStep, ForLoopStep,
     ParallelStep, ReturnStep, SwitchCase, DefaultCase, ParallelBranch,
     RaiseStep, TryCatchStep, CatchBlock, ParallelForLoop
 )
+from dsl_classifier import is_dsl_expression
 
+# Use the libyaml emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _BaseDumper
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeDumper as _BaseDumper
+    LIBYAML_AVAILABLE = False
 
-def _is_dsl_expression(value: str) -> bool:
-    """
-    Enhanced check if a string value contains Moveworks DSL expressions that need quoting.
-
-    Args:
-        value: String value to check
-
-    Returns:
-        True if the value contains DSL expressions, False otherwise
-    """
-    if not isinstance(value, str):
-        return False
-
-    # Enhanced DSL patterns that need string quoting in YAML
-    dsl_patterns = [
-        # Data references
-        r'\bdata\.[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)*',  # data.field_name.subfield
-        r'\bdata\.[a-zA-Z_][a-zA-Z0-9_]*\[[0-9]+\]',  # data.array[0]
-        r'\bdata\.[a-zA-Z_][a-zA-Z0-9_]*\[-?[0-9]+\]',  # data.array[-1]
-
-        # Meta info references
-        r'\bmeta_info\.[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)*',  # meta_info.user.email
-
-        # Comparison operators
-        r'==|!=|>=|<=|>|<',  # Comparison operators in conditions
 
-        # Logical operators
-        r'&&|\|\|',  # Logical AND/OR operators
+def _represent_workflow_str(dumper, data):
+    """Represent multiline strings as literal blocks and quote DSL expressions."""
+    if '\n' in data:
+        return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='|')
+    elif is_dsl_expression(data):
+        # Force DSL expressions to be quoted
+        return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='"')
+    return dumper.represent_scalar('tag:yaml.org,2002:str', data)
 
-        # DSL functions (enhanced detection)
-        r'\$[A-Z_]+\(',  # All Moveworks functions starting with $
 
-        # Common DSL function patterns
-        r'\$CONCAT\s*\(',  # $CONCAT with optional whitespace
-        r'\$IF\s*\(',      # $IF with optional whitespace
-        r'\$SPLIT\s*\(',   # $SPLIT with optional whitespace
-        r'\$TEXT\s*\(',    # $TEXT with optional whitespace
-        r'\$UPPER\s*\(',   # $UPPER with optional whitespace
-        r'\$LOWER\s*\(',   # $LOWER with optional whitespace
+class WorkflowDumper(_BaseDumper):
+    """
+    YAML Dumper for compound action output.
 
-        # Array/object method calls that might be DSL
-        r'\.contains\s*\(',  # .contains() method
-        r'\.length\b',       # .length property
-        r'\.size\b',         # .size property
+    The string representer is registered on this class only, so generating
+    workflow YAML never changes PyYAML's global Dumper state. Each dump
+    creates its own Dumper instance, which makes generation safe to run from
+    several threads at once.
+    """
 
-        # Null checks
-        r'!= null\b',        # != null
-        r'== null\b',        # == null
 
-        # Boolean literals in expressions (when part of larger expressions)
-        r'\b(true|false)\b.*[=<>!&|]',  # Boolean with operators
-        r'[=<>!&|].*\b(true|false)\b',  # Operators with boolean
-    ]
+WorkflowDumper.add_representer(str, _represent_workflow_str)
 
-    return any(re.search(pattern, value) for pattern in dsl_patterns)
+# yaml.dump options for compound action output
+YAML_DUMP_OPTIONS = dict(
+    default_flow_style=False,
+    indent=2,
+    sort_keys=False,
+    allow_unicode=True,
+    width=1000  # Prevent line wrapping for long strings
+)
 
 
 def _ensure_dsl_string_quoting(obj: Any) -> Any:
@@ -89,10 +75,8 @@ def _ensure_dsl_string_quoting(obj: Any) -> Any:
         return {key: _ensure_dsl_string_quoting(value) for key, value in obj.items()}
     elif isinstance(obj, list):
         return [_ensure_dsl_string_quoting(item) for item in obj]
-    elif isinstance(obj, str) and _is_dsl_expression(obj):
-        # Return as-is - YAML serializer will handle quoting
-        return obj
     else:
+        # Strings are returned as-is - the YAML representer quotes DSL expressions
         return obj
 
 
@@ -257,13 +241,9 @@ def step_to_yaml_dict(step) -> Dict[str, Any]:
         if step.cases:
             cases_list = []
             for case in step.cases:
-                # Apply DSL string formatting to condition if it contains DSL expressions
-                condition = case.condition
-                if isinstance(condition, str) and _is_dsl_expression(condition):
-                    condition = condition  # Keep as string for YAML quoting
-
+                # Conditions containing DSL expressions are quoted by the YAML representer
                 case_dict = {
-                    'condition': condition,
+                    'condition': case.condition,
                     'steps': [step_to_yaml_dict(nested_step) for nested_step in case.steps]
                 }
                 cases_list.append(case_dict)
@@ -425,15 +405,26 @@ def workflow_to_yaml_dict(workflow: Workflow, action_name: str = None) -> Dict[s
     return compound_action
 
 
-def generate_yaml_string(workflow: Workflow, action_name: str = None) -> str:
+def generate_yaml_string(workflow: Workflow, action_name: str = None,
+                         validation_result=None, emit_only: bool = False,
+                         dirty: Optional[Iterable[int]] = None) -> str:
     """
     Generate a YAML string from a Workflow instance with proper APIthon script formatting.
 
-    Validates output_key compliance before generation.
+    Validates output_key compliance before generation. By default the full
+    compliance validation runs first; live previews can instead pass a result
+    they already computed, or set emit_only to gate on the mandatory-field
+    checks alone so the cost is dominated by serialization.
 
     Args:
         workflow: The Workflow instance to convert
         action_name: Optional action name for the compound action
+        validation_result: Optional precomputed ComplianceValidationResult
+            for this workflow to gate on instead of re-validating
+        emit_only: Gate on the cheap mandatory-field checks only
+        dirty: Indices of the steps edited in place since this workflow was
+            last validated, passed to the incremental validator. None
+            re-reads every step.
 
     Returns:
         YAML string representation of the workflow with literal block scalars for script code
@@ -442,9 +433,15 @@ def generate_yaml_string(workflow: Workflow, action_name: str = None) -> str:
         ValueError: If mandatory output_key fields are missing or invalid
     """
     # Validate output_key compliance before generating YAML
-    from compliance_validator import compliance_validator
-
-    validation_result = compliance_validator.validate_workflow_compliance(workflow, action_name or "compound_action")
+    if validation_result is None:
+        if emit_only:
+            from compliance_validator import compliance_validator
+            validation_result = compliance_validator.validate_mandatory_fields(
+                workflow, action_name or "compound_action")
+        else:
+            from incremental_validator import incremental_validator
+            validation_result = incremental_validator.validate_compliance(
+                workflow, action_name or "compound_action", dirty=dirty)
 
     # Check for mandatory field errors specifically related to output_key and action_name
     output_key_errors = [error for error in validation_result.mandatory_field_errors
@@ -459,35 +456,64 @@ def generate_yaml_string(workflow: Workflow, action_name: str = None) -> str:
         error_msg += "\n".join(f"• {error}" for error in mandatory_errors)
         raise ValueError(error_msg)
 
+    return emit_workflow_yaml(workflow, action_name)
+
+
+def emit_workflow_yaml(workflow: Workflow, action_name: str = None) -> str:
+    """
+    Serialize a workflow to YAML without any validation.
+
+    Args:
+        workflow: The Workflow instance to convert
+        action_name: Optional action name for the compound action
+
+    Returns:
+        YAML string representation of the workflow
+    """
     workflow_dict = workflow_to_yaml_dict(workflow, action_name)
 
-    # Custom YAML representer for multiline strings and DSL expressions
-    def represent_literal_str(dumper, data):
-        if '\n' in data:
-            return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='|')
-        elif _is_dsl_expression(data):
-            # Force DSL expressions to be quoted
-            return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='"')
-        return dumper.represent_scalar('tag:yaml.org,2002:str', data)
-
-    # Add custom representer for script code and DSL expressions
-    yaml.add_representer(str, represent_literal_str)
-
-    try:
-        # Configure YAML output for proper formatting
-        yaml_string = yaml.dump(
-            workflow_dict,
-            default_flow_style=False,
-            indent=2,
-            sort_keys=False,
-            allow_unicode=True,
-            width=1000  # Prevent line wrapping for long strings
-        )
-    finally:
-        # Reset the representer to avoid affecting other YAML operations
-        yaml.representer.Representer.yaml_representers[str] = yaml.representer.Representer.represent_str
-
-    return yaml_string
+    return yaml.dump(workflow_dict, Dumper=WorkflowDumper, **YAML_DUMP_OPTIONS)
+
+
+def generate_yaml_many(workflows: Iterable[Workflow],
+                       action_names: Optional[Sequence[str]] = None,
+                       workers: Optional[int] = None,
+                       return_exceptions: bool = False) -> List[Union[str, Exception]]:
+    """
+    Generate YAML for many workflows concurrently.
+
+    Args:
+        workflows: Workflows to convert
+        action_names: Optional action names, one per workflow
+        workers: Number of worker threads; None lets the executor decide and
+            1 generates in the current thread
+        return_exceptions: Return errors (such as missing mandatory fields)
+            in place of the YAML string instead of raising the first one
+
+    Returns:
+        List of YAML strings in the same order as the workflows
+    """
+    workflows = list(workflows)
+    if action_names is None:
+        action_names = [None] * len(workflows)
+    elif len(action_names) != len(workflows):
+        raise ValueError("action_names must have one entry per workflow")
+
+    def generate(item):
+        workflow, action_name = item
+        try:
+            return generate_yaml_string(workflow, action_name)
+        except Exception as e:
+            if return_exceptions:
+                return e
+            raise
+
+    items = list(zip(workflows, action_names))
+    if workers == 1 or len(items) <= 1:
+        return [generate(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(generate, items))
 
 
 # Example usage and testing
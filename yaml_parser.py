@@ -0,0 +1,504 @@
+"""
+YAML parsing module for Moveworks Compound Action workflows.
+
+This module is the inverse of yaml_generator: it reads compound action YAML and
+rebuilds the full core_structures tree, including switch, for, parallel,
+try/catch, raise and return steps. The libyaml CSafeLoader is used when it is
+available. Every parsed object and field keeps its source line and column in a
+SourceMap so problems can be reported against the original file.
+
+Multi-document streams are parsed one document at a time.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, IO
+
+from yaml.nodes import MappingNode, ScalarNode, SequenceNode
+
+from core_structures import (
+    Workflow, ActionStep, ScriptStep, SwitchStep, ForLoopStep,
+    ParallelStep, ReturnStep, SwitchCase, DefaultCase, ParallelBranch,
+    RaiseStep, TryCatchStep, CatchBlock, ParallelForLoop
+)
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader
+    LIBYAML_AVAILABLE = False
+
+
+# Keys that identify the type of a step mapping
+STEP_TYPE_KEYS = ('action', 'script', 'switch', 'for', 'parallel', 'return', 'raise', 'try_catch')
+
+
+@dataclass(frozen=True)
+class SourceLocation:
+    """
+    Position of a YAML node in its source document.
+
+    Attributes:
+        line: 1-based line number
+        column: 1-based column number
+        path: Dotted path of the node within the document (e.g. "steps[0].action.output_key")
+    """
+    line: int
+    column: int
+    path: str
+
+    def __str__(self) -> str:
+        return f"line {self.line}, column {self.column} ({self.path})"
+
+
+class SourceMap:
+    """
+    Maps parsed objects and their fields to source locations.
+
+    Objects are tracked by identity, so the map is only meaningful while the
+    parsed workflow is alive and unchanged.
+    """
+
+    def __init__(self):
+        self._locations: Dict[Tuple[int, Optional[str]], SourceLocation] = {}
+        self._objects: List[Any] = []
+
+    def add(self, obj: Any, location: SourceLocation, field_name: Optional[str] = None):
+        """Record the location of an object, or of one of its fields."""
+        if field_name is None:
+            # Keep objects alive so their ids are not reused
+            self._objects.append(obj)
+        self._locations[(id(obj), field_name)] = location
+
+    def get(self, obj: Any, field_name: Optional[str] = None) -> Optional[SourceLocation]:
+        """
+        Get the source location of an object or one of its fields.
+
+        Args:
+            obj: A parsed step or nested structure
+            field_name: Optional dataclass field name (e.g. "output_key")
+
+        Returns:
+            SourceLocation, or None if the object or field was not parsed from YAML
+        """
+        return self._locations.get((id(obj), field_name))
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+
+class WorkflowYAMLError(ValueError):
+    """Raised when YAML cannot be converted into a workflow."""
+
+    def __init__(self, message: str, location: Optional[SourceLocation] = None):
+        self.location = location
+        if location is not None:
+            message = f"{message} at {location}"
+        super().__init__(message)
+
+
+@dataclass
+class ParsedCompoundAction:
+    """
+    A compound action parsed from one YAML document.
+
+    Attributes:
+        action_name: Top-level action_name, if the document has one
+        workflow: The rebuilt Workflow
+        source_map: Source locations of every parsed object and field
+        warnings: Non-fatal issues such as unknown keys
+        document_index: 0-based index of the document within the stream
+    """
+    action_name: Optional[str]
+    workflow: Workflow
+    source_map: SourceMap
+    warnings: List[str] = field(default_factory=list)
+    document_index: int = 0
+
+
+class _WorkflowBuilder:
+    """Builds core_structures objects from a composed YAML node tree."""
+
+    def __init__(self, loader, source_map: SourceMap, warnings: List[str]):
+        self.loader = loader
+        self.source_map = source_map
+        self.warnings = warnings
+
+    # ------------------------------------------------------------------
+    # Node helpers
+    # ------------------------------------------------------------------
+
+    def location(self, node, path: str) -> SourceLocation:
+        """Source location of a node."""
+        mark = node.start_mark
+        return SourceLocation(line=mark.line + 1, column=mark.column + 1, path=path)
+
+    def value(self, node) -> Any:
+        """Construct the plain Python value of a node."""
+        return self.loader.construct_object(node, deep=True)
+
+    def mapping(self, node, path: str) -> Dict[str, Tuple[Any, Any]]:
+        """Return {key: (key_node, value_node)} for a mapping node."""
+        if not isinstance(node, MappingNode):
+            raise WorkflowYAMLError("Expected a mapping", self.location(node, path))
+        items = {}
+        for key_node, value_node in node.value:
+            key = self.value(key_node)
+            if not isinstance(key, str):
+                raise WorkflowYAMLError(f"Mapping keys must be strings, got {key!r}", self.location(key_node, path))
+            items[key] = (key_node, value_node)
+        return items
+
+    def sequence(self, node, path: str) -> List[Any]:
+        """Return the item nodes of a sequence node (null is treated as empty)."""
+        if isinstance(node, ScalarNode) and self.value(node) is None:
+            return []
+        if not isinstance(node, SequenceNode):
+            raise WorkflowYAMLError("Expected a list", self.location(node, path))
+        return node.value
+
+    def warn_unknown(self, items: Dict[str, Any], known: Tuple[str, ...], path: str):
+        """Record a warning for every unexpected key in a mapping."""
+        for key, (key_node, _) in items.items():
+            if key not in known:
+                self.warnings.append(f"Unknown key '{key}' ignored at {self.location(key_node, path)}")
+
+    def fields(self, items: Dict[str, Tuple[Any, Any]], mapping: Dict[str, str],
+               path: str) -> Dict[str, Any]:
+        """
+        Read plain-valued fields from a mapping.
+
+        Args:
+            items: Parsed mapping items
+            mapping: {yaml_key: dataclass_field}
+            path: Path of the mapping
+
+        Returns:
+            {dataclass_field: (value, location)} for keys present in the mapping
+        """
+        values = {}
+        for yaml_key, field_name in mapping.items():
+            if yaml_key in items:
+                _, value_node = items[yaml_key]
+                values[field_name] = (self.value(value_node), self.location(value_node, f"{path}.{yaml_key}"))
+        return values
+
+    def create(self, cls, node, path: str, values: Dict[str, Tuple[Any, SourceLocation]], **extra):
+        """Instantiate a dataclass and record its locations."""
+        kwargs = {name: value for name, (value, _) in values.items()}
+        kwargs.update(extra)
+        try:
+            obj = cls(**kwargs)
+        except (TypeError, ValueError) as e:
+            raise WorkflowYAMLError(f"Invalid {cls.__name__}: {e}", self.location(node, path)) from e
+
+        self.source_map.add(obj, self.location(node, path))
+        for name, (_, location) in values.items():
+            self.source_map.add(obj, location, name)
+        return obj
+
+    # ------------------------------------------------------------------
+    # Documents and step lists
+    # ------------------------------------------------------------------
+
+    def document(self, node) -> Tuple[Optional[str], Workflow]:
+        """Build (action_name, workflow) from a document's root node."""
+        action_name = None
+
+        if isinstance(node, SequenceNode):
+            steps = self.steps(node, "steps")
+        else:
+            items = self.mapping(node, "")
+            if 'steps' in items:
+                steps = self.steps(items['steps'][1], "steps")
+                if 'action_name' in items:
+                    action_name = self.value(items['action_name'][1])
+                self.warn_unknown(items, ('action_name', 'steps', 'input_args', 'description'), "")
+            elif any(key in items for key in STEP_TYPE_KEYS):
+                # Single expression without a steps list
+                steps = [self.step(node, "steps[0]")]
+            else:
+                raise WorkflowYAMLError("Compound action must have a 'steps' list", self.location(node, ""))
+
+        workflow = Workflow(steps=steps)
+        self.source_map.add(workflow, self.location(node, ""))
+        return action_name, workflow
+
+    def steps(self, node, path: str) -> List[Any]:
+        """Build a list of steps from a sequence node."""
+        return [self.step(item, f"{path}[{i}]") for i, item in enumerate(self.sequence(node, path))]
+
+    def step(self, node, path: str) -> Any:
+        """Build a single step from a step mapping."""
+        items = self.mapping(node, path)
+        step_keys = [key for key in STEP_TYPE_KEYS if key in items]
+
+        if not step_keys:
+            raise WorkflowYAMLError(
+                f"Unknown step type; expected one of: {', '.join(STEP_TYPE_KEYS)}",
+                self.location(node, path)
+            )
+        if len(step_keys) > 1:
+            raise WorkflowYAMLError(
+                f"Step has more than one type key: {', '.join(step_keys)}",
+                self.location(node, path)
+            )
+
+        step_key = step_keys[0]
+        body_node = items[step_key][1]
+        body_path = f"{path}.{step_key}"
+
+        # Switch steps keep their output_key next to the 'switch' key
+        allowed = (step_key, 'output_key', 'description') if step_key == 'switch' else (step_key,)
+        self.warn_unknown(items, allowed, path)
+
+        builder = getattr(self, f"_build_{step_key}")
+        return builder(body_node, body_path, items, path)
+
+    # ------------------------------------------------------------------
+    # Step types
+    # ------------------------------------------------------------------
+
+    def _body(self, body_node, body_path: str) -> Dict[str, Tuple[Any, Any]]:
+        """Mapping items of a step body; an empty body may be written as null."""
+        if isinstance(body_node, ScalarNode) and self.value(body_node) is None:
+            return {}
+        return self.mapping(body_node, body_path)
+
+    def _build_action(self, body_node, body_path, outer_items, path):
+        items = self._body(body_node, body_path)
+        known = ('action_name', 'output_key', 'input_args', 'description', 'delay_config', 'progress_updates')
+        self.warn_unknown(items, known, body_path)
+        values = self.fields(items, {key: key for key in known}, body_path)
+        values.setdefault('action_name', ('', None))
+        values.setdefault('output_key', ('', None))
+        if values.get('input_args', (None,))[0] is None:
+            values.pop('input_args', None)
+        return self._create_step(ActionStep, body_node, body_path, values)
+
+    def _build_script(self, body_node, body_path, outer_items, path):
+        items = self._body(body_node, body_path)
+        known = ('code', 'output_key', 'input_args', 'description')
+        self.warn_unknown(items, known, body_path)
+        values = self.fields(items, {key: key for key in known}, body_path)
+        values.setdefault('code', ('', None))
+        values.setdefault('output_key', ('', None))
+        if values.get('input_args', (None,))[0] is None:
+            values.pop('input_args', None)
+        return self._create_step(ScriptStep, body_node, body_path, values)
+
+    def _build_switch(self, body_node, body_path, outer_items, path):
+        items = self._body(body_node, body_path)
+        self.warn_unknown(items, ('cases', 'default', 'output_key', 'description'), body_path)
+
+        cases = []
+        if 'cases' in items:
+            cases_path = f"{body_path}.cases"
+            for i, case_node in enumerate(self.sequence(items['cases'][1], cases_path)):
+                case_path = f"{cases_path}[{i}]"
+                case_items = self.mapping(case_node, case_path)
+                self.warn_unknown(case_items, ('condition', 'steps'), case_path)
+                values = self.fields(case_items, {'condition': 'condition'}, case_path)
+                values.setdefault('condition', ('', None))
+                nested = self.steps(case_items['steps'][1], f"{case_path}.steps") if 'steps' in case_items else []
+                cases.append(self.create(SwitchCase, case_node, case_path, values, steps=nested))
+
+        default_case = None
+        if 'default' in items:
+            default_node = items['default'][1]
+            default_path = f"{body_path}.default"
+            default_items = self._body(default_node, default_path)
+            self.warn_unknown(default_items, ('steps',), default_path)
+            nested = self.steps(default_items['steps'][1], f"{default_path}.steps") if 'steps' in default_items else []
+            default_case = self.create(DefaultCase, default_node, default_path, {}, steps=nested)
+
+        values = self.fields(items, {'output_key': 'output_key', 'description': 'description'}, body_path)
+        values.update(self.fields(outer_items, {'output_key': 'output_key', 'description': 'description'}, path))
+        return self._create_step(SwitchStep, body_node, body_path, values, cases=cases, default_case=default_case)
+
+    def _build_for(self, body_node, body_path, outer_items, path):
+        items = self._body(body_node, body_path)
+        self.warn_unknown(items, ('each', 'index', 'in', 'output_key', 'steps', 'description'), body_path)
+        values = self.fields(items, {
+            'each': 'each', 'index': 'index', 'in': 'in_source',
+            'output_key': 'output_key', 'description': 'description'
+        }, body_path)
+        nested = self.steps(items['steps'][1], f"{body_path}.steps") if 'steps' in items else []
+        return self._create_step(ForLoopStep, body_node, body_path, values, steps=nested)
+
+    def _build_parallel(self, body_node, body_path, outer_items, path):
+        items = self._body(body_node, body_path)
+        self.warn_unknown(items, ('for', 'branches', 'output_key', 'description'), body_path)
+        values = self.fields(items, {'output_key': 'output_key', 'description': 'description'}, body_path)
+
+        if 'for' in items and 'branches' in items:
+            raise WorkflowYAMLError("Parallel step cannot have both 'for' and 'branches'", self.location(body_node, body_path))
+
+        if 'for' in items:
+            for_node = items['for'][1]
+            for_path = f"{body_path}.for"
+            for_items = self.mapping(for_node, for_path)
+            self.warn_unknown(for_items, ('each', 'in', 'index_key', 'output_key', 'steps'), for_path)
+            for_values = self.fields(for_items, {
+                'each': 'each', 'in': 'in_source', 'index_key': 'index_key', 'output_key': 'output_key'
+            }, for_path)
+            nested = self.steps(for_items['steps'][1], f"{for_path}.steps") if 'steps' in for_items else []
+            for_loop = self.create(ParallelForLoop, for_node, for_path, for_values, steps=nested)
+            return self._create_step(ParallelStep, body_node, body_path, values, for_loop=for_loop)
+
+        branches = []
+        if 'branches' in items:
+            branches_path = f"{body_path}.branches"
+            for i, branch_node in enumerate(self.sequence(items['branches'][1], branches_path)):
+                branch_path = f"{branches_path}[{i}]"
+                branch_items = self.mapping(branch_node, branch_path)
+                self.warn_unknown(branch_items, ('name', 'steps'), branch_path)
+                branch_values = self.fields(branch_items, {'name': 'name'}, branch_path)
+                nested = self.steps(branch_items['steps'][1], f"{branch_path}.steps") if 'steps' in branch_items else []
+                branches.append(self.create(ParallelBranch, branch_node, branch_path, branch_values, steps=nested))
+        return self._create_step(ParallelStep, body_node, body_path, values, branches=branches)
+
+    def _build_return(self, body_node, body_path, outer_items, path):
+        items = self._body(body_node, body_path)
+        self.warn_unknown(items, ('output_mapper', 'description'), body_path)
+        values = self.fields(items, {'output_mapper': 'output_mapper', 'description': 'description'}, body_path)
+        if values.get('output_mapper', (None,))[0] is None:
+            values.pop('output_mapper', None)
+        return self._create_step(ReturnStep, body_node, body_path, values)
+
+    def _build_raise(self, body_node, body_path, outer_items, path):
+        items = self._body(body_node, body_path)
+        self.warn_unknown(items, ('output_key', 'message', 'description'), body_path)
+        values = self.fields(items, {
+            'output_key': 'output_key', 'message': 'message', 'description': 'description'
+        }, body_path)
+        return self._create_step(RaiseStep, body_node, body_path, values)
+
+    def _build_try_catch(self, body_node, body_path, outer_items, path):
+        items = self._body(body_node, body_path)
+        self.warn_unknown(items, ('try', 'catch', 'output_key', 'description'), body_path)
+        values = self.fields(items, {'output_key': 'output_key', 'description': 'description'}, body_path)
+
+        try_steps = []
+        if 'try' in items:
+            try_path = f"{body_path}.try"
+            try_items = self._body(items['try'][1], try_path)
+            self.warn_unknown(try_items, ('steps',), try_path)
+            try_steps = self.steps(try_items['steps'][1], f"{try_path}.steps") if 'steps' in try_items else []
+
+        catch_block = None
+        if 'catch' in items:
+            catch_node = items['catch'][1]
+            catch_path = f"{body_path}.catch"
+            catch_items = self._body(catch_node, catch_path)
+            self.warn_unknown(catch_items, ('on_status_code', 'steps', 'description'), catch_path)
+            catch_values = self.fields(catch_items, {
+                'on_status_code': 'on_status_code', 'description': 'description'
+            }, catch_path)
+            nested = self.steps(catch_items['steps'][1], f"{catch_path}.steps") if 'steps' in catch_items else []
+            catch_block = self.create(CatchBlock, catch_node, catch_path, catch_values, steps=nested)
+
+        return self._create_step(TryCatchStep, body_node, body_path, values,
+                                 try_steps=try_steps, catch_block=catch_block)
+
+    def _create_step(self, cls, body_node, body_path, values, **extra):
+        """Create a step, dropping placeholder locations for defaulted fields."""
+        located = {name: (value, location) for name, (value, location) in values.items() if location is not None}
+        defaults = {name: value for name, (value, location) in values.items() if location is None}
+        defaults.update(extra)
+        return self.create(cls, body_node, body_path, located, **defaults)
+
+
+def _reset_constructor(loader: SafeLoader):
+    """Forget the objects constructed for a document, as SafeLoader.construct_document does."""
+    loader.constructed_objects = {}
+    loader.recursive_objects = {}
+    loader.state_generators = []
+    loader.deep_construct = False
+
+
+def iter_compound_actions(stream: Union[str, bytes, IO]) -> Iterator[ParsedCompoundAction]:
+    """
+    Parse every document of a YAML stream into a compound action.
+
+    Documents are composed and converted one at a time, so large multi-document
+    streams do not need to be held in memory at once.
+
+    Args:
+        stream: YAML text or a readable file object
+
+    Yields:
+        ParsedCompoundAction for each non-empty document
+
+    Raises:
+        WorkflowYAMLError: If a document is not a valid compound action
+        yaml.YAMLError: If the stream is not valid YAML
+    """
+    loader = SafeLoader(stream)
+    try:
+        index = 0
+        while loader.check_node():
+            node = loader.get_node()
+            if node is not None:
+                source_map = SourceMap()
+                warnings = []
+                builder = _WorkflowBuilder(loader, source_map, warnings)
+                try:
+                    action_name, workflow = builder.document(node)
+                finally:
+                    _reset_constructor(loader)
+                yield ParsedCompoundAction(
+                    action_name=action_name,
+                    workflow=workflow,
+                    source_map=source_map,
+                    warnings=warnings,
+                    document_index=index
+                )
+            index += 1
+    finally:
+        loader.dispose()
+
+
+def parse_compound_action_yaml(stream: Union[str, bytes, IO]) -> ParsedCompoundAction:
+    """
+    Parse a single compound action from YAML.
+
+    Args:
+        stream: YAML text or a readable file object
+
+    Returns:
+        ParsedCompoundAction for the first document
+
+    Raises:
+        WorkflowYAMLError: If the YAML is empty or not a valid compound action
+    """
+    for parsed in iter_compound_actions(stream):
+        return parsed
+    raise WorkflowYAMLError("YAML document is empty")
+
+
+def load_workflow_from_yaml(stream: Union[str, bytes, IO]) -> Workflow:
+    """
+    Convenience wrapper returning only the Workflow of a compound action.
+
+    Args:
+        stream: YAML text or a readable file object
+
+    Returns:
+        The parsed Workflow
+    """
+    return parse_compound_action_yaml(stream).workflow
+
+
+def load_compound_action_file(path: str) -> ParsedCompoundAction:
+    """
+    Parse the first compound action in a YAML file.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        ParsedCompoundAction for the file
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_compound_action_yaml(f)